@@ -6,7 +6,28 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from dsbf.core.context import AnalysisContext
 from dsbf.eda.task_result import TaskResult
+from dsbf.utils.backend import is_polars, to_polars
 from dsbf.utils.logging_utils import get_log_fn, setup_logger
+from dsbf.utils.sketches import (
+    FrequentItemsSketch,
+    HyperLogLog,
+    KLLSketch,
+    hll_relative_error,
+    iter_slices,
+    kll_rank_error,
+    sketch_distinct,
+    sketch_frequent,
+    sketch_quantiles,
+)
+from dsbf.utils.type_profile import TypeProfile, type_profile
+
+# Defaults for `engine.sketches`, used when `engine.approximate` is enabled
+SKETCH_DEFAULTS: Dict[str, int] = {
+    "hll_precision": 14,  # ~0.81% relative standard error on distinct counts
+    "kll_k": 200,  # ~1.33% normalized rank error on quantiles
+    "top_k_capacity": 1000,  # Count error <= rows / (capacity + 1)
+    "chunk_rows": 1_000_000,  # Rows folded into a sketch at a time
+}
 
 
 class BaseTask(ABC):
@@ -17,6 +38,10 @@ class BaseTask(ABC):
 
     context: Optional[AnalysisContext] = None
 
+    # Tasks that implement partial/merge/finalize set this to True so they can
+    # be computed over record batches, partitions, or workers and combined.
+    mergeable: bool = False
+
     def __init__(
         self, name: Optional[str] = None, config: Optional[Dict[str, Any]] = None
     ):
@@ -38,6 +63,119 @@ class BaseTask(ABC):
         """Execute the task. Must set self.output as a TaskResult."""
         pass
 
+    def partial(self, chunk: Any) -> Dict[str, Any]:
+        """
+        Summarize one chunk of rows into a mergeable partial state.
+
+        Args:
+            chunk (Any): A Pandas or Polars DataFrame holding a subset of rows.
+
+        Returns:
+            Dict[str, Any]: Partial state whose memory does not grow with rows.
+        """
+        raise NotImplementedError(f"{self.name} does not support partial states.")
+
+    def merge(self, states: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Combine partial states from disjoint chunks into a single state.
+
+        Merging must be associative so chunks can be combined in any grouping.
+        """
+        raise NotImplementedError(f"{self.name} does not support partial states.")
+
+    def finalize(self, state: Dict[str, Any]) -> None:
+        """Turn a merged state into a TaskResult. Must set self.output."""
+        raise NotImplementedError(f"{self.name} does not support partial states.")
+
+    def run_partials(self, df: Any) -> None:
+        """
+        Run a mergeable task by folding fixed-size row slices into its state,
+        so auxiliary memory stays bounded by the sketch sizes.
+        """
+        df = to_polars(df)
+        chunk_rows = int(self.get_sketch_param("chunk_rows"))
+        state: Optional[Dict[str, Any]] = None
+        for chunk in iter_slices(df, chunk_rows):
+            partial = self.partial(chunk)
+            state = partial if state is None else self.merge([state, partial])
+        self.finalize(state if state is not None else self.partial(df))
+
+    @property
+    def approximate(self) -> bool:
+        """True when `engine.approximate` requests sketch-based statistics."""
+        return bool(self.get_engine_param("approximate", False))
+
+    def get_sketch_param(self, key: str, default=None):
+        """
+        Get a sketch setting from the task config, then `engine.sketches`, then
+        the built-in SKETCH_DEFAULTS.
+        """
+        value = self.get_task_param(key)
+        if value is None:
+            value = (self.get_engine_param("sketches") or {}).get(key)
+        if value is None:
+            value = SKETCH_DEFAULTS.get(key, default)
+        return value
+
+    def count_unique(self, df: Any, column: str) -> int:
+        """
+        Count distinct non-null values in a column, preferring exact source
+        statistics, then a HyperLogLog estimate in approximate mode.
+        """
+        n_unique = self.get_source_stat(column, "n_unique")
+        if n_unique is not None:
+            return int(n_unique)
+        if self.approximate:
+            return int(round(self.distinct_sketch(df[column]).estimate()))
+        return df[column].n_unique() if is_polars(df) else df[column].nunique()
+
+    def distinct_sketch(self, values: Any) -> HyperLogLog:
+        """HyperLogLog sketch of a column using the configured precision."""
+        return sketch_distinct(
+            values,
+            p=int(self.get_sketch_param("hll_precision")),
+            chunk_rows=int(self.get_sketch_param("chunk_rows")),
+        )
+
+    def frequent_items(self, values: Any) -> FrequentItemsSketch:
+        """Frequent-items sketch of a column using the configured capacity."""
+        return sketch_frequent(
+            values,
+            capacity=int(self.get_sketch_param("top_k_capacity")),
+            chunk_rows=int(self.get_sketch_param("chunk_rows")),
+        )
+
+    def quantile_sketch(self, values: Any) -> KLLSketch:
+        """KLL quantile sketch of a numeric column using the configured k."""
+        return sketch_quantiles(
+            values,
+            k=int(self.get_sketch_param("kll_k")),
+            chunk_rows=int(self.get_sketch_param("chunk_rows")),
+        )
+
+    def approximation_metadata(self, *kinds: str) -> Dict[str, Any]:
+        """
+        Error bounds for the sketches used in approximate mode.
+
+        Args:
+            *kinds (str): Any of 'distinct' (HyperLogLog) or 'quantile' (KLL).
+
+        Returns:
+            Dict[str, Any]: Empty when running exactly.
+        """
+        if not self.approximate:
+            return {}
+        metadata: Dict[str, Any] = {"approximate": True}
+        if "distinct" in kinds:
+            metadata["distinct_count_relative_error"] = hll_relative_error(
+                int(self.get_sketch_param("hll_precision"))
+            )
+        if "quantile" in kinds:
+            metadata["quantile_rank_error"] = kll_rank_error(
+                int(self.get_sketch_param("kll_k"))
+            )
+        return metadata
+
     def get_output_path(self, filename: str) -> str:
         """
         Construct the path to save a file (e.g., figure) inside the output directory.
@@ -60,6 +198,53 @@ class BaseTask(ABC):
         """
         return self.config.get(key, default)
 
+    def get_max_rows(self) -> Optional[int]:
+        """
+        Row budget for this task: `max_rows` from the task config, else the
+        default declared in `register_task`. None or 0 means all rows.
+        """
+        max_rows = self.get_task_param("max_rows")
+        if max_rows is None:
+            from dsbf.eda.task_registry import TASK_REGISTRY, _to_snake_case
+
+            spec = TASK_REGISTRY.get(_to_snake_case(self.__class__.__name__))
+            max_rows = spec.max_rows if spec else None
+        return int(max_rows) if max_rows else None
+
+    def get_input_columns(self, data: Any) -> Optional[List[str]]:
+        """
+        Columns of `data` this task reads: those in the column classes declared
+        with `reads` in `register_task` whose semantic type is one of the
+        task's expected types, plus any named by its `column_params`. None
+        means the task reads every column.
+        """
+        from dsbf.eda.task_registry import (
+            TASK_REGISTRY,
+            _to_snake_case,
+            task_input_columns,
+        )
+
+        spec = TASK_REGISTRY.get(_to_snake_case(self.__class__.__name__))
+        if spec is None:
+            return None
+        return task_input_columns(
+            spec,
+            data,
+            self.config,
+            semantic_types=self.context.get_routing_types() if self.context else None,
+            project=bool(self.get_engine_param("column_projection", True)),
+        )
+
+    def get_type_profile(self, column: str) -> TypeProfile:
+        """
+        Type families of `column` in this task's input, shared with other
+        tasks through the context when there is one.
+        """
+        series = self.input_data[column]
+        if self.context:
+            return self.context.get_type_profile(column, series)
+        return type_profile(series)
+
     def get_engine_param(self, key: str, default=None):
         """
         Get a value from the 'engine' section of the global config.
@@ -69,6 +254,16 @@ class BaseTask(ABC):
             return ctx.config.get("engine", {}).get(key, default)
         return default
 
+    def get_plot_max_rows(self) -> Optional[int]:
+        """
+        Row cap for row-level plots: the task's `plot_max_rows`, then
+        `engine.plot_max_rows` (None leaves PlotFactory's default, 0 disables it).
+        """
+        value = self.get_task_param("plot_max_rows")
+        if value is None:
+            value = self.get_engine_param("plot_max_rows")
+        return value
+
     def get_metadata_param(self, key: str, default=None):
         """
         Get a value from the 'metadata' section of the global config.
@@ -78,6 +273,48 @@ class BaseTask(ABC):
             return ctx.config.get("metadata", {}).get(key, default)
         return default
 
+    def get_source_stat(self, column: Optional[str], key: str, default=None):
+        """
+        Look up an exact statistic supplied by the data source (e.g. a Parquet
+        footer) instead of computing it from the data.
+
+        Args:
+            column (str or None): Column name, or None for dataset-level
+                statistics such as 'num_rows'.
+            key (str): Statistic name (e.g. 'null_count', 'min', 'max').
+            default: Value returned when the statistic is not available.
+
+        Returns:
+            The statistic value, or `default` if the source did not provide it.
+        """
+        if not self.context:
+            return default
+
+        source_stats = self.context.get_metadata("source_stats") or {}
+        if column is None:
+            return source_stats.get(key, default)
+        return source_stats.get("columns", {}).get(column, {}).get(key, default)
+
+    def get_sampling_info(self) -> Dict[str, Any]:
+        """
+        Describe how the analysed data was sampled from the source, so tasks can
+        widen confidence bounds. Returns {} when the full dataset is analysed.
+
+        Keys include 'original_rows', 'sampled_rows', 'sampling_fraction',
+        'strategy', and 'seed'; 'task_max_rows' is set when this task ran on a
+        smaller sample from the shared pool.
+        """
+        if not self.context:
+            return {}
+        info = dict(self.context.run_metadata.get("sampling") or {})
+        if self.input_data is not None and self.input_data is not self.context.data:
+            info.setdefault("original_rows", self.context.data.shape[0])
+            info["sampled_rows"] = self.input_data.shape[0]
+            info["task_max_rows"] = self.get_max_rows()
+        if info and info.get("original_rows"):
+            info["sampling_fraction"] = info["sampled_rows"] / info["original_rows"]
+        return info
+
     def _log(self, msg: str, level: str = "debug") -> None:
         """
         Structured logging that prefers the context logger if available.
@@ -100,7 +337,7 @@ class BaseTask(ABC):
             raise RuntimeError("AnalysisContext is not set in this task.")
 
         if not self.context.reliability_flags:
-            self.context.compute_reliability_flags(self.input_data)
+            self.context.compute_reliability_flags(self.context.data)
 
         return self.context.reliability_flags
 
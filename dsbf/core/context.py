@@ -1,14 +1,16 @@
 # dsbf/core/context.py
 
-from typing import TYPE_CHECKING, Any, Dict, Optional, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, cast
 
 import pandas as pd
 import polars as pl
 
+from dsbf.core.sample_pool import SamplePool
 from dsbf.eda.task_result import TaskResult
 from dsbf.utils.backend import is_polars
 from dsbf.utils.logging_utils import DSBFLogger, get_log_fn, setup_logger
 from dsbf.utils.reliability_stats import compute_reliability_flags as compute_flags
+from dsbf.utils.type_profile import TypeProfile, type_profile
 
 if TYPE_CHECKING:
     from dsbf.core.base_task import BaseTask
@@ -23,11 +25,15 @@ class AnalysisContext:
         data (Any): The input dataframe (Pandas or Polars).
         config (dict): Full config dictionary (engine, metadata, task-level).
         results (dict[str, TaskResult]): Stores each task's final output.
+        data_source (Any): Optional backing source (e.g. SQLSource) that tasks can
+            query for pushed-down aggregations instead of scanning `data`.
         metadata (dict): Flexible key-value store for:
             - 'semantic_types': analysis-intent column types
             - 'inferred_dtypes': raw type inference results
             - 'task_durations': per-task runtime (sec)
             - 'plugin_warnings': plugin validation messages
+            - 'source_stats': exact statistics supplied by the data source
+            - 'task_rows': rows each task ran on, when capped by `max_rows`
             - Any custom task-level or engine-level signals
     """
 
@@ -38,6 +44,7 @@ class AnalysisContext:
         output_dir: Optional[str] = None,
         run_metadata: Optional[Dict[str, Any]] = None,
         reference_data: Optional[Any] = None,
+        data_source: Optional[Any] = None,
     ):
         """
         Initialize shared context object for a single DSBF profiling run.
@@ -48,11 +55,15 @@ class AnalysisContext:
         self.output_dir = output_dir
         self.run_metadata = run_metadata or {}
         self.reference_data = reference_data
+        self.data_source = data_source
 
         self.results: Dict[str, TaskResult] = {}  # Stores outputs by task name
         self.metadata: Dict[str, Any] = {}  # Shared metadata from tasks or engine
         self.stage: Optional[str] = None  # Inferred data stage (raw, cleaned, etc.)
         self.reliability_flags: Dict[str, Any] = {}  # Cached global reliability info
+        self._sample_pool: Optional[SamplePool] = None
+        self._projections: Dict[Tuple[Any, ...], Any] = {}
+        self._type_profiles: Dict[Tuple[Any, ...], TypeProfile] = {}
 
         self.logger: DSBFLogger = setup_logger(
             "dsbf.context",
@@ -101,20 +112,93 @@ class AnalysisContext:
             f"tasks={list(self.results.keys())}>"
         )
 
+    @property
+    def sample_pool(self) -> SamplePool:
+        """Shared nested samples of `data` for tasks with a `max_rows` policy."""
+        if self._sample_pool is None or self._sample_pool.data is not self.data:
+            seed = self.config.get("resource_limits", {}).get("sample_seed", 42)
+            self._sample_pool = SamplePool(self.data, seed=int(seed))
+        return self._sample_pool
+
+    def get_task_data(
+        self, max_rows: Optional[int], columns: Optional[List[str]] = None
+    ) -> Any:
+        """
+        Return the data a task should see under its `max_rows` policy,
+        restricted to `columns` if given. Projections are cached so tasks
+        reading the same columns share one view.
+        """
+        if self.data is None or not hasattr(self.data, "shape"):
+            return self.data
+        data = self.sample_pool.get(max_rows)
+        if columns is None or len(columns) == data.shape[1]:
+            return data
+
+        key = (id(self.data), max_rows, tuple(columns))
+        if key not in self._projections:
+            self._projections = {
+                k: v for k, v in self._projections.items() if k[0] == id(self.data)
+            }
+            self._projections[key] = (
+                data.select(columns) if is_polars(data) else data[columns]
+            )
+        return self._projections[key]
+
+    def get_type_profile(self, column: str, series: Any) -> TypeProfile:
+        """
+        Type profile of `column` (see `dsbf.utils.type_profile`), where
+        `series` is the column as a task sees it. Profiles are cached so tasks
+        seeing the same rows of a column share one scan.
+        """
+        key = (id(self.data), column, len(series))
+        if key not in self._type_profiles:
+            self._type_profiles = {
+                k: v for k, v in self._type_profiles.items() if k[0] == id(self.data)
+            }
+            self._type_profiles[key] = type_profile(series)
+        return self._type_profiles[key]
+
+    def get_routing_types(self) -> Dict[str, str]:
+        """
+        Semantic types used to route columns to tasks: `semantic_types` once
+        inferred, or {} before inference or with `engine.semantic_routing` off.
+        """
+        if not self.config.get("engine", {}).get("semantic_routing", True):
+            return {}
+        return self.get_metadata("semantic_types") or {}
+
     def run_task(self, task: "BaseTask") -> TaskResult:
 
         # import statement here to prevent cyclical imports warning
         from dsbf.utils.task_utils import validate_task_result
 
-        # Inject task input and context
-        task.set_input(self.data)
+        # Inject task input (sampled if the task caps its rows, restricted to
+        # the columns routed to it) and context
         task.context = self
+        get_max_rows = getattr(task, "get_max_rows", None)
+        max_rows = get_max_rows() if get_max_rows else None
+        sampled = self.get_task_data(max_rows)
+
+        columns = None
+        get_input_columns = getattr(task, "get_input_columns", None)
+        if get_input_columns and hasattr(sampled, "columns"):
+            columns = get_input_columns(sampled)
+        data = self.get_task_data(max_rows, columns)
+
+        task.set_input(data)
         task.run()
         result = task.get_output()
 
         if result is None:
             raise RuntimeError(f"Task '{task.name}' did not produce a TaskResult.")
 
+        if sampled is not self.data:
+            self.metadata.setdefault("task_rows", {})[task.name] = data.shape[0]
+            result.metadata["sampled_rows"] = data.shape[0]
+            result.metadata["source_rows"] = self.data.shape[0]
+        if data is not sampled:
+            result.metadata["input_columns"] = data.shape[1]
+
         # Validate result before storing it
         if not validate_task_result(result):
             msg = f"[{task.name}] TaskResult validation failed"
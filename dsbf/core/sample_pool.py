@@ -0,0 +1,55 @@
+# dsbf/core/sample_pool.py
+
+from typing import Any, Dict, Optional
+
+import polars as pl
+
+from dsbf.utils.backend import is_polars
+
+
+class SamplePool:
+    """
+    Nested random samples of one dataset, shared by every task in a run.
+
+    A single seeded permutation of row positions is drawn once; the sample of
+    size n is its first n positions in original row order. Smaller samples are
+    therefore subsets of larger ones, and tasks asking for the same size get
+    the same cached frame instead of re-sampling.
+
+    Args:
+        data: Polars or Pandas DataFrame to sample from.
+        seed (int): Seed for the row permutation.
+    """
+
+    def __init__(self, data: Any, seed: int = 42):
+        self.data = data
+        self.seed = seed
+        self.n_rows = data.shape[0]
+        self._order: Optional[pl.Series] = None
+        self._samples: Dict[int, Any] = {}
+
+    def get(self, max_rows: Optional[int]) -> Any:
+        """
+        Return at most `max_rows` rows (all rows if None, 0, or not smaller than
+        the dataset).
+        """
+        if not max_rows or max_rows >= self.n_rows:
+            return self.data
+
+        if max_rows not in self._samples:
+            if self._order is None:
+                self._order = pl.int_range(0, self.n_rows, eager=True).shuffle(
+                    seed=self.seed
+                )
+            rows = self._order.head(max_rows).sort()
+            self._samples[max_rows] = (
+                self.data[rows]
+                if is_polars(self.data)
+                else self.data.iloc[rows.to_numpy()]
+            )
+        return self._samples[max_rows]
+
+    @property
+    def sizes(self) -> list:
+        """Sample sizes materialized so far."""
+        return sorted(self._samples)
@@ -0,0 +1,311 @@
+# dsbf/eda/distributed_engine.py
+"""
+Multi-host profiling over a small HTTP/JSON protocol.
+
+Workers (`dsbf worker`) expose two endpoints:
+
+    GET  /health   -> {"status": "ok", "sketch_format": int, "hash_version": str}
+    POST /partial  {"partition": {...}, "config": {...}, "tasks": [...],
+                    "sketch_format": int, "hash_version": str}
+                   -> {"rows": int, "states": {task: encoded partial state},
+                       "sketch_format": int, "hash_version": str}
+
+The coordinator (`dsbf coordinator`) plans row partitions exactly like the
+map-reduce engine, hands them to workers, and merges the partial states it
+gets back. A partition that fails on one worker is re-run on another, and an
+unreachable worker stops receiving work. Every worker must be able to read the
+dataset path (shared filesystem or object store); the coordinator reads the
+first partition itself for type inference.
+
+Distinct-count sketches hash values with Polars, whose hashes change between
+versions, so both sides send their sketch format and hash version. A worker
+refuses requests from a different version (HTTP 409), and the coordinator
+rejects replies that do not match its own and drops that worker from the pool.
+"""
+
+import json
+import queue
+import threading
+import urllib.error
+import urllib.request
+from dataclasses import asdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from dsbf.eda.mapreduce_engine import MapReduceProfileEngine, profile_partition
+from dsbf.utils.logging_utils import setup_logger
+from dsbf.utils.partition_utils import RowPartition
+from dsbf.utils.sketches import (
+    HASH_VERSION,
+    SKETCH_FORMAT,
+    decode_state,
+    encode_state,
+)
+
+SKETCH_VERSION = {"sketch_format": SKETCH_FORMAT, "hash_version": HASH_VERSION}
+
+
+class SketchVersionError(ValueError):
+    """A worker builds sketches that cannot be merged with the coordinator's."""
+
+
+def check_sketch_version(payload: Dict[str, Any], peer: str) -> None:
+    """Raise SketchVersionError unless `payload` carries this host's versions."""
+    theirs = {key: payload.get(key) for key in SKETCH_VERSION}
+    if theirs != SKETCH_VERSION:
+        raise SketchVersionError(
+            f"{peer} uses sketch format {theirs['sketch_format']} / hash version "
+            f"{theirs['hash_version']}; this host uses {SKETCH_FORMAT} / "
+            f"{HASH_VERSION}."
+        )
+
+
+class _WorkerHandler(BaseHTTPRequestHandler):
+    """Serves partial task states for partitions posted by a coordinator."""
+
+    def do_GET(self):
+        if self.path.rstrip("/") == "/health":
+            self._reply(200, {"status": "ok", **SKETCH_VERSION})
+        else:
+            self._reply(404, {"error": f"Unknown endpoint: {self.path}"})
+
+    def do_POST(self):
+        if self.path.rstrip("/") != "/partial":
+            self._reply(404, {"error": f"Unknown endpoint: {self.path}"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length))
+        except Exception as e:
+            self._reply(400, {"error": f"{type(e).__name__}: {e}"})
+            return
+        try:
+            check_sketch_version(request, "Coordinator")
+        except SketchVersionError as e:
+            self.server.logger.warning(f"Rejected request: {e}")
+            self._reply(409, {"error": str(e), **SKETCH_VERSION})
+            return
+        try:
+            partition = RowPartition(**request["partition"])
+            rows, states = profile_partition(
+                partition, request["config"], request["tasks"]
+            )
+            self.server.logger.info(f"Profiled {partition.label} ({rows} rows)")
+            self._reply(
+                200, {"rows": rows, "states": encode_state(states), **SKETCH_VERSION}
+            )
+        except Exception as e:
+            self.server.logger.warning(f"Partition failed: {e}")
+            self._reply(500, {"error": f"{type(e).__name__}: {e}"})
+
+    def _reply(self, status: int, payload: Dict[str, Any]) -> None:
+        body = json.dumps(payload, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        self.server.logger.debug(format % args)
+
+
+def make_worker_server(host: str = "127.0.0.1", port: int = 8765) -> Any:
+    """Create (but do not start) a worker HTTP server; port 0 picks a free port."""
+    server = ThreadingHTTPServer((host, port), _WorkerHandler)
+    server.logger = setup_logger("dsbf.worker")
+    return server
+
+
+def serve_worker(host: str = "127.0.0.1", port: int = 8765) -> None:
+    """Run a worker until interrupted."""
+    server = make_worker_server(host, port)
+    server.logger.info(f"DSBF worker listening on http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+class DistributedProfileEngine(MapReduceProfileEngine):
+    """
+    Coordinator that profiles row partitions on remote workers and merges them.
+
+    Config (`engine.distributed`):
+        workers: Worker base URLs, e.g. ["http://10.0.0.5:8765", ...]
+        max_attempts: Tries per partition before the run fails (default 3)
+        timeout_seconds: Per-request timeout (default 3600)
+
+    Partition sizing comes from `engine.mapreduce.partition_rows`.
+
+    Args:
+        config (dict or None): Full DSBF config (default config if None).
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        super().__init__(config)
+        dist_cfg = self.config.get("engine", {}).get("distributed") or {}
+        self.workers: List[str] = [
+            url.rstrip("/") for url in dist_cfg.get("workers") or []
+        ]
+        self.max_attempts = int(dist_cfg.get("max_attempts") or 3)
+        self.timeout = float(dist_cfg.get("timeout_seconds") or 3600)
+        self.assignments: Dict[str, int] = {}
+        self.retries = 0
+        self.lost_workers: List[str] = []
+
+        if not self.workers:
+            raise ValueError("engine.distributed.workers must list at least one URL.")
+
+    def plan_partitions(self):
+        pieces = super().plan_partitions()
+        if not all(isinstance(piece, RowPartition) for piece in pieces):
+            raise ValueError(
+                "Distributed profiling needs a dataset path readable by every worker."
+            )
+        return pieces
+
+    def request_partial(
+        self, worker: str, piece: RowPartition, task_names: List[str]
+    ) -> Tuple[int, Dict[str, Any]]:
+        """
+        Ask one worker for a partition's partial states.
+
+        Raises:
+            SketchVersionError: If the worker's sketch format or hash version
+                differs from the coordinator's.
+        """
+        body = json.dumps(
+            {
+                "partition": asdict(piece),
+                "config": self.config,
+                "tasks": task_names,
+                **SKETCH_VERSION,
+            },
+            default=str,
+        ).encode("utf-8")
+        request = urllib.request.Request(
+            f"{worker}/partial",
+            data=body,
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                payload = json.loads(response.read())
+        except urllib.error.HTTPError as e:
+            if e.code == 409:
+                check_sketch_version(json.loads(e.read() or b"{}"), worker)
+            raise
+        check_sketch_version(payload, worker)
+        return payload["rows"], decode_state(payload["states"])
+
+    def map_partitions(
+        self, task_names: List[str]
+    ) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Schedule partitions on workers, one request per worker at a time.
+
+        Failed partitions go back on the queue and are preferably retried on a
+        worker that has not failed them yet. A worker whose connection fails, or
+        whose sketch version differs from the coordinator's, is dropped from the
+        pool.
+        """
+        pending: "queue.Queue[int]" = queue.Queue()
+        for index in range(len(self.pieces)):
+            pending.put(index)
+
+        results: Dict[int, Tuple[int, Dict[str, Any]]] = {}
+        failed_on: Dict[int, List[str]] = {}
+        errors: List[str] = []
+        live = set(self.workers)
+        lock = threading.Lock()
+        done = threading.Event()
+
+        def _finish_if_stuck() -> None:
+            if not live and len(results) < len(self.pieces):
+                errors.append("No reachable workers left.")
+                done.set()
+
+        def _work(worker: str) -> None:
+            while not done.is_set():
+                try:
+                    index = pending.get(timeout=0.05)
+                except queue.Empty:
+                    continue
+
+                with lock:
+                    tried = failed_on.get(index, [])
+                    skip = worker in tried and bool(live - set(tried))
+                if skip:
+                    pending.put(index)  # Leave it for a worker that hasn't failed
+                    done.wait(0.05)
+                    continue
+
+                piece = self.pieces[index]
+                try:
+                    outcome = self.request_partial(worker, piece, task_names)
+                except Exception as e:
+                    unreachable = isinstance(e, SketchVersionError) or (
+                        isinstance(e, urllib.error.URLError)
+                        and not isinstance(e, urllib.error.HTTPError)
+                    )
+                    with lock:
+                        tried = failed_on.setdefault(index, [])
+                        tried.append(worker)
+                        self.retries += 1
+                        self._log(
+                            f"Partition {piece.label} failed on {worker}: {e}",
+                            level="warn",
+                        )
+                        if len(tried) >= self.max_attempts:
+                            errors.append(
+                                f"Partition {piece.label} failed "
+                                f"{len(tried)} time(s): {e}"
+                            )
+                            done.set()
+                        else:
+                            pending.put(index)
+                        if unreachable:
+                            live.discard(worker)
+                            self.lost_workers.append(worker)
+                            _finish_if_stuck()
+                            return
+                    continue
+
+                with lock:
+                    results[index] = outcome
+                    self.assignments[worker] = self.assignments.get(worker, 0) + 1
+                    if len(results) == len(self.pieces):
+                        done.set()
+
+        self._log(
+            f"Dispatching {len(self.pieces)} partition(s) to "
+            f"{len(self.workers)} worker(s)",
+            level="info",
+        )
+        threads = [
+            threading.Thread(target=_work, args=(worker,), daemon=True)
+            for worker in self.workers
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        if errors:
+            raise RuntimeError(errors[0])
+        for index in range(len(self.pieces)):
+            yield results[index]
+
+    def describe_run(self, final: bool) -> None:
+        super().describe_run(final)
+        self.run_metadata["mapreduce"]["workers"] = len(self.workers)
+        self.run_metadata["distributed"] = {
+            "workers": self.workers,
+            "assignments": self.assignments,
+            "retries": self.retries,
+            "lost_workers": self.lost_workers,
+        }
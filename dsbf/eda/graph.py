@@ -10,26 +10,64 @@ visualization.
 import os
 import time
 from datetime import datetime
-from typing import Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 import networkx as nx
 import psutil
 
 from dsbf.core.base_task import BaseTask
 from dsbf.core.context import AnalysisContext
+from dsbf.eda.task_registry import TaskSpec, task_input_columns
 from dsbf.eda.task_result import TaskResult, error_to_metadata
 from dsbf.utils.dag_layout import assign_waterfall_positions, draw_dag, topo_sort_levels
 
 
 class Task:
     def __init__(
-        self, name: str, task_instance: BaseTask, requires: Optional[List[str]] = None
+        self,
+        name: str,
+        task_instance: Optional[BaseTask] = None,
+        requires: Optional[List[str]] = None,
+        spec: Optional[TaskSpec] = None,
+        config: Optional[Dict[str, Any]] = None,
     ):
+        """
+        A node in the execution graph. Pass either a ready `task_instance` or
+        the task's `spec` and `config`, in which case the task is instantiated
+        only when it runs (and never if no columns are routed to it).
+        """
+        if task_instance is None and spec is None:
+            raise ValueError(f"Task '{name}' needs a task instance or a spec.")
         self.name = name
-        self.task_instance = task_instance
+        self._task_instance = task_instance
+        self.spec = spec
+        self.config = config or {}
         self.requires = requires or []
         self.result: Optional[TaskResult] = None
-        self.status = "pending"  # "success" or "failed"
+        self.status = "pending"  # "success", "failed" or "skipped"
+
+    @property
+    def task_instance(self) -> BaseTask:
+        if self._task_instance is None:
+            assert self.spec is not None
+            self._task_instance = self.spec.cls(name=self.name, config=self.config)
+        return self._task_instance
+
+    def routed_columns(self, context: AnalysisContext) -> Optional[List[str]]:
+        """
+        Columns the engine will hand this task (see `task_input_columns`), or
+        None if it reads every column. Only the schema of `context.data` is
+        inspected.
+        """
+        if self.spec is None or not hasattr(context.data, "columns"):
+            return None
+        return task_input_columns(
+            self.spec,
+            context.data,
+            self.config,
+            semantic_types=context.get_routing_types(),
+            project=context.config.get("engine", {}).get("column_projection", True),
+        )
 
     def run(self, context: AnalysisContext) -> TaskResult:
         try:
@@ -116,6 +154,27 @@ class ExecutionGraph:
                     )
                 continue
 
+            # Nothing to analyse: skip without building the task or its input
+            routed = task.routed_columns(context)
+            if routed is not None and not routed:
+                expected = task.spec.expected_semantic_types if task.spec else None
+                task.status = "skipped"
+                task.result = TaskResult(
+                    name=task.name,
+                    status="skipped",
+                    summary={
+                        "message": (
+                            "[SKIPPED] No columns match the types this task reads."
+                        )
+                    },
+                    metadata={"expected_semantic_types": expected or []},
+                )
+                context.set_result(task.name, task.result)
+                task_outcomes["skipped"].append(task.name)
+                if log_fn:
+                    log_fn(f"\\[{task.name}] Skipped: no matching columns", "info")
+                continue
+
             # Try running the task
             start_time = time.time()
             try:
@@ -0,0 +1,123 @@
+# dsbf/eda/incremental_engine.py
+"""
+Incremental profile engine for append-only datasets.
+
+Keeps the merged task states and a source fingerprint in a profile state file
+between runs. When the source has only grown (rows appended to a file, or new
+files in a partitioned directory), only the new rows are profiled and folded
+into the saved states; any other change triggers a full run.
+"""
+
+import os
+from typing import Any, Dict, Optional
+
+from dsbf.eda.mapreduce_engine import MapReduceProfileEngine
+from dsbf.eda.merge_engine import mergeable_task_names
+from dsbf.utils.incremental import fingerprint_source, plan_appended_partitions
+from dsbf.utils.partition_utils import RowPartition, read_row_partition
+from dsbf.utils.profile_state import load_profile_state, save_profile_state
+
+
+class IncrementalProfileEngine(MapReduceProfileEngine):
+    """
+    Profiles only rows appended since the previous run of the same source.
+
+    Config (`engine.incremental`):
+        state_path: Profile state file read at start and rewritten at the end
+
+    Partitions and workers come from `engine.mapreduce`.
+
+    Args:
+        config (dict or None): Full DSBF config (default config if None).
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        super().__init__(config)
+        inc_cfg = self.config.get("engine", {}).get("incremental") or {}
+        self.state_path = inc_cfg.get("state_path")
+        if not self.state_path:
+            raise ValueError("engine.incremental.state_path is required.")
+
+        self.dataset_path = self.config.get("metadata", {}).get("dataset_path")
+        if not self.dataset_path:
+            raise ValueError("Incremental profiling needs metadata.dataset_path.")
+
+        self.mode = "full"
+        self.reason = "no previous state"
+        self.previous_rows = 0
+        self.fingerprint: Dict[str, Any] = {}
+
+    def run(self):
+        self._log("Starting incremental profiling...", level="stage")
+        self.load_tasks()
+
+        previous = self._load_previous()
+        if previous is not None:
+            pieces, self.fingerprint, self.reason = plan_appended_partitions(
+                self.dataset_path, previous["fingerprint"], self.partition_rows
+            )
+            if pieces is not None:
+                self.mode = "append"
+                self.pieces = list(pieces)
+                self.previous_rows = int(previous.get("rows") or 0)
+
+        if self.mode == "full":
+            self._log(f"Full run ({self.reason})", level="info")
+            self.fingerprint = fingerprint_source(self.dataset_path)
+            self.pieces = self.plan_partitions()
+        else:
+            self._log(
+                f"Appending {len(self.pieces)} new partition(s) to "
+                f"{self.previous_rows} previously profiled rows",
+                level="info",
+            )
+
+        # Type inference needs a frame: the first new partition, or else the
+        # first partition of the whole dataset.
+        first = self.pieces[0] if self.pieces else self.plan_partitions()[0]
+        self.start(
+            read_row_partition(first) if isinstance(first, RowPartition) else first
+        )
+
+        if previous is not None and self.mode == "append":
+            self.fold(previous["tasks"], rows=self.previous_rows)
+        for rows, states in self.map_partitions(list(self.tasks)):
+            self.rows_profiled += rows
+            self.fold(states, rows=rows)
+
+        self.emit(final=True)
+        save_profile_state(
+            self.state_path,
+            self.states,
+            rows=self.rows_merged,
+            sources=[self.dataset_path],
+            extra={"fingerprint": self.fingerprint},
+        )
+        self.record_run()
+        self._log(f"[DONE] Results saved to: {self.output_dir}", level="stage")
+
+    def _load_previous(self) -> Optional[Dict[str, Any]]:
+        """Load the saved state if it belongs to this source and these tasks."""
+        if not os.path.exists(self.state_path):
+            return None
+
+        previous = load_profile_state(self.state_path)
+        if previous.get("sources") != [self.dataset_path]:
+            self.reason = "state belongs to another source"
+        elif "fingerprint" not in previous:
+            self.reason = "state has no source fingerprint"
+        elif set(previous["tasks"]) != set(mergeable_task_names()):
+            self.reason = "task set changed"
+        else:
+            return previous
+        return None
+
+    def describe_run(self, final: bool) -> None:
+        super().describe_run(final)
+        self.run_metadata["incremental"] = {
+            "mode": self.mode,
+            "reason": self.reason,
+            "previous_rows": self.previous_rows,
+            "new_rows": self.rows_profiled,
+            "state_path": self.state_path,
+        }
@@ -0,0 +1,145 @@
+# dsbf/eda/mapreduce_engine.py
+"""
+Map-reduce profile engine.
+
+Splits a dataset into row partitions (files, Parquet row-group ranges, or
+record-aligned byte ranges of text files), computes every mergeable task's
+partial state for each partition in a separate worker process, and merges the
+states into a single report. Work scales with the number of cores while each
+worker only reads and holds one partition.
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+import polars as pl
+
+from dsbf.eda.merge_engine import MergeableProfileEngine, compute_partial_states
+from dsbf.utils.backend import to_polars
+from dsbf.utils.data_loader import load_dataset
+from dsbf.utils.partition_utils import (
+    RowPartition,
+    is_partitioned_path,
+    plan_row_partitions,
+    read_row_partition,
+)
+from dsbf.utils.sketches import iter_slices
+
+Piece = Union[RowPartition, pl.DataFrame]
+
+
+def profile_partition(
+    piece: Piece, config: Dict[str, Any], task_names: List[str]
+) -> Tuple[int, Dict[str, Any]]:
+    """
+    Worker entry point: load one partition and compute its partial states.
+
+    Returns:
+        Tuple[int, Dict[str, Any]]: (row count, partial state per task).
+    """
+    df = read_row_partition(piece) if isinstance(piece, RowPartition) else piece
+    return df.height, compute_partial_states(df, config, task_names)
+
+
+class MapReduceProfileEngine(MergeableProfileEngine):
+    """
+    Profiles row partitions in parallel worker processes and merges the results.
+
+    Config (`engine.mapreduce`):
+        max_workers: Worker processes (default: CPU count; 1 = in-process)
+        partition_rows: Target rows per partition (default 1,000,000)
+        start_method: multiprocessing start method (default 'spawn')
+
+    Only mergeable tasks run; their results match a single-pass run except
+    where a task documents an approximation (quantile sketches, and the
+    frequent-items sketches behind merged value counts and null patterns once
+    their capacity is exceeded). Approximate results carry
+    `metadata["approximate"]` and are listed in the run metadata.
+
+    Args:
+        config (dict or None): Full DSBF config (default config if None).
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        super().__init__(config)
+        mr_cfg = self.config.get("engine", {}).get("mapreduce") or {}
+        self.max_workers = int(mr_cfg.get("max_workers") or os.cpu_count() or 1)
+        self.partition_rows = int(mr_cfg.get("partition_rows") or 1_000_000)
+        self.start_method = mr_cfg.get("start_method", "spawn")
+        self.pieces: List[Piece] = []
+        self.rows_profiled = 0
+
+    def run(self):
+        self._log("Starting map-reduce profiling...", level="stage")
+        self.load_tasks()
+
+        self.pieces = self.plan_partitions()
+        first = self.pieces[0]
+        self.start(
+            read_row_partition(first) if isinstance(first, RowPartition) else first
+        )
+
+        for rows, states in self.map_partitions(list(self.tasks)):
+            self.rows_profiled += rows
+            self.fold(states, rows=rows)
+
+        self.emit(final=True)
+        self.record_run()
+        self._log(f"[DONE] Results saved to: {self.output_dir}", level="stage")
+
+    def plan_partitions(self) -> List[Piece]:
+        """Split the configured dataset into partitions."""
+        meta = self.config.get("metadata", {})
+        dataset_path = meta.get("dataset_path")
+
+        if dataset_path and (
+            is_partitioned_path(dataset_path) or os.path.exists(dataset_path)
+        ):
+            pieces: List[Piece] = list(
+                plan_row_partitions(dataset_path, self.partition_rows)
+            )
+        else:
+            # Built-in datasets are already in memory: split them into slices
+            df = to_polars(
+                load_dataset(
+                    name=meta.get("dataset_name", "iris"),
+                    source=meta.get("dataset_source", "sklearn"),
+                    backend="polars",
+                )
+            )
+            pieces = list(iter_slices(df, self.partition_rows))
+
+        if not pieces:
+            raise ValueError("No partitions found for the configured dataset.")
+        self._log(f"Planned {len(pieces)} partition(s)", level="info")
+        return pieces
+
+    def map_partitions(
+        self, task_names: List[str]
+    ) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """Yield (rows, partial states) for every partition."""
+        workers = min(self.max_workers, len(self.pieces))
+        if workers <= 1:
+            for piece in self.pieces:
+                yield profile_partition(piece, self.config, task_names)
+            return
+
+        self._log(f"Profiling partitions with {workers} worker(s)", level="info")
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context(self.start_method),
+        ) as executor:
+            yield from executor.map(
+                profile_partition, self.pieces, repeat(self.config), repeat(task_names)
+            )
+
+    def describe_run(self, final: bool) -> None:
+        self.run_metadata["mapreduce"] = {
+            "partitions": len(self.pieces),
+            "workers": min(self.max_workers, len(self.pieces)),
+            "partition_rows": self.partition_rows,
+            "rows": self.rows_profiled,
+        }
@@ -0,0 +1,279 @@
+# dsbf/eda/merge_engine.py
+"""
+Shared machinery for engines that build a profile from mergeable task states.
+
+Tasks that set `mergeable = True` implement `partial(chunk) -> state`,
+`merge(states) -> state`, and `finalize(state)`. Engines in this family compute
+partial states over pieces of a dataset (stream batches, row partitions in
+worker processes, ...), merge them, and finalize once into a regular report.
+With `engine.save_profile_state` the merged states are also written to
+`profile_state.json`, so later runs can merge them without the raw data.
+
+Merged results are exact unless a task's bounded sketch had to approximate
+(quantiles, or top-k counts past the sketch capacity); such results set
+`metadata["approximate"]` and are listed in `approximate_results` in the run
+metadata.
+"""
+
+import os
+from typing import Any, Dict, List, Optional
+
+import polars as pl
+
+from dsbf.config import load_default_config
+from dsbf.core.base_engine import BaseEngine
+from dsbf.core.base_task import BaseTask
+from dsbf.core.context import AnalysisContext
+from dsbf.eda.task_registry import (
+    TASK_REGISTRY,
+    get_all_task_specs,
+    load_task_group,
+    set_plugin_logger,
+)
+from dsbf.utils.profile_state import (
+    PROFILE_STATE_FILE,
+    load_profile_state,
+    save_profile_state,
+)
+from dsbf.utils.report_utils import render_user_report, write_metadata_report
+from dsbf.utils.task_utils import instantiate_task
+
+
+def mergeable_task_names() -> List[str]:
+    """Names of registered, non-experimental tasks that support merging."""
+    return [
+        spec.name
+        for spec in get_all_task_specs()
+        if not spec.experimental and getattr(spec.cls, "mergeable", False)
+    ]
+
+
+def compute_partial_states(
+    chunk: Any, config: Dict[str, Any], task_names: List[str]
+) -> Dict[str, Any]:
+    """
+    Compute every task's partial state for one piece of a dataset.
+
+    Runs standalone (e.g. in a worker process): loads the configured task groups
+    and builds a throwaway context, so only the chunk and config are needed.
+
+    Returns:
+        Dict[str, Any]: Partial state per task name.
+    """
+    for group in config.get("task_groups", ["core"]):
+        load_task_group(group)
+
+    context = AnalysisContext(data=chunk, config=config)
+    task_cfg = config.get("tasks", {})
+    states: Dict[str, Any] = {}
+    for name in task_names:
+        task = instantiate_task(name, task_cfg.get(name, {}))
+        task.context = context
+        states[name] = task.partial(chunk)
+    return states
+
+
+def merge_partial_states(
+    partials: List[Dict[str, Any]], config: Dict[str, Any], task_names: List[str]
+) -> Dict[str, Any]:
+    """
+    Merge per-piece partial states (as returned by `compute_partial_states`)
+    into one state per task name.
+    """
+    context = AnalysisContext(data=None, config=config)
+    task_cfg = config.get("tasks", {})
+    merged: Dict[str, Any] = {}
+    for name in task_names:
+        states = [p[name] for p in partials if name in p]
+        if not states:
+            continue
+        task = instantiate_task(name, task_cfg.get(name, {}))
+        task.context = context
+        merged[name] = states[0] if len(states) == 1 else task.merge(states)
+    return merged
+
+
+class MergeableProfileEngine(BaseEngine):
+    """
+    Base engine that folds partial task states and finalizes them into a report.
+
+    Subclasses decide where partial states come from and call `start()` with a
+    representative frame (used for type inference), `fold()` with new states,
+    and `emit()` to write the report.
+
+    Args:
+        config (dict or None): Full DSBF config (default config if None).
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        super().__init__(config or load_default_config())
+        self.context: Optional[AnalysisContext] = None
+        self.results: dict = {}
+        self.tasks: Dict[str, BaseTask] = {}
+        self.states: Dict[str, Any] = {}
+        self.rows_merged = 0
+        self.state_extra: Dict[str, Any] = {}
+
+        meta = self.config.get("metadata", {})
+        source = meta.get("dataset_path") or meta.get("dataset_name")
+        self.sources: List[str] = [str(source)] if source else []
+        self.save_state = bool(
+            self.config.get("engine", {}).get("save_profile_state", False)
+        )
+
+    def get_result(self, task_name: str):
+        return self.results.get(task_name)
+
+    def get_all_results(self):
+        return self.results
+
+    def load_tasks(self) -> None:
+        set_plugin_logger(self._log)
+        for group in self.config.get("task_groups", ["core"]):
+            load_task_group(group)
+
+    def start(
+        self, sample: Optional[pl.DataFrame], task_names: Optional[List[str]] = None
+    ) -> None:
+        """
+        Create the context, infer types from `sample` (skipped if None), and
+        pick tasks (all mergeable tasks unless `task_names` is given).
+        """
+        self.context = AnalysisContext(
+            data=sample,
+            config=self.config,
+            output_dir=self.output_dir,
+            run_metadata=self.run_metadata,
+        )
+
+        task_cfg = self.config.get("tasks", {})
+        if sample is not None and "infer_types" in TASK_REGISTRY:
+            self.context.run_task(
+                instantiate_task("infer_types", task_cfg.get("infer_types", {}))
+            )
+
+        for name in task_names or mergeable_task_names():
+            task = instantiate_task(name, task_cfg.get(name, {}))
+            task.context = self.context
+            self.tasks[name] = task
+
+        self._log(
+            f"Merging {len(self.tasks)} mergeable task(s): {sorted(self.tasks)}",
+            level="info",
+        )
+
+    def fold(self, *partials: Dict[str, Any], rows: int = 0) -> None:
+        """
+        Merge partial states (one dict of task -> state per piece) in place;
+        `rows` is the number of rows the partials cover.
+        """
+        self.rows_merged += rows
+        for name, task in self.tasks.items():
+            states = [p[name] for p in partials if name in p]
+            if name in self.states:
+                states.insert(0, self.states[name])
+            if states:
+                self.states[name] = (
+                    states[0] if len(states) == 1 else task.merge(states)
+                )
+
+    def emit(self, final: bool = True) -> None:
+        """Finalize the current states and write the report and metadata."""
+        assert self.context is not None
+        for name, task in self.tasks.items():
+            if name not in self.states:
+                continue
+            task.finalize(self.states[name])
+            result = task.get_output()
+            if result is not None:
+                self.context.set_result(name, result)
+
+        self.results = dict(self.context.results)
+        self.run_metadata["approximate_results"] = sorted(
+            name
+            for name, result in self.results.items()
+            if name in self.tasks and (result.metadata or {}).get("approximate")
+        )
+        self.describe_run(final)
+
+        if not self.config.get("metadata", {}).get("disable_report", False):
+            render_user_report(
+                results=self.context.results,
+                output_path=os.path.join(self.output_dir, "report.json"),
+            )
+        if self.save_state:
+            save_profile_state(
+                os.path.join(self.output_dir, PROFILE_STATE_FILE),
+                self.states,
+                rows=self.rows_merged,
+                sources=self.sources,
+                extra=self.state_extra,
+            )
+        write_metadata_report(self.context)
+
+    def describe_run(self, final: bool) -> None:
+        """Hook for subclasses to record engine-specific run metadata."""
+
+
+class ProfileStateMergeEngine(MergeableProfileEngine):
+    """
+    Builds one report from saved profile states without touching raw data.
+
+    Each input is a `profile_state.json` file (or the run directory holding
+    it). Tasks present in any input are merged; the combined state is saved
+    again so rollups can themselves be merged later. Inputs saved from a
+    sample (`sampled: true`) are merged with a warning, and the rollup stays
+    marked as sampled.
+
+    Args:
+        state_paths (list): Profile state files or run directories.
+        config (dict or None): Full DSBF config (default config if None).
+    """
+
+    def __init__(self, state_paths: List[str], config: Optional[Dict[str, Any]] = None):
+        super().__init__(config)
+        if not state_paths:
+            raise ValueError("At least one profile state is required to merge.")
+        self.state_paths = list(state_paths)
+        self.sources = []
+        self.save_state = True
+
+    def run(self):
+        self._log(f"Merging {len(self.state_paths)} profile state(s)...", level="stage")
+        self.load_tasks()
+
+        profiles = [load_profile_state(path) for path in self.state_paths]
+        mergeable = set(mergeable_task_names())
+        task_names = sorted(
+            {name for p in profiles for name in p["tasks"] if name in mergeable}
+        )
+        self.start(None, task_names=task_names)
+
+        sampled_inputs = []
+        for path, profile in zip(self.state_paths, profiles):
+            self.sources.extend(s for s in profile["sources"] if s not in self.sources)
+            self.fold(profile["tasks"], rows=int(profile.get("rows") or 0))
+            self._log(f"Merged {path} ({profile.get('rows')} rows)", level="info")
+            if profile.get("sampled"):
+                sampled_inputs.append(path)
+                self._log(
+                    f"{path} was saved from a {profile.get('sampling_strategy')} "
+                    f"sample of {profile.get('rows')} of "
+                    f"{profile.get('source_rows')} rows; merged results only "
+                    "cover the sampled rows",
+                    level="warn",
+                )
+        if sampled_inputs:
+            self.state_extra = {"sampled": True, "sampled_inputs": sampled_inputs}
+
+        self.emit(final=True)
+        self.record_run()
+        self._log(f"[DONE] Results saved to: {self.output_dir}", level="stage")
+
+    def describe_run(self, final: bool) -> None:
+        self.run_metadata["merged_profiles"] = {
+            "inputs": self.state_paths,
+            "sources": self.sources,
+            "rows": self.rows_merged,
+            "sampled_inputs": self.state_extra.get("sampled_inputs", []),
+        }
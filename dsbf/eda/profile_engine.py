@@ -1,7 +1,8 @@
 # dsbf/eda/profile_engine.py
 
+import json
 import os
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 import networkx as nx
 import pandas as pd
@@ -11,19 +12,52 @@ from dsbf.config import load_default_config
 from dsbf.core.base_engine import BaseEngine
 from dsbf.core.context import AnalysisContext
 from dsbf.eda.graph import ExecutionGraph, Task
+from dsbf.eda.merge_engine import (
+    compute_partial_states,
+    merge_partial_states,
+    mergeable_task_names,
+)
 from dsbf.eda.stage_inference import infer_stage
 from dsbf.eda.task_registry import (
     TASK_REGISTRY,
+    TaskSpec,
     get_all_task_specs,
     get_plugin_warnings,
     load_task_group,
     set_plugin_logger,
 )
+from dsbf.utils.backend import columns_of_class
 from dsbf.utils.config_validation import validate_config_and_graph
-from dsbf.utils.data_loader import load_dataset
+from dsbf.utils.data_loader import load_dataset, load_parquet
 from dsbf.utils.data_utils import data_sampling
+from dsbf.utils.filesystem import (
+    DEFAULT_BLOCK_SIZE,
+    DEFAULT_CACHE_MAX_BYTES,
+    BlockCache,
+    RemoteFile,
+    get_filesystem,
+    is_remote_path,
+    read_remote_parquet,
+    read_remote_table,
+)
+from dsbf.utils.parquet_utils import (
+    is_parquet_path,
+    merge_footer_stats,
+    read_parquet_footer_stats,
+)
+from dsbf.utils.partition_utils import (
+    discover_partitions,
+    filter_partitions,
+    is_partitioned_path,
+    load_partitions,
+    plan_row_partitions,
+    read_row_partition,
+)
+from dsbf.utils.profile_state import PROFILE_STATE_FILE, save_profile_state
+from dsbf.utils.progressive import CONVERGENCE_TASKS
 from dsbf.utils.report_utils import render_user_report, write_metadata_report
-from dsbf.utils.task_utils import filter_tasks, instantiate_task
+from dsbf.utils.sql_source import SQLSource
+from dsbf.utils.task_utils import filter_tasks
 
 
 class ProfileEngine(BaseEngine):
@@ -38,6 +72,10 @@ class ProfileEngine(BaseEngine):
         self.context: Optional[AnalysisContext] = None
         self.results: dict = {}
         self.inferred_stage: Optional[str] = None
+        self.source_stats: Optional[Dict[str, Any]] = None
+        self.partition_summaries: Dict[str, Dict[str, Any]] = {}
+        self.data_source: Optional[Any] = None
+        self.load_sampling: Optional[Dict[str, Any]] = None
 
     def get_result(self, task_name: str):
         return self.results.get(task_name)
@@ -48,40 +86,44 @@ class ProfileEngine(BaseEngine):
     def run(self):
         self._log("Starting profiling...", level="stage")
 
+        # Load tasks into the global registry (their column needs drive loading)
+        task_groups = self.config.get("task_groups", ["core"])
+        self._log(f"Loading task groups: {task_groups}", level="stage")
+
+        set_plugin_logger(self._log)
+
+        for group in task_groups:
+            load_task_group(group)
+
         df = self._load_data()
-        df, sampling_info = data_sampling(df, self.config, log_fn=self._log)
+        # Set when the loader itself read only part of the source
+        self.load_sampling = self.run_metadata.get("sampling")
+
+        reference_path = self.config.get("engine", {}).get("reference_dataset_path")
+        reference_df = self._load_reference(reference_path) if reference_path else None
+
+        full_df = df
+        df, sampling_info = data_sampling(
+            df, self.config, log_fn=self._log, reference_df=reference_df
+        )
 
         if sampling_info:
             self.run_metadata["sampling"] = sampling_info
 
-        reference_path = self.config.get("engine", {}).get("reference_dataset_path")
-        if reference_path and os.path.exists(reference_path):
-            self._log(f"Loading reference dataset from: {reference_path}", level="info")
-            reference_df = pd.read_csv(reference_path)
-        else:
-            reference_df = None
-            if reference_path:
-                self._log(
-                    f"[WARNING] Reference path '{reference_path}' not found.",
-                    level="info",
-                )
-
         self.context = AnalysisContext(
             data=df,
             config=self.config,
             output_dir=self.output_dir,
             run_metadata=self.run_metadata,
             reference_data=reference_df,
+            data_source=self.data_source,
         )
 
-        # Load tasks into the global registry
-        task_groups = self.config.get("task_groups", ["core"])
-        self._log(f"Loading task groups: {task_groups}", level="stage")
-
-        set_plugin_logger(self._log)
-
-        for group in task_groups:
-            load_task_group(group)
+        if self.source_stats:
+            self.context.set_metadata("source_stats", self.source_stats)
+            self.run_metadata["stats_source"] = self.source_stats["source"]
+        if self.partition_summaries:
+            self.context.set_metadata("partition_summaries", self.partition_summaries)
 
         plugin_warnings = get_plugin_warnings()
         if plugin_warnings:
@@ -109,10 +151,15 @@ class ProfileEngine(BaseEngine):
         self.run_metadata["inferred_stage"] = self.inferred_stage
         self._log(f"Inferred data stage: {self.inferred_stage}", level="stage")
 
+        if self.config.get("engine", {}).get("approximate", False):
+            self.run_metadata["approximate"] = True
+            self._log("Approximate mode: using mergeable sketches", level="info")
+
         # Build graph and run tasks
         self._log("Building execution graph...", level="info")
         graph = self.build_graph()
         self.results = graph.run(self.context, log_fn=self._log)
+        self._annotate_convergence()
 
         # Optional DAG visualization
         if self.config.get("metadata", {}).get("visualize_dag", False):
@@ -130,12 +177,105 @@ class ProfileEngine(BaseEngine):
                 output_path=os.path.join(self.output_dir, "report.json"),
             )
 
+        # Per-partition summaries next to the combined report
+        if self.partition_summaries:
+            with open(os.path.join(self.output_dir, "partition_report.json"), "w") as f:
+                json.dump(self.partition_summaries, f, indent=2, default=str)
+
+        if self.config.get("engine", {}).get("save_profile_state", False):
+            self._save_profile_state(full_df)
+
         # Write separate runtime metadata
         write_metadata_report(self.context)
 
         self.record_run()
         self._log(f"[DONE] Results saved to: {self.output_dir}", level="stage")
 
+    def _save_profile_state(self, df: Any) -> None:
+        """
+        Write the mergeable tasks' states over the full dataset to
+        `profile_state.json`, so this run can later be merged with others.
+
+        `df` is the loaded frame before task sampling. When the loader read only
+        part of a local file (head rows or projected columns), the states are
+        built in a second pass over the whole file, one row partition at a time.
+        Other partial loads (SQL extracts, remote heads) are saved from the
+        loaded rows and marked `sampled`, which `dsbf merge` reports.
+        """
+        task_names = mergeable_task_names()
+        meta = self.config.get("metadata", {})
+        dataset_path = meta.get("dataset_path")
+        source = dataset_path or meta.get("dataset_name")
+        partial_load = bool(
+            self.load_sampling
+            or self.run_metadata.get("projected_columns")
+            or isinstance(df, pl.LazyFrame)
+        )
+
+        extra: Dict[str, Any] = {}
+        if not partial_load:
+            states = compute_partial_states(df, self.config, task_names)
+            rows = df.shape[0]
+        elif dataset_path and os.path.isfile(dataset_path):
+            # Same partition size as the map-reduce engine keeps memory bounded
+            partition_rows = int(
+                (self.config.get("engine", {}).get("mapreduce") or {}).get(
+                    "partition_rows"
+                )
+                or 1_000_000
+            )
+            partials, rows = [], 0
+            for partition in plan_row_partitions(dataset_path, partition_rows):
+                chunk = read_row_partition(partition)
+                rows += chunk.height
+                partials.append(compute_partial_states(chunk, self.config, task_names))
+            states = merge_partial_states(partials, self.config, task_names)
+            self._log(f"Built profile state over all {rows} rows", level="info")
+        else:
+            if isinstance(df, pl.LazyFrame):
+                df = self.context.data if self.context else df.collect()
+            sampling = self.load_sampling or {}
+            states = compute_partial_states(df, self.config, task_names)
+            rows = df.shape[0]
+            extra = {
+                "sampled": True,
+                "source_rows": sampling.get("original_rows"),
+                "sampling_strategy": sampling.get("strategy", "unknown"),
+            }
+            self._log(
+                f"Profile state covers a sample of {rows} rows "
+                f"({extra['sampling_strategy']}); it is marked as sampled",
+                level="warn",
+            )
+
+        path = save_profile_state(
+            os.path.join(self.output_dir, PROFILE_STATE_FILE),
+            states,
+            rows=rows,
+            sources=[str(source)] if source else [],
+            extra=extra,
+        )
+        self.run_metadata["profile_state"] = path
+        self._log(f"Saved profile state to {path}", level="info")
+
+    def _annotate_convergence(self) -> None:
+        """
+        Record on each task result the progressive-sampling size at which the
+        statistics it depends on converged.
+        """
+        converged_at = (self.run_metadata.get("sampling") or {}).get(
+            "converged_at_rows"
+        )
+        if not converged_at:
+            return
+        for family, task_names in CONVERGENCE_TASKS.items():
+            if family not in converged_at:
+                continue
+            for name in task_names:
+                result = self.results.get(name)
+                if result is not None:
+                    result.metadata["converged_at_rows"] = converged_at[family]
+
     def _load_data(self) -> Union[pd.DataFrame, pl.DataFrame]:
         dataset_path = self.config.get("metadata", {}).get("dataset_path")
         dataset_name = self.config.get("metadata", {}).get("dataset_name", "iris")
@@ -145,9 +285,25 @@ class ProfileEngine(BaseEngine):
 
         backend = self.config.get("engine", {}).get("backend", "pandas")
 
+        sql_cfg = self.config.get("metadata", {}).get("sql_source")
+        if sql_cfg:
+            self._log(f"Loading SQL table: {sql_cfg.get('table')}", level="stage")
+            return self._load_sql(sql_cfg, backend)
+
+        if is_remote_path(dataset_path):
+            self._log(f"Loading remote dataset from: {dataset_path}", level="stage")
+            return self._load_remote(dataset_path, backend)
+
+        if is_partitioned_path(dataset_path):
+            self._log(f"Loading partitioned dataset from: {dataset_path}", "stage")
+            return self._load_partitioned(dataset_path, backend)
+
         if dataset_path and os.path.exists(dataset_path):
             self._log(f"Loading dataset from: {dataset_path}", level="stage")
-            return pd.read_csv(dataset_path)
+            columns = self._required_columns(dataset_path)
+            if is_parquet_path(dataset_path):
+                return self._load_parquet(dataset_path, backend, columns)
+            return pd.read_csv(dataset_path, usecols=columns)
 
         self._log(
             f"Loading built-in dataset: {dataset_name} from {dataset_source}",
@@ -155,8 +311,246 @@ class ProfileEngine(BaseEngine):
         )
         return load_dataset(name=dataset_name, source=dataset_source, backend=backend)
 
-    def build_graph(self) -> ExecutionGraph:
+    def _required_columns(self, dataset_path: str) -> Optional[List[str]]:
+        """
+        Columns of a local file that some selected task reads, or None to read
+        them all.
+
+        Projection applies only when every selected task declares the column
+        classes it reads (`reads` in `register_task`); type inference simply
+        types whatever is loaded.
+        """
+        if not self.config.get("engine", {}).get("column_projection", True):
+            return None
+
+        specs = [s for s in self.select_task_specs() if s.name != "infer_types"]
+        if not specs or any(spec.reads is None for spec in specs):
+            return None
+
+        schema = (
+            pl.read_parquet_schema(dataset_path)
+            if is_parquet_path(dataset_path)
+            else pl.scan_csv(dataset_path, infer_schema_length=10_000).collect_schema()
+        )
+        needed = {self.config.get("resource_limits", {}).get("stratify_column")}
+        task_cfg = self.config.get("tasks", {})
+        for spec in specs:
+            needed.update(columns_of_class(schema, spec.reads or []))
+            for key in spec.column_params or []:
+                value = task_cfg.get(spec.name, {}).get(key)
+                needed.update([value] if isinstance(value, str) else value or [])
+
+        columns = [col for col in schema if col in needed]
+        if not columns or len(columns) == len(schema):
+            return None
 
+        self._log(
+            f"Reading {len(columns)} of {len(schema)} columns needed by the "
+            "selected tasks",
+            level="info",
+        )
+        self.run_metadata["projected_columns"] = columns
+        return columns
+
+    def _load_parquet(
+        self, dataset_path: str, backend: str, columns: Optional[List[str]] = None
+    ) -> Union[pd.DataFrame, pl.DataFrame]:
+        """
+        Load a Parquet dataset, answering exact summary statistics from the footer.
+
+        When footer statistics are enabled, row counts, null counts, and min/max
+        values are read from the file metadata and shared with tasks through the
+        context. If head sampling would truncate the file anyway, only the leading
+        rows are decoded since the exact totals are already known from the footer.
+        """
+        if not self.config.get("engine", {}).get("parquet_footer_stats", True):
+            return load_parquet(dataset_path, backend=backend, columns=columns)
+
+        self.source_stats = read_parquet_footer_stats(dataset_path)
+        n_rows = self._parquet_row_limit(self.source_stats)
+        return load_parquet(
+            dataset_path, backend=backend, n_rows=n_rows, columns=columns
+        )
+
+    def _parquet_row_limit(self, footer_stats: Dict[str, Any]) -> Optional[int]:
+        """
+        Return how many leading rows to decode when head sampling applies to a
+        Parquet file whose exact totals are known from its footer.
+        """
+        total_rows = footer_stats["num_rows"]
+        self._log(
+            f"Read Parquet footer statistics ({total_rows} rows, "
+            f"{footer_stats['num_row_groups']} row group(s))",
+            level="info",
+        )
+
+        limits = self.config.get("resource_limits", {})
+        threshold = limits.get("sample_threshold_rows", 1_000_000)
+        if (
+            limits.get("enable_sampling", True)
+            and limits.get("sample_strategy", "head") == "head"
+            and total_rows > threshold
+        ):
+            self._log(
+                f"Reading first {threshold} of {total_rows} rows (head sampling)",
+                level="info",
+            )
+            self.run_metadata["sampling"] = {
+                "original_rows": total_rows,
+                "sampled_rows": threshold,
+                "strategy": "head",
+            }
+            return threshold
+        return None
+
+    def _load_remote(
+        self, dataset_path: str, backend: str
+    ) -> Union[pd.DataFrame, pl.DataFrame]:
+        """
+        Load a dataset from an object store URL (e.g. `s3://bucket/key.parquet`).
+
+        Reads go through the pluggable filesystem layer as byte ranges backed by
+        a local block cache. For Parquet, only the footer and the required row
+        groups are fetched, with row groups read in parallel.
+        """
+        engine_cfg = self.config.get("engine", {})
+        cache = self._block_cache(dataset_path)
+
+        if not is_parquet_path(dataset_path):
+            df = read_remote_table(dataset_path, cache)
+        else:
+            n_rows = None
+            if engine_cfg.get("parquet_footer_stats", True):
+                self.source_stats = read_parquet_footer_stats(
+                    RemoteFile(cache, dataset_path)
+                )
+                n_rows = self._parquet_row_limit(self.source_stats)
+            df = read_remote_parquet(
+                dataset_path,
+                cache,
+                max_workers=engine_cfg.get("max_workers"),
+                n_rows=n_rows,
+            )
+
+        self._log(
+            f"Fetched {cache.remote_reads} block(s) from {dataset_path}", level="info"
+        )
+        return df if backend == "polars" else df.to_pandas()
+
+    def _block_cache(self, path: str) -> BlockCache:
+        """Build a block cache for a remote path from `engine.filesystem`."""
+        fs_cfg = dict(self.config.get("engine", {}).get("filesystem") or {})
+        cache_dir = fs_cfg.pop("cache_dir", None)
+        block_size_mb = fs_cfg.pop("block_size_mb", None)
+        block_size = (
+            int(block_size_mb * 1024 * 1024) if block_size_mb else DEFAULT_BLOCK_SIZE
+        )
+        max_cache_mb = fs_cfg.pop("max_cache_mb", DEFAULT_CACHE_MAX_BYTES / 1024**2)
+        return BlockCache(
+            get_filesystem(path, fs_cfg),
+            cache_dir=cache_dir,
+            block_size=block_size,
+            max_bytes=int(max_cache_mb * 1024 * 1024) if max_cache_mb else None,
+        )
+
+    def _load_reference(self, reference_path: str) -> Optional[pd.DataFrame]:
+        """Load the reference dataset (local or remote) as a pandas DataFrame."""
+        if is_remote_path(reference_path):
+            self._log(f"Loading reference dataset from: {reference_path}", "info")
+            return read_remote_table(
+                reference_path, self._block_cache(reference_path)
+            ).to_pandas()
+
+        if os.path.exists(reference_path):
+            self._log(f"Loading reference dataset from: {reference_path}", "info")
+            if is_parquet_path(reference_path):
+                return pd.read_parquet(reference_path)
+            return pd.read_csv(reference_path)
+
+        self._log(f"[WARNING] Reference path '{reference_path}' not found.", "info")
+        return None
+
+    def _load_partitioned(
+        self, dataset_path: str, backend: str
+    ) -> Union[pd.DataFrame, pl.DataFrame]:
+        """
+        Load a Hive-partitioned directory or glob, keeping only the partitions
+        selected by `metadata.partition_filter`.
+
+        Partitions are read in parallel and concatenated. Partition values are
+        added as string columns, and per-partition summaries are collected when
+        `metadata.per_partition_summaries` is enabled.
+        """
+        metadata_cfg = self.config.get("metadata", {})
+        partitions = discover_partitions(dataset_path)
+        selected = filter_partitions(partitions, metadata_cfg.get("partition_filter"))
+        self._log(
+            f"Selected {len(selected)} of {len(partitions)} partition(s)",
+            level="info",
+        )
+
+        df, self.partition_summaries = load_partitions(
+            selected,
+            max_workers=self.config.get("engine", {}).get("max_workers"),
+            summarize=bool(metadata_cfg.get("per_partition_summaries", False)),
+        )
+        self.run_metadata["partitions"] = {
+            "total": len(partitions),
+            "selected": [p.label for p in selected],
+        }
+
+        files = [path for p in selected for path in p.files]
+        if self.config.get("engine", {}).get("parquet_footer_stats", True) and all(
+            is_parquet_path(path) for path in files
+        ):
+            self.source_stats = merge_footer_stats(
+                [read_parquet_footer_stats(path) for path in files]
+            )
+            # Partition columns shared by every selected partition are never null
+            shared_keys = set.intersection(*(set(p.values) for p in selected))
+            for key in shared_keys:
+                self.source_stats["columns"].setdefault(
+                    key, {"null_count": 0, "non_null_count": df.height}
+                )
+            self.source_stats["num_columns"] = df.width
+
+        return df if backend == "polars" else df.to_pandas()
+
+    def _load_sql(
+        self, sql_cfg: Dict[str, Any], backend: str
+    ) -> Union[pd.DataFrame, pl.DataFrame]:
+        """
+        Profile a database table with SQL pushdown.
+
+        Counts, null counts, min/max/avg, distinct counts, top-k value counts, and
+        histogram buckets are computed in the database and shared as
+        `source_stats`. Tasks receive a sampled extract for row-level analysis; the
+        connection is closed once both are fetched.
+        """
+        source = SQLSource.from_config(sql_cfg)
+        self.data_source = source
+        try:
+            self.source_stats = source.compute_stats()
+            df = source.sample()
+        finally:
+            source.close()
+        total_rows = self.source_stats["num_rows"]
+        self._log(
+            f"Pushed down aggregations over {total_rows} rows; "
+            f"extracted {len(df)} sampled row(s)",
+            level="info",
+        )
+        if len(df) < total_rows:
+            self.run_metadata["sampling"] = {
+                "original_rows": total_rows,
+                "sampled_rows": len(df),
+                "strategy": "sql_random",
+            }
+
+        return pl.from_pandas(df) if backend == "polars" else df
+
+    def select_task_specs(self) -> List[TaskSpec]:
+        """Registered tasks selected by depth, domain, stage and runtime filters."""
         selected_depth = self.config.get("metadata", {}).get("profiling_depth", "full")
         PROFILING_DEPTH = {
             "basic": 1,
@@ -217,6 +611,10 @@ class ProfileEngine(BaseEngine):
             f"Selected {len(filtered_specs)} tasks after filtering and depth checks",
             "info",
         )
+        return filtered_specs
+
+    def build_graph(self) -> ExecutionGraph:
+        filtered_specs = self.select_task_specs()
 
         G = nx.DiGraph()
         for spec in filtered_specs:
@@ -234,10 +632,14 @@ class ProfileEngine(BaseEngine):
         for task_name in sorted_names:
             try:
                 task_specific_cfg = self.config.get("tasks", {}).get(task_name, {})
-                task_instance = instantiate_task(task_name, task_specific_cfg)
                 requires = list(G.predecessors(task_name))
                 tasks.append(
-                    Task(name=task_name, task_instance=task_instance, requires=requires)
+                    Task(
+                        name=task_name,
+                        requires=requires,
+                        spec=TASK_REGISTRY[task_name],
+                        config=task_specific_cfg,
+                    )
                 )
             except KeyError:
                 self._log(
@@ -0,0 +1,225 @@
+# dsbf/eda/stream_engine.py
+"""
+Streaming profile engine.
+
+Profiles NDJSON or CSV records read from stdin (or any text stream) in fixed-size
+record batches. Each batch updates the mergeable partial state of every task that
+implements partial/merge/finalize, so memory stays bounded by the batch size and
+sketch capacities no matter how long the stream runs. Reports are written in the
+usual `report.json` format periodically and again at end of input.
+"""
+
+import csv
+import io
+import itertools
+import sys
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO
+
+import polars as pl
+
+from dsbf.eda.merge_engine import MergeableProfileEngine
+
+STREAM_FORMATS = ("auto", "ndjson", "csv")
+
+
+def widen_dtype(known: pl.DataType, new: pl.DataType) -> Optional[pl.DataType]:
+    """
+    Dtype holding the values of both `known` and `new` without loss, or None
+    if there is none (the caller keeps `known` and coerces).
+    """
+    if new == known or new == pl.Null:
+        return known
+    if known == pl.Null:
+        return new
+    if known.is_numeric() and new.is_numeric():
+        if known.is_float() or new.is_float():
+            return pl.Float64
+        return pl.Int64
+    if known == pl.Date and new == pl.Datetime:
+        return new
+    return None
+
+
+class StreamingProfileEngine(MergeableProfileEngine):
+    """
+    Profiles an unbounded record stream with mergeable task accumulators.
+
+    Config (`engine.streaming`):
+        format: 'auto' | 'ndjson' | 'csv' (auto-detects NDJSON from a leading '{')
+        batch_rows: Records per batch (default 10,000)
+        emit_every_batches: Rewrite the report every N batches (0 = only at EOF)
+
+    Args:
+        config (dict or None): Full DSBF config (default config if None).
+        stream (TextIO or None): Text stream to read (default: sys.stdin).
+    """
+
+    def __init__(
+        self, config: Optional[Dict[str, Any]] = None, stream: Optional[TextIO] = None
+    ):
+        super().__init__(config)
+        self.stream = stream if stream is not None else sys.stdin
+
+        stream_cfg = self.config.get("engine", {}).get("streaming") or {}
+        self.input_format = stream_cfg.get("format", "auto")
+        if self.input_format not in STREAM_FORMATS:
+            raise ValueError(
+                f"Unsupported stream format '{self.input_format}'. "
+                f"Expected one of {STREAM_FORMATS}."
+            )
+        self.batch_rows = int(stream_cfg.get("batch_rows", 10_000))
+        self.emit_every = int(stream_cfg.get("emit_every_batches", 0))
+
+        self.schema: Optional[Dict[str, pl.DataType]] = None
+        self.rows_seen = 0
+        self.batches_seen = 0
+        self.coerced_values: Dict[str, int] = {}
+        self._csv_header: Optional[List[str]] = None
+
+    def run(self):
+        self._log("Starting streaming profiling...", level="stage")
+
+        self.load_tasks()
+
+        for batch in self.iter_batches():
+            if self.context is None:
+                self.start(batch)
+            self.update(batch)
+
+            if self.emit_every and self.batches_seen % self.emit_every == 0:
+                self.emit(final=False)
+
+        if self.context is None:
+            raise ValueError("No records received on the input stream.")
+
+        self.emit(final=True)
+        self.record_run()
+        self._log(f"[DONE] Results saved to: {self.output_dir}", level="stage")
+
+    # -- Input --
+    def iter_batches(self) -> Iterator[pl.DataFrame]:
+        """Yield record batches of at most `batch_rows` records from the stream."""
+        lines = iter(self.stream)
+        first = next((line for line in lines if line.strip()), None)
+        if first is None:
+            return
+        if self.input_format == "auto":
+            self.input_format = "ndjson" if first.lstrip()[:1] == "{" else "csv"
+            self._log(f"Detected stream format: {self.input_format}", "info")
+
+        lines = itertools.chain([first], lines)
+        records = (
+            self._csv_records(lines)
+            if self.input_format == "csv"
+            else self._ndjson_records(lines)
+        )
+        batch: List[Any] = []
+        for record in records:
+            batch.append(record)
+            if len(batch) >= self.batch_rows:
+                yield self._parse(batch)
+                batch = []
+
+        if batch:
+            yield self._parse(batch)
+
+    @staticmethod
+    def _ndjson_records(lines: Iterable[str]) -> Iterator[str]:
+        for line in lines:
+            if line.strip():
+                yield line if line.endswith("\n") else line + "\n"
+
+    def _csv_records(self, lines: Iterable[str]) -> Iterator[List[str]]:
+        """CSV records after the header; quoted fields may span lines."""
+        reader = csv.reader(lines)
+        self._csv_header = next(reader, None)
+        for row in reader:
+            if row:
+                yield row
+
+    def _parse(self, records: List[Any]) -> pl.DataFrame:
+        if self.input_format == "ndjson":
+            df = pl.read_ndjson(io.StringIO("".join(records)))
+        else:
+            buffer = io.StringIO()
+            writer = csv.writer(buffer, lineterminator="\n")
+            writer.writerow(self._csv_header or [])
+            writer.writerows(records)
+            buffer.seek(0)
+            df = pl.read_csv(buffer, infer_schema_length=None)
+        return self._align(df)
+
+    def _align(self, df: pl.DataFrame) -> pl.DataFrame:
+        """
+        Conform a batch to the stream schema established so far.
+
+        The schema is widened when a batch needs it and no values are lost:
+        all-null columns take the first real dtype seen, and numeric columns
+        are promoted (to Float64 once floats appear). Values that still do not
+        fit the established dtype become nulls and are counted per column in
+        `coerced_values`. Missing columns are filled with nulls, and unseen
+        columns are dropped.
+        """
+        if self.schema is None:
+            self.schema = dict(df.schema)
+            return df
+
+        for col, dtype in df.schema.items():
+            known = self.schema.get(col)
+            if known is not None:
+                self.schema[col] = widen_dtype(known, dtype) or known
+
+        columns = []
+        for col, dtype in self.schema.items():
+            if col not in df.columns:
+                columns.append(pl.Series(col, [None] * df.height, dtype=dtype))
+                continue
+            try:
+                aligned = df[col].cast(dtype, strict=False)
+            except pl.exceptions.InvalidOperationError:
+                aligned = pl.Series(col, [None] * df.height, dtype=dtype)
+            lost = aligned.null_count() - df[col].null_count()
+            if lost:
+                self.coerced_values[col] = self.coerced_values.get(col, 0) + lost
+                self._log(
+                    f"{lost} value(s) in '{col}' did not fit the stream dtype "
+                    f"{dtype} and were set to null",
+                    level="warn",
+                )
+            columns.append(aligned)
+        return pl.DataFrame(columns)
+
+    # -- Accumulation --
+    def update(self, batch: pl.DataFrame) -> None:
+        """Fold one record batch into every task's running state."""
+        self.fold(
+            {name: task.partial(batch) for name, task in self.tasks.items()},
+            rows=batch.height,
+        )
+
+        self.rows_seen += batch.height
+        self.batches_seen += 1
+        self._log(
+            f"Processed batch {self.batches_seen} ({self.rows_seen} rows total)",
+            level="debug",
+        )
+
+    # -- Output --
+    def emit(self, final: bool = True) -> None:
+        """Finalize the current states and write the report and metadata."""
+        super().emit(final)
+        self._log(
+            f"Emitted {'final' if final else 'interim'} report after "
+            f"{self.rows_seen} rows",
+            level="info",
+        )
+
+    def describe_run(self, final: bool) -> None:
+        self.run_metadata["streaming"] = {
+            "format": self.input_format,
+            "rows": self.rows_seen,
+            "batches": self.batches_seen,
+            "batch_rows": self.batch_rows,
+            "coerced_values": dict(self.coerced_values),
+            "complete": final,
+        }
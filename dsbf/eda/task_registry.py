@@ -9,9 +9,10 @@ import traceback
 from collections import defaultdict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, Dict, List, Literal, Optional, Type
+from typing import Any, Callable, Dict, List, Literal, Optional, Type
 
 from dsbf.core.base_task import BaseTask
+from dsbf.utils.backend import COLUMN_CLASSES, columns_of_class
 from dsbf.utils.logging_utils import setup_logger
 
 logger = setup_logger("dsbf.task_registry", "info")
@@ -65,6 +66,9 @@ class TaskSpec:
     expected_semantic_types: Optional[List[str]] = (
         None  # List of expected semantic types (e.g., ["continuous"])
     )
+    max_rows: Optional[int] = None  # Default row budget (None = all rows)
+    reads: Optional[List[str]] = None  # Column classes read (None = all columns)
+    column_params: Optional[List[str]] = None  # Task params naming columns read
 
 
 # -- Global registry --
@@ -87,6 +91,9 @@ def register_task(
     outputs: Optional[List[str]] = None,
     experimental: bool = False,
     expected_semantic_types: Optional[List[str]] = None,
+    max_rows: Optional[int] = None,
+    reads: Optional[List[str]] = None,
+    column_params: Optional[List[str]] = None,
 ) -> Callable[[Type[BaseTask]], Type[BaseTask]]:
     """
     Decorator to register a BaseTask subclass in the global TASK_REGISTRY.
@@ -107,6 +114,15 @@ def register_task(
         experimental (bool): Flag to mark unstable or test-only tasks.
         expected_semantic_types (Optional[List[str]]): Expected semantic types for
             column selection.
+        max_rows (Optional[int]): Default number of rows the task needs; larger
+            datasets are served from the shared sample pool. Overridable per task
+            with `max_rows` in the `tasks:` config (0 = all rows).
+        reads (Optional[List[str]]): Column classes the task reads ("numeric",
+            "string", "boolean", "temporal", "other"). The task is handed only
+            those columns, and loaders can skip columns no task reads. None
+            means all columns.
+        column_params (Optional[List[str]]): Task config keys whose values name
+            further columns the task reads (e.g. ["target_column"]).
 
     Returns:
         Callable: Class decorator that registers the task into TASK_REGISTRY.
@@ -121,6 +137,13 @@ def register_task(
                 f"Allowed stages are: {VALID_STAGES}"
             )
 
+        unknown_reads = set(reads or []) - set(COLUMN_CLASSES)
+        if unknown_reads:
+            raise ValueError(
+                f"Invalid column class(es) {sorted(unknown_reads)} for task "
+                f"'{task_name}'. Allowed classes are: {COLUMN_CLASSES}"
+            )
+
         if task_name in TASK_REGISTRY:
             existing_cls = TASK_REGISTRY[task_name].cls
             raise ValueError(
@@ -143,6 +166,9 @@ def register_task(
             outputs=outputs,
             experimental=experimental,
             expected_semantic_types=expected_semantic_types,
+            max_rows=max_rows,
+            reads=reads,
+            column_params=column_params,
         )
 
         TASK_REGISTRY[task_name] = spec
@@ -155,6 +181,51 @@ def _to_snake_case(name: str) -> str:
     return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
 
 
+def task_input_columns(
+    spec: TaskSpec,
+    data: Any,
+    task_config: Optional[Dict[str, Any]] = None,
+    semantic_types: Optional[Dict[str, str]] = None,
+    project: bool = True,
+) -> Optional[List[str]]:
+    """
+    Columns of `data` a task should be handed.
+
+    A column is routed to the task if its class is in the spec's `reads` (when
+    `project` is set) and its semantic type, from `semantic_types`, is one of
+    the spec's `expected_semantic_types`. Columns named by the task's
+    `column_params` are always included. Tasks expecting "any" type are not
+    routed by semantic type.
+
+    Args:
+        spec (TaskSpec): The task's registry entry.
+        data (Any): Pandas/Polars DataFrame (only its schema is read).
+        task_config (dict or None): The task's config (for `column_params`).
+        semantic_types (dict or None): Column -> semantic type from
+            `infer_types`; None or empty disables semantic routing.
+        project (bool): Apply the spec's `reads` column classes.
+
+    Returns:
+        Optional[List[str]]: Column names in frame order (possibly empty), or
+        None if the task reads every column.
+    """
+    expected = set(spec.expected_semantic_types or [])
+    route = bool(semantic_types) and bool(expected) and "any" not in expected
+    reads = spec.reads if project else None
+    if reads is None and not route:
+        return None
+
+    columns = list(data.columns) if reads is None else columns_of_class(data, reads)
+    if route:
+        columns = [col for col in columns if semantic_types.get(col) in expected]
+
+    wanted = set(columns)
+    for key in spec.column_params or []:
+        value = (task_config or {}).get(key)
+        wanted.update([value] if isinstance(value, str) else value or [])
+    return [col for col in data.columns if col in wanted]
+
+
 def get_all_task_specs() -> List[TaskSpec]:
     return list(TASK_REGISTRY.values())
 
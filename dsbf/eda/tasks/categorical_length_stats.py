@@ -2,13 +2,11 @@
 
 from typing import Any, Dict
 
-import polars as pl
-
 from dsbf.core.base_task import BaseTask
 from dsbf.eda.task_registry import register_task
 from dsbf.eda.task_result import TaskResult, make_failure_result
-from dsbf.utils.backend import is_polars
 from dsbf.utils.plot_factory import PlotFactory
+from dsbf.utils.text_stats import as_string_series, length_histogram, string_lengths
 
 
 @register_task(
@@ -28,6 +26,8 @@ class CategoricalLengthStats(BaseTask):
     columns. Supports both Pandas and Polars DataFrames.
 
     Produces a TaskResult with per-column summary stats and length histograms.
+    Lengths use the same Polars kernel as SummarizeTextFields, and histograms
+    are plotted from pre-binned counts.
     """
 
     def run(self) -> None:
@@ -47,37 +47,19 @@ class CategoricalLengthStats(BaseTask):
             # Compute string length stats per column
             for col in matching_cols:
                 try:
-                    if is_polars(df):
-                        lengths = df.select(
-                            pl.col(col).cast(pl.Utf8).str.len_chars().alias("len")
-                        ).drop_nulls()["len"]
-                        if lengths.len() == 0:
-                            continue
-                        stats = {
-                            "mean_length": lengths.mean(),
-                            "max_length": lengths.max(),
-                            "min_length": lengths.min(),
-                        }
-                    else:
-                        lengths = df[col].dropna().str.len()
-                        if len(lengths) == 0:
-                            continue
-                        stats = {
-                            "mean_length": lengths.mean(),
-                            "max_length": lengths.max(),
-                            "min_length": lengths.min(),
-                        }
+                    lengths = string_lengths(as_string_series(df[col]))
+                    if lengths.len() == 0:
+                        continue
+                    stats = {
+                        "mean_length": lengths.mean(),
+                        "max_length": lengths.max(),
+                        "min_length": lengths.min(),
+                    }
 
                     results[col] = stats
 
-                    # Generate histogram plots
-                    lengths_series = (
-                        lengths.to_pandas()
-                        if hasattr(lengths, "to_pandas")
-                        else lengths
-                    )
-                    lengths_series.name = f"{col} length"
-
+                    # Generate histogram plots from binned lengths
+                    histogram = length_histogram(lengths)
                     annotation = [
                         f"Min: {stats['min_length']:.1f}, "
                         f"Mean: {stats['mean_length']:.1f}, "
@@ -85,12 +67,16 @@ class CategoricalLengthStats(BaseTask):
                     ]
 
                     save_path = self.get_output_path(f"{col}_length_hist.png")
-                    static = PlotFactory.plot_histogram_static(
-                        lengths_series, save_path, title=f"{col} — String Lengths"
+                    static = PlotFactory.plot_binned_histogram_static(
+                        histogram,
+                        save_path,
+                        title=f"{col} — String Lengths",
+                        x_label=f"{col} length",
                     )
-                    interactive = PlotFactory.plot_histogram_interactive(
-                        lengths_series,
+                    interactive = PlotFactory.plot_binned_histogram_interactive(
+                        histogram,
                         title=f"{col} — String Lengths",
+                        x_label=f"{col} length",
                         annotations=annotation,
                     )
 
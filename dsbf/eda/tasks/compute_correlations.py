@@ -1,10 +1,12 @@
 # dsbf/eda/tasks/compute_correlations.py
 
-from typing import Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
-from scipy.stats import chi2_contingency
+import polars as pl
+import pyarrow.compute as pc
 
 from dsbf.core.base_task import BaseTask
 from dsbf.eda.task_registry import register_task
@@ -14,17 +16,83 @@ from dsbf.eda.task_result import (
     log_reliability_warnings,
     make_failure_result,
 )
-from dsbf.utils.backend import is_polars
+from dsbf.utils.backend import columns_of_class, is_polars, to_polars
 from dsbf.utils.plot_factory import PlotFactory
+from dsbf.utils.sketches import RunningCovariance
 
 
-def cramers_v(x: pd.Series, y: pd.Series) -> float:
-    contingency = pd.crosstab(x, y)
-    chi2 = chi2_contingency(contingency)[0]
-    n = contingency.sum().sum()
-    phi2 = chi2 / n
-    r, k = contingency.shape
-    return np.sqrt(phi2 / min(k - 1, r - 1)) if min(k - 1, r - 1) > 0 else 0.0
+def encode_categorical(values: Any) -> Tuple[np.ndarray, int]:
+    """
+    Dictionary-encode a Pandas/Polars column to dense integer codes.
+
+    Returns:
+        Tuple[np.ndarray, int]: Codes 0..k-1 for the k distinct non-null
+        values (nulls get code k), and k.
+    """
+    if isinstance(values, pl.Series):
+        codes, labels = encode_labels(values)
+        return codes, len(labels)
+    codes, uniques = pd.factorize(values)
+    k = len(uniques)
+    codes = np.where(codes < 0, k, codes)
+    return codes.astype(np.int64), k
+
+
+def encode_labels(values: pl.Series) -> Tuple[np.ndarray, List[str]]:
+    """
+    Dictionary-encode a Polars column as strings.
+
+    Returns:
+        Tuple[np.ndarray, List[str]]: Codes 0..k-1 (nulls get code k) and the
+        k distinct values in code order.
+    """
+    encoded = values.cast(pl.Utf8).to_arrow().dictionary_encode()
+    labels = encoded.dictionary.to_pylist()
+    codes = pc.fill_null(encoded.indices, len(labels)).to_numpy()
+    return codes.astype(np.int64), labels
+
+
+def contingency_table(
+    x_codes: np.ndarray, x_k: int, y_codes: np.ndarray, y_k: int
+) -> np.ndarray:
+    """
+    Co-occurrence counts of two encoded columns with one bincount, ignoring
+    rows where either value is null (code k).
+    """
+    keys = x_codes * (y_k + 1) + y_codes
+    counts = np.bincount(keys, minlength=(x_k + 1) * (y_k + 1))
+    return counts.reshape(x_k + 1, y_k + 1)[:x_k, :y_k]
+
+
+def cramers_v(x: Any, y: Any, bias_correction: bool = True) -> float:
+    x_codes, x_k = encode_categorical(x)
+    y_codes, y_k = encode_categorical(y)
+    return cramers_v_from_table(
+        contingency_table(x_codes, x_k, y_codes, y_k), bias_correction
+    )
+
+
+def cramers_v_from_table(contingency: Any, bias_correction: bool = True) -> float:
+    """
+    Cramér's V from a contingency table of co-occurrence counts, with the
+    Bergsma (2013) bias correction unless `bias_correction` is False.
+    Categories that never co-occur with a non-null value are ignored.
+    """
+    table = np.asarray(contingency, dtype=float)
+    table = table[table.sum(axis=1) > 0][:, table.sum(axis=0) > 0]
+    r, k = table.shape
+    if min(k - 1, r - 1) <= 0:
+        return 0.0
+
+    n = table.sum()
+    expected = np.outer(table.sum(axis=1), table.sum(axis=0)) / n
+    phi2 = float(((table - expected) ** 2 / expected).sum()) / n
+    if bias_correction and n > 1:
+        phi2 = max(0.0, phi2 - (k - 1) * (r - 1) / (n - 1))
+        r -= (r - 1) ** 2 / (n - 1)
+        k -= (k - 1) ** 2 / (n - 1)
+    denominator = min(k - 1, r - 1)
+    return float(np.sqrt(phi2 / denominator)) if denominator > 0 else 0.0
 
 
 @register_task(
@@ -37,8 +105,21 @@ def cramers_v(x: pd.Series, y: pd.Series) -> float:
     runtime_estimate="moderate",
     tags=["numeric", "correlation"],
     expected_semantic_types=["continuous", "categorical"],
+    reads=["numeric", "string"],
 )
 class ComputeCorrelations(BaseTask):
+    """
+    Pearson correlations between numeric columns and bias-corrected Cramér's V
+    between text columns (integer-coded once, one bincount per pair).
+
+    Mergeable: partial states hold exact pairwise co-moments and contingency
+    tables, so partitioned runs give the same coefficients as a single pass.
+    Text columns are capped at `max_categories` in partial states too: a
+    column over the cap is dropped from the state with all of its pairs.
+    """
+
+    mergeable = True
+
     def run(self) -> None:
         try:
             df = self.input_data
@@ -47,8 +128,6 @@ class ComputeCorrelations(BaseTask):
 
             # --- Polars numeric correlation ---
             if is_polars(df):
-                import polars as pl
-
                 try:
                     numeric_cols = [
                         col
@@ -82,38 +161,33 @@ class ComputeCorrelations(BaseTask):
                 if len(numeric_cols) < 2:
                     self._log(
                         "    Fewer than 2 numeric columns —"
-                        " skipping correlation computation."
+                        " skipping numeric correlations."
                     )
-                    self.output = TaskResult(
-                        name=self.name,
-                        status="success",
-                        summary={
-                            "message": (
-                                "Not enough numeric columns to compute correlations."
-                            )
-                        },
-                        data={},
-                        plots={},
-                    )
-                    return
-                numeric_df = df[numeric_cols]
                 for i, col1 in enumerate(numeric_cols):
                     for j in range(i + 1, len(numeric_cols)):
                         col2 = numeric_cols[j]
                         corr = df[col1].corr(df[col2])
                         correlations[f"{col1}|{col2}"] = corr
 
+            numeric_pair_count = len(correlations)
+
             # --- Categorical Cramér’s V correlations ---
-            if is_polars(df):
-                df = df.to_pandas()
-                backend_used = "mixed"
+            cat_cols = columns_of_class(df, ["string"])
+            cat_correlations, skipped_cols = self._categorical_correlations(
+                df, cat_cols
+            )
+            correlations.update(cat_correlations)
 
-            cat_cols = df.select_dtypes(include="object").columns
-            for i, col1 in enumerate(cat_cols):
-                for j in range(i + 1, len(cat_cols)):
-                    col2 = cat_cols[j]
-                    v = cramers_v(df[col1], df[col2])
-                    correlations[f"{col1}|{col2}"] = v
+            if not correlations:
+                self.output = TaskResult(
+                    name=self.name,
+                    status="success",
+                    summary={"message": "Not enough columns to compute correlations."},
+                    data={},
+                    plots={},
+                    metadata={"skipped_categorical_columns": skipped_cols},
+                )
+                return
 
             result = TaskResult(
                 name=self.name,
@@ -127,12 +201,9 @@ class ComputeCorrelations(BaseTask):
                 data=correlations,
                 metadata={
                     "backend": backend_used,
-                    "numeric_pair_count": sum(
-                        "|" in k and k.split("|")[0] in df.columns for k in correlations
-                    ),
-                    "categorical_pair_count": sum(
-                        "|" in k and k.split("|")[0] in cat_cols for k in correlations
-                    ),
+                    "numeric_pair_count": numeric_pair_count,
+                    "categorical_pair_count": len(cat_correlations),
+                    "skipped_categorical_columns": skipped_cols,
                 },
             )
 
@@ -228,37 +299,7 @@ class ComputeCorrelations(BaseTask):
                 )
 
             # --- Optional visualization ---
-            if correlations:
-                corr_df = pd.DataFrame(
-                    index=df.columns, columns=df.columns, dtype=float
-                )
-                for pair, value in correlations.items():
-                    col1, col2 = pair.split("|")
-                    corr_df.loc[col1, col2] = value
-                    corr_df.loc[col2, col1] = value  # Ensure symmetry
-                    corr_df.loc[col1, col1] = 1.0
-                    corr_df.loc[col2, col2] = 1.0
-                corr_df.fillna(1.0, inplace=True)
-
-                # Convert to numeric-only (some non-numeric pairs may sneak in)
-                numeric_corr = corr_df.select_dtypes(include=[np.number])
-
-                save_path = self.get_output_path("correlation_heatmap.png")
-                static_plot = PlotFactory.plot_correlation_static(
-                    numeric_corr,
-                    save_path=save_path,
-                    title="Correlation Heatmap",
-                )
-                interactive_plot = PlotFactory.plot_correlation_interactive(
-                    numeric_corr,
-                    title="Correlation Heatmap",
-                )
-                result.plots = {
-                    "correlation_matrix": {
-                        "static": static_plot["path"],
-                        "interactive": interactive_plot,
-                    }
-                }
+            self._attach_heatmap(result, correlations, list(df.columns))
 
             result.metadata.update(
                 {
@@ -281,3 +322,262 @@ class ComputeCorrelations(BaseTask):
                 level="warn",
             )
             self.output = make_failure_result(self.name, e)
+
+    def _categorical_correlations(
+        self, df: Any, columns: List[str]
+    ) -> Tuple[Dict[str, float], Dict[str, int]]:
+        """
+        Cramér's V for every pair of categorical columns.
+
+        Each column is dictionary-encoded once; each pair's contingency table
+        is one bincount over combined codes, and pairs are spread over a
+        thread pool. Columns with more than `max_categories` distinct values,
+        or whose values are all distinct, are left out.
+
+        Returns:
+            Tuple of ({"col1|col2": V}, {skipped column: distinct count}).
+        """
+        max_categories = int(self.get_task_param("max_categories") or 100)
+        bias_correction = bool(self.get_task_param("bias_correction", True))
+        max_workers: Optional[int] = self.get_task_param("max_workers")
+
+        encoded: Dict[str, Tuple[np.ndarray, int]] = {}
+        skipped: Dict[str, int] = {}
+        for col in columns:
+            codes, k = encode_categorical(df[col])
+            non_null = int(np.count_nonzero(codes < k))
+            if k > max_categories or (k > 1 and k == non_null):
+                skipped[col] = k
+            else:
+                encoded[col] = (codes, k)
+        if skipped:
+            self._log(
+                f"    Skipping Cramér's V for high-cardinality column(s): "
+                f"{sorted(skipped)}",
+                "debug",
+            )
+
+        names = list(encoded)
+        pairs = [(a, b) for i, a in enumerate(names) for b in names[i + 1 :]]
+
+        def _pair(pair: Tuple[str, str]) -> Tuple[str, float]:
+            a, b = pair
+            table = contingency_table(*encoded[a], *encoded[b])
+            return f"{a}|{b}", cramers_v_from_table(table, bias_correction)
+
+        if len(pairs) < 2:
+            return dict(map(_pair, pairs)), skipped
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(executor.map(_pair, pairs)), skipped
+
+    def _attach_heatmap(
+        self, result: TaskResult, correlations: Dict[str, float], columns: List[str]
+    ) -> None:
+        if not correlations:
+            return
+
+        corr_df = pd.DataFrame(index=columns, columns=columns, dtype=float)
+        for pair, value in correlations.items():
+            col1, col2 = pair.split("|")
+            corr_df.loc[col1, col2] = value
+            corr_df.loc[col2, col1] = value  # Ensure symmetry
+            corr_df.loc[col1, col1] = 1.0
+            corr_df.loc[col2, col2] = 1.0
+        corr_df.fillna(1.0, inplace=True)
+
+        # Convert to numeric-only (some non-numeric pairs may sneak in)
+        numeric_corr = corr_df.select_dtypes(include=[np.number])
+
+        save_path = self.get_output_path("correlation_heatmap.png")
+        static_plot = PlotFactory.plot_correlation_static(
+            numeric_corr,
+            save_path=save_path,
+            title="Correlation Heatmap",
+        )
+        interactive_plot = PlotFactory.plot_correlation_interactive(
+            numeric_corr,
+            title="Correlation Heatmap",
+        )
+        result.plots = {
+            "correlation_matrix": {
+                "static": static_plot["path"],
+                "interactive": interactive_plot,
+            }
+        }
+
+    # -- Mergeable protocol --
+    def partial(self, chunk: Any) -> Dict[str, Any]:
+        df = to_polars(chunk)
+        max_categories = int(self.get_task_param("max_categories") or 100)
+        numeric = [c for c, dtype in df.schema.items() if dtype.is_numeric()]
+        text = [
+            c for c, dtype in df.schema.items() if dtype in (pl.Utf8, pl.Categorical)
+        ]
+
+        pairs: Dict[str, RunningCovariance] = {}
+        for i, col1 in enumerate(numeric):
+            for col2 in numeric[i + 1 :]:
+                pairs[f"{col1}|{col2}"] = RunningCovariance().update(df[col1], df[col2])
+
+        # Same cardinality cap as `run()`; all-distinct columns can only be
+        # told apart once merged, so that check waits for `finalize()`
+        encoded: Dict[str, Tuple[np.ndarray, List[str]]] = {}
+        categories: Dict[str, Dict[str, int]] = {}
+        skipped: Dict[str, int] = {}
+        for col in text:
+            codes, labels = encode_labels(df[col])
+            if len(labels) > max_categories:
+                skipped[col] = len(labels)
+                continue
+            encoded[col] = (codes, labels)
+            counts = np.bincount(codes, minlength=len(labels) + 1)
+            categories[col] = dict(zip(labels, counts[: len(labels)].tolist()))
+
+        tables: Dict[str, Dict[str, Dict[str, int]]] = {}
+        names = list(encoded)
+        for i, col1 in enumerate(names):
+            codes1, labels1 = encoded[col1]
+            for col2 in names[i + 1 :]:
+                codes2, labels2 = encoded[col2]
+                counts = contingency_table(codes1, len(labels1), codes2, len(labels2))
+                table: Dict[str, Dict[str, int]] = {}
+                for x, y in zip(*np.nonzero(counts)):
+                    table.setdefault(labels1[x], {})[labels2[y]] = int(counts[x, y])
+                tables[f"{col1}|{col2}"] = table
+
+        return {
+            "numeric": pairs,
+            "categorical": tables,
+            "categories": categories,
+            "skipped_categorical": skipped,
+        }
+
+    def merge(self, states: List[Dict[str, Any]]) -> Dict[str, Any]:
+        max_categories = int(self.get_task_param("max_categories") or 100)
+        pairs: Dict[str, RunningCovariance] = {}
+        categories: Dict[str, Dict[str, int]] = {}
+        skipped: Dict[str, int] = {}
+        for state in states:
+            for pair, cov in state["numeric"].items():
+                pairs.setdefault(pair, RunningCovariance()).merge(cov)
+            for col, k in state.get("skipped_categorical", {}).items():
+                skipped[col] = max(skipped.get(col, 0), k)
+            for col, counts in state.get("categories", {}).items():
+                merged_counts = categories.setdefault(col, {})
+                for value, n in counts.items():
+                    merged_counts[value] = merged_counts.get(value, 0) + n
+
+        # Columns over the cap once merged are dropped with all their pairs;
+        # their reported distinct count is a lower bound
+        for col, counts in list(categories.items()):
+            if col in skipped or len(counts) > max_categories:
+                skipped[col] = max(skipped.get(col, 0), len(counts))
+                del categories[col]
+
+        tables: Dict[str, Dict[str, Dict[str, int]]] = {}
+        for state in states:
+            for pair, table in state["categorical"].items():
+                if any(col in skipped for col in pair.split("|")):
+                    continue
+                merged = tables.setdefault(pair, {})
+                for x, row in table.items():
+                    merged_row = merged.setdefault(x, {})
+                    for y, n in row.items():
+                        merged_row[y] = merged_row.get(y, 0) + n
+        return {
+            "numeric": pairs,
+            "categorical": tables,
+            "categories": categories,
+            "skipped_categorical": skipped,
+        }
+
+    def finalize(self, state: Dict[str, Any]) -> None:
+        correlations: Dict[str, float] = {
+            pair: cov.correlation() for pair, cov in state["numeric"].items()
+        }
+        # As in `run()`, columns whose values are all distinct are left out
+        skipped = dict(state.get("skipped_categorical", {}))
+        for col, counts in state.get("categories", {}).items():
+            if len(counts) > 1 and all(n == 1 for n in counts.values()):
+                skipped[col] = len(counts)
+        tables = {
+            pair: table
+            for pair, table in state["categorical"].items()
+            if not any(col in skipped for col in pair.split("|"))
+        }
+        for pair, table in tables.items():
+            contingency = pd.DataFrame(table).fillna(0)
+            correlations[pair] = cramers_v_from_table(
+                contingency, bool(self.get_task_param("bias_correction", True))
+            )
+
+        columns: List[str] = []
+        for pair in correlations:
+            columns.extend(c for c in pair.split("|") if c not in columns)
+
+        result = TaskResult(
+            name=self.name,
+            status="success",
+            summary={
+                "message": (
+                    f"Computed correlations for {len(correlations)} column pairs."
+                )
+            },
+            data=correlations,
+            metadata={
+                "backend": "merged",
+                "numeric_pair_count": len(state["numeric"]),
+                "categorical_pair_count": len(tables),
+                "skipped_categorical_columns": skipped,
+            },
+        )
+
+        # Reliability checks that the merged co-moments can answer exactly
+        n_rows = max((cov.n for cov in state["numeric"].values()), default=0)
+        if state["numeric"] and n_rows < 30:
+            add_reliability_warning(
+                result,
+                level="strong_warning",
+                code="low_row_count",
+                description=(
+                    "Pearson correlation may be statistically"
+                    " unreliable with fewer than 30 observations."
+                ),
+                recommendation=(
+                    "Use bootstrapped confidence intervals or collect more data."
+                ),
+            )
+        constant = sorted(
+            {
+                col
+                for pair, cov in state["numeric"].items()
+                for col, m2 in zip(pair.split("|"), (cov.m2_x, cov.m2_y))
+                if cov.n >= 2 and m2 == 0
+            }
+        )
+        if constant:
+            add_reliability_warning(
+                result,
+                level="strong_warning",
+                code="zero_variance",
+                description=(
+                    "The following features have near-zero variance: "
+                    f"{constant}. Correlation is undefined."
+                ),
+                recommendation=(
+                    "Drop or impute constant features before computing correlation."
+                ),
+            )
+
+        self._attach_heatmap(result, correlations, columns)
+        result.metadata.update(
+            {
+                "suggested_viz_type": "heatmap",
+                "recommended_section": "Correlations",
+                "display_priority": "medium",
+                "column_types": self.get_column_type_info(columns),
+            }
+        )
+
+        log_reliability_warnings(self, result)
+        self.output = result
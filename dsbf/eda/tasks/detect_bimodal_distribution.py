@@ -1,16 +1,88 @@
 # dsbf/eda/tasks/detect_bimodal_distribution.py
 
-from typing import Any, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple
 
 import numpy as np
+import polars as pl
 from sklearn.mixture import GaussianMixture
 
 from dsbf.core.base_task import BaseTask
 from dsbf.eda.task_registry import register_task
 from dsbf.eda.task_result import TaskResult, make_failure_result
-from dsbf.utils.backend import is_polars
+from dsbf.utils.backend import columns_of_class, to_polars
 from dsbf.utils.plot_factory import PlotFactory
 
+# Bimodality coefficient of a uniform distribution; larger values suggest
+# more than one mode.
+BC_THRESHOLD = 5 / 9
+
+# Binomial smoothing kernel applied to the screening histogram
+SMOOTHING_KERNEL = np.array([1.0, 4.0, 6.0, 4.0, 1.0]) / 16.0
+
+
+def bimodality_coefficient(x: np.ndarray) -> float:
+    """
+    Sample bimodality coefficient (g1^2 + 1) / (g2 + 3(n-1)^2 / ((n-2)(n-3))),
+    from the bias-adjusted skewness g1 and excess kurtosis g2.
+    """
+    n = x.size
+    if n < 4:
+        return float("nan")
+    d = x - x.mean()
+    m2 = np.mean(d * d)
+    if m2 == 0:
+        return float("nan")
+    m3 = np.mean(d**3)
+    m4 = np.mean(d**4)
+    g1 = m3 / m2**1.5 * np.sqrt(n * (n - 1)) / (n - 2)
+    g2 = ((n + 1) * (m4 / m2**2 - 3) + 6) * (n - 1) / ((n - 2) * (n - 3))
+    return float((g1**2 + 1) / (g2 + 3 * (n - 1) ** 2 / ((n - 2) * (n - 3))))
+
+
+def count_histogram_modes(
+    x: np.ndarray,
+    max_bins: int = 64,
+    min_peak_fraction: float = 0.1,
+    max_valley_ratio: float = 0.7,
+) -> int:
+    """
+    Count modes of a smoothed, fixed-size histogram of `x`.
+
+    A peak counts if it is at least `min_peak_fraction` of the highest peak
+    and the lowest bin between it and the previous counted peak is at most
+    `max_valley_ratio` of the smaller of the two; otherwise the two peaks are
+    merged into one mode.
+    """
+    bins = int(min(max_bins, max(5, np.ceil(2 * np.cbrt(x.size)))))
+    counts, _ = np.histogram(x, bins=bins)
+    smooth = np.convolve(counts.astype(float), SMOOTHING_KERNEL, mode="same")
+
+    padded = np.concatenate([[-1.0], smooth, [-1.0]])
+    peaks = np.flatnonzero((padded[1:-1] > padded[:-2]) & (padded[1:-1] >= padded[2:]))
+    peaks = peaks[smooth[peaks] >= min_peak_fraction * smooth.max()]
+    if peaks.size == 0:
+        return 0
+
+    modes = 1
+    last = peaks[0]
+    for peak in peaks[1:]:
+        valley = smooth[last : peak + 1].min()
+        if valley <= max_valley_ratio * min(smooth[last], smooth[peak]):
+            modes += 1
+            last = peak
+        elif smooth[peak] > smooth[last]:
+            last = peak
+    return modes
+
+
+def fit_bic_pair(x: np.ndarray, seed: int = 0) -> Tuple[float, float]:
+    """BIC of 1- and 2-component Gaussian mixtures fitted to `x`."""
+    values = x.reshape(-1, 1)
+    gmm1 = GaussianMixture(n_components=1, random_state=seed).fit(values)
+    gmm2 = GaussianMixture(n_components=2, random_state=seed).fit(values)
+    return float(gmm1.bic(values)), float(gmm2.bic(values))
+
 
 @register_task(
     display_name="Detect Bimodal Distributions",
@@ -21,36 +93,45 @@ from dsbf.utils.plot_factory import PlotFactory
     domain="core",
     runtime_estimate="moderate",
     tags=["distribution", "outliers"],
+    max_rows=50_000,
     expected_semantic_types=["continuous"],
+    reads=["numeric"],
 )
 class DetectBimodalDistribution(BaseTask):
     """
-    Uses Gaussian Mixture Models to flag numeric columns likely to follow
-    a bimodal distribution, based on BIC improvement between 1 and 2 components.
+    Flags numeric columns likely to follow a bimodal distribution, based on
+    BIC improvement between 1 and 2 Gaussian mixture components.
+
+    Each column is screened first in a single pass: the bimodality
+    coefficient and the number of modes of a fixed-size histogram. Mixtures
+    are only fitted, on a bounded subsample and in parallel, for columns that
+    pass either screen; the rest are reported as not bimodal.
     """
 
     def run(self) -> None:
         """
-        Runs the bimodal detection task using Gaussian Mixture Models.
+        Runs the bimodal detection task.
         Stores results as a TaskResult, including:
         - bimodal_flags: dict of column: bool
         - bic_scores: dict of column: {bic_1_component, bic_2_components}
+          (only for columns that passed screening)
+        - screening: dict of column: {bimodality_coefficient, histogram_modes,
+          passed}
         """
 
         try:
-
-            # ctx = self.context
-            df = self.input_data
-            if is_polars(df):
-                self._log(
-                    "    Falling back to Pandas: sklearn GMM requires numeric arrays",
-                    "debug",
-                )
-                df = df.to_pandas()  # sklearn requires numpy/pandas
+            df = to_polars(self.input_data)
 
             bic_threshold = float(self.get_task_param("bic_threshold") or 10.0)
+            bc_threshold = float(self.get_task_param("bc_threshold") or BC_THRESHOLD)
+            histogram_bins = int(self.get_task_param("histogram_bins") or 64)
+            sample_size = int(self.get_task_param("gmm_sample_size") or 10_000)
+            max_workers: Optional[int] = self.get_task_param("max_workers")
+            seed = int(self.get_task_param("seed") or 0)
+
             bimodal_flags: Dict[str, bool] = {}
             bic_scores: Dict[str, Dict[str, float]] = {}
+            screening: Dict[str, Dict[str, Any]] = {}
 
             # Use semantic typing to select relevant columns
             matched_cols, excluded = self.get_columns_by_intent()
@@ -58,32 +139,47 @@ class DetectBimodalDistribution(BaseTask):
                 f"    Processing {len(matched_cols)} 'continuous' column(s)", "debug"
             )
 
-            numeric_df = df.select_dtypes(include=np.number)
-
-            for col in numeric_df.columns:
-                col_data = numeric_df[col].dropna().values.reshape(-1, 1)
+            rng = np.random.default_rng(seed)
+            candidates: Dict[str, np.ndarray] = {}
+            for col in columns_of_class(df, ["numeric"]):
+                x = df[col].cast(pl.Float64).to_numpy()
+                x = x[np.isfinite(x)]
 
-                # Skip if not enough data points for GMM
-                if col_data.shape[0] < 10:
-                    continue
-
-                if np.std(col_data) == 0 or np.unique(col_data).size < 2:
+                # Skip if not enough data points or no spread for GMM
+                if x.size < 10 or x.min() == x.max():
                     continue
 
+                bc = bimodality_coefficient(x)
+                modes = count_histogram_modes(x, max_bins=histogram_bins)
+                passed = bool(bc > bc_threshold or modes >= 2)
+                screening[col] = {
+                    "bimodality_coefficient": bc,
+                    "histogram_modes": modes,
+                    "passed": passed,
+                }
+                bimodal_flags[col] = False
+                if passed:
+                    if x.size > sample_size:
+                        x = rng.choice(x, size=sample_size, replace=False)
+                    candidates[col] = x
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    col: executor.submit(fit_bic_pair, x, seed)
+                    for col, x in candidates.items()
+                }
+            for col, future in futures.items():
                 try:
-                    gmm1 = GaussianMixture(n_components=1).fit(col_data)
-                    gmm2 = GaussianMixture(n_components=2).fit(col_data)
-                    bic1 = gmm1.bic(col_data)
-                    bic2 = gmm2.bic(col_data)
-
-                    bic_scores[col] = {
-                        "bic_1_component": float(bic1),
-                        "bic_2_components": float(bic2),
-                    }
-                    bimodal_flags[col] = bool((bic1 - bic2) > bic_threshold)
+                    bic1, bic2 = future.result()
                 except Exception as e:
                     self._log(f"    Failed on column {col}: {e}", "debug")
+                    del bimodal_flags[col]
                     continue
+                bic_scores[col] = {
+                    "bic_1_component": bic1,
+                    "bic_2_components": bic2,
+                }
+                bimodal_flags[col] = bool((bic1 - bic2) > bic_threshold)
 
             plots: dict[str, dict[str, Any]] = {}
 
@@ -91,12 +187,14 @@ class DetectBimodalDistribution(BaseTask):
                 for col in bimodal_flags:
                     if col not in df.columns:
                         continue
-                    series = df[col].dropna()
+                    series = df[col].to_pandas().dropna()
                     if series.empty:
                         continue
 
                     save_path = self.get_output_path(f"{col}_bimodal_hist.png")
-                    static = PlotFactory.plot_histogram_static(series, save_path)
+                    static = PlotFactory.plot_histogram_static(
+                        series, save_path, max_rows=self.get_plot_max_rows()
+                    )
 
                     interactive = PlotFactory.plot_histogram_interactive(
                         series,
@@ -105,6 +203,7 @@ class DetectBimodalDistribution(BaseTask):
                             if bimodal_flags[col]
                             else []
                         ),
+                        max_rows=self.get_plot_max_rows(),
                     )
 
                     plots[col] = {
@@ -124,10 +223,14 @@ class DetectBimodalDistribution(BaseTask):
                 data={
                     "bimodal_flags": bimodal_flags,
                     "bic_scores": bic_scores,
+                    "screening": screening,
                 },
                 plots=plots,
                 metadata={
                     "bic_threshold": bic_threshold,
+                    "bc_threshold": bc_threshold,
+                    "gmm_sample_size": sample_size,
+                    "gmm_fitted_columns": list(candidates),
                     "suggested_viz_type": "histogram",
                     "recommended_section": "Distributions",
                     "display_priority": "medium",
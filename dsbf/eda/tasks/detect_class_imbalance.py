@@ -26,7 +26,9 @@ from dsbf.utils.reco_engine import get_recommendation_tip
     domain="core",
     runtime_estimate="fast",
     tags=["target", "imbalance", "ml_readiness"],
-    expected_semantic_types=["continuous"],
+    expected_semantic_types=["categorical"],
+    reads=[],
+    column_params=["target_column"],
 )
 class DetectClassImbalance(BaseTask):
     """
@@ -44,7 +46,7 @@ class DetectClassImbalance(BaseTask):
             # Use semantic typing to select relevant columns
             matched_cols, excluded = self.get_columns_by_intent()
             self._log(
-                f"    Processing {len(matched_cols)} 'continuous' column(s)", "debug"
+                f"    Processing {len(matched_cols)} 'categorical' column(s)", "debug"
             )
 
             # Load parameters from config
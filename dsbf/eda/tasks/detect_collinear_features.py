@@ -1,9 +1,9 @@
 # dsbf/eda/tasks/detect_collinear_features.py
 
-from typing import Dict, List
+from typing import Any, Dict, List, Tuple
 
 import numpy as np
-from statsmodels.stats.outliers_influence import variance_inflation_factor
+import polars as pl
 
 from dsbf.core.base_task import BaseTask
 from dsbf.eda.task_registry import register_task
@@ -12,10 +12,95 @@ from dsbf.eda.task_result import (
     add_reliability_warning,
     make_failure_result,
 )
-from dsbf.utils.backend import is_polars
+from dsbf.utils.backend import columns_of_class, is_polars
 from dsbf.utils.plot_factory import PlotFactory
 from dsbf.utils.reco_engine import get_recommendation_tip
 
+# Smallest eigenvalue kept when repairing a non-PSD correlation matrix
+PSD_EIGENVALUE_FLOOR = 1e-4
+
+
+def pairwise_complete_corr(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pearson correlation matrix where each pair uses the rows in which both
+    columns are present (as pandas' DataFrame.corr), computed with a few
+    matrix products instead of per-pair passes.
+
+    Args:
+        values (np.ndarray): n x p float array, NaN for missing values.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The p x p correlation matrix (NaN where
+        a pair has fewer than 2 shared rows or no variance) and the p x p
+        shared row counts.
+    """
+    present = ~np.isnan(values)
+    weights = present.astype(float)
+    # Centre each column first so the sums below do not lose precision
+    means = np.nanmean(values, axis=0) if values.size else np.zeros(values.shape[1])
+    x = np.where(present, values - means, 0.0)
+
+    counts = weights.T @ weights
+    sums = x.T @ weights  # sums[i, j]: sum of x_i over rows where x_j is present
+    squares = (x * x).T @ weights
+    products = x.T @ x
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cov = products - sums * sums.T / counts
+        var = squares - sums * sums / counts
+        corr = cov / np.sqrt(var * var.T)
+    corr[counts < 2] = np.nan
+    return np.clip(corr, -1.0, 1.0), counts
+
+
+def nearest_psd_corr(
+    corr: np.ndarray, floor: float = PSD_EIGENVALUE_FLOOR
+) -> Tuple[np.ndarray, int]:
+    """
+    Repair a correlation matrix that is not positive semidefinite, as
+    pairwise-complete matrices under block-wise missingness can be.
+
+    Eigenvalues below `floor` are raised to it and the diagonal is rescaled to
+    ones (eigenvalue clipping, as statsmodels' `corr_clipped`). The floor keeps
+    the repaired matrix invertible, so VIFs stay finite rather than reporting
+    the clipped directions as exact collinearity.
+
+    Returns:
+        Tuple[np.ndarray, int]: The repaired matrix (`corr` itself when it is
+        already PSD) and how many eigenvalues were negative.
+    """
+    eigenvalues, vectors = np.linalg.eigh(corr)
+    tolerance = eigenvalues.max() * corr.shape[0] * np.finfo(float).eps
+    negative = int(np.sum(eigenvalues < -tolerance))
+    if not negative:
+        return corr, 0
+
+    repaired = (vectors * np.maximum(eigenvalues, floor)) @ vectors.T
+    scale = np.sqrt(np.diag(repaired))
+    repaired = repaired / np.outer(scale, scale)
+    np.fill_diagonal(repaired, 1.0)
+    return repaired, negative
+
+
+def vif_from_corr(corr: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Variance inflation factors of all columns at once: the diagonal of the
+    inverse correlation matrix, via its eigendecomposition. For a singular
+    matrix the pseudo-inverse is used, and columns with weight on a (near-)zero
+    eigenvalue, i.e. exact linear combinations of others, get VIF = inf.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: VIF per column and the eigenvalues
+        (descending).
+    """
+    eigenvalues, vectors = np.linalg.eigh(corr)
+    tolerance = eigenvalues.max() * corr.shape[0] * np.finfo(float).eps
+    singular = eigenvalues <= tolerance
+
+    inverse = np.where(singular, 0.0, 1.0 / np.where(singular, 1.0, eigenvalues))
+    vif = (vectors**2) @ inverse
+    vif[(vectors[:, singular] ** 2).sum(axis=1) > 1e-8] = np.inf
+    return vif, eigenvalues[::-1]
+
 
 @register_task(
     display_name="Detect Collinear Features",
@@ -26,45 +111,81 @@ from dsbf.utils.reco_engine import get_recommendation_tip
     domain="core",
     runtime_estimate="slow",
     tags=["multicollinearity", "numeric"],
+    max_rows=50_000,
     expected_semantic_types=["continuous"],
+    reads=["numeric"],
 )
 class DetectCollinearFeatures(BaseTask):
+    """
+    Flags multicollinear numeric features by variance inflation factor.
+
+    VIFs for all columns come from one pairwise-complete correlation matrix
+    (rows with nulls elsewhere are kept), together with its eigenvalues and
+    condition number. Pairwise-complete matrices need not be positive
+    semidefinite; such matrices are projected onto a valid correlation matrix
+    first (eigenvalues floored at `psd_eigenvalue_floor`) and the result is
+    flagged with `non_psd` in the metadata.
+    """
+
     def run(self) -> None:
         try:
             df = self.input_data
             flags = self.ensure_reliability_flags()
 
             vif_threshold = float(self.get_task_param("vif_threshold") or 10.0)
-
-            if is_polars(df):
-                self._log(
-                    "    Falling back to Pandas: VIF calculation requires NumPy arrays",
-                    "debug",
-                )
-                df = df.to_pandas()
+            psd_floor = float(
+                self.get_task_param("psd_eigenvalue_floor") or PSD_EIGENVALUE_FLOOR
+            )
 
             # Use semantic typing to select relevant columns
             matched_cols, excluded = self.get_columns_by_intent()
             self._log(
                 f"    Processing {len(matched_cols)} 'continuous' column(s)", "debug"
             )
-            numeric_df = df.select_dtypes(include=np.number).dropna()
 
-            if numeric_df.shape[1] < 2:
+            numeric_cols = columns_of_class(df, ["numeric"])
+            values = self._as_float_array(df, numeric_cols)
+
+            # Constant or (nearly) empty columns have no defined correlation
+            spread = np.sum(~np.isnan(values), axis=0) >= 2
+            spread[spread] = np.nanstd(values[:, spread], axis=0) > 0
+            constant_columns = [c for c, ok in zip(numeric_cols, spread) if not ok]
+            numeric_cols = [c for c, ok in zip(numeric_cols, spread) if ok]
+            values = values[:, spread]
+
+            if len(numeric_cols) < 2:
                 self.output = TaskResult(
                     name=self.name,
                     status="success",
                     summary={"message": "Not enough numeric features to compute VIF."},
                     data={"vif_scores": {}, "collinear_columns": []},
-                    metadata={"vif_threshold": vif_threshold},
+                    metadata={
+                        "vif_threshold": vif_threshold,
+                        "constant_columns": constant_columns,
+                    },
                 )
                 return
 
-            vif_scores: Dict[str, float] = {}
-            for i in range(numeric_df.shape[1]):
-                col = numeric_df.columns[i]
-                vif_val = variance_inflation_factor(numeric_df.values, i)
-                vif_scores[col] = float(vif_val)
+            corr, counts = pairwise_complete_corr(values)
+            # Pairs without enough shared rows are treated as uncorrelated
+            corr = np.where(np.isnan(corr), 0.0, corr)
+            np.fill_diagonal(corr, 1.0)
+            raw_min_eigenvalue = float(np.linalg.eigvalsh(corr)[0])
+            corr, negative_eigenvalues = nearest_psd_corr(corr, psd_floor)
+            if negative_eigenvalues:
+                self._log(
+                    f"    Correlation matrix has {negative_eigenvalues} negative "
+                    "eigenvalue(s); projected to the nearest PSD matrix",
+                    "debug",
+                )
+            vif, eigenvalues = vif_from_corr(corr)
+            vif_scores: Dict[str, float] = {
+                col: float(v) for col, v in zip(numeric_cols, vif)
+            }
+            smallest = float(eigenvalues[-1])
+            condition_number = (
+                float(eigenvalues[0] / smallest) if smallest > 0 else float("inf")
+            )
 
             collinear_columns: List[str] = [
                 col for col, vif in vif_scores.items() if vif > vif_threshold
@@ -82,9 +203,16 @@ class DetectCollinearFeatures(BaseTask):
                 data={
                     "vif_scores": vif_scores,
                     "collinear_columns": collinear_columns,
+                    "condition_number": condition_number,
+                    "eigenvalues": [float(v) for v in eigenvalues],
                 },
                 metadata={
                     "vif_threshold": vif_threshold,
+                    "constant_columns": constant_columns,
+                    "min_pairwise_rows": int(counts.min()),
+                    "non_psd": bool(negative_eigenvalues),
+                    "negative_eigenvalues": negative_eigenvalues,
+                    "min_raw_eigenvalue": raw_min_eigenvalue,
                     "suggested_viz_type": "heatmap",
                     "recommended_section": "Multicollinearity",
                     "display_priority": "high",
@@ -96,6 +224,21 @@ class DetectCollinearFeatures(BaseTask):
             )
 
             # Reliability warnings
+            if negative_eigenvalues:
+                add_reliability_warning(
+                    result,
+                    level="heuristic_caution",
+                    code="vif_non_psd",
+                    description=(
+                        "Pairwise-complete correlations were inconsistent (not"
+                        " positive semidefinite) due to missing values; VIFs"
+                        " come from the nearest valid correlation matrix."
+                    ),
+                    recommendation=(
+                        "Impute missing values or compare VIFs on complete"
+                        " rows before acting on them."
+                    ),
+                )
             if flags["low_row_count"]:
                 add_reliability_warning(
                     result,
@@ -149,6 +292,8 @@ class DetectCollinearFeatures(BaseTask):
 
             try:
                 save_path = self.get_output_path("correlation_heatmap.png")
+                if is_polars(df):
+                    df = df.to_pandas()
                 static = PlotFactory.plot_correlation_static(
                     df, save_path=save_path, title="Correlation Matrix"
                 )
@@ -188,3 +333,15 @@ class DetectCollinearFeatures(BaseTask):
                 level="warn",
             )
             self.output = make_failure_result(self.name, e)
+
+    @staticmethod
+    def _as_float_array(df: Any, columns: List[str]) -> np.ndarray:
+        """Selected columns as an n x p float64 array with NaN for nulls."""
+        if is_polars(df):
+            return (
+                df.select([pl.col(c).cast(pl.Float64) for c in columns])
+                .fill_nan(None)
+                .to_numpy()
+                .astype(float)
+            )
+        return df[columns].to_numpy(dtype=float, na_value=np.nan)
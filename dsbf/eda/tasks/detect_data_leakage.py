@@ -19,6 +19,7 @@ from dsbf.utils.reco_engine import get_recommendation_tip
     runtime_estimate="moderate",
     tags=["leakage", "target"],
     expected_semantic_types=["categorical", "continuous"],
+    reads=["numeric"],
 )
 class DetectDataLeakage(BaseTask):
     """
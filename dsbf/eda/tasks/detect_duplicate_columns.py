@@ -1,11 +1,139 @@
 # dsbf/eda/tasks/detect_duplicate_columns.py
 
-from typing import List, Tuple
+from typing import Any, Dict, List, Set, Tuple
+
+import polars as pl
 
 from dsbf.core.base_task import BaseTask
 from dsbf.eda.task_registry import register_task
 from dsbf.eda.task_result import TaskResult, make_failure_result
-from dsbf.utils.backend import is_polars
+from dsbf.utils.backend import column_class, to_polars
+
+ROW_INDEX = "__dsbf_row__"
+SEEDS = (0, 2)
+INT64_LIMIT = 2.0**63
+
+
+def _normalised(col: str, dtype: Any) -> pl.Expr:
+    """
+    Column values in a dtype-independent form: numerics as Float64 with NaN as
+    null and -0.0 as 0.0, strings/categoricals as Utf8, others unchanged.
+    """
+    cls = column_class(dtype)
+    if cls == "numeric":
+        # Adding 0.0 turns -0.0 into 0.0
+        return pl.col(col).cast(pl.Float64).fill_nan(None) + 0.0
+    if cls == "string":
+        return pl.col(col).cast(pl.Utf8)
+    return pl.col(col)
+
+
+def _int64_columns(df: pl.DataFrame) -> Set[str]:
+    """
+    Numeric columns whose values are all integers that Int64 holds exactly:
+    integer columns (UInt64 only below 2**63) and integral float columns.
+    """
+    checks = []
+    for col, dtype in df.schema.items():
+        if column_class(dtype) != "numeric":
+            continue
+        values = pl.col(col)
+        if dtype.is_float():
+            values = values.fill_nan(None)
+            fits = (values == values.floor()) & (values.abs() < INT64_LIMIT)
+            checks.append(fits.all().alias(col))
+        elif dtype == pl.UInt64:
+            checks.append((values.max() < 2**63).fill_null(True).alias(col))
+        elif dtype.is_integer():
+            checks.append(pl.lit(True).alias(col))
+    if not checks:
+        return set()
+    return {col for col, fits in df.select(checks).row(0, named=True).items() if fits}
+
+
+def _exact_key(col: str, dtype: Any, as_int64: bool) -> pl.Expr:
+    """
+    Lossless, dtype-independent column values: numerics that fit as Int64
+    (so integer and integral float columns compare equal), other integers
+    unchanged, and `_normalised` values for everything else.
+    """
+    if as_int64:
+        values = pl.col(col).fill_nan(None) if dtype.is_float() else pl.col(col)
+        return values.cast(pl.Int64)
+    if column_class(dtype) == "numeric" and dtype.is_integer():
+        return pl.col(col)
+    return _normalised(col, dtype)
+
+
+def _fingerprint(expr: pl.Expr, name: str) -> List[pl.Expr]:
+    """
+    Two order-sensitive 64-bit hashes of a column (nulls hash to a fixed
+    value), so equal columns always share a fingerprint. Row positions are
+    hashed once in the `ROW_INDEX#<seed>` columns added by `_with_positions`.
+    """
+    return [
+        (expr.hash(seed) ^ pl.col(f"{ROW_INDEX}#{seed}")).sum().alias(f"{name}#{seed}")
+        for seed in SEEDS
+    ]
+
+
+def _with_positions(df: pl.DataFrame) -> pl.DataFrame:
+    """Add a row index and its per-seed hashes used by `_fingerprint`."""
+    return df.with_row_index(ROW_INDEX).with_columns(
+        [
+            pl.col(ROW_INDEX).hash(seed + 1).alias(f"{ROW_INDEX}#{seed}")
+            for seed in SEEDS
+        ]
+    )
+
+
+def _group_by_fingerprint(
+    df: pl.DataFrame, exprs: Dict[str, pl.Expr]
+) -> List[List[str]]:
+    """
+    Columns whose expressions are exactly equal, grouped (in column order).
+    Only columns with colliding fingerprints are compared value by value, and
+    only expressions of the same dtype can be equal.
+    """
+    if len(exprs) < 2:
+        return []
+    fingerprints = df.select(
+        [e for name, expr in exprs.items() for e in _fingerprint(expr, name)]
+    ).row(0, named=True)
+
+    buckets: Dict[Tuple[Any, ...], List[str]] = {}
+    for name in exprs:
+        key = tuple(fingerprints[f"{name}#{seed}"] for seed in SEEDS)
+        buckets.setdefault(key, []).append(name)
+
+    groups: List[List[str]] = []
+    for names in buckets.values():
+        if len(names) < 2:
+            continue
+        values = df.select([exprs[name].alias(name) for name in names])
+        classes: List[List[str]] = []
+        for name in names:
+            for members in classes:
+                first = values[members[0]]
+                if values[name].dtype == first.dtype and values[name].equals(
+                    first, null_equal=True
+                ):
+                    members.append(name)
+                    break
+            else:
+                classes.append([name])
+        groups.extend(members for members in classes if len(members) > 1)
+    return groups
+
+
+def _pairs(groups: List[List[str]], order: Dict[str, int]) -> List[Tuple[str, str]]:
+    pairs = [
+        (a, b)
+        for members in groups
+        for i, a in enumerate(members)
+        for b in members[i + 1 :]
+    ]
+    return sorted(pairs, key=lambda pair: (order[pair[0]], order[pair[1]]))
 
 
 @register_task(
@@ -22,7 +150,14 @@ from dsbf.utils.backend import is_polars
 class DetectDuplicateColumns(BaseTask):
     """
     Detects columns that are exact duplicates of one another.
-    Compares all unique column pairs using .equals().
+
+    Each column is hashed once into a dtype-normalised, null-aware fingerprint;
+    only columns with colliding fingerprints are compared value by value.
+    Integers are kept exact (as Int64, which integral float columns also map
+    to), so large distinct integers never collapse into equal floats. With
+    `near_duplicates` enabled, numeric columns equal up to a constant offset and
+    categorical columns equal up to a renaming of categories are also reported,
+    found the same way from canonicalised columns.
     """
 
     def run(self) -> None:
@@ -33,39 +168,25 @@ class DetectDuplicateColumns(BaseTask):
         try:
 
             # ctx = self.context
-            df = self.input_data
-            if is_polars(df):
-                self._log(
-                    (
-                        "    Falling back to Pandas: duplicate column"
-                        " detection requires `.equals()`"
-                    ),
-                    "debug",
-                )
-                df = df.to_pandas()
+            df = to_polars(self.input_data)
 
             # Use semantic typing to select relevant columns
             matched_col, excluded = self.get_columns_by_intent()
             self._log(f"    Processing {len(matched_col)} column(s)", "debug")
 
-            duplicate_pairs: List[Tuple[str, str]] = []
-            columns = df.columns.tolist()
-            seen = set()
-
-            for i, col1 in enumerate(columns):
-                for j in range(i + 1, len(columns)):
-                    col2 = columns[j]
-                    if (col1, col2) not in seen:
-                        try:
-                            if df[col1].equals(df[col2]):
-                                duplicate_pairs.append((col1, col2))
-                                seen.add((col1, col2))
-                        except Exception as e:
-                            self._log(
-                                f"    [DetectDuplicateColumns] Comparison failed for "
-                                f"{col1} and {col2}: {e}",
-                                "debug",
-                            )
+            near_duplicates = bool(self.get_task_param("near_duplicates", False))
+            tolerance = float(self.get_task_param("offset_tolerance") or 1e-9)
+
+            order = {col: i for i, col in enumerate(df.columns)}
+            indexed = _with_positions(df)
+            groups = self._exact_groups(indexed)
+            duplicate_pairs: List[Tuple[str, str]] = _pairs(groups, order)
+
+            near_duplicate_pairs: List[Dict[str, Any]] = []
+            if near_duplicates:
+                near_duplicate_pairs = self._near_duplicates(
+                    indexed, set(duplicate_pairs), order, tolerance
+                )
 
             self.output = TaskResult(
                 name=self.name,
@@ -75,8 +196,13 @@ class DetectDuplicateColumns(BaseTask):
                         f"Found {len(duplicate_pairs)} duplicate column pair(s)."
                     )
                 },
-                data={"duplicate_column_pairs": duplicate_pairs},
+                data={
+                    "duplicate_column_pairs": duplicate_pairs,
+                    "near_duplicate_column_pairs": near_duplicate_pairs,
+                },
                 metadata={
+                    "duplicate_groups": len(groups),
+                    "near_duplicates_checked": near_duplicates,
                     "suggested_viz_type": "None",
                     "recommended_section": "Redundancy",
                     "display_priority": "medium",
@@ -115,3 +241,92 @@ class DetectDuplicateColumns(BaseTask):
                 level="warn",
             )
             self.output = make_failure_result(self.name, e)
+
+    def _exact_groups(self, df: pl.DataFrame) -> List[List[str]]:
+        as_int64 = _int64_columns(df)
+        exprs = {}
+        for col, dtype in df.schema.items():
+            if col.startswith(ROW_INDEX):
+                continue
+            try:
+                key = _exact_key(col, dtype, col in as_int64)
+                df.head(1).select(key.hash())
+                exprs[col] = key
+            except Exception as e:
+                self._log(f"    Cannot fingerprint {col}: {e}", "debug")
+        return _group_by_fingerprint(df, exprs)
+
+    def _near_duplicates(
+        self,
+        df: pl.DataFrame,
+        exact: Set[Tuple[str, str]],
+        order: Dict[str, int],
+        tolerance: float,
+    ) -> List[Dict[str, Any]]:
+        """
+        Pairs equal up to a constant offset (numeric) or a renaming of
+        categories (string/boolean), excluding exact duplicates, constant
+        columns, and (for renamings) columns without repeated values.
+        """
+        classes = {
+            c: column_class(dtype)
+            for c, dtype in df.schema.items()
+            if not c.startswith(ROW_INDEX)
+        }
+        numeric = [c for c, cls in classes.items() if cls == "numeric"]
+        categorical = [c for c, cls in classes.items() if cls in ("string", "boolean")]
+        # Integers are shifted and differenced exactly, as Int64
+        as_int64 = _int64_columns(df)
+        keys = {c: _exact_key(c, df.schema[c], c in as_int64) for c in numeric}
+        stats = df.select(
+            [keys[c].min().alias(f"{c}#min") for c in numeric]
+            + [keys[c].max().alias(f"{c}#max") for c in numeric]
+            + [
+                pl.col(c).drop_nulls().n_unique().alias(f"{c}#unique")
+                for c in categorical
+            ]
+            + [pl.col(c).count().alias(f"{c}#count") for c in categorical]
+        ).row(0, named=True)
+
+        shifted: Dict[str, pl.Expr] = {}
+        for col in numeric:
+            low, high = stats[f"{col}#min"], stats[f"{col}#max"]
+            if low is not None and low != high:
+                # Rounded so float noise from the shift does not split groups
+                shifted[col] = (keys[col] - low).cast(pl.Float64).round(6)
+
+        codes: Dict[str, pl.Expr] = {}
+        for col in categorical:
+            if 2 <= stats[f"{col}#unique"] < stats[f"{col}#count"]:
+                # Categories numbered by first appearance
+                codes[col] = (
+                    pl.when(pl.col(col).is_not_null())
+                    .then(pl.col(ROW_INDEX).min().over(col).rank("dense"))
+                    .cast(pl.UInt32)
+                )
+
+        pairs: List[Dict[str, Any]] = []
+        for a, b in _pairs(_group_by_fingerprint(df, shifted), order):
+            if (a, b) in exact:
+                continue
+            diff = df.select((keys[b] - keys[a]).alias("d"))["d"]
+            if diff.drop_nulls().is_empty():
+                continue
+            low, high = diff.min(), diff.max()
+            scale = max(1.0, abs(low), abs(high))
+            if high - low <= tolerance * scale:
+                pairs.append(
+                    {
+                        "columns": [a, b],
+                        "relation": "constant_offset",
+                        "offset": float(diff.mean()),
+                    }
+                )
+
+        for a, b in _pairs(_group_by_fingerprint(df, codes), order):
+            if (a, b) not in exact:
+                pairs.append({"columns": [a, b], "relation": "category_renaming"})
+
+        return sorted(
+            pairs, key=lambda p: (order[p["columns"][0]], order[p["columns"][1]])
+        )
@@ -1,15 +1,25 @@
 # dsbf/eda/tasks/detect_encoded_columns.py
 
-import math
-import re
-import statistics
-from collections import Counter
+import polars as pl
 
 from dsbf.core.base_task import BaseTask
 from dsbf.eda.task_registry import register_task
 from dsbf.eda.task_result import TaskResult, make_failure_result
-from dsbf.utils.backend import is_polars, is_text_polars
+from dsbf.utils.backend import is_text_polars, to_polars
 from dsbf.utils.reco_engine import get_recommendation_tip
+from dsbf.utils.text_stats import character_entropy
+
+# Full-value patterns, tried in order on a sample of each column
+ENCODED_PATTERNS = {
+    "uuid": (
+        r"(?i)^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]"
+        r"{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$"
+    ),
+    "hex": r"^[0-9a-fA-F]+$",
+    "base64": r"^[A-Za-z0-9+/=]+$",
+}
+
+PATTERN_SAMPLE_SIZE = 50
 
 
 @register_task(
@@ -27,13 +37,15 @@ from dsbf.utils.reco_engine import get_recommendation_tip
     runtime_estimate="fast",
     inputs=["dataframe"],
     outputs=["TaskResult"],
-    expected_semantic_types=["text", "categorical"],
+    expected_semantic_types=["text", "categorical", "id"],
 )
 class DetectEncodedColumns(BaseTask):
     """
     Detects columns that contain hash-like or encoded data such as
         base64, hex, or UUIDs.
     Flags based on entropy, uniform length, and restricted character sets.
+    Length statistics and the character histogram are computed in bulk;
+    character entropy is only needed for columns of near-uniform length.
     """
 
     def run(self) -> None:
@@ -44,7 +56,8 @@ class DetectEncodedColumns(BaseTask):
             # Use semantic typing to select relevant columns
             matched_col, excluded = self.get_columns_by_intent()
             self._log(
-                f"    Processing {len(matched_col)} ['text', 'categorical'] column(s)",
+                f"    Processing {len(matched_col)} ['text', 'categorical', 'id']"
+                " column(s)",
                 "debug",
             )
 
@@ -56,65 +69,50 @@ class DetectEncodedColumns(BaseTask):
             detect_hex = self.get_task_param("detect_hex", True)
             detect_uuid = self.get_task_param("detect_uuid", True)
 
+            enabled_patterns = {
+                "uuid": detect_uuid,
+                "hex": detect_hex,
+                "base64": detect_base64,
+            }
+
             flagged_columns = []
             details = {}
             recommendations = []
 
+            df = to_polars(df)
             for col in df.columns:
                 column = df.get_column(col)
-                if not is_polars(df) or not is_text_polars(column):
-                    continue
-
-                charsets = {
-                    "base64": re.compile(r"^[A-Za-z0-9+/=]+$"),
-                    "hex": re.compile(r"^[0-9a-fA-F]+$"),
-                    "uuid": re.compile(
-                        (
-                            r"^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]"
-                            "{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$"
-                        ),
-                        re.I,
-                    ),
-                }
-
-                try:
-                    values = column.drop_nulls().to_list()
-                except Exception:
+                if not is_text_polars(column):
                     continue
 
+                values = column.cast(pl.Utf8).drop_nulls()
                 if len(values) < 10:
                     continue  # Skip small columns
 
-                # Entropy + length uniformity check
-                lengths = [len(v) for v in values]
-                avg_len = statistics.mean(lengths)
-                std_len = statistics.stdev(lengths) if len(lengths) > 1 else 0
-
-                all_chars = "".join(values)
-                freqs = Counter(all_chars)
-                probs = [v / len(all_chars) for v in freqs.values() if v > 0]
-                entropy = -sum(p * math.log2(p) for p in probs)
+                lengths = values.str.len_chars()
+                avg_len = float(lengths.mean())
+                std_len = float(lengths.std())
 
                 match_type = None
+                entropy = None
 
-                # Entropy + length check first
-                if entropy > min_entropy and std_len < length_std_threshold:
-                    match_type = "high_entropy"
+                # Entropy + length check first; a spread-out length
+                # distribution rules it out without reading the characters
+                if std_len < length_std_threshold:
+                    entropy = character_entropy(values)
+                    if entropy > min_entropy:
+                        match_type = "high_entropy"
 
                 # Only apply pattern match if no entropy-based match
                 if match_type is None:
-                    if detect_uuid and all(
-                        charsets["uuid"].fullmatch(v) for v in values[:50]
-                    ):
-                        match_type = "uuid"
-                    elif detect_hex and all(
-                        charsets["hex"].fullmatch(v) for v in values[:50]
-                    ):
-                        match_type = "hex"
-                    elif detect_base64 and all(
-                        charsets["base64"].fullmatch(v) for v in values[:50]
-                    ):
-                        match_type = "base64"
+                    sample = values.head(PATTERN_SAMPLE_SIZE)
+                    for name, pattern in ENCODED_PATTERNS.items():
+                        if (
+                            enabled_patterns[name]
+                            and sample.str.contains(pattern).all()
+                        ):
+                            match_type = name
+                            break
 
                 if match_type:
                     flagged_columns.append(col)
@@ -122,8 +120,10 @@ class DetectEncodedColumns(BaseTask):
                         "match_type": match_type,
                         "avg_length": avg_len,
                         "length_std": std_len,
-                        "entropy": entropy,
-                        "sample_values": values[:5],
+                        "entropy": (
+                            character_entropy(values) if entropy is None else entropy
+                        ),
+                        "sample_values": values.head(5).to_list(),
                     }
                     recommendations.append(
                         f"Column '{col}' appears to contain {match_type} strings. "
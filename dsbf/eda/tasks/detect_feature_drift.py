@@ -205,6 +205,7 @@ class DetectFeatureDrift(BaseTask):
                         ],
                         save_path=static_path,
                         title=f"{col} — Current Distribution",
+                        max_rows=self.get_plot_max_rows(),
                     )
                     interactive = PlotFactory.plot_histogram_interactive(
                         series_combined[series_combined["dataset"] == "current"][
@@ -215,6 +216,7 @@ class DetectFeatureDrift(BaseTask):
                             f"PSI: {drift_results[col].get('psi', '?')}",
                             f"KS p-value: {drift_results[col].get('ks_pvalue', '?')}",
                         ],
+                        max_rows=self.get_plot_max_rows(),
                     )
 
                     plots[col] = {
@@ -2,6 +2,8 @@
 
 from typing import Any, Dict
 
+import pandas as pd
+
 from dsbf.core.base_task import BaseTask
 from dsbf.eda.task_registry import register_task
 from dsbf.eda.task_result import TaskResult, make_failure_result
@@ -19,7 +21,7 @@ from dsbf.utils.reco_engine import get_recommendation_tip
     domain="core",
     runtime_estimate="fast",
     tags=["categorical", "cardinality"],
-    expected_semantic_types=["categorical"],
+    expected_semantic_types=["categorical", "text", "id"],
 )
 class DetectHighCardinality(BaseTask):
     """
@@ -39,7 +41,9 @@ class DetectHighCardinality(BaseTask):
             # Use semantic typing to select relevant columns
             matched_col, excluded = self.get_columns_by_intent()
             self._log(
-                f"    Processing {len(matched_col)} 'categorical' column(s)", "debug"
+                f"    Processing {len(matched_col)} ['categorical', 'text', 'id']"
+                " column(s)",
+                "debug",
             )
 
             cardinality_threshold = float(
@@ -48,28 +52,14 @@ class DetectHighCardinality(BaseTask):
 
             results: Dict[str, int] = {}
 
-            if is_polars(df):
-                for col in df.columns:
-                    try:
-                        n_unique = df[col].n_unique()
-                        if n_unique > cardinality_threshold:
-                            results[col] = n_unique
-                            self._log(
-                                f"    {col} has {n_unique} unique values", "debug"
-                            )
-                    except Exception:
-                        continue
-            else:
-                for col in df.columns:
-                    try:
-                        n_unique = df[col].nunique()
-                        if n_unique > cardinality_threshold:
-                            results[col] = n_unique
-                            self._log(
-                                f"    {col} has {n_unique} unique values", "debug"
-                            )
-                    except Exception:
-                        continue
+            for col in df.columns:
+                try:
+                    n_unique = self.count_unique(df, col)
+                    if n_unique > cardinality_threshold:
+                        results[col] = n_unique
+                        self._log(f"    {col} has {n_unique} unique values", "debug")
+                except Exception:
+                    continue
 
             # Plotting
             plots: dict[str, dict[str, Any]] = {}
@@ -79,7 +69,10 @@ class DetectHighCardinality(BaseTask):
 
             for col in results:
                 series = df[col].dropna()
-                counts = series.value_counts().head(10)
+                if self.approximate:
+                    counts = pd.Series(dict(self.frequent_items(series).top(10)))
+                else:
+                    counts = series.value_counts().head(10)
                 counts.name = col
 
                 n_unique = results[col]
@@ -106,6 +99,7 @@ class DetectHighCardinality(BaseTask):
                 plots=plots,
                 metadata={
                     "cardinality_threshold": cardinality_threshold,
+                    **self.approximation_metadata("distinct"),
                     "suggested_viz_type": "bar",
                     "recommended_section": "Cardinality",
                     "display_priority": "medium",
@@ -5,7 +5,6 @@ from typing import Any, Dict
 from dsbf.core.base_task import BaseTask
 from dsbf.eda.task_registry import register_task
 from dsbf.eda.task_result import TaskResult, make_failure_result
-from dsbf.utils.backend import is_polars
 
 
 @register_task(
@@ -17,7 +16,7 @@ from dsbf.utils.backend import is_polars
     domain="core",
     runtime_estimate="fast",
     tags=["metadata", "id", "index"],
-    expected_semantic_types=["id", "categorical", "text"],
+    expected_semantic_types=["any"],
 )
 class DetectIdColumns(BaseTask):
     """
@@ -33,48 +32,31 @@ class DetectIdColumns(BaseTask):
 
             # Use semantic typing to select relevant columns
             matched_col, excluded = self.get_columns_by_intent()
-            self._log(
-                f"    Processing {len(matched_col)} ['id', 'categorical', 'text']"
-                " column(s)",
-                "debug",
-            )
+            self._log(f"    Processing {len(df.columns)} column(s)", "debug")
 
             threshold_ratio = float(self.get_task_param("threshold_ratio") or 0.95)
 
-            n_rows = df.shape[0]
-            threshold = threshold_ratio * n_rows
+            n_rows = int(self.get_source_stat(None, "num_rows", df.shape[0]))
             results: Dict[str, str] = {}
 
-            if is_polars(df):
-                for col in df.columns:
-                    try:
-                        n_unique = df[col].n_unique()
-                        if n_unique >= threshold:
-                            results[col] = f"{n_unique} unique values (likely ID)"
-                            self._log(
-                                (
-                                    f"    {col} flagged as likely ID with {n_unique}"
-                                    " unique values"
-                                ),
-                                "debug",
-                            )
-                    except Exception:
-                        continue
-            else:
-                for col in df.columns:
-                    try:
-                        n_unique = df[col].nunique()
-                        if n_unique >= threshold:
-                            results[col] = f"{n_unique} unique values (likely ID)"
-                            self._log(
-                                (
-                                    f"    {col} flagged as likely ID with {n_unique}"
-                                    " unique values"
-                                ),
-                                "debug",
-                            )
-                    except Exception:
-                        continue
+            for col in df.columns:
+                try:
+                    n_unique = self.count_unique(df, col)
+                    # Compare against the rows the distinct count was taken over:
+                    # the whole source, or only the loaded (possibly sampled) rows
+                    from_source = self.get_source_stat(col, "n_unique") is not None
+                    rows = n_rows if from_source else df.shape[0]
+                    if n_unique >= threshold_ratio * rows:
+                        results[col] = f"{n_unique} unique values (likely ID)"
+                        self._log(
+                            (
+                                f"    {col} flagged as likely ID with {n_unique}"
+                                " unique values"
+                            ),
+                            "debug",
+                        )
+                except Exception:
+                    continue
 
             self.output = TaskResult(
                 name=self.name,
@@ -83,7 +65,9 @@ class DetectIdColumns(BaseTask):
                 data=results,
                 metadata={
                     "rows": n_rows,
+                    "sample_rows": int(df.shape[0]),
                     "threshold_ratio": threshold_ratio,
+                    **self.approximation_metadata("distinct"),
                     "suggested_viz_type": "None",
                     "recommended_section": "Schema",
                     "display_priority": "low",
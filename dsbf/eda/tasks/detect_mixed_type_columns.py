@@ -1,7 +1,5 @@
 # dsbf/eda/tasks/detect_mixed_type_columns.py
 
-from collections import Counter, defaultdict
-
 import polars as pl
 
 from dsbf.core.base_task import BaseTask
@@ -32,6 +30,8 @@ class DetectMixedTypeColumns(BaseTask):
     Detects columns that contain more than one data type,
         such as a mix of floats and strings.
     Focuses on object-like columns where dtype is not strongly enforced.
+    Values are grouped by type family from the shared column type profile, so
+    ints of different widths count as one type and NaN counts as null.
     """
 
     def run(self) -> None:
@@ -58,27 +58,16 @@ class DetectMixedTypeColumns(BaseTask):
                     if df[col].dtype != pl.Object:
                         continue
 
-                try:
-                    values = df[col].to_numpy()
-                except Exception:
-                    continue  # Skip columns that fail conversion
-
-                # Type counter (excluding None if requested)
-                type_counter = Counter()
-                for v in values:
-                    if v is None:
-                        if not ignore_null_type:
-                            type_counter["NoneType"] += 1
-                    else:
-                        type_counter[type(v).__name__] += 1
+                # Type family counts (excluding nulls unless requested)
+                profile = self.get_type_profile(col)
+                type_counter = dict(profile.counts)
+                if not ignore_null_type and profile.null_count:
+                    type_counter["NoneType"] = profile.null_count
 
                 if len(type_counter) <= 1:
                     continue  # Only one type, skip
 
                 total = sum(type_counter.values())
-                if total == 0:
-                    continue  # Column is entirely null or empty
-
                 minority_types = {
                     t: count
                     for t, count in type_counter.items()
@@ -89,19 +78,23 @@ class DetectMixedTypeColumns(BaseTask):
                 if not minority_types:
                     continue
 
-                # Collect sample values from minority types
-                samples_by_type = defaultdict(list)
-                for v in values:
-                    if v is None and ignore_null_type:
-                        continue
-                    tname = type(v).__name__
-                    if tname in minority_types and len(samples_by_type[tname]) < 5:
-                        samples_by_type[tname].append(repr(v))
+                # Sample values from minority types, by the profiled positions
+                series = df[col]
+                samples_by_type = {
+                    t: [
+                        repr(series[i] if is_polars(df) else series.iloc[i])
+                        for i in profile.samples[t]
+                    ]
+                    for t in minority_types
+                    if t in profile.samples
+                }
+                if "NoneType" in minority_types:
+                    samples_by_type["NoneType"] = ["None"] * min(profile.null_count, 5)
 
                 flagged_columns.append(col)
                 details[col] = {
                     "type_counts": dict(type_counter),
-                    "sample_values": dict(samples_by_type),
+                    "sample_values": samples_by_type,
                 }
                 recommendations.append(
                     f"Column '{col}' contains multiple data types"
@@ -23,7 +23,8 @@ from dsbf.utils.reco_engine import get_recommendation_tip
     domain="core",
     runtime_estimate="fast",
     tags=["numeric", "variance", "ml_readiness"],
-    expected_semantic_types=["continuous"],
+    expected_semantic_types=["continuous", "categorical"],
+    reads=["numeric"],
 )
 class DetectNearZeroVariance(BaseTask):
     def run(self) -> None:
@@ -33,7 +34,9 @@ class DetectNearZeroVariance(BaseTask):
             # Use semantic typing to select relevant columns
             matched_col, excluded = self.get_columns_by_intent()
             self._log(
-                f"    Processing {len(matched_col)} 'continuous' column(s)", "debug"
+                f"    Processing {len(matched_col)} ['continuous', 'categorical']"
+                " column(s)",
+                "debug",
             )
 
             threshold = float(self.get_task_param("threshold") or 1e-4)
@@ -69,9 +72,13 @@ class DetectNearZeroVariance(BaseTask):
                     series = df[col].dropna()
 
                     save_path = self.get_output_path(f"{col}_boxplot.png")
-                    static = PlotFactory.plot_boxplot_static(series, save_path)
+                    static = PlotFactory.plot_boxplot_static(
+                        series, save_path, max_rows=self.get_plot_max_rows()
+                    )
                     interactive = PlotFactory.plot_boxplot_interactive(
-                        series, annotations=[f"Variance = {low_variance[col]:.8f}"]
+                        series,
+                        annotations=[f"Variance = {low_variance[col]:.8f}"],
+                        max_rows=self.get_plot_max_rows(),
                     )
 
                     plots[col] = {
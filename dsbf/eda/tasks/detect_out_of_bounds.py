@@ -19,7 +19,8 @@ from dsbf.utils.backend import is_polars
     domain="core",
     runtime_estimate="fast",
     tags=["bounds", "validation"],
-    expected_semantic_types=["continuous"],
+    expected_semantic_types=["continuous", "categorical"],
+    reads=["numeric"],
 )
 class DetectOutOfBounds(BaseTask):
     """
@@ -33,7 +34,9 @@ class DetectOutOfBounds(BaseTask):
             # Use semantic typing to select relevant columns
             matched_col, excluded = self.get_columns_by_intent()
             self._log(
-                f"    Processing {len(matched_col)} 'continuous' column(s)", "debug"
+                f"    Processing {len(matched_col)} ['continuous', 'categorical']"
+                " column(s)",
+                "debug",
             )
 
             # Load shared reliability flags in case we
@@ -54,10 +57,21 @@ class DetectOutOfBounds(BaseTask):
                 df = df.to_pandas()
 
             flagged: Dict[str, Dict[str, Any]] = {}
+            footer_cleared = []
 
             for col in df.select_dtypes(include=np.number).columns:
                 if col in bounds:
                     lower, upper = bounds[col]
+
+                    # Exact min/max from source metadata (e.g. Parquet footer) can
+                    # rule out violations without scanning the column.
+                    col_min = self.get_source_stat(col, "min")
+                    col_max = self.get_source_stat(col, "max")
+                    if col_min is not None and col_max is not None:
+                        if lower <= col_min and col_max <= upper:
+                            footer_cleared.append(col)
+                            continue
+
                     series = df[col].dropna()
                     violations = series[(series < lower) | (series > upper)]
 
@@ -80,6 +94,7 @@ class DetectOutOfBounds(BaseTask):
                 data=flagged,
                 metadata={
                     "rule_columns": list(bounds.keys()),
+                    "source_stat_columns": footer_cleared,
                     "suggested_viz_type": "None",
                     "recommended_section": "Validation",
                     "display_priority": "high",
@@ -22,6 +22,7 @@ from dsbf.utils.reco_engine import get_recommendation_tip
     runtime_estimate="moderate",
     tags=["outliers", "numeric"],
     expected_semantic_types=["continuous"],
+    reads=["numeric"],
 )
 class DetectOutliers(BaseTask):
     """
@@ -67,8 +68,11 @@ class DetectOutliers(BaseTask):
                     self._log(f"    {col} skipped: empty after dropna()", "debug")
                     continue
 
-                q1 = series.quantile(0.25)
-                q3 = series.quantile(0.75)
+                if self.approximate:
+                    q1, q3 = self.quantile_sketch(series).quantiles([0.25, 0.75])
+                else:
+                    q1 = series.quantile(0.25)
+                    q3 = series.quantile(0.75)
                 iqr = q3 - q1
                 lower = q1 - 1.5 * iqr
                 upper = q3 + 1.5 * iqr
@@ -81,7 +85,9 @@ class DetectOutliers(BaseTask):
 
                 # Plot boxplot
                 save_path = self.get_output_path(f"{col}_boxplot.png")
-                static = PlotFactory.plot_boxplot_static(series, save_path)["path"]
+                static = PlotFactory.plot_boxplot_static(
+                    series, save_path, max_rows=self.get_plot_max_rows()
+                )["path"]
                 annotations = [
                     f"IQR: {iqr:.3f}",
                     f"Lower bound: {lower:.3f}",
@@ -89,7 +95,7 @@ class DetectOutliers(BaseTask):
                     f"Outliers detected: {outlier_mask.sum()}",
                 ]
                 interactive = PlotFactory.plot_boxplot_interactive(
-                    series, annotations=annotations
+                    series, annotations=annotations, max_rows=self.get_plot_max_rows()
                 )
 
                 plots[col] = {"static": static, "interactive": interactive}
@@ -111,6 +117,7 @@ class DetectOutliers(BaseTask):
                     "method": method,
                     "threshold_pct": flag_threshold,
                     "total_rows": n_rows,
+                    **self.approximation_metadata("quantile"),
                     "suggested_viz_type": "boxplot",
                     "recommended_section": "Outliers",
                     "display_priority": "high",
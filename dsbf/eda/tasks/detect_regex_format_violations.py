@@ -1,9 +1,26 @@
 import re
+from typing import Dict, List, Optional, Tuple
+
+import polars as pl
 
 from dsbf.core.base_task import BaseTask
 from dsbf.eda.task_registry import register_task
 from dsbf.eda.task_result import TaskResult, make_failure_result
-from dsbf.utils.backend import is_text_polars
+from dsbf.utils.backend import is_text_polars, to_polars
+
+
+def anchored(pattern: str) -> str:
+    """Wrap a pattern so `str.contains` behaves like `re.fullmatch`."""
+    return f"^(?:{pattern})$"
+
+
+def is_polars_regex(pattern: str) -> bool:
+    """True if Polars' (Rust) regex engine accepts `pattern`."""
+    try:
+        pl.Series([""], dtype=pl.Utf8).str.contains(anchored(pattern))
+    except Exception:
+        return False
+    return True
 
 
 @register_task(
@@ -22,24 +39,34 @@ from dsbf.utils.backend import is_text_polars
     inputs=["dataframe"],
     outputs=["TaskResult"],
     expected_semantic_types=["text"],
+    column_params=["custom_patterns"],
 )
 class DetectRegexFormatViolations(BaseTask):
     """
     Detects string columns that fail to match specified regex formats.
 
+    Patterns run on Polars' native regex engine, all columns in one query.
+    A strided sample first decides which columns are structured (at least
+    `match_threshold` of sampled values match); only those are checked in
+    full, and only the first `max_violations` offending values per column are
+    kept. Patterns Polars cannot compile (e.g. look-arounds) fall back to
+    Python's `re`.
+
     Config format:
     tasks:
       detect_regex_format_violations:
-        patterns:
+        custom_patterns:
           column_name: regex_pattern
-        max_violations_to_store: 5
+        match_threshold: 0.6
+        max_violations: 5
+        sample_size: 10000
     """
 
     def run(self):
         try:
 
             # ctx = self.context
-            df = self.input_data
+            df = to_polars(self.input_data)
 
             # Use semantic typing to select relevant columns
             matched_col, excluded = self.get_columns_by_intent()
@@ -47,31 +74,61 @@ class DetectRegexFormatViolations(BaseTask):
 
             patterns = dict(self.get_task_param("custom_patterns") or {})
             max_violations = int(self.get_task_param("max_violations") or 5)
+            match_threshold = float(self.get_task_param("match_threshold") or 0.0)
+            sample_size = int(self.get_task_param("sample_size") or 10_000)
 
-            summary = {}
-            data = {}
-            recs = []
-
+            native: Dict[str, str] = {}
+            fallback: Dict[str, re.Pattern] = {}
             for col_name, pattern in patterns.items():
-                if col_name not in df.columns:
+                if col_name not in df.columns or not is_text_polars(df[col_name]):
                     continue
-                col = df[col_name]
-                if not is_text_polars(col):
+                if is_polars_regex(pattern):
+                    native[col_name] = anchored(pattern)
                     continue
-
                 try:
-                    regex = re.compile(pattern)
+                    fallback[col_name] = re.compile(pattern)
                 except re.error:
                     continue  # Invalid regex pattern
 
-                values = col.drop_nulls().to_list()
-                violations = [v for v in values if not regex.fullmatch(str(v))]
-                num_violations = len(violations)
+            match_rates = self._sample_match_rates(df, native, sample_size)
+            step = max(1, df.height // max(sample_size, 1))
+            for col_name, regex in fallback.items():
+                sample = df[col_name].gather_every(step).cast(pl.Utf8).drop_nulls()
+                match_rates[col_name] = (
+                    sum(bool(regex.fullmatch(v)) for v in sample) / len(sample)
+                    if len(sample)
+                    else None
+                )
+            unstructured = sorted(
+                col
+                for col, rate in match_rates.items()
+                if rate is not None and rate < match_threshold
+            )
+
+            found = self._native_violations(
+                df,
+                {c: p for c, p in native.items() if c not in unstructured},
+                max_violations,
+            )
+            for col_name, regex in fallback.items():
+                if col_name not in unstructured:
+                    found[col_name] = self._python_violations(
+                        df[col_name], regex, max_violations
+                    )
+
+            summary = {}
+            data = {}
+            recs = []
+
+            for col_name in patterns:
+                if col_name not in found:
+                    continue
+                num_violations, violations = found[col_name]
 
                 if num_violations > 0:
                     summary[col_name] = {
                         "num_violations": num_violations,
-                        "sample_violations": violations[:max_violations],
+                        "sample_violations": violations,
                     }
                     data[col_name] = violations
                     recs.append(
@@ -93,6 +150,9 @@ class DetectRegexFormatViolations(BaseTask):
                     "suggested_viz_type": "None",
                     "recommended_section": "Format",
                     "display_priority": "high",
+                    "match_threshold": match_threshold,
+                    "sample_match_rates": match_rates,
+                    "unstructured_columns": unstructured,
                     "excluded_columns": excluded,
                     "column_types": self.get_column_type_info(
                         matched_col + list(excluded.keys())
@@ -108,3 +168,52 @@ class DetectRegexFormatViolations(BaseTask):
                 level="warn",
             )
             self.output = make_failure_result(self.name, e)
+
+    @staticmethod
+    def _sample_match_rates(
+        df: pl.DataFrame, patterns: Dict[str, str], sample_size: int
+    ) -> Dict[str, Optional[float]]:
+        """Share of non-null values matching, on every n-th row (one query)."""
+        if not patterns:
+            return {}
+        step = max(1, df.height // max(sample_size, 1))
+        sample = df.select(list(patterns)).gather_every(step)
+        rates = sample.select(
+            pl.col(col).cast(pl.Utf8).str.contains(pattern).mean().alias(col)
+            for col, pattern in patterns.items()
+        ).row(0)
+        return dict(zip(patterns, rates))
+
+    @staticmethod
+    def _native_violations(
+        df: pl.DataFrame, patterns: Dict[str, str], max_violations: int
+    ) -> Dict[str, Tuple[int, List[str]]]:
+        """Violation count and first offending values per column (one query)."""
+        if not patterns:
+            return {}
+        exprs = []
+        for i, (col, pattern) in enumerate(patterns.items()):
+            values = pl.col(col).cast(pl.Utf8)
+            bad = values.is_not_null() & ~values.str.contains(pattern)
+            exprs += [
+                bad.sum().alias(f"count_{i}"),
+                values.filter(bad).head(max_violations).implode().alias(f"head_{i}"),
+            ]
+        row = df.lazy().select(exprs).collect().row(0)
+        return {
+            col: (int(row[2 * i]), list(row[2 * i + 1]))
+            for i, col in enumerate(patterns)
+        }
+
+    @staticmethod
+    def _python_violations(
+        column: pl.Series, regex: re.Pattern, max_violations: int
+    ) -> Tuple[int, List[str]]:
+        """Violation count and first offending values, checked with `re`."""
+        count, violations = 0, []
+        for v in column.cast(pl.Utf8).drop_nulls():
+            if not regex.fullmatch(v):
+                count += 1
+                if len(violations) < max_violations:
+                    violations.append(v)
+        return count, violations
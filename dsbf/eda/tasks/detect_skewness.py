@@ -24,6 +24,7 @@ from dsbf.utils.reco_engine import get_recommendation_tip
     runtime_estimate="fast",
     tags=["distribution", "skew"],
     expected_semantic_types=["continuous"],
+    reads=["numeric"],
 )
 class DetectSkewness(BaseTask):
     """
@@ -69,9 +70,13 @@ class DetectSkewness(BaseTask):
 
                     annotations = [f"Skewness: {skew_val:.3f}"]
                     save_path = self.get_output_path(f"{col}_histogram.png")
-                    static_plot = PlotFactory.plot_histogram_static(series, save_path)
+                    static_plot = PlotFactory.plot_histogram_static(
+                        series, save_path, max_rows=self.get_plot_max_rows()
+                    )
                     interactive_plot = PlotFactory.plot_histogram_interactive(
-                        series, annotations=annotations
+                        series,
+                        annotations=annotations,
+                        max_rows=self.get_plot_max_rows(),
                     )
                     plots[col] = {
                         "static": static_plot["path"],
@@ -100,9 +105,13 @@ class DetectSkewness(BaseTask):
 
                     annotations = [f"Skewness: {skew_val:.3f}"]
                     save_path = self.get_output_path(f"{col}_histogram.png")
-                    static_plot = PlotFactory.plot_histogram_static(series, save_path)
+                    static_plot = PlotFactory.plot_histogram_static(
+                        series, save_path, max_rows=self.get_plot_max_rows()
+                    )
                     interactive_plot = PlotFactory.plot_histogram_interactive(
-                        series, annotations=annotations
+                        series,
+                        annotations=annotations,
+                        max_rows=self.get_plot_max_rows(),
                     )
                     plots[col] = {
                         "static": static_plot["path"],
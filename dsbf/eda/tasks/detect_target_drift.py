@@ -211,12 +211,16 @@ class DetectTargetDrift(BaseTask):
 
             static_path = self.get_output_path("target_drift_histogram.png")
             static = PlotFactory.plot_histogram_static(
-                cur_pd, save_path=static_path, title="Current Target Distribution"
+                cur_pd,
+                save_path=static_path,
+                title="Current Target Distribution",
+                max_rows=self.get_plot_max_rows(),
             )
             interactive = PlotFactory.plot_histogram_interactive(
                 cur_pd,
                 title="Current Target Distribution",
                 annotations=[f"PSI: {psi:.3f}", f"KS p-value: {ks_p:.3f}"],
+                max_rows=self.get_plot_max_rows(),
             )
             result.plots = {
                 "target_drift": {
@@ -22,6 +22,7 @@ from dsbf.utils.plot_factory import PlotFactory
     runtime_estimate="fast",
     tags=["zeros", "sparsity"],
     expected_semantic_types=["continuous"],
+    reads=["numeric"],
 )
 class DetectZeros(BaseTask):
     """
@@ -1,9 +1,14 @@
 # dsbf/eda/tasks/infer_types.py
 
+import hashlib
+import json
+import os
 import warnings
-from typing import Any, Dict
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
+import polars as pl
 
 from dsbf.core.base_task import BaseTask
 from dsbf.eda.task_registry import register_task
@@ -14,6 +19,82 @@ warnings.filterwarnings(
     "ignore", category=UserWarning, message="Could not infer format.*"
 )
 
+TYPE_CACHE_FILE = "infer_types_cache.json"
+
+# Inferred types by column fingerprint, shared by runs in this process
+_TYPE_CACHE: Dict[str, str] = {}
+MAX_CACHE_ENTRIES = 100_000
+
+HEX_ID_PATTERN = r"^[A-Fa-f0-9\-]{8,}$"
+# Integer ID rule: enough rows to tell a key from a small measured column, and
+# distinct values spanning at most this multiple of their count
+MIN_INTEGER_ID_ROWS = 100
+MAX_INTEGER_ID_SPAN = 2.0
+# String ID rule: distinct ratio of the full column, and how far below it a
+# sample's ratio may fall and still trigger the full count
+ID_DISTINCT_RATIO = 0.9
+SAMPLE_RATIO_MARGIN = 0.1
+
+
+def stratified_positions(n_rows: int, size: int, seed: int = 42) -> np.ndarray:
+    """
+    Row positions of a sample of `size` rows with one row drawn from each of
+    `size` equal, contiguous strata, so every part of the data is represented.
+    """
+    if n_rows <= size:
+        return np.arange(n_rows)
+    bounds = np.linspace(0, n_rows, size + 1).astype(np.int64)
+    rng = np.random.default_rng(seed)
+    return bounds[:-1] + (rng.random(size) * np.diff(bounds)).astype(np.int64)
+
+
+def _parse_iso_date(values: pl.Series) -> pl.Series:
+    return values.str.to_date("%Y-%m-%d", strict=False)
+
+
+def _parse_inferred_datetime(values: pl.Series) -> pl.Series:
+    try:
+        return values.str.to_datetime(strict=False, time_zone="UTC")
+    except pl.exceptions.ComputeError:  # No format fits the first value
+        return pl.Series(values.name, [None] * len(values), dtype=pl.Datetime)
+
+
+def _parse_pandas_datetime(values: pl.Series) -> pl.Series:
+    return pl.from_pandas(pd.to_datetime(values.to_pandas(), errors="coerce", utc=True))
+
+
+# Datetime parsers, tried in order: ISO dates, then Polars' format inference,
+# then Pandas' more permissive parser
+DATETIME_PARSERS: List[Callable[[pl.Series], pl.Series]] = [
+    _parse_iso_date,
+    _parse_inferred_datetime,
+    _parse_pandas_datetime,
+]
+
+
+def parse_failures(
+    parser: Callable[[pl.Series], pl.Series],
+    values: pl.Series,
+    max_failures: int,
+    chunk_rows: int,
+    probe_rows: Optional[int] = None,
+) -> int:
+    """
+    Number of non-null values `parser` cannot parse, checked `chunk_rows` at a
+    time (after a first chunk of `probe_rows`, if given) and stopping as soon
+    as more than `max_failures` are found.
+    """
+    first = probe_rows or chunk_rows
+    starts = [0, *range(first, len(values), chunk_rows)]
+    ends = starts[1:] + [len(values)]
+    failures = 0
+    for start, end in zip(starts, ends):
+        parsed = parser(values.slice(start, end - start))
+        failures += int(parsed.is_null().sum())
+        if failures > max_failures:
+            break
+    return failures
+
 
 @register_task(
     display_name="Infer Column Types",
@@ -34,6 +115,15 @@ class InferTypes(BaseTask):
     The inferred types are used to guide downstream tasks such as visualizations,
     statistical tests, or recommendations, while the analysis intent helps align
     profiling behavior with how the data will be used, not just what it is.
+
+    Inference runs in Polars on a row-stratified sample of `sample_size` rows.
+    The full column is read only when the sample cannot decide: exact distinct
+    counts for low-cardinality numerics, near-unique strings and sorted or
+    densely packed unique integers (surrogate keys, typed 'id'), and datetime
+    parsing of columns whose sample parsed, stopping after `max_parse_failures`
+    failures. Results are cached by column name, dtype, row count, a hash of
+    the sampled values and the settings that affect inference, in process and
+    (with `cache_dir`) across runs.
     """
 
     def run(self) -> None:
@@ -45,10 +135,13 @@ class InferTypes(BaseTask):
         try:
             df: Any = self.input_data
 
-            # Convert to Pandas for compatibility
-            if is_polars(df):
-                df = df.to_pandas()
+            sample_size = int(self.get_task_param("sample_size") or 10_000)
+            seed = int(self.get_task_param("seed") or 42)
+            cache_dir: Optional[str] = self.get_task_param("cache_dir")
+            cache = self._load_cache(cache_dir)
+            cache_hits = 0
 
+            positions = stratified_positions(df.shape[0], sample_size, seed)
             results: Dict[str, Dict[str, str]] = {}
 
             # Loop through each column to infer dtypes
@@ -58,46 +151,15 @@ class InferTypes(BaseTask):
 
                 # Always record something, even for empty columns
                 try:
-                    series = df[col].dropna()
-                    nunique = series.nunique()
-                    total = series.size
-                    uniq_ratio = nunique / total if total else 0
-
-                    # ---- Heuristic rules for semantic typing ----
-                    if pd.api.types.is_bool_dtype(series):
-                        analysis_intent_dtype = "categorical"
-                    elif pd.api.types.is_numeric_dtype(series):
-                        if nunique == 2:
-                            analysis_intent_dtype = "categorical"
-                        elif uniq_ratio < 0.05 and nunique <= 20:
-                            analysis_intent_dtype = "categorical"
-                        else:
-                            analysis_intent_dtype = "continuous"
-                    elif pd.api.types.is_datetime64_any_dtype(series):
-                        analysis_intent_dtype = "datetime"
-                    elif pd.api.types.is_string_dtype(series):
-                        try:
-                            # Attempt ISO-style format first for performance
-                            pd.to_datetime(
-                                series, format="%Y-%m-%d", errors="raise", utc=True
-                            )
-                            analysis_intent_dtype = "datetime"
-                        except Exception:
-                            try:
-                                pd.to_datetime(series, errors="raise", utc=True)
-                                analysis_intent_dtype = "datetime"
-                            except Exception:
-                                if (
-                                    series.str.fullmatch(r"[A-Fa-f0-9\-]{8,}").mean()
-                                    > 0.8
-                                ):
-                                    analysis_intent_dtype = "id"
-                                elif uniq_ratio > 0.9:
-                                    analysis_intent_dtype = "id"
-                                elif series.str.len().mean() > 30:
-                                    analysis_intent_dtype = "text"
-                                else:
-                                    analysis_intent_dtype = "categorical"
+                    series = self._as_polars_series(df, col)
+                    sample = series.gather(positions)
+                    key = self._fingerprint(series, sample)
+                    if key in cache:
+                        analysis_intent_dtype = cache[key]
+                        cache_hits += 1
+                    else:
+                        analysis_intent_dtype = self._infer(series, sample)
+                        cache[key] = analysis_intent_dtype
                 except Exception:
                     pass  # Still record defaults below
 
@@ -107,6 +169,8 @@ class InferTypes(BaseTask):
                     "analysis_intent_dtype": analysis_intent_dtype,
                 }
 
+            self._save_cache(cache_dir, cache)
+
             # ---- Store semantic type metadata in context ----
             if self.context:
                 # Map: column → 'continuous' | 'categorical' | etc.
@@ -129,6 +193,11 @@ class InferTypes(BaseTask):
                 status="success",
                 summary={"message": f"Inferred types for {len(results)} columns."},
                 data=results,
+                metadata={
+                    "inference_sample_rows": int(len(positions)),
+                    "cache_hits": cache_hits,
+                    **self.approximation_metadata("distinct"),
+                },
             )
 
         except Exception as e:
@@ -140,3 +209,141 @@ class InferTypes(BaseTask):
                 level="warn",
             )
             self.output = make_failure_result(self.name, e)
+
+    def _infer(self, series: pl.Series, sample: pl.Series) -> str:
+        """Analysis-intent type of one column (heuristic rules below)."""
+        dtype = series.dtype
+        sample_rows = len(sample)
+        sample = sample.drop_nulls()
+        if sample.is_empty():
+            # Sparse column: fall back to its first non-null values
+            sample = series.drop_nulls().head(sample_rows)
+        if sample.is_empty():
+            return "unknown"
+
+        # ---- Heuristic rules for semantic typing ----
+        if dtype == pl.Boolean:
+            return "categorical"
+        if dtype.is_integer() and self._is_integer_id(series, sample):
+            return "id"
+        if dtype.is_numeric():
+            # More than 20 distinct values in the sample rules out both
+            # categorical rules without counting the full column
+            if sample.n_unique() > 20:
+                return "continuous"
+            nunique, total = self._distinct_count(series)
+            if nunique == 2:
+                return "categorical"
+            if total and nunique / total < 0.05 and nunique <= 20:
+                return "categorical"
+            return "continuous"
+        if dtype.is_temporal():
+            return "datetime"
+        if dtype in (pl.Utf8, pl.Categorical, pl.Enum):
+            return self._infer_string(series.cast(pl.Utf8), sample.cast(pl.Utf8))
+        return "unknown"
+
+    def _infer_string(self, series: pl.Series, sample: pl.Series) -> str:
+        max_failures = int(self.get_task_param("max_parse_failures") or 0)
+        probe_rows = int(self.get_task_param("parse_probe_rows") or 100)
+        chunk_rows = int(self.get_sketch_param("chunk_rows"))
+
+        for parser in DATETIME_PARSERS:
+            # The first chunk of the sample is a probe, so most non-date
+            # columns give up after a handful of values
+            if parse_failures(parser, sample, max_failures, probe_rows) > max_failures:
+                continue
+            values = series.drop_nulls()
+            if len(values) == len(sample) or (
+                parse_failures(parser, values, max_failures, chunk_rows) <= max_failures
+            ):
+                return "datetime"
+
+        if sample.str.contains(HEX_ID_PATTERN).mean() > 0.8:
+            return "id"
+        # A sample's distinct ratio only estimates the column's (a stratified
+        # sample can over- or under-represent duplicates), so any sample near
+        # the threshold gets the full distinct count
+        if sample.n_unique() / len(sample) > ID_DISTINCT_RATIO - SAMPLE_RATIO_MARGIN:
+            nunique, total = self._distinct_count(series)
+            if total and nunique / total > ID_DISTINCT_RATIO:
+                return "id"
+        if sample.str.len_chars().mean() > 30:
+            return "text"
+        return "categorical"
+
+    def _is_integer_id(self, series: pl.Series, sample: pl.Series) -> bool:
+        """
+        Surrogate-key check for integer columns: (nearly) unique values that are
+        sorted or densely cover their range, as auto-increment keys do. Random
+        unique integers spread over a wide range stay numeric.
+        """
+        if len(sample) < MIN_INTEGER_ID_ROWS or sample.n_unique() < len(sample):
+            return False
+        values = series.drop_nulls()
+        span = float(values.max()) - float(values.min()) + 1  # type: ignore[arg-type]
+        if not (values.is_sorted() or values.is_sorted(descending=True)) and (
+            span > MAX_INTEGER_ID_SPAN * len(values)
+        ):
+            return False
+        nunique, total = self._distinct_count(values)
+        return bool(total) and nunique / total > 0.95
+
+    def _distinct_count(self, series: pl.Series) -> Tuple[int, int]:
+        """(distinct, total) over the column's non-null values."""
+        values = series.drop_nulls()
+        nunique = (
+            int(round(self.distinct_sketch(values).estimate()))
+            if self.approximate
+            else values.n_unique()
+        )
+        return nunique, len(values)
+
+    def _fingerprint(self, series: pl.Series, sample: pl.Series) -> str:
+        """Cache key: column name and dtype, row count, sampled values, settings."""
+        digest = hashlib.sha256()
+        settings = {
+            key: self.get_task_param(key)
+            for key in ("sample_size", "seed", "max_parse_failures", "parse_probe_rows")
+        }
+        settings.update(
+            {key: self.get_sketch_param(key) for key in ("chunk_rows", "hll_precision")}
+        )
+        header = [
+            series.name,
+            str(series.dtype),
+            len(series),
+            pl.__version__,
+            self.approximate,
+            settings,
+        ]
+        digest.update(json.dumps(header, sort_keys=True, default=str).encode())
+        digest.update(sample.hash(seed=0).to_numpy().tobytes())
+        return digest.hexdigest()
+
+    @staticmethod
+    def _as_polars_series(df: Any, col: str) -> pl.Series:
+        if is_polars(df):
+            return df[col]
+        return pl.from_pandas(df[[col]])[col]
+
+    @staticmethod
+    def _load_cache(cache_dir: Optional[str]) -> Dict[str, str]:
+        if cache_dir:
+            path = os.path.join(cache_dir, TYPE_CACHE_FILE)
+            if os.path.exists(path):
+                try:
+                    with open(path, "r") as f:
+                        _TYPE_CACHE.update(json.load(f))
+                except (OSError, ValueError):
+                    pass  # Unreadable cache: infer again and overwrite it
+        return _TYPE_CACHE
+
+    @staticmethod
+    def _save_cache(cache_dir: Optional[str], cache: Dict[str, str]) -> None:
+        while len(cache) > MAX_CACHE_ENTRIES:
+            del cache[next(iter(cache))]  # Oldest entries first
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+            with open(os.path.join(cache_dir, TYPE_CACHE_FILE), "w") as f:
+                json.dump(cache, f)
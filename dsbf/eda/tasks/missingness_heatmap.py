@@ -47,10 +47,16 @@ class MissingnessHeatmap(BaseTask):
             save_path = self.get_output_path("missingness_heatmap.png")
 
             static = PlotFactory.plot_null_matrix_static(
-                df, save_path=save_path, title="Missingness Heatmap"
+                df,
+                save_path=save_path,
+                title="Missingness Heatmap",
+                max_rows=self.get_plot_max_rows(),
             )
             interactive = PlotFactory.plot_null_matrix_interactive(
-                df, title="Missingness Heatmap", annotations=annotation
+                df,
+                title="Missingness Heatmap",
+                annotations=annotation,
+                max_rows=self.get_plot_max_rows(),
             )
 
             plots = {
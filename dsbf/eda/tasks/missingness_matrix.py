@@ -18,6 +18,7 @@ from dsbf.utils.plot_factory import PlotFactory
     domain="core",
     runtime_estimate="fast",
     tags=["missing", "structure", "viz"],
+    max_rows=50_000,
     expected_semantic_types=["any"],
 )
 class MissingnessMatrix(BaseTask):
@@ -46,6 +47,7 @@ class MissingnessMatrix(BaseTask):
                 save_path=fig_path,
                 title="Missingness Matrix",
                 annotations=[f"Total missing cells: {df.isnull().sum().sum()}"],
+                max_rows=self.get_plot_max_rows(),
             )
 
             plots = {
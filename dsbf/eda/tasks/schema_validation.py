@@ -125,14 +125,9 @@ class SchemaValidation(BaseTask):
                     ),
                 )
 
-        # --- Mixed type detection --- (fallback to pandas)
-        if is_pl:
-            df_pd = df.to_pandas()
-        else:
-            df_pd = df
-        for col in df_pd.columns:
-            unique_types = df_pd[col].map(type).nunique()
-            if unique_types > 1:
+        # --- Mixed type detection ---
+        for col in df.columns:
+            if self.get_type_profile(col).is_mixed:
                 result_data["mixed_type_columns"].append(col)
                 if self.output is None:
                     self.output = TaskResult(name=self.name)
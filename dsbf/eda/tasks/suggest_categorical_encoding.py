@@ -27,6 +27,7 @@ from dsbf.utils.reco_engine import get_recommendation_tip
     runtime_estimate="fast",
     tags=["categorical", "encoding", "ml_readiness"],
     expected_semantic_types=["categorical"],
+    column_params=["target_column"],
 )
 class SuggestCategoricalEncoding(BaseTask):
     """
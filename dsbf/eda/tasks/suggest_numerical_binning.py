@@ -1,6 +1,6 @@
 # dsbf/eda/tasks/suggest_numerical_binning.py
 
-from typing import Any
+from typing import Any, Dict, List
 
 from dsbf.core.base_task import BaseTask
 from dsbf.eda.task_registry import register_task
@@ -12,6 +12,7 @@ from dsbf.eda.task_result import (
 from dsbf.utils.backend import is_polars
 from dsbf.utils.plot_factory import PlotFactory
 from dsbf.utils.reco_engine import get_recommendation_tip
+from dsbf.utils.sketches import RunningMoments, iter_slices
 
 
 @register_task(
@@ -28,6 +29,7 @@ from dsbf.utils.reco_engine import get_recommendation_tip
     runtime_estimate="fast",
     tags=["numeric", "transformation", "ml_readiness"],
     expected_semantic_types=["continuous"],
+    reads=["numeric"],
 )
 class SuggestNumericalBinning(BaseTask):
     """
@@ -46,10 +48,6 @@ class SuggestNumericalBinning(BaseTask):
                 f"    Processing {len(matched_col)} 'continuous' column(s)", "debug"
             )
 
-            flags = self.ensure_reliability_flags()
-            skew_vals = flags.get("skew_vals", {})
-            stds = flags.get("stds", {})
-            # means = flags.get("means", {})
             skew_threshold = float(self.get_task_param("skew_threshold") or 1.0)
 
             if is_polars(df):
@@ -57,6 +55,16 @@ class SuggestNumericalBinning(BaseTask):
             else:
                 numeric_cols = list(df.select_dtypes(include="number").columns)
 
+            if self.approximate:
+                # One streaming pass of moments instead of the exact median/MAD
+                # scans behind the global reliability flags
+                flags = self._moment_flags(df, numeric_cols)
+            else:
+                flags = self.ensure_reliability_flags()
+            skew_vals = flags.get("skew_vals", {})
+            stds = flags.get("stds", {})
+            # means = flags.get("means", {})
+
             suggestions = {}
 
             for col in numeric_cols:
@@ -67,7 +75,10 @@ class SuggestNumericalBinning(BaseTask):
                     skew = skew_vals[col]
                     std = stds[col]
 
-                    if is_polars(df):
+                    if col in flags.get("mins", {}):
+                        min_val = flags["mins"][col]
+                        max_val = flags["maxs"][col]
+                    elif is_polars(df):
                         min_val = df[col].drop_nulls().min()
                         max_val = df[col].drop_nulls().max()
                     else:
@@ -111,6 +122,7 @@ class SuggestNumericalBinning(BaseTask):
                     "suggested_viz_type": "bar",
                     "recommended_section": "Transformations",
                     "display_priority": "high",
+                    **self.approximation_metadata(),
                     "excluded_columns": excluded,
                     "column_types": self.get_column_type_info(
                         matched_col + list(excluded.keys())
@@ -153,12 +165,16 @@ class SuggestNumericalBinning(BaseTask):
 
                     save_path = self.get_output_path(f"{col}_binning_hist.png")
                     static = PlotFactory.plot_histogram_static(
-                        series, save_path=save_path, title=f"{col} — Distribution"
+                        series,
+                        save_path=save_path,
+                        title=f"{col} — Distribution",
+                        max_rows=self.get_plot_max_rows(),
                     )
                     interactive = PlotFactory.plot_histogram_interactive(
                         series,
                         title=f"{col} — Distribution",
                         annotations=annotation,
+                        max_rows=self.get_plot_max_rows(),
                     )
 
                     plots[col] = {
@@ -206,3 +222,37 @@ class SuggestNumericalBinning(BaseTask):
                 level="warn",
             )
             self.output = make_failure_result(self.name, e)
+
+    def _moment_flags(self, df: Any, numeric_cols: List[str]) -> Dict[str, Any]:
+        """
+        Skewness, std, and range per column from mergeable running moments,
+        in the same shape as the reliability flags used in exact mode.
+        """
+        chunk_rows = int(self.get_sketch_param("chunk_rows"))
+        skew_vals: Dict[str, float] = {}
+        stds: Dict[str, float] = {}
+        mins: Dict[str, float] = {}
+        maxs: Dict[str, float] = {}
+        n_rows = 0
+
+        for col in numeric_cols:
+            moments = RunningMoments()
+            for chunk in iter_slices(df[col], chunk_rows):
+                moments.update(chunk)
+            n = moments.n
+            n_rows = max(n_rows, n)
+            if n < 3:
+                continue
+            # Adjusted Fisher-Pearson skewness, matching scipy's bias=False
+            skew_vals[col] = moments.skewness() * (n * (n - 1)) ** 0.5 / (n - 2)
+            stds[col] = moments.std(ddof=1)
+            mins[col], maxs[col] = moments.min, moments.max
+
+        return {
+            "low_row_count": n_rows < 30,
+            "high_skew": any(abs(v) > 2 for v in skew_vals.values()),
+            "skew_vals": skew_vals,
+            "stds": stds,
+            "mins": mins,
+            "maxs": maxs,
+        }
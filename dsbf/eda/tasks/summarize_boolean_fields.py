@@ -24,7 +24,7 @@ def is_boolean_column(series) -> bool:
     domain="core",
     runtime_estimate="fast",
     tags=["boolean", "summary"],
-    expected_semantic_types=["boolean"],
+    expected_semantic_types=["categorical"],
 )
 class SummarizeBooleanFields(BaseTask):
     """
@@ -40,7 +40,9 @@ class SummarizeBooleanFields(BaseTask):
 
             # Use semantic typing to select relevant columns
             matched_col, excluded = self.get_columns_by_intent()
-            self._log(f"    Processing {len(matched_col)} 'boolean' column(s)", "debug")
+            self._log(
+                f"    Processing {len(matched_col)} 'categorical' column(s)", "debug"
+            )
 
             if is_polars(df):
                 df = df.to_pandas()
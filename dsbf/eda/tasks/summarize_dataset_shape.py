@@ -1,11 +1,13 @@
 # dsbf/eda/tasks/summarize_dataset_shape.py
 
-from typing import Any
+from typing import Any, Dict, List
+
+import polars as pl
 
 from dsbf.core.base_task import BaseTask
 from dsbf.eda.task_registry import register_task
 from dsbf.eda.task_result import TaskResult, make_failure_result
-from dsbf.utils.backend import is_polars
+from dsbf.utils.backend import is_polars, missing_expr, to_polars
 
 
 @register_task(
@@ -25,8 +27,12 @@ class SummarizeDatasetShape(BaseTask):
     - Row and column counts
     - Approximate memory usage in MB
     - Percentage of missing cells
+
+    Supports partial/merge/finalize for streaming and partitioned runs.
     """
 
+    mergeable = True
+
     def run(self) -> None:
         try:
 
@@ -46,9 +52,27 @@ class SummarizeDatasetShape(BaseTask):
                 )
 
             n_rows, n_cols = df.shape
-            total_cells = n_rows * n_cols
 
-            null_pct = df.isnull().sum().sum() / total_cells if total_cells else 0.0
+            # Exact totals from source metadata (e.g. Parquet footer) if available.
+            # The null percentage uses source totals only when every column has a
+            # footer null count; otherwise both cells and nulls come from the
+            # loaded (possibly sampled) rows.
+            loaded_rows = n_rows
+            n_rows = int(self.get_source_stat(None, "num_rows", n_rows))
+            footer_nulls = {
+                col: self.get_source_stat(col, "null_count") for col in df.columns
+            }
+
+            if footer_nulls and all(c is not None for c in footer_nulls.values()):
+                stats_source = self.get_source_stat(None, "source")
+                null_cells = sum(footer_nulls.values())
+                total_cells = n_rows * n_cols
+            else:
+                stats_source = "data"
+                null_cells = df.isnull().sum().sum()
+                total_cells = loaded_rows * n_cols
+
+            null_pct = null_cells / total_cells if total_cells else 0.0
             mem_bytes = df.memory_usage(deep=True).sum()
 
             self.output = TaskResult(
@@ -67,6 +91,7 @@ class SummarizeDatasetShape(BaseTask):
                     "suggested_viz_type": "summary",
                     "recommended_section": "Overview",
                     "display_priority": "high",
+                    "stats_source": stats_source,
                     "excluded_columns": excluded,
                     "column_types": self.get_column_type_info(
                         matched_col + list(excluded.keys())
@@ -83,3 +108,67 @@ class SummarizeDatasetShape(BaseTask):
                 level="warn",
             )
             self.output = make_failure_result(self.name, e)
+
+    def partial(self, chunk: Any) -> Dict[str, Any]:
+        df = to_polars(chunk)
+        null_cells = 0
+        if df.width:
+            null_cells = int(
+                df.select(
+                    pl.sum_horizontal(
+                        [missing_expr(c, dtype).sum() for c, dtype in df.schema.items()]
+                    )
+                ).item()
+            )
+        return {
+            "rows": df.height,
+            "columns": df.columns,
+            "null_cells": null_cells,
+            "bytes": int(df.estimated_size()),
+        }
+
+    def merge(self, states: List[Dict[str, Any]]) -> Dict[str, Any]:
+        columns: List[str] = []
+        for state in states:
+            columns.extend(c for c in state["columns"] if c not in columns)
+
+        # Chunks missing a column contribute all-null cells for it
+        null_cells = sum(
+            s["null_cells"] + s["rows"] * (len(columns) - len(s["columns"]))
+            for s in states
+        )
+        return {
+            "rows": sum(s["rows"] for s in states),
+            "columns": columns,
+            "null_cells": null_cells,
+            "bytes": sum(s["bytes"] for s in states),
+        }
+
+    def finalize(self, state: Dict[str, Any]) -> None:
+        matched_col, excluded = self.get_columns_by_intent()
+        n_rows, n_cols = state["rows"], len(state["columns"])
+        total_cells = n_rows * n_cols
+
+        self.output = TaskResult(
+            name=self.name,
+            status="success",
+            summary={"message": (f"Dataset has {n_rows} rows and {n_cols} columns.")},
+            data={
+                "num_rows": n_rows,
+                "num_columns": n_cols,
+                "null_cell_percentage": round(
+                    state["null_cells"] / total_cells if total_cells else 0.0, 4
+                ),
+                "approx_memory_MB": round(state["bytes"] / 1_048_576, 2),
+            },
+            metadata={
+                "suggested_viz_type": "summary",
+                "recommended_section": "Overview",
+                "display_priority": "high",
+                "stats_source": "merged",
+                "excluded_columns": excluded,
+                "column_types": self.get_column_type_info(
+                    matched_col + list(excluded.keys())
+                ),
+            },
+        )
@@ -1,6 +1,6 @@
 # dsbf/eda/tasks/summarize_modes.py
 
-from typing import Any
+from typing import Any, Dict
 
 import pandas as pd
 
@@ -9,6 +9,7 @@ from dsbf.eda.task_registry import register_task
 from dsbf.eda.task_result import TaskResult, make_failure_result
 from dsbf.utils.backend import is_polars
 from dsbf.utils.plot_factory import PlotFactory
+from dsbf.utils.sketches import FrequentItemsSketch
 
 
 @register_task(
@@ -41,7 +42,15 @@ class SummarizeModes(BaseTask):
             matched_col, excluded = self.get_columns_by_intent()
             self._log(f"    Processing {len(matched_col)} column(s)", "debug")
 
-            if is_polars(df):
+            sketches: Dict[str, FrequentItemsSketch] = {}
+            if self.approximate:
+                # Bounded-memory top-k sketches instead of full value counts
+                sketches = {col: self.frequent_items(df[col]) for col in df.columns}
+                result = {
+                    col: self._modes_from_sketch(sketch)
+                    for col, sketch in sketches.items()
+                }
+            elif is_polars(df):
                 result = {
                     col: (
                         values
@@ -70,10 +79,17 @@ class SummarizeModes(BaseTask):
 
             for col in df.columns:
                 series = df[col].dropna()
-                if series.nunique() <= 1 or not pd.api.types.is_object_dtype(series):
+                if not pd.api.types.is_object_dtype(series):
                     continue
 
-                counts = series.value_counts()
+                if col in sketches:
+                    counts = pd.Series(
+                        {v: c for v, c in sketches[col].top(10) if v is not None}
+                    )
+                else:
+                    counts = series.value_counts()
+                if len(counts) <= 1:
+                    continue
                 mode_val = counts.index[0]
                 mode_freq = counts.iloc[0]
 
@@ -89,6 +105,12 @@ class SummarizeModes(BaseTask):
                     "interactive": interactive_plot,
                 }
 
+            approx_metadata = self.approximation_metadata()
+            if sketches:
+                approx_metadata["count_error_bound"] = {
+                    col: sketch.error_bound() for col, sketch in sketches.items()
+                }
+
             self.output = TaskResult(
                 name=self.name,
                 status="success",
@@ -99,6 +121,7 @@ class SummarizeModes(BaseTask):
                     "suggested_viz_type": "bar",
                     "recommended_section": "Summary",
                     "display_priority": "medium",
+                    **approx_metadata,
                     "excluded_columns": excluded,
                     "column_types": self.get_column_type_info(
                         matched_col + list(excluded.keys())
@@ -115,3 +138,13 @@ class SummarizeModes(BaseTask):
                 level="warn",
             )
             self.output = make_failure_result(self.name, e)
+
+    @staticmethod
+    def _modes_from_sketch(sketch: FrequentItemsSketch) -> Any:
+        """Most frequent non-null value(s) tracked by a frequent-items sketch."""
+        counts = {v: c for v, c in sketch.counts.items() if v is not None}
+        if not counts:
+            return None
+        top = max(counts.values())
+        modes = [v for v, c in counts.items() if c == top]
+        return modes if len(modes) > 1 else modes[0]
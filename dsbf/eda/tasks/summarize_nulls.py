@@ -7,8 +7,10 @@ import pandas as pd
 from dsbf.core.base_task import BaseTask
 from dsbf.eda.task_registry import register_task
 from dsbf.eda.task_result import TaskResult, make_failure_result
-from dsbf.utils.backend import is_polars
+from dsbf.utils.backend import missing_expr, to_polars
+from dsbf.utils.null_patterns import count_null_patterns, top_null_patterns
 from dsbf.utils.plot_factory import PlotFactory
+from dsbf.utils.sketches import FrequentItemsSketch
 
 
 @register_task(
@@ -30,9 +32,18 @@ class SummarizeNulls(BaseTask):
     - Null counts per column
     - Null percentages per column
     - Columns with >50% missing values
-    - Row-wise null patterns as binary strings (e.g., '101')
+    - Row-wise null patterns as binary strings (e.g., '101'), counted on
+      bit-packed missing masks (top `pattern_capacity` reported)
+
+    Supports partial/merge/finalize. Merged null counts are exact; merged null
+    patterns are tracked with a bounded frequent-items sketch
+    (`pattern_capacity` patterns), so once more distinct patterns occur their
+    counts may be underestimated by up to `null_patterns_error_bound` and the
+    result is marked `approximate`.
     """
 
+    mergeable = True
+
     def run(self) -> None:
         try:
 
@@ -44,16 +55,49 @@ class SummarizeNulls(BaseTask):
             self._log(f"    Processing {len(matched_col)} column(s)", "debug")
 
             null_threshold = float(self.get_task_param("null_threshold") or 0.5)
+            max_patterns = int(self.get_task_param("pattern_capacity") or 1000)
 
-            if is_polars(df):
-                df = df.to_pandas()
+            df = to_polars(df)
+            n_rows: int = df.height
 
-            n_rows: int = df.shape[0]
+            # Exact null counts from source metadata (e.g. Parquet footer) are used
+            # as-is; only the remaining columns are scanned. Footer counts cover
+            # the whole source, so on sampled data they are used only if every
+            # column has one, and all counts share one scope (`rows`).
+            source_rows = int(self.get_source_stat(None, "num_rows", n_rows))
+            footer_counts: Dict[str, int] = {}
+            for col in df.columns:
+                count = self.get_source_stat(col, "null_count")
+                if count is not None:
+                    footer_counts[col] = int(count)
+            if source_rows != n_rows and len(footer_counts) < df.width:
+                footer_counts = {}
+            rows = source_rows if footer_counts else n_rows
+            scan_cols = [col for col in df.columns if col not in footer_counts]
+
+            scanned_counts: Dict[str, int] = (
+                {
+                    col: int(count)
+                    for col, count in df.select(
+                        [
+                            missing_expr(c, df.schema[c]).sum().alias(c)
+                            for c in scan_cols
+                        ]
+                    )
+                    .row(0, named=True)
+                    .items()
+                }
+                if scan_cols
+                else {}
+            )
 
             # Column null counts and percentages
-            null_counts: Dict[str, int] = df.isnull().sum().to_dict()
+            null_counts: Dict[str, int] = {
+                col: footer_counts.get(col, scanned_counts.get(col, 0))
+                for col in df.columns
+            }
             null_percentages: Dict[str, float] = {
-                col: null_counts[col] / n_rows for col in df.columns
+                col: null_counts[col] / rows if rows else 0.0 for col in df.columns
             }
 
             high_null_columns: List[str] = [
@@ -64,12 +108,12 @@ class SummarizeNulls(BaseTask):
                 "debug",
             )
 
-            # Row-wise null pattern frequency (e.g., "101" means null in cols 1 and 3)
-            null_mask_df = df.isnull().astype(int)
-            null_patterns = null_mask_df.apply(
-                lambda row: "".join(row.astype(str)), axis=1
+            # Row-wise null pattern frequency (e.g., "101" means null in cols 1 and 3),
+            # counted on bit-packed masks; only the reported patterns are decoded
+            pattern_table = count_null_patterns(df)
+            pattern_counts: Dict[str, int] = dict(
+                top_null_patterns(pattern_table, df.width, max_patterns)
             )
-            pattern_counts: Dict[str, int] = null_patterns.value_counts().to_dict()
 
             self.output = TaskResult(
                 name=self.name,
@@ -86,7 +130,10 @@ class SummarizeNulls(BaseTask):
                     "null_patterns": pattern_counts,
                 },
                 metadata={
-                    "rows": n_rows,
+                    "rows": rows,
+                    "null_counts_scope": "source" if rows == source_rows else "sample",
+                    "source_stat_columns": list(footer_counts.keys()),
+                    "distinct_null_patterns": pattern_table.height,
                     "suggested_viz_type": "bar",
                     "recommended_section": "Missingness",
                     "display_priority": "high",
@@ -97,32 +144,7 @@ class SummarizeNulls(BaseTask):
                 },
             )
 
-            if self.context and self.context.output_dir and self.output.data:
-                null_series = pd.Series(self.output.data["null_counts"])
-                save_path = self.get_output_path("null_counts_barplot.png")
-
-                # Annotate fully null or high-null columns
-                annotations = []
-                for col, count in self.output.data["null_counts"].items():
-                    pct = self.output.data["null_percentages"].get(col, 0)
-                    if count == self.output.metadata["rows"]:
-                        annotations.append(f"{col} is fully null ({pct:.1%})")
-                    elif pct > 0.5:
-                        annotations.append(f"{col} has >50% missing ({pct:.1%})")
-
-                # Static and interactive plots
-                static = PlotFactory.plot_barplot_static(null_series, save_path)
-                interactive = PlotFactory.plot_barplot_interactive(
-                    null_series,
-                    annotations=annotations,
-                )
-
-                self.output.plots = {
-                    "null_counts": {
-                        "static": static["path"],
-                        "interactive": interactive,
-                    }
-                }
+            self._attach_plots()
 
         except Exception as e:
             if self.context:
@@ -133,3 +155,154 @@ class SummarizeNulls(BaseTask):
                 level="warn",
             )
             self.output = make_failure_result(self.name, e)
+
+    def _attach_plots(self) -> None:
+        """Add the null-count bar plots to self.output."""
+        if not (self.output and self.output.data):
+            return
+        if not (self.context and self.context.output_dir):
+            return
+
+        null_series = pd.Series(self.output.data["null_counts"])
+        save_path = self.get_output_path("null_counts_barplot.png")
+
+        # Annotate fully null or high-null columns
+        annotations = []
+        for col, count in self.output.data["null_counts"].items():
+            pct = self.output.data["null_percentages"].get(col, 0)
+            if count == self.output.metadata["rows"]:
+                annotations.append(f"{col} is fully null ({pct:.1%})")
+            elif pct > 0.5:
+                annotations.append(f"{col} has >50% missing ({pct:.1%})")
+
+        # Static and interactive plots
+        static = PlotFactory.plot_barplot_static(null_series, save_path)
+        interactive = PlotFactory.plot_barplot_interactive(
+            null_series,
+            annotations=annotations,
+        )
+
+        self.output.plots = {
+            "null_counts": {
+                "static": static["path"],
+                "interactive": interactive,
+            }
+        }
+
+    def partial(self, chunk: Any) -> Dict[str, Any]:
+        df = to_polars(chunk)
+        capacity = int(self.get_task_param("pattern_capacity") or 1000)
+        patterns = FrequentItemsSketch(capacity=capacity)
+        null_counts: Dict[str, int] = {}
+
+        if df.width:
+            null_counts = {
+                c: int(v)
+                for c, v in df.select(
+                    [
+                        missing_expr(c, dtype).sum().alias(c)
+                        for c, dtype in df.schema.items()
+                    ]
+                )
+                .row(0, named=True)
+                .items()
+            }
+            # Decode only the patterns the sketch could keep; the rest are
+            # pruned anyway and only their total is recorded
+            pattern_table = count_null_patterns(df)
+            kept = top_null_patterns(pattern_table, df.width, capacity + 1)
+            patterns.update_counts(
+                kept, others=df.height - sum(count for _, count in kept)
+            )
+
+        return {
+            "rows": df.height,
+            "columns": df.columns,
+            "null_counts": null_counts,
+            "patterns": patterns,
+        }
+
+    def merge(self, states: List[Dict[str, Any]]) -> Dict[str, Any]:
+        columns: List[str] = []
+        for state in states:
+            columns.extend(c for c in state["columns"] if c not in columns)
+
+        null_counts = {c: 0 for c in columns}
+        patterns = None
+        for state in states:
+            for col in columns:
+                # Chunks missing a column are all-null for it
+                null_counts[col] += state["null_counts"].get(col, state["rows"])
+
+            sketch = state["patterns"]
+            if state["columns"] != columns:
+                sketch = self._remap_patterns(sketch, state["columns"], columns)
+            if patterns is None:
+                patterns = FrequentItemsSketch(capacity=sketch.capacity)
+            patterns.merge(sketch)
+
+        return {
+            "rows": sum(s["rows"] for s in states),
+            "columns": columns,
+            "null_counts": null_counts,
+            "patterns": patterns,
+        }
+
+    @staticmethod
+    def _remap_patterns(
+        sketch: FrequentItemsSketch, columns: List[str], target: List[str]
+    ) -> FrequentItemsSketch:
+        """Rewrite pattern strings onto `target` column order ('1' if absent)."""
+        positions = {c: i for i, c in enumerate(columns)}
+        remapped = FrequentItemsSketch(capacity=sketch.capacity)
+        remapped.n, remapped.offset = sketch.n, sketch.offset
+        for pattern, count in sketch.counts.items():
+            key = "".join(
+                pattern[positions[c]] if c in positions else "1" for c in target
+            )
+            remapped.counts[key] = remapped.counts.get(key, 0) + count
+        return remapped
+
+    def finalize(self, state: Dict[str, Any]) -> None:
+        matched_col, excluded = self.get_columns_by_intent()
+        null_threshold = float(self.get_task_param("null_threshold") or 0.5)
+        n_rows = state["rows"]
+        null_counts = state["null_counts"]
+        null_percentages = {
+            col: count / n_rows if n_rows else 0.0 for col, count in null_counts.items()
+        }
+        high_null_columns = [
+            col for col, pct in null_percentages.items() if pct >= null_threshold
+        ]
+        patterns: FrequentItemsSketch = state["patterns"]
+
+        self.output = TaskResult(
+            name=self.name,
+            status="success",
+            summary={
+                "message": (
+                    f"{len(high_null_columns)} column(s) have >50% missing values."
+                )
+            },
+            data={
+                "null_counts": null_counts,
+                "null_percentages": null_percentages,
+                "high_null_columns": high_null_columns,
+                "null_patterns": dict(patterns.top(patterns.capacity)),
+            },
+            metadata={
+                "rows": n_rows,
+                "source_stat_columns": [],
+                "approximate": not patterns.is_exact,
+                "null_patterns_exact": patterns.is_exact,
+                "null_patterns_error_bound": patterns.error_bound(),
+                "suggested_viz_type": "bar",
+                "recommended_section": "Missingness",
+                "display_priority": "high",
+                "excluded_columns": excluded,
+                "column_types": self.get_column_type_info(
+                    matched_col + list(excluded.keys())
+                ),
+            },
+        )
+        self._attach_plots()
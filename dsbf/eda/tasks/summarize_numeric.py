@@ -1,14 +1,26 @@
 # dsbf/eda/tasks/summarize_numeric.py
 
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 import numpy as np
 
 from dsbf.core.base_task import BaseTask
 from dsbf.eda.task_registry import register_task
 from dsbf.eda.task_result import TaskResult, make_failure_result
-from dsbf.utils.backend import is_polars
+from dsbf.utils.backend import is_polars, to_polars
 from dsbf.utils.plot_factory import PlotFactory
+from dsbf.utils.sketches import KLLSketch, RunningMoments
+
+# Reported source statistic -> key in the data source's column statistics
+SOURCE_STAT_KEYS = {
+    "count": "non_null_count",
+    "mean": "mean",
+    "min": "min",
+    "max": "max",
+    "histogram": "histogram",
+}
+
+PERCENTILES = [0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99]
 
 
 @register_task(
@@ -20,7 +32,8 @@ from dsbf.utils.plot_factory import PlotFactory
     domain="core",
     runtime_estimate="fast",
     tags=["numeric", "summary"],
-    expected_semantic_types=["continuous"],
+    expected_semantic_types=["continuous", "categorical"],
+    reads=["numeric"],
 )
 class SummarizeNumeric(BaseTask):
     """
@@ -29,8 +42,18 @@ class SummarizeNumeric(BaseTask):
     - Count, mean, std, min, max
     - Percentiles: 1%, 5%, 25%, 50%, 75%, 95%, 99%
     - A flag for near-zero variance columns (variance < 1e-4)
+
+    All of these describe the analysed (possibly sampled) rows. Exact
+    whole-source statistics from the data source (Parquet footer, SQL pushdown)
+    are reported alongside under each column's `source_stats` key rather than
+    replacing sample values, so percentiles stay consistent with min/max.
+
+    Supports partial/merge/finalize using exact running moments and a KLL
+    quantile sketch (`kll_k`) for the percentiles.
     """
 
+    mergeable = True
+
     def run(self) -> None:
         try:
             df: Any = self.input_data
@@ -38,7 +61,9 @@ class SummarizeNumeric(BaseTask):
             # Use semantic typing to select relevant columns
             matched_col, excluded = self.get_columns_by_intent()
             self._log(
-                f"    Processing {len(matched_col)} 'continuous' column(s)", "debug"
+                f"    Processing {len(matched_col)} ['continuous', 'categorical']"
+                " column(s)",
+                "debug",
             )
 
             if is_polars(df):
@@ -49,6 +74,7 @@ class SummarizeNumeric(BaseTask):
 
             numeric_df = df.select_dtypes(include=np.number)
             extended_stats: Dict[str, Dict[str, Any]] = {}
+            source_stat_columns: List[str] = []
             plots: Dict[str, Dict[str, Any]] = {}
 
             for col in numeric_df.columns:
@@ -59,9 +85,7 @@ class SummarizeNumeric(BaseTask):
                     continue
 
                 # Compute descriptive stats with extended percentiles
-                desc = series.describe(
-                    percentiles=[0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99]
-                )
+                desc = series.describe(percentiles=PERCENTILES)
                 # Custom variance check for near-constant features
                 variance = np.var(series)
                 near_zero_var = bool(variance < 1e-4)
@@ -82,10 +106,24 @@ class SummarizeNumeric(BaseTask):
                     "near_zero_variance": near_zero_var,
                 }
 
+                # Whole-source statistics (e.g. Parquet footer), kept separate
+                source_stats: Dict[str, Any] = {}
+                for stat, key in SOURCE_STAT_KEYS.items():
+                    value = self.get_source_stat(col, key)
+                    if value is not None:
+                        source_stats[stat] = value
+                if source_stats:
+                    extended_stats[col]["source_stats"] = source_stats
+                    source_stat_columns.append(col)
+
                 # Add visualizations
                 save_path = self.get_output_path(f"{col}_histogram.png")
-                static = PlotFactory.plot_histogram_static(series, save_path)["path"]
-                interactive = PlotFactory.plot_histogram_interactive(series)
+                static = PlotFactory.plot_histogram_static(
+                    series, save_path, max_rows=self.get_plot_max_rows()
+                )["path"]
+                interactive = PlotFactory.plot_histogram_interactive(
+                    series, max_rows=self.get_plot_max_rows()
+                )
                 plots[col] = {
                     "static": static,
                     "interactive": interactive,
@@ -107,6 +145,9 @@ class SummarizeNumeric(BaseTask):
                     "suggested_viz_type": "histogram",
                     "recommended_section": "Summary",
                     "display_priority": "medium",
+                    "stats_scope": "sample" if self.get_sampling_info() else "full",
+                    "source_stat_columns": source_stat_columns,
+                    "source_stats_source": self.get_source_stat(None, "source"),
                     "excluded_columns": excluded,
                     "column_types": self.get_column_type_info(
                         matched_col + list(excluded.keys())
@@ -123,3 +164,75 @@ class SummarizeNumeric(BaseTask):
                 level="warn",
             )
             self.output = make_failure_result(self.name, e)
+
+    def partial(self, chunk: Any) -> Dict[str, Any]:
+        df = to_polars(chunk)
+        k = int(self.get_sketch_param("kll_k"))
+        columns: Dict[str, Dict[str, Any]] = {}
+        for col, dtype in df.schema.items():
+            if not dtype.is_numeric():
+                continue
+            values = df[col].cast(float).to_numpy()
+            columns[col] = {
+                "moments": RunningMoments().update(values),
+                "quantiles": KLLSketch(k=k).update(values),
+            }
+        return {"columns": columns}
+
+    def merge(self, states: List[Dict[str, Any]]) -> Dict[str, Any]:
+        columns: Dict[str, Dict[str, Any]] = {}
+        for state in states:
+            for col, acc in state["columns"].items():
+                if col not in columns:
+                    columns[col] = {
+                        "moments": RunningMoments(),
+                        "quantiles": KLLSketch(k=acc["quantiles"].k),
+                    }
+                columns[col]["moments"].merge(acc["moments"])
+                columns[col]["quantiles"].merge(acc["quantiles"])
+        return {"columns": columns}
+
+    def finalize(self, state: Dict[str, Any]) -> None:
+        matched_col, excluded = self.get_columns_by_intent()
+        extended_stats: Dict[str, Dict[str, Any]] = {}
+        rank_errors: Dict[str, float] = {}
+
+        for col, acc in state["columns"].items():
+            moments: RunningMoments = acc["moments"]
+            sketch: KLLSketch = acc["quantiles"]
+            if moments.n == 0:
+                continue
+
+            quantiles = sketch.quantiles(PERCENTILES)
+            extended_stats[col] = {
+                "count": float(moments.n),
+                "mean": moments.mean,
+                "std": moments.std(ddof=1),
+                "min": moments.min,
+                **{f"{q * 100:g}%": v for q, v in zip(PERCENTILES, quantiles)},
+                "max": moments.max,
+                "near_zero_variance": bool(moments.variance(ddof=0) < 1e-4),
+            }
+            rank_errors[col] = sketch.rank_error()
+
+        self.output = TaskResult(
+            name=self.name,
+            status="success",
+            summary={
+                "message": (
+                    f"Extended summary for {len(extended_stats)} numeric columns."
+                )
+            },
+            data=extended_stats,
+            metadata={
+                "suggested_viz_type": "histogram",
+                "recommended_section": "Summary",
+                "display_priority": "medium",
+                "approximate": any(error > 0 for error in rank_errors.values()),
+                "quantile_rank_error": rank_errors,
+                "excluded_columns": excluded,
+                "column_types": self.get_column_type_info(
+                    matched_col + list(excluded.keys())
+                ),
+            },
+        )
@@ -1,14 +1,20 @@
 # dsbf/eda/tasks/summarize_text_fields.py
 
-import re
-from collections import Counter
 from typing import Any, Dict
 
+import polars as pl
+
 from dsbf.core.base_task import BaseTask
 from dsbf.eda.task_registry import register_task
 from dsbf.eda.task_result import TaskResult, make_failure_result
 from dsbf.utils.backend import is_polars, is_text_pandas, is_text_polars
 from dsbf.utils.plot_factory import PlotFactory
+from dsbf.utils.text_stats import (
+    as_string_series,
+    length_histogram,
+    string_lengths,
+    summarize_strings,
+)
 
 
 @register_task(
@@ -23,6 +29,7 @@ from dsbf.utils.plot_factory import PlotFactory
     runtime_estimate="fast",
     tags=["text", "summary"],
     expected_semantic_types=["text"],
+    reads=["string"],
 )
 class SummarizeTextFields(BaseTask):
     """
@@ -33,6 +40,9 @@ class SummarizeTextFields(BaseTask):
     - Total characters
     - Most frequent string
     - Symbol presence flag
+
+    All statistics come from Polars string kernels (see
+    `dsbf.utils.text_stats`); length histograms are plotted pre-binned.
     """
 
     def run(self) -> None:
@@ -46,83 +56,55 @@ class SummarizeTextFields(BaseTask):
             self._log(f"    Processing {len(matched_col)} 'text' column(s)", "debug")
 
             results: Dict[str, Dict[str, Any]] = {}
+            lengths: Dict[str, pl.Series] = {}
 
-            if is_polars(df):
-                for col in df.columns:
-                    if is_text_polars(df[col]):
-                        try:
-                            strings = df[col].drop_nulls().to_list()
-                            if not strings:
-                                continue
-
-                            char_counts = [len(s) for s in strings]
-                            word_counts = [len(s.split()) for s in strings]
-                            total_chars = sum(char_counts)
-                            total_words = sum(word_counts)
-                            avg_word_len = (
-                                total_chars / total_words if total_words else 0
-                            )
-
-                            most_common = Counter(strings).most_common(1)
-                            top_value = most_common[0][0] if most_common else None
-                            has_symbols = any(re.search(r"[^\w\s]", s) for s in strings)
-
-                            self._log(f"    Summarized text column: {col}", "debug")
-                            results[col] = {
-                                "avg_char_length": sum(char_counts) / len(char_counts),
-                                "avg_word_count": sum(word_counts) / len(word_counts),
-                                "avg_word_length": avg_word_len,
-                                "total_chars": total_chars,
-                                "most_frequent_value": top_value,
-                                "contains_symbols": has_symbols,
-                            }
-                        except Exception:
-                            continue
-            else:
-                for col in df.columns:
-                    if is_text_pandas(df[col]):
-                        try:
-                            texts = df[col].dropna().astype(str)
-                            char_counts = texts.map(len)
-                            word_counts = texts.map(lambda s: len(s.split()))
-                            total_chars = char_counts.sum()
-                            total_words = word_counts.sum()
-                            avg_word_len = (
-                                total_chars / total_words if total_words else 0
-                            )
-
-                            most_common = Counter(texts).most_common(1)
-                            top_value = most_common[0][0] if most_common else None
-                            has_symbols = any(re.search(r"[^\w\s]", s) for s in texts)
-
-                            self._log(f"    Summarized text column: {col}", "debug")
-                            results[col] = {
-                                "avg_char_length": char_counts.mean(),
-                                "avg_word_count": word_counts.mean(),
-                                "avg_word_length": avg_word_len,
-                                "total_chars": total_chars,
-                                "most_frequent_value": top_value,
-                                "contains_symbols": has_symbols,
-                            }
-                        except Exception:
-                            continue
+            for col in df.columns:
+                if is_polars(df):
+                    if not is_text_polars(df[col]):
+                        continue
+                elif not is_text_pandas(df[col]):
+                    continue
+                values = as_string_series(df[col])
 
-            plots: dict[str, dict[str, Any]] = {}
+                try:
+                    stats = summarize_strings(values)
+                except Exception:
+                    continue
+                if not stats:
+                    continue
 
-            if is_polars(df):
-                df = df.to_pandas()
+                count, total_words = stats["count"], stats["total_words"]
+                self._log(f"    Summarized text column: {col}", "debug")
+                results[col] = {
+                    "avg_char_length": stats["total_chars"] / count,
+                    "avg_word_count": total_words / count,
+                    "avg_word_length": (
+                        stats["total_chars"] / total_words if total_words else 0
+                    ),
+                    "total_chars": stats["total_chars"],
+                    "most_frequent_value": stats["most_frequent_value"],
+                    "contains_symbols": stats["contains_symbols"],
+                }
+                lengths[col] = string_lengths(values)
+
+            plots: dict[str, dict[str, Any]] = {}
 
             for col in results:
-                series = df[col].dropna().astype(str).map(len)
-                if series.empty:
+                histogram = length_histogram(lengths[col])
+                if not histogram["counts"]:
                     continue
 
                 save_path = self.get_output_path(f"{col}_text_length.png")
-                static = PlotFactory.plot_histogram_static(series, save_path)
-                interactive = PlotFactory.plot_histogram_interactive(series)
+                x_label = f"{col} length"
+                static = PlotFactory.plot_binned_histogram_static(
+                    histogram, save_path, x_label=x_label
+                )
+                interactive = PlotFactory.plot_binned_histogram_interactive(
+                    histogram, x_label=x_label
+                )
 
                 avg_len = results[col].get("avg_char_length", 0)
-                max_len = series.max()
+                max_len = lengths[col].max()
                 interactive["annotations"] = [f"Avg: {avg_len:.1f}, Max: {max_len}"]
 
                 plots[col] = {
@@ -1,14 +1,15 @@
 # dsbf/eda/tasks/summarize_unique.py
 
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 import pandas as pd
 
 from dsbf.core.base_task import BaseTask
 from dsbf.eda.task_registry import register_task
 from dsbf.eda.task_result import TaskResult, make_failure_result
-from dsbf.utils.backend import is_polars
+from dsbf.utils.backend import is_polars, to_polars
 from dsbf.utils.plot_factory import PlotFactory
+from dsbf.utils.sketches import HyperLogLog
 
 
 @register_task(
@@ -26,9 +27,12 @@ class SummarizeUnique(BaseTask):
     """
     Computes the number of unique values for each column in the DataFrame.
 
-    Supports both Pandas and Polars input.
+    Supports both Pandas and Polars input, and partial/merge/finalize using a
+    HyperLogLog sketch per column (`hll_precision`) for approximate counts.
     """
 
+    mergeable = True
+
     def run(self) -> None:
         try:
 
@@ -39,6 +43,11 @@ class SummarizeUnique(BaseTask):
             matched_col, excluded = self.get_columns_by_intent()
             self._log(f"    Processing {len(matched_col)} column(s)", "debug")
 
+            # Approximate mode: fold row slices into HyperLogLog sketches
+            if self.approximate:
+                self.run_partials(df)
+                return
+
             if is_polars(df):
                 result: Dict[str, int] = {col: df[col].n_unique() for col in df.columns}
                 self._log(
@@ -48,6 +57,12 @@ class SummarizeUnique(BaseTask):
             else:
                 result = df.nunique().to_dict()
 
+            # Exact distinct counts pushed down to the source (e.g. SQL)
+            for col in result:
+                n_unique = self.get_source_stat(col, "n_unique")
+                if n_unique is not None:
+                    result[col] = n_unique
+
             self.output = TaskResult(
                 name=self.name,
                 status="success",
@@ -66,32 +81,7 @@ class SummarizeUnique(BaseTask):
                 },
             )
 
-            # Use the output data dict to build a plot
-            if self.context and self.context.output_dir and self.output.data:
-                counts_series = pd.Series(self.output.data)
-
-                # Add annotations based on cardinality
-                annotations = []
-                for col, count in self.output.data.items():
-                    if count == 1:
-                        annotations.append(f"{col} is constant (1 unique value)")
-                    elif count > 50:
-                        annotations.append(
-                            f"{col} has high cardinality ({count} values)"
-                        )
-
-                save_path = self.get_output_path("unique_counts_barplot.png")
-                static = PlotFactory.plot_barplot_static(counts_series, save_path)
-                interactive = PlotFactory.plot_barplot_interactive(
-                    counts_series, annotations=annotations
-                )
-
-                self.output.plots = {
-                    "unique_counts": {
-                        "static": static["path"],
-                        "interactive": interactive,
-                    }
-                }
+            self._attach_plots()
 
         except Exception as e:
             if self.context:
@@ -102,3 +92,84 @@ class SummarizeUnique(BaseTask):
                 level="warn",
             )
             self.output = make_failure_result(self.name, e)
+
+    def _attach_plots(self) -> None:
+        """Add the unique-count bar plot to self.output."""
+        if not (self.output and self.output.data):
+            return
+        if not (self.context and self.context.output_dir):
+            return
+
+        counts_series = pd.Series(self.output.data)
+
+        # Add annotations based on cardinality
+        annotations = []
+        for col, count in self.output.data.items():
+            if count == 1:
+                annotations.append(f"{col} is constant (1 unique value)")
+            elif count > 50:
+                annotations.append(f"{col} has high cardinality ({count} values)")
+
+        save_path = self.get_output_path("unique_counts_barplot.png")
+        static = PlotFactory.plot_barplot_static(counts_series, save_path)
+        interactive = PlotFactory.plot_barplot_interactive(
+            counts_series, annotations=annotations
+        )
+
+        self.output.plots = {
+            "unique_counts": {
+                "static": static["path"],
+                "interactive": interactive,
+            }
+        }
+
+    def partial(self, chunk: Any) -> Dict[str, Any]:
+        df = to_polars(chunk)
+        p = int(self.get_sketch_param("hll_precision"))
+        return {
+            "columns": {col: HyperLogLog(p=p).update(df[col]) for col in df.columns}
+        }
+
+    def merge(self, states: List[Dict[str, Any]]) -> Dict[str, Any]:
+        columns: Dict[str, HyperLogLog] = {}
+        for state in states:
+            for col, sketch in state["columns"].items():
+                if col not in columns:
+                    columns[col] = HyperLogLog(p=sketch.p)
+                    columns[col].hash_version = sketch.hash_version
+                columns[col].merge(sketch)
+        return {"columns": columns}
+
+    def finalize(self, state: Dict[str, Any]) -> None:
+        matched_col, excluded = self.get_columns_by_intent()
+        result = {
+            col: int(round(sketch.estimate()))
+            for col, sketch in state["columns"].items()
+        }
+        for col in result:
+            n_unique = self.get_source_stat(col, "n_unique")
+            if n_unique is not None:
+                result[col] = n_unique
+        relative_error = max(
+            (sketch.relative_error() for sketch in state["columns"].values()),
+            default=0.0,
+        )
+
+        self.output = TaskResult(
+            name=self.name,
+            status="success",
+            summary={"message": (f"Computed unique counts for {len(result)} columns.")},
+            data=result,
+            metadata={
+                "suggested_viz_type": "bar",
+                "recommended_section": "Summary",
+                "display_priority": "low",
+                "approximate": True,
+                "distinct_count_relative_error": relative_error,
+                "excluded_columns": excluded,
+                "column_types": self.get_column_type_info(
+                    matched_col + list(excluded.keys())
+                ),
+            },
+        )
+        self._attach_plots()
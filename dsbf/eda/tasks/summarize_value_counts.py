@@ -1,14 +1,15 @@
 # dsbf/eda/tasks/summarize_value_counts.py
 
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 import pandas as pd
 
 from dsbf.core.base_task import BaseTask
 from dsbf.eda.task_registry import register_task
 from dsbf.eda.task_result import TaskResult, make_failure_result
-from dsbf.utils.backend import is_polars
+from dsbf.utils.backend import is_polars, to_polars
 from dsbf.utils.plot_factory import PlotFactory
+from dsbf.utils.sketches import FrequentItemsSketch
 
 
 @register_task(
@@ -26,9 +27,16 @@ class SummarizeValueCounts(BaseTask):
     """
     Computes the top-k most frequent values for each column.
 
-    Converts Polars to Pandas if needed for consistent functionality.
+    Converts Polars to Pandas if needed for consistent functionality. Supports
+    partial/merge/finalize with a bounded frequent-items sketch per column
+    (`top_k_capacity` tracked values). Merged counts are exact for columns
+    with at most that many distinct values; beyond it they may be
+    underestimated by up to `count_error_bound`, and the result is marked
+    `approximate` with the affected `approximate_columns`.
     """
 
+    mergeable = True
+
     def run(self) -> None:
         """
         Perform value count summarization on each column, returning the most
@@ -45,6 +53,11 @@ class SummarizeValueCounts(BaseTask):
 
             top_k = int(self.get_task_param("top_k") or 5)
 
+            # Approximate mode: fold row slices into frequent-items sketches
+            if self.approximate:
+                self.run_partials(df)
+                return
+
             # Convert Polars to Pandas for compatibility with value_counts
             if is_polars(df):
                 df = df.to_pandas()
@@ -54,8 +67,15 @@ class SummarizeValueCounts(BaseTask):
                 )
 
             result: Dict[str, Dict[Any, int]] = {}
+            source_top_k = int(self.get_source_stat(None, "top_k", 0))
 
             for col in df.columns:
+                # Exact top-k pushed down to the source (e.g. SQL GROUP BY)
+                top_values = self.get_source_stat(col, "top_values")
+                if top_values is not None and source_top_k >= top_k:
+                    result[col] = dict(list(top_values.items())[:top_k])
+                    continue
+
                 try:
                     vc = df[col].value_counts(dropna=False).head(top_k)
                     result[col] = vc.to_dict()
@@ -63,30 +83,7 @@ class SummarizeValueCounts(BaseTask):
                 except Exception:
                     continue  # Skip columns that fail (e.g., unhashable types)
 
-            # Plotting
-            plots: dict[str, dict[str, Any]] = {}
-
-            for col, freqs in result.items():
-                if not freqs:
-                    continue
-                series_for_plot = pd.Series(freqs)
-                series_for_plot.name = col
-
-                top_value = series_for_plot.index[0]
-                top_count = series_for_plot.iloc[0]
-                annotations = [f"Top value: '{top_value}' ({top_count}x)"]
-
-                save_path = self.get_output_path(f"{col}_value_counts_barplot.png")
-                static_plot = PlotFactory.plot_barplot_static(
-                    series_for_plot, save_path
-                )
-                interactive_plot = PlotFactory.plot_barplot_interactive(series_for_plot)
-                interactive_plot["annotations"] = annotations
-
-                plots[col] = {
-                    "static": static_plot["path"],
-                    "interactive": interactive_plot,
-                }
+            plots = self._build_plots(result)
 
             self.output = TaskResult(
                 name=self.name,
@@ -117,3 +114,82 @@ class SummarizeValueCounts(BaseTask):
                 level="warn",
             )
             self.output = make_failure_result(self.name, e)
+
+    def _build_plots(self, result: Dict[str, Dict[Any, int]]) -> Dict[str, Any]:
+        """Build a bar plot of the top values for each column."""
+        plots: dict[str, dict[str, Any]] = {}
+
+        for col, freqs in result.items():
+            if not freqs:
+                continue
+            series_for_plot = pd.Series(freqs)
+            series_for_plot.name = col
+
+            top_value = series_for_plot.index[0]
+            top_count = series_for_plot.iloc[0]
+            annotations = [f"Top value: '{top_value}' ({top_count}x)"]
+
+            save_path = self.get_output_path(f"{col}_value_counts_barplot.png")
+            static_plot = PlotFactory.plot_barplot_static(series_for_plot, save_path)
+            interactive_plot = PlotFactory.plot_barplot_interactive(series_for_plot)
+            interactive_plot["annotations"] = annotations
+
+            plots[col] = {
+                "static": static_plot["path"],
+                "interactive": interactive_plot,
+            }
+
+        return plots
+
+    def partial(self, chunk: Any) -> Dict[str, Any]:
+        df = to_polars(chunk)
+        capacity = int(self.get_sketch_param("top_k_capacity"))
+        columns: Dict[str, FrequentItemsSketch] = {}
+        for col in df.columns:
+            try:
+                columns[col] = FrequentItemsSketch(capacity=capacity).update(df[col])
+            except Exception:
+                continue  # Skip columns that fail (e.g., unhashable types)
+        return {"columns": columns}
+
+    def merge(self, states: List[Dict[str, Any]]) -> Dict[str, Any]:
+        columns: Dict[str, FrequentItemsSketch] = {}
+        for state in states:
+            for col, sketch in state["columns"].items():
+                if col not in columns:
+                    columns[col] = FrequentItemsSketch(capacity=sketch.capacity)
+                columns[col].merge(sketch)
+        return {"columns": columns}
+
+    def finalize(self, state: Dict[str, Any]) -> None:
+        matched_col, excluded = self.get_columns_by_intent()
+        top_k = int(self.get_task_param("top_k") or 5)
+        sketches: Dict[str, FrequentItemsSketch] = state["columns"]
+        result = {col: dict(sketch.top(top_k)) for col, sketch in sketches.items()}
+        approximate_columns = [
+            col for col, sketch in sketches.items() if not sketch.is_exact
+        ]
+
+        self.output = TaskResult(
+            name=self.name,
+            status="success",
+            summary={"message": (f"Computed value counts for {len(result)} columns.")},
+            data=result,
+            plots=self._build_plots(result),
+            metadata={
+                "top_k": top_k,
+                "suggested_viz_type": "bar",
+                "recommended_section": "Summary",
+                "display_priority": "medium",
+                "approximate": bool(approximate_columns),
+                "approximate_columns": approximate_columns,
+                "exact": {col: sketch.is_exact for col, sketch in sketches.items()},
+                "count_error_bound": {
+                    col: sketch.error_bound() for col, sketch in sketches.items()
+                },
+                "excluded_columns": excluded,
+                "column_types": self.get_column_type_info(
+                    matched_col + list(excluded.keys())
+                ),
+            },
+        )
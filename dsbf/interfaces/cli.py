@@ -1,10 +1,17 @@
 # dsbf/interfaces/cli.py
 
+from typing import List
+
 import typer
 import yaml
 
 from dsbf.config import load_default_config
+from dsbf.eda.distributed_engine import DistributedProfileEngine, serve_worker
+from dsbf.eda.incremental_engine import IncrementalProfileEngine
+from dsbf.eda.mapreduce_engine import MapReduceProfileEngine
+from dsbf.eda.merge_engine import ProfileStateMergeEngine
 from dsbf.eda.profile_engine import ProfileEngine
+from dsbf.eda.stream_engine import StreamingProfileEngine
 
 app = typer.Typer(help="DSBF: Data Scientist's Best Friend — EDA Profiling CLI")
 
@@ -42,19 +49,119 @@ def run(
 
 @app.command()
 def profile(
-    data: str = typer.Argument(..., help="Path to dataset CSV file."),
+    data: str = typer.Argument(
+        ..., help="Path to dataset CSV file, or '-' to stream records from stdin."
+    ),
     depth: str = typer.Option(
         "standard", "--depth", "-d", help="Profiling depth: basic | standard | full"
     ),
+    stream_format: str = typer.Option(
+        "auto", "--format", help="Stream format for '-': auto | ndjson | csv"
+    ),
+    batch_rows: int = typer.Option(
+        10_000, "--batch-rows", help="Records per batch when streaming."
+    ),
+    emit_every: int = typer.Option(
+        0, "--emit-every", help="Rewrite the report every N batches (0 = at EOF)."
+    ),
+    workers: int = typer.Option(
+        0,
+        "--workers",
+        "-w",
+        help="Profile row partitions in N worker processes and merge (map-reduce).",
+    ),
+    save_state: bool = typer.Option(
+        False, "--save-state", help="Also write profile_state.json for `dsbf merge`."
+    ),
+    incremental: str = typer.Option(
+        None,
+        "--incremental",
+        help="State file kept between runs; profile only rows appended since.",
+    ),
 ):
     """Profile a single dataset using default config."""
     cfg = load_default_config()
-    cfg["metadata"]["dataset_path"] = data
     cfg["metadata"]["profiling_depth"] = depth
+    cfg["engine"]["save_profile_state"] = save_state
+
+    if data == "-":
+        cfg["engine"]["streaming"] = {
+            "format": stream_format,
+            "batch_rows": batch_rows,
+            "emit_every_batches": emit_every,
+        }
+        StreamingProfileEngine(cfg).run()
+        return
+
+    cfg["metadata"]["dataset_path"] = data
+    if incremental:
+        cfg["engine"]["incremental"] = {"state_path": incremental}
+        if workers:
+            cfg["engine"].setdefault("mapreduce", {})["max_workers"] = workers
+        IncrementalProfileEngine(cfg).run()
+        return
+
+    if workers:
+        cfg["engine"].setdefault("mapreduce", {})["max_workers"] = workers
+        MapReduceProfileEngine(cfg).run()
+        return
+
     engine = ProfileEngine(cfg)
     engine.run()
 
 
+@app.command()
+def merge(
+    states: List[str] = typer.Argument(
+        ..., help="profile_state.json files (or run directories) to combine."
+    ),
+    output_dir: str = typer.Option(
+        None, "--output-dir", "-o", help="Directory for the merged report."
+    ),
+):
+    """Combine saved profile states into one report without re-reading data."""
+    cfg = load_default_config()
+    if output_dir:
+        cfg["output_dir"] = output_dir
+    ProfileStateMergeEngine(states, cfg).run()
+
+
+@app.command()
+def worker(
+    host: str = typer.Option("127.0.0.1", "--host", help="Interface to bind."),
+    port: int = typer.Option(8765, "--port", "-p", help="Port to listen on."),
+):
+    """Serve partial profiles of row partitions to a coordinator."""
+    serve_worker(host, port)
+
+
+@app.command()
+def coordinator(
+    data: str = typer.Argument(
+        ..., help="Dataset path readable by every worker (file, directory, glob)."
+    ),
+    workers: List[str] = typer.Option(
+        ..., "--worker", "-w", help="Worker URL, e.g. http://host:8765 (repeatable)."
+    ),
+    partition_rows: int = typer.Option(
+        1_000_000, "--partition-rows", help="Target rows per partition."
+    ),
+    max_attempts: int = typer.Option(
+        3, "--max-attempts", help="Tries per partition before the run fails."
+    ),
+):
+    """Profile a dataset across worker hosts and merge the results."""
+    cfg = load_default_config()
+    cfg["metadata"]["dataset_path"] = data
+    cfg["engine"].setdefault("mapreduce", {})["partition_rows"] = partition_rows
+    cfg["engine"]["distributed"] = {
+        **(cfg["engine"].get("distributed") or {}),
+        "workers": workers,
+        "max_attempts": max_attempts,
+    }
+    DistributedProfileEngine(cfg).run()
+
+
 @app.command()
 def quickstart(
     dataset: str = typer.Argument(
@@ -20,3 +20,76 @@ def is_text_pandas(series):
         or isinstance(series.dtype, pd.CategoricalDtype)
         or (series.dtype == object and non_null.map(type).eq(str).mean() > 0.8)
     )
+
+
+def to_polars(df):
+    """Return a Polars DataFrame, converting from Pandas if needed."""
+    import polars as pl
+
+    return df if is_polars(df) else pl.from_pandas(df)
+
+
+def missing_expr(name, dtype):
+    """Polars expression flagging missing values (nulls, and NaN for floats)."""
+    import polars as pl
+
+    if dtype.is_float():
+        return pl.col(name).is_null() | pl.col(name).is_nan()
+    return pl.col(name).is_null()
+
+
+# Coarse column classes tasks can declare they read (see register_task `reads`)
+COLUMN_CLASSES = ("numeric", "string", "boolean", "temporal", "other")
+
+
+def column_class(dtype):
+    """Coarse class of a Polars or Pandas dtype (one of COLUMN_CLASSES)."""
+    import pandas as pd
+    import polars as pl
+
+    if isinstance(dtype, pl.DataType) or (
+        isinstance(dtype, type) and issubclass(dtype, pl.DataType)
+    ):
+        if dtype == pl.Boolean:
+            return "boolean"
+        if dtype.is_numeric():
+            return "numeric"
+        if dtype in (pl.Utf8, pl.Categorical, pl.Enum):
+            return "string"
+        if dtype.is_temporal():
+            return "temporal"
+        return "other"
+
+    if pd.api.types.is_bool_dtype(dtype):
+        return "boolean"
+    if pd.api.types.is_numeric_dtype(dtype):
+        return "numeric"
+    if pd.api.types.is_datetime64_any_dtype(dtype) or pd.api.types.is_timedelta64_dtype(
+        dtype
+    ):
+        return "temporal"
+    if (
+        pd.api.types.is_string_dtype(dtype)
+        or pd.api.types.is_object_dtype(dtype)
+        or isinstance(dtype, pd.CategoricalDtype)
+    ):
+        return "string"
+    return "other"
+
+
+def columns_of_class(schema, classes):
+    """
+    Names of columns whose class is in `classes`, in schema order.
+
+    `schema` may be a Polars/Pandas DataFrame or a {column: dtype} mapping.
+    """
+    from collections.abc import Mapping
+
+    if isinstance(schema, Mapping):
+        items = schema.items()
+    elif is_polars(schema):
+        items = schema.schema.items()
+    else:
+        items = schema.dtypes.items()
+    wanted = set(classes)
+    return [col for col, dtype in items if column_class(dtype) in wanted]
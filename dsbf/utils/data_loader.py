@@ -6,7 +6,7 @@ Provides flexible dataset loading for local files, sklearn built-ins,
 seaborn demos, and OpenML, with backend-agnostic support for pandas and polars.
 """
 import inspect
-from typing import Union
+from typing import List, Optional, Union
 
 import pandas as pd
 import polars as pl
@@ -76,6 +76,32 @@ def load_dataset(
     return df
 
 
+def load_parquet(
+    path: str,
+    backend: str = "pandas",
+    n_rows: Optional[int] = None,
+    columns: Optional[List[str]] = None,
+) -> Union[pd.DataFrame, pl.DataFrame]:
+    """
+    Load a local Parquet file, optionally reading only the first `n_rows` rows
+    and only the given `columns`.
+
+    Parameters:
+        path (str): Path to the Parquet file.
+        backend (str): pandas or polars
+        n_rows (Optional[int]): If set, stop reading after this many rows so that
+            only the leading row groups are decoded.
+        columns (Optional[List[str]]): If set, decode only these column chunks.
+
+    Returns:
+        Union[pd.DataFrame, pl.DataFrame]: The loaded dataset.
+    """
+    df = pl.read_parquet(path, n_rows=n_rows, columns=columns)
+    if backend == "polars":
+        return df
+    return df.to_pandas()
+
+
 def list_available_datasets(source: str = "sklearn"):
     if source == "sklearn":
         return sorted(
@@ -1,45 +1,319 @@
 # dsbf/utils/data_utils.py
 
+from typing import Any, Dict, List, Optional, Sequence
 
-def data_sampling(df, config, log_fn=None):
+import numpy as np
+import pandas as pd
+import polars as pl
+
+from dsbf.utils.backend import columns_of_class, is_polars
+from dsbf.utils.progressive import progressive_sample
+
+SAMPLE_STRATEGIES = ("head", "random", "stratified", "reservoir", "progressive")
+DEFAULT_SAMPLE_SEED = 42
+# Stratify columns with more distinct values are binned (numeric) or warned about
+MAX_STRATA = 1_000
+STRATIFY_BINS = 20
+
+# Helper columns used while sampling Polars frames; dropped before returning
+ROW_INDEX = "__dsbf_row__"
+SAMPLE_KEY = "__dsbf_key__"
+
+
+def data_sampling(df, config, log_fn=None, reference_df=None):
+    """
+    Reduce a dataset to `resource_limits.sample_threshold_rows` rows.
+
+    Strategies (`resource_limits.sample_strategy`):
+        head: First N rows.
+        random: Uniform sample without replacement.
+        stratified: Proportional sample by `stratify_column`, so every stratum
+            keeps its share of rows (and at least one row where possible). A
+            numeric column with more than `MAX_STRATA` distinct values is
+            stratified by `STRATIFY_BINS` quantile bins instead.
+        reservoir: Single-pass uniform sample; also accepts a Polars LazyFrame.
+        progressive: Nested random samples of growing size until summary
+            statistics converge (see `dsbf.utils.progressive`); settings come
+            from `resource_limits.progressive` and the threshold is not used.
+
+    Random strategies are seeded by `resource_limits.sample_seed`, so the same
+    config always yields the same sample. Polars inputs are sampled natively.
+
+    Returns:
+        Tuple of (sampled dataframe, sampling info dict or None if not sampled).
+    """
     limits = config.get("resource_limits", {})
     if not limits.get("enable_sampling", True):
         return df, None  # No sampling
 
-    threshold = limits.get("sample_threshold_rows", 1_000_000)
+    threshold = int(limits.get("sample_threshold_rows", 1_000_000))
     strategy = limits.get("sample_strategy", "head")
+    seed = int(limits.get("sample_seed", DEFAULT_SAMPLE_SEED))
+    stratify_column = limits.get("stratify_column")
+
+    if strategy not in SAMPLE_STRATEGIES:
+        if log_fn:
+            log_fn(f"Unknown sample strategy '{strategy}'; using 'head'", level="warn")
+        strategy = "head"
+
+    if isinstance(df, pl.LazyFrame):
+        sampled_df, original_rows = reservoir_sample_lazy(df, threshold, seed=seed)
+        if original_rows <= threshold:
+            return sampled_df, None
+        return sampled_df, _sampling_info(
+            original_rows, sampled_df.height, "reservoir", seed
+        )
 
-    if df.shape[0] <= threshold:
+    if strategy == "progressive":
+        return progressive_sample(
+            df,
+            settings=limits.get("progressive"),
+            seed=seed,
+            reference_df=reference_df,
+            log_fn=log_fn,
+        )
+
+    original_rows = df.shape[0]
+    if original_rows <= threshold:
         return df, None  # No sampling needed
 
+    if strategy == "stratified" and (
+        stratify_column is None or stratify_column not in df.columns
+    ):
+        if log_fn:
+            log_fn(
+                f"Stratify column '{stratify_column}' not found; "
+                "falling back to random sampling",
+                level="warn",
+            )
+        strategy = "random"
+
     if log_fn:
         log_fn(
             f"Sampling dataset (rows > {threshold}) using strategy '{strategy}'",
             level="info",
         )
 
-    sampled_df = {
-        "head": lambda d: d.head(threshold),
-        "random": lambda d: (
-            d.sample(n=threshold, random_state=42)
-            if hasattr(d, "sample")
-            else d.head(threshold)
-        ),
-        "stratified": lambda d: d.head(
-            threshold
-        ),  # TODO: implement when labels available
-    }.get(strategy, lambda d: d.head(threshold))(df)
-
-    return sampled_df, {
-        "original_rows": df.shape[0],
-        "sampled_rows": threshold,
+    if strategy == "head":
+        sampled_df = df.head(threshold)
+    elif strategy == "stratified":
+        bins = _stratify_bins(df, stratify_column, threshold, log_fn)
+        sampled_df = stratified_sample(
+            df, stratify_column, threshold, seed=seed, bins=bins
+        )
+    elif strategy == "reservoir" and is_polars(df):
+        sampled_df = ReservoirSampler(threshold, seed=seed).update(df).sample()
+    else:
+        sampled_df = random_sample(df, threshold, seed=seed)
+
+    info = _sampling_info(original_rows, sampled_df.shape[0], strategy, seed)
+    if strategy == "stratified":
+        info["stratify_column"] = stratify_column
+        info["stratify_bins"] = bins
+    return sampled_df, info
+
+
+def _stratify_bins(df, column: str, n: int, log_fn=None) -> Optional[int]:
+    """
+    Quantile bins to stratify a high-cardinality numeric column by, or None to
+    use its values. High-cardinality non-numeric columns (e.g. IDs) are kept
+    but logged, since most of their strata cannot get a row.
+    """
+    strata = _stratum_count(df, column)
+    if strata <= MAX_STRATA:
+        return None
+    if column in columns_of_class(df, ["numeric"]):
+        if log_fn:
+            log_fn(
+                f"Stratify column '{column}' has {strata} distinct values; "
+                f"stratifying by {STRATIFY_BINS} quantile bins",
+                level="info",
+            )
+        return STRATIFY_BINS
+    if log_fn:
+        detail = (
+            f"more than the {n} sample rows, so only the largest strata are sampled"
+            if strata > n
+            else "consider a coarser column"
+        )
+        log_fn(
+            f"Stratify column '{column}' has {strata} distinct values; {detail}",
+            level="warn",
+        )
+    return None
+
+
+def _sampling_info(
+    original_rows: int, sampled_rows: int, strategy: str, seed: int
+) -> Dict[str, Any]:
+    return {
+        "original_rows": original_rows,
+        "sampled_rows": sampled_rows,
+        "sampling_fraction": sampled_rows / original_rows if original_rows else 1.0,
         "strategy": strategy,
+        "seed": seed if strategy != "head" else None,
     }
 
 
-def is_integer_polars(series):
-    import polars as pl
+def random_sample(df, n: int, seed: int = DEFAULT_SAMPLE_SEED):
+    """Uniform sample of `n` rows without replacement, in original row order."""
+    if n >= df.shape[0]:
+        return df
+    if is_polars(df):
+        rows = pl.int_range(0, df.height, eager=True).sample(n=n, seed=seed).sort()
+        return df[rows]
+    return df.sample(n=n, random_state=seed).sort_index()
+
+
+def allocate_strata(sizes: Sequence[int], n: int) -> List[int]:
+    """
+    Split `n` sample rows across strata proportionally to their sizes.
+
+    Uses largest-remainder rounding so the quotas sum to exactly `n`, and gives
+    every stratum at least one row when `n` allows, so rare classes are never
+    sampled away. With more strata than rows, the `n` largest strata get one
+    row each. Runs in O(k log k) for k strata.
+    """
+    size_arr = np.asarray(sizes, dtype=np.int64)
+    total = int(size_arr.sum())
+    if total <= n:
+        return size_arr.tolist()
 
+    exact = size_arr * n / total
+    quotas = np.minimum(size_arr, np.maximum(1, np.floor(exact).astype(np.int64)))
+
+    # Trim guaranteed minimums back if they overshot n. Only strata raised to
+    # one row are above their exact share, by less than one row each, so
+    # dropping the `excess` furthest above it removes one row from each.
+    excess = int(quotas.sum()) - n
+    if excess > 0:
+        order = np.argsort(exact - quotas, kind="stable")
+        quotas[order[:excess]] -= 1
+
+    shortfall = n - int(quotas.sum())
+    if shortfall > 0:
+        order = np.argsort(quotas - exact, kind="stable")
+        open_strata = order[quotas[order] < size_arr[order]]
+        quotas[open_strata[:shortfall]] += 1
+    return quotas.tolist()
+
+
+def _stratum_count(df, column: str) -> int:
+    """Number of distinct values (missing counted once) in `column`."""
+    if is_polars(df):
+        return int(df[column].n_unique())
+    return int(df[column].nunique(dropna=False))
+
+
+def stratified_sample(
+    df,
+    column: str,
+    n: int,
+    seed: int = DEFAULT_SAMPLE_SEED,
+    bins: Optional[int] = None,
+):
+    """
+    Proportional stratified sample of `n` rows by `column`, in original row order.
+    Missing values form their own stratum. With `bins`, a numeric column is
+    stratified by that many quantile bins instead of by its raw values.
+    """
+    if n >= df.shape[0]:
+        return df
+
+    if is_polars(df):
+        key = pl.col(column)
+        if bins:
+            key = key.qcut(bins, allow_duplicates=True)
+        groups = (
+            df.select(key.alias(column))
+            .with_row_index(ROW_INDEX)
+            .group_by(column, maintain_order=True)
+            .agg(pl.col(ROW_INDEX).shuffle(seed=seed))
+        )
+        quotas = allocate_strata(groups[ROW_INDEX].list.len().to_list(), n)
+        rows = (
+            groups.select(pl.col(ROW_INDEX).list.head(pl.Series(quotas)))
+            .explode(ROW_INDEX)[ROW_INDEX]
+            .sort()
+        )
+        return df[rows]
+
+    keys = df[column]
+    if bins:
+        keys = pd.qcut(keys, bins, duplicates="drop").astype(str)
+    rng = np.random.default_rng(seed)
+    order = rng.permutation(len(df))
+    shuffled = df.iloc[order]
+    groups = shuffled.groupby(keys.iloc[order].to_numpy(), dropna=False, sort=False)
+    group_ids = groups.ngroup().to_numpy()
+    quotas = np.array(allocate_strata(np.bincount(group_ids).tolist(), n))
+    keep = groups.cumcount().to_numpy() < quotas[group_ids]
+    return shuffled[keep].sort_index()
+
+
+def _priority(seed: int) -> pl.Expr:
+    # Pseudo-random priority derived from the global row position, so the
+    # sample does not depend on how the input was split into batches
+    return pl.col(ROW_INDEX).hash(seed=seed).alias(SAMPLE_KEY)
+
+
+class ReservoirSampler:
+    """
+    Single-pass uniform sample of fixed size over a stream of Polars batches.
+
+    Every row gets a seeded pseudo-random priority and the reservoir keeps the
+    `n` rows with the lowest priorities, so memory is bounded by `n` plus one
+    batch and the sample is reproducible regardless of batch sizes.
+
+    Args:
+        n (int): Sample size.
+        seed (int): Seed for the row priorities.
+    """
+
+    def __init__(self, n: int, seed: int = DEFAULT_SAMPLE_SEED):
+        self.n = n
+        self.seed = seed
+        self.rows_seen = 0
+        self._reservoir: Optional[pl.DataFrame] = None
+
+    def update(self, batch: pl.DataFrame) -> "ReservoirSampler":
+        keyed = batch.with_row_index(ROW_INDEX, offset=self.rows_seen).with_columns(
+            _priority(self.seed)
+        )
+        self.rows_seen += batch.height
+
+        if self._reservoir is not None:
+            keyed = pl.concat([self._reservoir, keyed], how="diagonal_relaxed")
+        self._reservoir = keyed.bottom_k(self.n, by=SAMPLE_KEY)
+        return self
+
+    def sample(self) -> pl.DataFrame:
+        """Return the current sample in stream order."""
+        if self._reservoir is None:
+            return pl.DataFrame()
+        return self._reservoir.sort(ROW_INDEX).drop(ROW_INDEX, SAMPLE_KEY)
+
+
+def reservoir_sample_lazy(lf: pl.LazyFrame, n: int, seed: int = DEFAULT_SAMPLE_SEED):
+    """
+    Reservoir-sample a LazyFrame in one streaming pass. Selects the same rows
+    as `ReservoirSampler` would for the collected frame.
+
+    Returns:
+        Tuple of (sampled pl.DataFrame, total row count).
+    """
+    sample_query = (
+        lf.with_row_index(ROW_INDEX)
+        .with_columns(_priority(seed))
+        .bottom_k(n, by=SAMPLE_KEY)
+        .sort(ROW_INDEX)
+        .drop(ROW_INDEX, SAMPLE_KEY)
+    )
+    sampled_df, count = pl.collect_all([sample_query, lf.select(pl.len())])
+    return sampled_df, int(count.item())
+
+
+def is_integer_polars(series):
     return hasattr(series, "dtype") and series.dtype in {
         pl.Int8,
         pl.Int16,
@@ -0,0 +1,398 @@
+# dsbf/utils/filesystem.py
+"""
+Pluggable filesystem layer for remote datasets.
+
+Dataset URLs such as `s3://bucket/key.parquet` are resolved to a filesystem by
+scheme. Reads are issued as byte ranges through a local read-through block cache,
+so Parquet files can be profiled by fetching only the footer and the row groups
+that are needed, in parallel, without downloading the whole object first.
+"""
+
+import hashlib
+import io
+import os
+import re
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlparse
+
+import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from dsbf.utils.parquet_utils import is_parquet_path
+
+DEFAULT_BLOCK_SIZE = 4 * 1024 * 1024  # 4 MiB
+DEFAULT_CACHE_MAX_BYTES = 2 * 1024**3  # 2 GiB
+BLOCK_FILE_PATTERN = re.compile(r"[0-9a-f]{40}_\d+_\d+")
+
+
+def default_cache_dir() -> str:
+    """Per-user cache directory: `$XDG_CACHE_HOME/dsbf` or `~/.cache/dsbf`."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "dsbf")
+
+
+class BaseFileSystem(ABC):
+    """Minimal byte-range interface a remote store must provide."""
+
+    @abstractmethod
+    def size(self, path: str) -> int:
+        """Return the object size in bytes."""
+
+    @abstractmethod
+    def read_range(self, path: str, start: int, length: int) -> bytes:
+        """Return `length` bytes starting at offset `start`."""
+
+    def fingerprint(self, path: str) -> str:
+        """Return a version tag used to key cached blocks (default: size)."""
+        return str(self.size(path))
+
+    def exists(self, path: str) -> bool:
+        try:
+            self.size(path)
+            return True
+        except Exception:
+            return False
+
+
+class LocalFileSystem(BaseFileSystem):
+    """Filesystem for local paths and `file://` URLs."""
+
+    def __init__(self, **_: Any):
+        pass
+
+    @staticmethod
+    def _local(path: str) -> str:
+        return urlparse(path).path if path.startswith("file://") else path
+
+    def size(self, path: str) -> int:
+        return os.path.getsize(self._local(path))
+
+    def fingerprint(self, path: str) -> str:
+        stat = os.stat(self._local(path))
+        return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+    def read_range(self, path: str, start: int, length: int) -> bytes:
+        with open(self._local(path), "rb") as f:
+            f.seek(start)
+            return f.read(length)
+
+
+class S3FileSystem(BaseFileSystem):
+    """
+    S3-compatible object store (AWS S3, MinIO, moto) using ranged GET requests.
+
+    Args:
+        client: Optional pre-built boto3 S3 client.
+        **client_kwargs: Passed to `boto3.client("s3", ...)`, e.g. `endpoint_url`
+            and `region_name` for MinIO or another S3-compatible service.
+    """
+
+    def __init__(self, client: Any = None, **client_kwargs: Any):
+        if client is None:
+            try:
+                import boto3
+            except ImportError as e:
+                raise ImportError(
+                    "Reading s3:// datasets requires boto3 (pip install 'dsbf[s3]')."
+                ) from e
+            client = boto3.client("s3", **client_kwargs)
+        self.client = client
+
+    @staticmethod
+    def _split(path: str) -> tuple:
+        parsed = urlparse(path)
+        return parsed.netloc, parsed.path.lstrip("/")
+
+    def size(self, path: str) -> int:
+        bucket, key = self._split(path)
+        return int(self.client.head_object(Bucket=bucket, Key=key)["ContentLength"])
+
+    def fingerprint(self, path: str) -> str:
+        bucket, key = self._split(path)
+        head = self.client.head_object(Bucket=bucket, Key=key)
+        return f"{head['ContentLength']}:{head.get('ETag', '')}"
+
+    def read_range(self, path: str, start: int, length: int) -> bytes:
+        if length <= 0:
+            return b""
+        bucket, key = self._split(path)
+        response = self.client.get_object(
+            Bucket=bucket, Key=key, Range=f"bytes={start}-{start + length - 1}"
+        )
+        return response["Body"].read()
+
+
+# -- Scheme registry --
+FILESYSTEMS: Dict[str, Callable[..., BaseFileSystem]] = {
+    "file": LocalFileSystem,
+    "s3": S3FileSystem,
+    "s3a": S3FileSystem,
+}
+
+
+def register_filesystem(scheme: str, factory: Callable[..., BaseFileSystem]) -> None:
+    """Register a filesystem factory for a URL scheme (e.g. 'gs')."""
+    FILESYSTEMS[scheme] = factory
+
+
+def get_scheme(path: Optional[str]) -> str:
+    if not path or "://" not in str(path):
+        return "file"
+    return urlparse(str(path)).scheme
+
+
+def is_remote_path(path: Optional[str]) -> bool:
+    """Return True for URLs handled by a non-local filesystem."""
+    return get_scheme(path) not in ("file",)
+
+
+def get_filesystem(path: str, options: Optional[Dict[str, Any]] = None):
+    """
+    Instantiate the filesystem registered for a path's scheme.
+
+    Args:
+        path (str): Dataset path or URL.
+        options (dict or None): Per-scheme options, e.g.
+            {"s3": {"endpoint_url": "http://localhost:9000"}}.
+
+    Returns:
+        BaseFileSystem: Filesystem instance.
+    """
+    scheme = get_scheme(path)
+    if scheme not in FILESYSTEMS:
+        raise ValueError(f"No filesystem registered for scheme '{scheme}://'")
+    return FILESYSTEMS[scheme](**(options or {}).get(scheme, {}))
+
+
+class BlockCache:
+    """
+    Local read-through cache of fixed-size blocks of remote objects.
+
+    Blocks are stored as files under `cache_dir`, keyed by object URL, version
+    fingerprint (e.g. size + ETag), and block index, so repeated runs (or repeated
+    footer reads) hit the local disk while changed objects are re-fetched.
+
+    The cache directory is created private to the user (mode 0700). Once the
+    blocks in it exceed `max_bytes`, the least recently used ones are deleted;
+    a cache hit refreshes a block's modification time.
+
+    Args:
+        fs (BaseFileSystem): Filesystem to fetch missing blocks from.
+        cache_dir (str or None): Cache directory (default: `default_cache_dir()`).
+        block_size (int): Block size in bytes.
+        max_bytes (int or None): Cache size cap in bytes (None for no cap).
+    """
+
+    def __init__(
+        self,
+        fs: BaseFileSystem,
+        cache_dir: Optional[str] = None,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        max_bytes: Optional[int] = DEFAULT_CACHE_MAX_BYTES,
+    ):
+        self.fs = fs
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.block_size = block_size
+        self.max_bytes = max_bytes
+        self.remote_reads = 0
+        self._sizes: Dict[str, int] = {}
+        self._fingerprints: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+        if cache_dir is None:
+            os.chmod(self.cache_dir, 0o700)
+        self._cached_bytes = sum(size for _, size, _ in self._entries())
+
+    def size(self, path: str) -> int:
+        if path not in self._sizes:
+            self._sizes[path] = self.fs.size(path)
+        return self._sizes[path]
+
+    def _block_path(self, path: str, index: int) -> str:
+        if path not in self._fingerprints:
+            self._fingerprints[path] = self.fs.fingerprint(path)
+        key = f"{path}:{self._fingerprints[path]}"
+        digest = hashlib.sha1(key.encode()).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}_{self.block_size}_{index}")
+
+    def _entries(self) -> List[tuple]:
+        """(access time, size, path) of every cached block."""
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if not BLOCK_FILE_PATTERN.fullmatch(entry.name):
+                continue  # Partial writes and files that are not ours
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue  # Evicted by another process
+            entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        return entries
+
+    def _evict(self, limit: int, keep: str) -> None:
+        """Delete least recently used blocks until the cache fits `limit`."""
+        entries = sorted(self._entries())
+        self._cached_bytes = sum(size for _, size, _ in entries)
+        for _, size, block_path in entries:
+            if self._cached_bytes <= limit:
+                break
+            if block_path == keep:
+                continue
+            try:
+                os.remove(block_path)
+            except FileNotFoundError:
+                pass
+            self._cached_bytes -= size
+
+    def _get_block(self, path: str, index: int) -> bytes:
+        block_path = self._block_path(path, index)
+        try:
+            with open(block_path, "rb") as f:
+                data = f.read()
+            os.utime(block_path)  # Mark as recently used
+            return data
+        except FileNotFoundError:
+            pass
+
+        start = index * self.block_size
+        length = min(self.block_size, self.size(path) - start)
+        data = self.fs.read_range(path, start, length)
+        with self._lock:
+            self.remote_reads += 1
+
+        # Write atomically so concurrent readers never see partial blocks
+        tmp_path = f"{block_path}.{os.getpid()}.{id(data)}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, block_path)
+
+        with self._lock:
+            self._cached_bytes += len(data)
+            if self.max_bytes is not None and self._cached_bytes > self.max_bytes:
+                self._evict(self.max_bytes, keep=block_path)
+        return data
+
+    def read(self, path: str, start: int, length: int) -> bytes:
+        """Read a byte range, fetching only the blocks not already cached."""
+        end = min(start + length, self.size(path))
+        if end <= start:
+            return b""
+        first, last = start // self.block_size, (end - 1) // self.block_size
+        chunks = [self._get_block(path, i) for i in range(first, last + 1)]
+        data = b"".join(chunks)
+        offset = start - first * self.block_size
+        return data[offset : offset + (end - start)]
+
+
+class RemoteFile(io.RawIOBase):
+    """Seekable, read-only file object over a `BlockCache`."""
+
+    def __init__(self, cache: BlockCache, path: str):
+        self.cache = cache
+        self.path = path
+        self._pos = 0
+        self._size = cache.size(path)
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            self._pos = offset
+        elif whence == io.SEEK_CUR:
+            self._pos += offset
+        elif whence == io.SEEK_END:
+            self._pos = self._size + offset
+        return self._pos
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = self._size - self._pos
+        data = self.cache.read(self.path, self._pos, size)
+        self._pos += len(data)
+        return data
+
+    def readinto(self, buffer: Any) -> int:
+        data = self.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+
+def read_remote_parquet(
+    path: str,
+    cache: BlockCache,
+    columns: Optional[List[str]] = None,
+    max_workers: Optional[int] = None,
+    n_rows: Optional[int] = None,
+) -> pl.DataFrame:
+    """
+    Read a remote Parquet file with parallel ranged reads, one per row group.
+
+    Only the footer and the row groups needed to cover `n_rows` (all if None)
+    are fetched; each row group is read on its own file handle in a thread pool.
+
+    Args:
+        path (str): Remote Parquet URL.
+        cache (BlockCache): Read-through cache for the object.
+        columns (List[str] or None): Optional column projection.
+        max_workers (int or None): Thread pool size.
+        n_rows (int or None): Stop after the row groups covering this many rows.
+
+    Returns:
+        pl.DataFrame: The loaded data.
+    """
+    metadata = pq.ParquetFile(RemoteFile(cache, path)).metadata
+
+    row_groups: List[int] = []
+    covered = 0
+    for i in range(metadata.num_row_groups):
+        if n_rows is not None and covered >= n_rows:
+            break
+        row_groups.append(i)
+        covered += metadata.row_group(i).num_rows
+
+    def _read(index: int) -> pa.Table:
+        parquet_file = pq.ParquetFile(RemoteFile(cache, path), metadata=metadata)
+        return parquet_file.read_row_group(index, columns=columns)
+
+    if row_groups:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            table = pa.concat_tables(list(executor.map(_read, row_groups)))
+    else:
+        table = metadata.schema.to_arrow_schema().empty_table()
+
+    df = pl.from_arrow(table)
+    assert isinstance(df, pl.DataFrame)
+    return df.head(n_rows) if n_rows is not None else df
+
+
+def read_remote_table(
+    path: str,
+    cache: BlockCache,
+    max_workers: Optional[int] = None,
+    n_rows: Optional[int] = None,
+) -> pl.DataFrame:
+    """
+    Read a remote dataset file through the block cache.
+
+    Parquet files use per-row-group ranged reads; other formats (CSV, NDJSON)
+    are streamed block by block into memory.
+    """
+    if is_parquet_path(path):
+        return read_remote_parquet(path, cache, max_workers=max_workers, n_rows=n_rows)
+
+    buffer = io.BytesIO(RemoteFile(cache, path).read())
+    if path.lower().endswith((".ndjson", ".jsonl")):
+        return pl.read_ndjson(buffer)
+    return pl.read_csv(buffer, n_rows=n_rows, infer_schema_length=10_000)
@@ -0,0 +1,217 @@
+# dsbf/utils/incremental.py
+"""
+Append detection for incremental profiling.
+
+A source fingerprint records, per data file, enough to tell whether a later
+version of the file only has rows appended:
+
+- CSV/NDJSON: byte size, row count, and a SHA-256 of the file's bytes. A file
+  that grew, whose first `bytes` bytes still hash the same and end on a record
+  boundary is treated as appended to, so an edit anywhere in the old content
+  (even one that keeps the length) is detected. The check is one sequential
+  read that hashes the old prefix on the way and counts only the new rows.
+- Parquet: byte size, modification time, and the row count and a digest of
+  the column chunk sizes and statistics of every row group. A file whose
+  leading row groups are unchanged is treated as appended to; a file with
+  the same row groups but a new size or modification time is rewritten.
+
+Directories and globs are fingerprinted file by file, so new files (e.g. a new
+daily partition) are picked up as appended data.
+"""
+
+import hashlib
+import json
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+import pyarrow.parquet as pq
+
+from dsbf.utils.parquet_utils import is_parquet_path
+from dsbf.utils.partition_utils import (
+    RowPartition,
+    TextScan,
+    discover_partitions,
+    is_partitioned_path,
+    scan_text_file,
+    text_partitions,
+)
+
+
+def _row_group_digest(row_group: Any) -> str:
+    """Digest of a Parquet row group's column chunk sizes and statistics."""
+    parts: List[Any] = [row_group.num_rows, row_group.total_byte_size]
+    for i in range(row_group.num_columns):
+        column = row_group.column(i)
+        stats = column.statistics
+        parts.append(
+            [
+                column.path_in_schema,
+                column.total_compressed_size,
+                column.total_uncompressed_size,
+                stats.to_dict() if stats is not None else None,
+            ]
+        )
+    return hashlib.sha256(json.dumps(parts, default=str).encode()).hexdigest()
+
+
+def _source_files(path: str) -> List[Tuple[str, Dict[str, str]]]:
+    if is_partitioned_path(path):
+        return [
+            (file_path, partition.values)
+            for partition in discover_partitions(path)
+            for file_path in partition.files
+        ]
+    return [(path, {})]
+
+
+def fingerprint_file(path: str) -> Dict[str, Any]:
+    """Fingerprint one data file (see module docstring)."""
+    stat = os.stat(path)
+    if is_parquet_path(path):
+        metadata = pq.ParquetFile(path).metadata
+        groups = [metadata.row_group(i) for i in range(metadata.num_row_groups)]
+        return {
+            "kind": "parquet",
+            "bytes": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "row_groups": [group.num_rows for group in groups],
+            "row_group_digests": [_row_group_digest(group) for group in groups],
+        }
+
+    return _text_fingerprint(scan_text_file(path), rows=0)
+
+
+def _text_fingerprint(scan: TextScan, rows: int) -> Dict[str, Any]:
+    """Fingerprint of a scanned text file with `rows` rows before the scan."""
+    return {
+        "kind": "text",
+        "bytes": scan.boundaries[-1],
+        "rows": rows + scan.rows,
+        "sha256": scan.sha256,
+    }
+
+
+def fingerprint_source(path: str) -> Dict[str, Any]:
+    """Fingerprint every data file behind a dataset path."""
+    return {
+        "files": {
+            file_path: fingerprint_file(file_path)
+            for file_path, _ in _source_files(path)
+        }
+    }
+
+
+def _row_group_chunks(
+    path: str, sizes: List[int], start: int, partition_rows: int, values: Dict[str, str]
+) -> List[RowPartition]:
+    parts: List[RowPartition] = []
+    groups: List[int] = []
+    rows = 0
+    for i in range(start, len(sizes)):
+        groups.append(i)
+        rows += sizes[i]
+        if rows >= partition_rows:
+            parts.append(RowPartition(path, row_groups=groups, values=values))
+            groups, rows = [], 0
+    if groups:
+        parts.append(RowPartition(path, row_groups=groups, values=values))
+    return parts
+
+
+def _appended_row_groups(
+    previous: Dict[str, Any], current: Dict[str, Any]
+) -> Optional[int]:
+    """
+    Index of the first new row group if Parquet fingerprint `current` is an
+    append-only extension of `previous`, else None.
+    """
+    old = previous.get("row_group_digests")
+    new = current["row_group_digests"]
+    if old is None or new[: len(old)] != old:
+        return None
+    touched = (previous.get("bytes"), previous.get("mtime_ns")) != (
+        current["bytes"],
+        current["mtime_ns"],
+    )
+    if len(new) == len(old) and touched:
+        return None  # Rewritten in place with matching statistics
+    return len(old)
+
+
+def _appended_text(
+    path: str,
+    previous: Optional[Dict[str, Any]],
+    partition_rows: int,
+    values: Dict[str, str],
+) -> Optional[Tuple[List[RowPartition], Dict[str, Any]]]:
+    """
+    Partitions of the rows appended to a CSV/NDJSON file since `previous` (a
+    new file if None) and its current fingerprint, or None if the file was
+    changed some other way.
+
+    Reads the file once: the digest is snapshotted at the old size to check
+    the prefix, and only records past it are counted and split.
+    """
+    old_bytes, old_rows = 0, 0
+    if previous is not None:
+        if previous.get("kind") != "text" or previous.get("sha256") is None:
+            return None
+        old_bytes, old_rows = previous["bytes"], int(previous["rows"])
+        if os.path.getsize(path) < old_bytes:
+            return None
+
+    scan = scan_text_file(
+        path, start=old_bytes, partition_rows=partition_rows, prefix_bytes=old_bytes
+    )
+    if previous is not None and (
+        scan.prefix_sha256 != previous["sha256"] or not scan.prefix_on_record
+    ):
+        return None
+    pieces = text_partitions(path, scan, values) if scan.rows else []
+    return pieces, _text_fingerprint(scan, rows=old_rows)
+
+
+def plan_appended_partitions(
+    path: str, previous: Dict[str, Any], partition_rows: int
+) -> Tuple[Optional[List[RowPartition]], Dict[str, Any], str]:
+    """
+    Plan row partitions covering only rows added since `previous` was taken.
+
+    Returns:
+        Tuple of (partitions, or None if the source changed in a way other
+        than appending; the current fingerprint, complete only for an
+        append; a short reason).
+    """
+    old_files = previous.get("files", {})
+    files = _source_files(path)
+    current: Dict[str, Any] = {"files": {}}
+
+    removed = sorted(set(old_files) - {file_path for file_path, _ in files})
+    if removed:
+        return None, current, f"file removed: {removed[0]}"
+
+    pieces: List[RowPartition] = []
+    for file_path, values in files:
+        old = old_files.get(file_path)
+        if not is_parquet_path(file_path):
+            appended = _appended_text(file_path, old, partition_rows, values)
+            if appended is None:
+                return None, current, f"file rewritten: {file_path}"
+            pieces += appended[0]
+            current["files"][file_path] = appended[1]
+            continue
+
+        fp = current["files"][file_path] = fingerprint_file(file_path)
+        start = 0
+        if old is not None:
+            appended = (
+                _appended_row_groups(old, fp) if old.get("kind") == "parquet" else None
+            )
+            if appended is None:
+                return None, current, f"file rewritten: {file_path}"
+            start = appended
+        pieces += _row_group_chunks(
+            file_path, fp["row_groups"], start, partition_rows, values
+        )
+
+    return pieces, current, "append-only"
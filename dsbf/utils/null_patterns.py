@@ -0,0 +1,83 @@
+# dsbf/utils/null_patterns.py
+"""
+Row-wise null patterns via bit-packed missing masks.
+
+A row's null pattern is the string of per-column missing flags in column order
+(e.g. '101' = missing in the first and third column). Instead of building that
+string for every row, each row's flags are packed into UInt64 words (one word
+per 64 columns) and the words are counted with a group-by; only the patterns
+that are reported get decoded back into strings.
+"""
+
+from typing import List, Optional, Sequence, Tuple
+
+import polars as pl
+
+from dsbf.utils.backend import missing_expr, to_polars
+
+WORD_BITS = 64
+
+
+def pack_null_patterns(df) -> pl.DataFrame:
+    """
+    Pack each row's missing flags into UInt64 words.
+
+    Returns:
+        pl.DataFrame: One UInt64 column per 64 input columns (`w0`, `w1`, ...),
+        where bit j of word k is set if column 64*k + j is missing.
+    """
+    df = to_polars(df)
+    schema = list(df.schema.items())
+    words = []
+    for k, start in enumerate(range(0, len(schema), WORD_BITS)):
+        bits = [
+            missing_expr(col, dtype).cast(pl.UInt64) * pl.lit(1 << j, dtype=pl.UInt64)
+            for j, (col, dtype) in enumerate(schema[start : start + WORD_BITS])
+        ]
+        words.append(pl.sum_horizontal(bits).cast(pl.UInt64).alias(f"w{k}"))
+    return df.select(words) if words else pl.DataFrame()
+
+
+def count_null_patterns(df) -> pl.DataFrame:
+    """
+    Count distinct row null patterns.
+
+    Returns:
+        pl.DataFrame: The packed words plus a `count` column, one row per
+        distinct pattern, most frequent first (ties in word order). Empty for a
+        frame without columns.
+    """
+    packed = pack_null_patterns(df)
+    if not packed.width:
+        return pl.DataFrame({"count": []}, schema={"count": pl.UInt32})
+    words = packed.columns
+    return (
+        packed.group_by(words)
+        .agg(pl.len().alias("count"))
+        .sort(["count", *words], descending=[True] + [False] * len(words))
+    )
+
+
+def decode_null_pattern(words: Sequence[int], width: int) -> str:
+    """Turn packed words back into a '0'/'1' pattern string over `width` columns."""
+    return "".join(
+        "1" if (words[j // WORD_BITS] >> (j % WORD_BITS)) & 1 else "0"
+        for j in range(width)
+    )
+
+
+def top_null_patterns(
+    counts: pl.DataFrame, width: int, limit: Optional[int] = None
+) -> List[Tuple[str, int]]:
+    """
+    Decode the `limit` most frequent patterns from `count_null_patterns`.
+
+    Returns:
+        List[Tuple[str, int]]: (pattern string, count) pairs, most frequent first.
+    """
+    top = counts if limit is None else counts.head(limit)
+    words = [col for col in top.columns if col != "count"]
+    return [
+        (decode_null_pattern(row[:-1], width), int(row[-1]))
+        for row in top.select([*words, "count"]).iter_rows()
+    ]
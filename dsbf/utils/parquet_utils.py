@@ -0,0 +1,177 @@
+# dsbf/utils/parquet_utils.py
+"""
+Parquet footer utilities.
+
+Parquet files carry per-row-group row counts, null counts, and min/max values in
+their footer. This module collects those statistics into a `source_stats` block
+that tasks can consult instead of scanning the data, but only for statistics that
+are exact for the whole file.
+"""
+
+from typing import Any, Dict, List, Optional
+
+import pyarrow.parquet as pq
+
+PARQUET_SUFFIXES = (".parquet", ".pq", ".parq")
+
+# Physical/logical types whose footer min/max match the in-memory values exactly
+_NUMERIC_PHYSICAL_TYPES = {"INT32", "INT64", "FLOAT", "DOUBLE"}
+_NUMERIC_LOGICAL_TYPES = {"NONE", "INT"}
+_FLOAT_PHYSICAL_TYPES = {"FLOAT", "DOUBLE"}
+
+
+def is_parquet_path(path: Optional[str]) -> bool:
+    """Return True if the path looks like a Parquet file."""
+    return bool(path) and str(path).lower().endswith(PARQUET_SUFFIXES)
+
+
+def read_parquet_footer_stats(path: Any) -> Dict[str, Any]:
+    """
+    Build exact dataset statistics from a Parquet footer without reading pages.
+
+    A column statistic is only included when every row group reports it:
+    - `null_count` is skipped for floating-point columns, since NaN values are
+      not counted as nulls in the footer but are treated as missing by pandas.
+    - `min` / `max` are only kept for plain integer and floating-point columns.
+    - `non_null_count` is derived when `null_count` is exact.
+
+    Args:
+        path (str or file-like): Path to a local Parquet file, or a seekable
+            file object (e.g. a remote file backed by ranged reads).
+
+    Returns:
+        Dict[str, Any]: {
+            "source": "parquet_footer",
+            "num_rows": int,
+            "num_columns": int,
+            "num_row_groups": int,
+            "columns": {column: {"null_count": ..., "min": ..., "max": ...}},
+        }
+    """
+    metadata = pq.ParquetFile(path).metadata
+    schema = metadata.schema
+
+    columns: Dict[str, Dict[str, Any]] = {}
+    top_level_names = schema.to_arrow_schema().names
+
+    for col_idx in range(metadata.num_columns):
+        col_schema = schema.column(col_idx)
+        name = col_schema.path
+
+        # Nested leaves (e.g. 'struct.field') do not map onto a dataframe column
+        if name not in top_level_names:
+            continue
+
+        physical_type = col_schema.physical_type
+        logical_type = str(col_schema.logical_type.type).upper()
+        is_numeric = (
+            physical_type in _NUMERIC_PHYSICAL_TYPES
+            and logical_type in _NUMERIC_LOGICAL_TYPES
+        )
+
+        null_count: Optional[int] = 0
+        col_min: Any = None
+        col_max: Any = None
+        has_min_max = is_numeric
+
+        for rg_idx in range(metadata.num_row_groups):
+            row_group = metadata.row_group(rg_idx)
+            if row_group.num_rows == 0:
+                continue
+
+            stats = row_group.column(col_idx).statistics
+            if stats is None:
+                null_count = None
+                has_min_max = False
+                break
+
+            if null_count is not None:
+                if stats.has_null_count:
+                    null_count += stats.null_count
+                else:
+                    null_count = None
+
+            # A row group of only nulls has no min/max but does not invalidate them
+            if has_min_max and stats.has_min_max:
+                col_min = stats.min if col_min is None else min(col_min, stats.min)
+                col_max = stats.max if col_max is None else max(col_max, stats.max)
+            elif has_min_max and stats.null_count != row_group.num_rows:
+                has_min_max = False
+
+        col_stats: Dict[str, Any] = {}
+        if null_count is not None and physical_type not in _FLOAT_PHYSICAL_TYPES:
+            col_stats["null_count"] = int(null_count)
+            col_stats["non_null_count"] = int(metadata.num_rows - null_count)
+        if has_min_max and col_min is not None:
+            col_stats["min"] = col_min
+            col_stats["max"] = col_max
+
+        columns[name] = col_stats
+
+    return {
+        "source": "parquet_footer",
+        "num_rows": int(metadata.num_rows),
+        "num_columns": len(top_level_names),
+        "num_row_groups": int(metadata.num_row_groups),
+        "columns": columns,
+    }
+
+
+def merge_footer_stats(stats_list: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Combine footer statistics from several Parquet files read as one dataset.
+
+    Files that lack a column contribute all-null rows for it (matching a diagonal
+    concat), so null counts stay exact. A statistic is dropped as soon as any file
+    that has the column cannot provide it.
+
+    Args:
+        stats_list (List[Dict[str, Any]]): Outputs of `read_parquet_footer_stats`.
+
+    Returns:
+        Dict[str, Any]: Combined statistics in the same format.
+    """
+    num_rows = sum(s["num_rows"] for s in stats_list)
+    all_columns: List[str] = []
+    for stats in stats_list:
+        all_columns.extend(c for c in stats["columns"] if c not in all_columns)
+
+    columns: Dict[str, Dict[str, Any]] = {}
+    for col in all_columns:
+        merged: Dict[str, Any] = {}
+        null_count: Optional[int] = 0
+        mins, maxs = [], []
+        has_min_max = True
+
+        for stats in stats_list:
+            col_stats = stats["columns"].get(col)
+            if col_stats is None:
+                if null_count is not None:
+                    null_count += stats["num_rows"]
+                continue
+
+            if null_count is not None:
+                count = col_stats.get("null_count")
+                null_count = None if count is None else null_count + count
+
+            if "min" in col_stats:
+                mins.append(col_stats["min"])
+                maxs.append(col_stats["max"])
+            elif col_stats.get("null_count") != stats["num_rows"]:
+                has_min_max = False
+
+        if null_count is not None:
+            merged["null_count"] = null_count
+            merged["non_null_count"] = num_rows - null_count
+        if has_min_max and mins:
+            merged["min"] = min(mins)
+            merged["max"] = max(maxs)
+        columns[col] = merged
+
+    return {
+        "source": "parquet_footer",
+        "num_rows": num_rows,
+        "num_columns": len(all_columns),
+        "num_row_groups": sum(s["num_row_groups"] for s in stats_list),
+        "columns": columns,
+    }
@@ -0,0 +1,558 @@
+# dsbf/utils/partition_utils.py
+"""
+Hive-style partitioned dataset utilities.
+
+Supports dataset paths that point at a directory (e.g. `events/date=2025-07-01/`)
+or a glob, discovers `key=value` partitions, prunes them with config filters,
+and loads the selected partitions in parallel. Datasets can also be split into
+row partitions (files, Parquet row-group ranges, or record-aligned byte ranges
+of CSV/NDJSON files) for map-reduce profiling.
+"""
+
+import glob
+import hashlib
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import polars as pl
+import pyarrow.parquet as pq
+
+from dsbf.utils.parquet_utils import is_parquet_path
+
+DATA_FILE_SUFFIXES = (".parquet", ".pq", ".parq", ".csv", ".ndjson", ".jsonl")
+_GLOB_CHARS = ("*", "?", "[")
+TEXT_BLOCK_BYTES = 1 << 20
+
+
+@dataclass
+class Partition:
+    """A single Hive partition and the data files that belong to it."""
+
+    values: Dict[str, str]  # e.g. {"date": "2025-07-01", "region": "us"}
+    files: List[str] = field(default_factory=list)
+
+    @property
+    def label(self) -> str:
+        """Stable partition label such as 'date=2025-07-01/region=us'."""
+        if not self.values:
+            return "__root__"
+        return "/".join(f"{k}={v}" for k, v in self.values.items())
+
+
+def is_partitioned_path(path: Optional[str]) -> bool:
+    """Return True if the dataset path is a directory or a glob pattern."""
+    if not path:
+        return False
+    return os.path.isdir(path) or any(ch in str(path) for ch in _GLOB_CHARS)
+
+
+def _parse_partition_values(file_path: str, root: str) -> Dict[str, str]:
+    rel_dir = os.path.relpath(os.path.dirname(file_path), root)
+    values: Dict[str, str] = {}
+    for part in rel_dir.split(os.sep):
+        if "=" in part:
+            key, value = part.split("=", 1)
+            values[key] = value
+    return values
+
+
+def _glob_root(pattern: str) -> str:
+    """Longest leading directory of a glob pattern without wildcards."""
+    parts = []
+    for part in pattern.split(os.sep):
+        if any(ch in part for ch in _GLOB_CHARS):
+            break
+        parts.append(part)
+    root = os.sep.join(parts)
+    return root if os.path.isdir(root) else os.path.dirname(root) or "."
+
+
+def discover_partitions(path: str) -> List[Partition]:
+    """
+    Find all data files under a directory or glob and group them by partition.
+
+    Args:
+        path (str): Directory (searched recursively) or glob pattern.
+
+    Returns:
+        List[Partition]: Partitions sorted by label.
+    """
+    if os.path.isdir(path):
+        root = path
+        candidates = glob.glob(os.path.join(path, "**", "*"), recursive=True)
+    else:
+        root = _glob_root(path)
+        candidates = []
+        for match in glob.glob(path, recursive=True):
+            if os.path.isdir(match):
+                candidates.extend(
+                    glob.glob(os.path.join(match, "**", "*"), recursive=True)
+                )
+            else:
+                candidates.append(match)
+
+    partitions: Dict[Tuple[Tuple[str, str], ...], Partition] = {}
+    for file_path in sorted(set(candidates)):
+        name = os.path.basename(file_path)
+        if not os.path.isfile(file_path) or name.startswith(("_", ".")):
+            continue
+        if not name.lower().endswith(DATA_FILE_SUFFIXES):
+            continue
+
+        values = _parse_partition_values(file_path, root)
+        key = tuple(values.items())
+        partitions.setdefault(key, Partition(values=values)).files.append(file_path)
+
+    return sorted(partitions.values(), key=lambda p: p.label)
+
+
+def _parse_date(value: Any) -> Optional[date]:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    try:
+        return datetime.strptime(str(value)[:10], "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+
+def _parse_number(value: Any) -> Optional[float]:
+    if isinstance(value, bool):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _ordered(value: str, bound: Any) -> Tuple[Any, Any]:
+    """
+    A partition value and a filter bound in comparable form: numbers if both
+    parse as numbers, dates if both parse as dates, else strings.
+    """
+    number, bound_number = _parse_number(value), _parse_number(bound)
+    if number is not None and bound_number is not None:
+        return number, bound_number
+    day, bound_day = _parse_date(value), _parse_date(bound)
+    if day is not None and bound_day is not None:
+        return day, bound_day
+    return value, str(bound)
+
+
+def _matches(value: str, rule: Any, today: date) -> bool:
+    if isinstance(rule, list):
+        return value in [str(v) for v in rule]
+    if not isinstance(rule, dict):
+        return value == str(rule)
+
+    if "last_n_days" in rule:
+        as_of = _parse_date(rule.get("as_of")) or today
+        value_date = _parse_date(value)
+        if value_date is None:
+            return False
+        start = as_of - timedelta(days=int(rule["last_n_days"]) - 1)
+        if not start <= value_date <= as_of:
+            return False
+
+    if "min" in rule:
+        key, bound = _ordered(value, rule["min"])
+        if key < bound:
+            return False
+    if "max" in rule:
+        key, bound = _ordered(value, rule["max"])
+        if key > bound:
+            return False
+    return True
+
+
+def filter_partitions(
+    partitions: List[Partition],
+    filters: Optional[Dict[str, Any]],
+    today: Optional[date] = None,
+) -> List[Partition]:
+    """
+    Prune partitions using per-key filter rules from config.
+
+    Each key in `filters` is a partition column mapped to one of:
+    - a scalar (equality), e.g. `region: us`
+    - a list of allowed values, e.g. `region: [us, eu]`
+    - a dict with `min` / `max` (inclusive) and/or `last_n_days`
+      (with optional `as_of`, default today) for `YYYY-MM-DD` values;
+      bounds compare numerically when the value and bound are both numbers
+      (so `hour=9` is below `min: 10`), as dates when both are dates, and
+      as strings otherwise
+
+    Partitions that do not define a filtered key are excluded.
+
+    Args:
+        partitions (List[Partition]): Discovered partitions.
+        filters (dict or None): Partition filter config.
+        today (date or None): Reference date for `last_n_days` (for testing).
+
+    Returns:
+        List[Partition]: Partitions matching every filter.
+    """
+    if not filters:
+        return partitions
+
+    today = today or date.today()
+    return [
+        p
+        for p in partitions
+        if all(
+            key in p.values and _matches(p.values[key], rule, today)
+            for key, rule in filters.items()
+        )
+    ]
+
+
+def _read_file(path: str) -> pl.DataFrame:
+    lower = path.lower()
+    if is_parquet_path(lower):
+        return pl.read_parquet(path)
+    if lower.endswith((".ndjson", ".jsonl")):
+        return pl.read_ndjson(path)
+    return pl.read_csv(path, infer_schema_length=10_000)
+
+
+def summarize_partition(df: pl.DataFrame) -> Dict[str, Any]:
+    """
+    Compute a lightweight summary of a single partition.
+
+    Returns:
+        Dict[str, Any]: Row count, null counts, and numeric min/max/mean.
+    """
+    numeric_cols = [c for c, dtype in df.schema.items() if dtype.is_numeric()]
+    numeric: Dict[str, Dict[str, Any]] = {}
+    if numeric_cols and df.height:
+        stats = df.select(
+            [pl.col(c).min().alias(f"{c}__min") for c in numeric_cols]
+            + [pl.col(c).max().alias(f"{c}__max") for c in numeric_cols]
+            + [pl.col(c).mean().alias(f"{c}__mean") for c in numeric_cols]
+        ).row(0, named=True)
+        numeric = {
+            c: {
+                "min": stats[f"{c}__min"],
+                "max": stats[f"{c}__max"],
+                "mean": stats[f"{c}__mean"],
+            }
+            for c in numeric_cols
+        }
+
+    return {
+        "rows": df.height,
+        "null_counts": df.null_count().row(0, named=True) if df.width else {},
+        "numeric": numeric,
+    }
+
+
+def _load_partition(
+    partition: Partition, summarize: bool
+) -> Tuple[pl.DataFrame, Optional[Dict[str, Any]]]:
+    frames = [_read_file(path) for path in partition.files]
+    df = pl.concat(frames, how="diagonal_relaxed") if len(frames) > 1 else frames[0]
+
+    # Hive convention: partition values become (string) columns
+    df = df.with_columns(
+        [
+            pl.lit(value, dtype=pl.Utf8).alias(key)
+            for key, value in partition.values.items()
+            if key not in df.columns
+        ]
+    )
+    return df, summarize_partition(df) if summarize else None
+
+
+def load_partitions(
+    partitions: List[Partition],
+    max_workers: Optional[int] = None,
+    summarize: bool = False,
+) -> Tuple[pl.DataFrame, Dict[str, Dict[str, Any]]]:
+    """
+    Load and concatenate the selected partitions in parallel.
+
+    Args:
+        partitions (List[Partition]): Partitions to load.
+        max_workers (int or None): Thread pool size (default: executor default).
+        summarize (bool): Whether to compute per-partition summaries.
+
+    Returns:
+        Tuple[pl.DataFrame, Dict[str, Dict[str, Any]]]:
+            - Combined Polars DataFrame
+            - Per-partition summaries keyed by partition label (empty if disabled)
+    """
+    if not partitions:
+        raise ValueError("No partitions selected — check dataset_path and filters.")
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        loaded = list(executor.map(lambda p: _load_partition(p, summarize), partitions))
+
+    combined = pl.concat([df for df, _ in loaded], how="diagonal_relaxed")
+    summaries = {
+        partition.label: summary
+        for partition, (_, summary) in zip(partitions, loaded)
+        if summary is not None
+    }
+    return combined, summaries
+
+
+@dataclass
+class RowPartition:
+    """
+    A slice of one data file profiled independently: a range of Parquet row
+    groups, or a record-aligned byte range of a CSV/NDJSON file (read together
+    with the file's first `header_end` bytes, its CSV header).
+    """
+
+    path: str
+    row_groups: Optional[List[int]] = None
+    values: Dict[str, str] = field(default_factory=dict)
+    byte_range: Optional[List[int]] = None
+    header_end: int = 0
+
+    @property
+    def label(self) -> str:
+        if self.row_groups is not None:
+            span = f"row_groups={self.row_groups[0]}-{self.row_groups[-1]}"
+        elif self.byte_range is not None:
+            span = f"bytes={self.byte_range[0]}-{self.byte_range[1] - 1}"
+        else:
+            span = "all"
+        return f"{os.path.basename(self.path)}[{span}]"
+
+
+def is_ndjson_path(path: str) -> bool:
+    return path.lower().endswith((".ndjson", ".jsonl"))
+
+
+@dataclass
+class TextScan:
+    """
+    One streaming pass over a CSV/NDJSON file (see `scan_text_file`).
+
+    Attributes:
+        sha256: Digest of the whole file.
+        prefix_sha256: Digest of the first `prefix_bytes` bytes, if requested.
+        prefix_on_record: Whether those bytes end exactly at a record boundary.
+        header_end: Byte offset just past the CSV header (0 for NDJSON).
+        rows: Data records starting at or after the scan's `start` offset.
+        boundaries: Record-aligned byte offsets from the first data byte at or
+            after `start` to the end of the file, one cut per `partition_rows`
+            records.
+    """
+
+    sha256: str
+    prefix_sha256: Optional[str]
+    prefix_on_record: bool
+    header_end: int
+    rows: int
+    boundaries: List[int]
+
+
+def scan_text_file(
+    path: str,
+    start: int = 0,
+    partition_rows: Optional[int] = None,
+    prefix_bytes: Optional[int] = None,
+) -> TextScan:
+    """
+    Hash, count, and split a CSV/NDJSON file in a single sequential read.
+
+    A newline ends a CSV record only outside quotes, i.e. after an even number
+    of quote characters (RFC 4180 escapes quotes by doubling them, which keeps
+    the parity), so quoted fields with embedded newlines stay in one record.
+    NDJSON records end at every newline.
+
+    Args:
+        path (str): File to scan.
+        start (int): Byte offset from which records are counted and split
+            (e.g. the old size of an appended file).
+        partition_rows (int or None): Records per partition; None for a single
+            partition.
+        prefix_bytes (int or None): Also hash the first `prefix_bytes` bytes,
+            by snapshotting the running digest.
+    """
+    quoted = not is_ndjson_path(path)
+    digest = hashlib.sha256()
+    prefix_sha256: Optional[str] = None
+    prefix_on_record = False
+    header_end: Optional[int] = None if quoted else 0
+    ends: List[int] = []
+    rows = 0
+    since_cut = 0
+    position = 0
+    parity = 0
+    last_end = 0
+
+    with open(path, "rb") as f:
+        while True:
+            block = f.read(TEXT_BLOCK_BYTES)
+            if not block:
+                break
+            if prefix_bytes is not None and position <= prefix_bytes:
+                cut = prefix_bytes - position
+                if cut <= len(block):
+                    digest.update(block[:cut])
+                    prefix_sha256 = digest.copy().hexdigest()
+                    digest.update(block[cut:])
+                else:
+                    digest.update(block)
+            else:
+                digest.update(block)
+
+            data = np.frombuffer(block, dtype=np.uint8)
+            newlines = np.flatnonzero(data == 0x0A)
+            if quoted and b'"' in block:
+                # Running quote count mod 256 keeps its parity
+                quotes = np.cumsum(data == 0x22, dtype=np.uint8)
+                newlines = newlines[(quotes[newlines] + parity) & 1 == 0]
+                parity = (int(quotes[-1]) + parity) & 1
+            record_ends = newlines + position + 1
+
+            if header_end is None and record_ends.size:
+                header_end = int(record_ends[0])
+            data_start = max(start, header_end or 0)
+            counted = record_ends[record_ends > data_start]
+            if prefix_bytes is not None and (
+                prefix_bytes in record_ends or prefix_bytes == 0
+            ):
+                prefix_on_record = True
+            if partition_rows and counted.size:
+                seen = np.arange(1, counted.size + 1) + since_cut
+                ends.extend(counted[seen % partition_rows == 0].tolist())
+                since_cut = int(seen[-1] % partition_rows)
+            rows += int(counted.size)
+            if record_ends.size:
+                last_end = int(record_ends[-1])
+            position += len(block)
+
+    if prefix_bytes is not None and prefix_sha256 is None:
+        prefix_sha256 = digest.hexdigest() if prefix_bytes == position else None
+        prefix_on_record = prefix_on_record or prefix_bytes == position
+    header_end = position if header_end is None else header_end
+    data_start = min(max(start, header_end), position)
+    if position > max(last_end, data_start):
+        rows += 1  # Final record without a trailing newline
+    boundaries = [data_start] + [end for end in ends if end < position] + [position]
+    return TextScan(
+        sha256=digest.hexdigest(),
+        prefix_sha256=prefix_sha256,
+        prefix_on_record=prefix_on_record,
+        header_end=header_end,
+        rows=rows,
+        boundaries=sorted(set(boundaries)),
+    )
+
+
+def text_partitions(
+    path: str, scan: TextScan, values: Dict[str, str]
+) -> List[RowPartition]:
+    """Row partitions covering the byte ranges between a scan's boundaries."""
+    bounds = scan.boundaries
+    parts = [
+        RowPartition(
+            path, values=values, byte_range=[lo, hi], header_end=scan.header_end
+        )
+        for lo, hi in zip(bounds, bounds[1:])
+    ]
+    return parts or [
+        RowPartition(
+            path,
+            values=values,
+            byte_range=[bounds[0], bounds[0]],
+            header_end=scan.header_end,
+        )
+    ]
+
+
+def _split_file(
+    path: str, partition_rows: int, values: Dict[str, str]
+) -> List[RowPartition]:
+    if is_parquet_path(path):
+        metadata = pq.ParquetFile(path).metadata
+        parts: List[RowPartition] = []
+        groups: List[int] = []
+        rows = 0
+        for i in range(metadata.num_row_groups):
+            groups.append(i)
+            rows += metadata.row_group(i).num_rows
+            if rows >= partition_rows:
+                parts.append(RowPartition(path, row_groups=groups, values=values))
+                groups, rows = [], 0
+        if groups or not parts:
+            parts.append(RowPartition(path, row_groups=groups, values=values))
+        return parts
+
+    return text_partitions(
+        path, scan_text_file(path, partition_rows=partition_rows), values
+    )
+
+
+def plan_row_partitions(path: str, partition_rows: int) -> List[RowPartition]:
+    """
+    Split a dataset path into row partitions of roughly `partition_rows` rows.
+
+    Directories and globs yield at least one partition per file (carrying the
+    file's Hive values); Parquet files are split on row-group boundaries and
+    text files into record-aligned byte ranges, found in one sequential pass,
+    so each worker reads only its own bytes.
+    """
+    if is_partitioned_path(path):
+        return [
+            part
+            for partition in discover_partitions(path)
+            for file_path in partition.files
+            for part in _split_file(file_path, partition_rows, partition.values)
+        ]
+    return _split_file(path, partition_rows, {})
+
+
+def _text_scan(path: str) -> pl.LazyFrame:
+    if is_ndjson_path(path):
+        return pl.scan_ndjson(path)
+    return pl.scan_csv(path, infer_schema_length=10_000)
+
+
+def _read_byte_range(partition: RowPartition) -> pl.DataFrame:
+    """
+    Parse one byte range of a text file with the schema inferred from the
+    file's head, so every partition gets the same column types.
+    """
+    schema = dict(_text_scan(partition.path).collect_schema())
+    lo, hi = partition.byte_range or [0, 0]
+    with open(partition.path, "rb") as f:
+        header = f.read(partition.header_end)
+        f.seek(lo)
+        body = f.read(hi - lo)
+    if not body.strip():
+        return pl.DataFrame(schema=schema)
+    if is_ndjson_path(partition.path):
+        return pl.read_ndjson(io.BytesIO(body), schema=schema)
+    return pl.read_csv(io.BytesIO(header + body), schema=schema)
+
+
+def read_row_partition(partition: RowPartition) -> pl.DataFrame:
+    """Load one row partition as a Polars DataFrame."""
+    path = partition.path
+    if partition.row_groups is not None:
+        table = pq.ParquetFile(path).read_row_groups(partition.row_groups)
+        df = pl.from_arrow(table)
+        assert isinstance(df, pl.DataFrame)
+    elif partition.byte_range is not None:
+        df = _read_byte_range(partition)
+    else:
+        df = _text_scan(path).collect()
+
+    return df.with_columns(
+        [
+            pl.lit(value, dtype=pl.Utf8).alias(key)
+            for key, value in partition.values.items()
+            if key not in df.columns
+        ]
+    )
@@ -16,9 +16,12 @@ import matplotlib.pyplot as plt
 import missingno as msno
 import pandas as pd
 import plotly.graph_objects as go
+import polars as pl
 import seaborn as sns
 from matplotlib.axes import Axes
 
+from dsbf.utils.backend import is_polars
+
 matplotlib.use("Agg")
 
 
@@ -31,6 +34,13 @@ class PlotData(TypedDict, total=False):
     annotations: List[str]
 
 
+# Row-level plots (histograms, boxplots, null matrices) draw from a seeded
+# sample of at most `max_rows` rows (this default if None, no cap if 0);
+# aggregates such as bar counts are exact
+DEFAULT_PLOT_MAX_ROWS = 50_000
+ROW_INDEX = "__dsbf_row__"
+
+
 # --- Global style config ---
 DEFAULT_PLOT_CONFIG = {
     "title_fontsize": 14,
@@ -62,12 +72,30 @@ class PlotFactory:
     def _is_empty(data: Union[pd.Series, pd.DataFrame]) -> bool:
         return data.empty if isinstance(data, pd.DataFrame) else data.size == 0
 
+    @staticmethod
+    def _limit_rows(data: Any, max_rows: Optional[int] = None) -> Any:
+        """Downsample to `max_rows` rows, keeping the original row order."""
+        limit = DEFAULT_PLOT_MAX_ROWS if max_rows is None else int(max_rows)
+        if not limit or len(data) <= limit:
+            return data
+        if is_polars(data):
+            frame = data.to_frame() if isinstance(data, pl.Series) else data
+            sampled = (
+                frame.with_row_index(ROW_INDEX)
+                .sample(n=limit, seed=42)
+                .sort(ROW_INDEX)
+                .drop(ROW_INDEX)
+            )
+            return sampled.to_series() if isinstance(data, pl.Series) else sampled
+        return data.sample(n=limit, random_state=42).sort_index()
+
     @staticmethod
     def plot_histogram_static(
         series: pd.Series,
         save_path: str,
         title: Optional[str] = None,
         annotations: Optional[list[str]] = None,
+        max_rows: Optional[int] = None,
     ) -> Dict[str, Any]:
         if PlotFactory._is_empty(series):
             return {
@@ -80,6 +108,7 @@ class PlotFactory:
                 },
             }
 
+        series = PlotFactory._limit_rows(series, max_rows)
         x_label_str = str(series.name) if series.name else "Value"
         title_str = title or "Histogram"
 
@@ -117,6 +146,7 @@ class PlotFactory:
         series: pd.Series,
         title: Optional[str] = None,
         annotations: Optional[list[str]] = None,
+        max_rows: Optional[int] = None,
     ) -> PlotData:
         if PlotFactory._is_empty(series):
             return {
@@ -126,6 +156,7 @@ class PlotFactory:
                 "annotations": ["Empty series"],
             }
 
+        series = PlotFactory._limit_rows(series, max_rows)
         x_label_str = str(series.name) if series.name else "Value"
         title_str = title or "Histogram"
 
@@ -150,12 +181,114 @@ class PlotFactory:
             "annotations": annotations or [],
         }
 
+    @staticmethod
+    def plot_binned_histogram_static(
+        histogram: Dict[str, list],
+        save_path: str,
+        title: Optional[str] = None,
+        x_label: Optional[str] = None,
+        annotations: Optional[list[str]] = None,
+    ) -> Dict[str, Any]:
+        """Histogram from pre-binned `{"edges": [...], "counts": [...]}`."""
+        edges, counts = histogram.get("edges", []), histogram.get("counts", [])
+        if not counts:
+            return {
+                "path": Path(save_path),
+                "plot_data": {
+                    "type": "histogram",
+                    "data": {},
+                    "config": {},
+                    "annotations": ["Empty series"],
+                },
+            }
+
+        x_label_str = x_label or "Value"
+        title_str = title or "Histogram"
+
+        fig, ax = plt.subplots(figsize=DEFAULT_PLOT_CONFIG["figsize"])
+        widths = [right - left for left, right in zip(edges[:-1], edges[1:])]
+        ax.bar(
+            edges[:-1],
+            counts,
+            width=widths,
+            align="edge",
+            color=DEFAULT_PLOT_CONFIG["color"],
+            edgecolor="white",
+        )
+        apply_static_style(ax, title_str, x_label_str, "Count")
+
+        os.makedirs(os.path.dirname(save_path), exist_ok=True)
+        fig.savefig(save_path)
+        plt.close(fig)
+
+        return {
+            "path": Path(save_path),
+            "plot_data": {
+                "type": "histogram",
+                "data": {"edges": edges, "counts": counts},
+                "config": {
+                    "title": title_str,
+                    "x_label": x_label_str,
+                    "y_label": "Count",
+                },
+                "annotations": annotations or [],
+            },
+        }
+
+    @staticmethod
+    def plot_binned_histogram_interactive(
+        histogram: Dict[str, list],
+        title: Optional[str] = None,
+        x_label: Optional[str] = None,
+        annotations: Optional[list[str]] = None,
+    ) -> PlotData:
+        """Interactive histogram from pre-binned edges and counts."""
+        edges, counts = histogram.get("edges", []), histogram.get("counts", [])
+        if not counts:
+            return {
+                "type": "histogram",
+                "data": {},
+                "config": {},
+                "annotations": ["Empty series"],
+            }
+
+        x_label_str = x_label or "Value"
+        title_str = title or "Histogram"
+
+        fig = go.Figure(
+            [
+                go.Bar(
+                    x=[
+                        (left + right) / 2 for left, right in zip(edges[:-1], edges[1:])
+                    ],
+                    y=counts,
+                    width=[right - left for left, right in zip(edges[:-1], edges[1:])],
+                    marker=dict(color=DEFAULT_PLOT_CONFIG["color"]),
+                )
+            ]
+        )
+        fig.update_layout(
+            title=title_str,
+            xaxis_title=x_label_str,
+            yaxis_title="Count",
+            bargap=0,
+            font=dict(family=DEFAULT_PLOT_CONFIG["font"]),
+        )
+
+        return {
+            "type": "histogram",
+            "data": {"edges": edges, "counts": counts},
+            "config": {"title": title_str, "x_label": x_label_str, "y_label": "Count"},
+            "annotations": annotations or [],
+        }
+
     @staticmethod
     def plot_boxplot_static(
         series: pd.Series,
         save_path: str,
         title: Optional[str] = None,
         annotations: Optional[list[str]] = None,
+        max_rows: Optional[int] = None,
     ) -> Dict[str, Any]:
         if PlotFactory._is_empty(series):
             return {
@@ -168,6 +301,7 @@ class PlotFactory:
                 },
             }
 
+        series = PlotFactory._limit_rows(series, max_rows)
         x_label_str = str(series.name) if series.name else "Value"
         title_str = title or "Boxplot"
 
@@ -199,6 +333,7 @@ class PlotFactory:
         series: pd.Series,
         title: Optional[str] = None,
         annotations: Optional[list[str]] = None,
+        max_rows: Optional[int] = None,
     ) -> PlotData:
         if PlotFactory._is_empty(series):
             return {
@@ -208,6 +343,7 @@ class PlotFactory:
                 "annotations": ["Empty series"],
             }
 
+        series = PlotFactory._limit_rows(series, max_rows)
         x_label_str = str(series.name) if series.name else "Value"
         title_str = title or "Boxplot"
 
@@ -313,6 +449,7 @@ class PlotFactory:
         save_path: str,
         title: Optional[str] = "Null Matrix",
         annotations: Optional[list[str]] = None,
+        max_rows: Optional[int] = None,
     ) -> Dict[str, Any]:
         if PlotFactory._is_empty(df):
             return {
@@ -325,6 +462,7 @@ class PlotFactory:
                 },
             }
 
+        df = PlotFactory._limit_rows(df, max_rows)
         title_str = title or "Null Matrix"
         fig, ax = plt.subplots(figsize=(10, 6))
         sns.heatmap(df.isnull(), cbar=False, cmap="viridis", ax=ax)
@@ -349,6 +487,7 @@ class PlotFactory:
         df: pd.DataFrame,
         title: Optional[str] = "Null Matrix",
         annotations: Optional[list[str]] = None,
+        max_rows: Optional[int] = None,
     ) -> PlotData:
         if PlotFactory._is_empty(df):
             return {
@@ -358,6 +497,7 @@ class PlotFactory:
                 "annotations": ["Empty dataframe"],
             }
 
+        df = PlotFactory._limit_rows(df, max_rows)
         title_str = title or "Null Matrix"
         z = df.isnull().astype(int).values
         fig = go.Figure([go.Heatmap(z=z, colorscale="Viridis")])
@@ -440,6 +580,7 @@ class PlotFactory:
         save_path: str,
         title: Optional[str] = "Missingness Matrix",
         annotations: Optional[list[str]] = None,
+        max_rows: Optional[int] = None,
     ) -> Dict[str, Any]:
         """
         Uses missingno to generate a missingness matrix plot. Returns static path only.
@@ -449,6 +590,7 @@ class PlotFactory:
             save_path (str): Path to save static image.
             title (Optional[str]): Optional title (not directly used by missingno).
             annotations (Optional[list[str]]):
+            max_rows (Optional[int]): Row cap for the plotted sample.
 
         Returns:
             dict: Dict with "path" key pointing to saved image.
@@ -461,6 +603,7 @@ class PlotFactory:
                 "annotations": ["Empty dataframe"],
             }
 
+        df = PlotFactory._limit_rows(df, max_rows)
         title_str = title or "Missingness Matrix"
         plt.figure()
         msno.matrix(df)
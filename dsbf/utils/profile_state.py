@@ -0,0 +1,92 @@
+# dsbf/utils/profile_state.py
+"""
+Saved profile state.
+
+A profile state file (`profile_state.json`, written next to `report.json`)
+holds the merged partial state of every mergeable task after a run. States
+from several runs (daily shards, regions, ...) can be merged into one report
+without re-reading raw data, and the merged state can itself be merged again.
+"""
+
+import json
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from dsbf.utils.sketches import decode_state, encode_state
+from dsbf.utils.versioning import get_dsbf_version
+
+PROFILE_STATE_FILE = "profile_state.json"
+PROFILE_STATE_FORMAT = "dsbf-profile-state"
+PROFILE_STATE_VERSION = 1
+
+
+def save_profile_state(
+    path: str,
+    states: Dict[str, Any],
+    rows: int,
+    sources: Optional[List[str]] = None,
+    extra: Optional[Dict[str, Any]] = None,
+) -> str:
+    """
+    Write task states to a versioned profile state file.
+
+    Args:
+        path (str): Output file path (or a directory to write
+            `profile_state.json` into).
+        states (dict): Partial state per task name.
+        rows (int): Number of rows the states summarize.
+        sources (list or None): Datasets the states were built from.
+        extra (dict or None): Additional top-level fields to record.
+
+    Returns:
+        str: The path written.
+    """
+    if os.path.isdir(path):
+        path = os.path.join(path, PROFILE_STATE_FILE)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    payload = {
+        "format": PROFILE_STATE_FORMAT,
+        "version": PROFILE_STATE_VERSION,
+        "dsbf_version": get_dsbf_version(),
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "rows": rows,
+        "sources": sources or [],
+        **(extra or {}),
+        "tasks": encode_state(states),
+    }
+    with open(path, "w") as f:
+        json.dump(payload, f, default=str)
+    return path
+
+
+def load_profile_state(path: str) -> Dict[str, Any]:
+    """
+    Read a profile state file (or a run directory containing one).
+
+    Returns:
+        Dict[str, Any]: The file's fields, with `tasks` decoded back into
+        partial states.
+
+    Raises:
+        ValueError: If the file is not a profile state or has an unsupported
+            version.
+    """
+    if os.path.isdir(path):
+        path = os.path.join(path, PROFILE_STATE_FILE)
+
+    with open(path, "r") as f:
+        payload = json.load(f)
+
+    if not isinstance(payload, dict) or payload.get("format") != PROFILE_STATE_FORMAT:
+        raise ValueError(f"{path} is not a DSBF profile state file.")
+    version = payload.get("version")
+    if not isinstance(version, int) or version > PROFILE_STATE_VERSION:
+        raise ValueError(
+            f"{path} has profile state version {version}; this DSBF supports "
+            f"up to {PROFILE_STATE_VERSION}."
+        )
+
+    payload["tasks"] = decode_state(payload.get("tasks") or {})
+    return payload
@@ -0,0 +1,295 @@
+# dsbf/utils/progressive.py
+"""
+Progressive sampling.
+
+Profiles nested random samples of growing size (e.g. 10k, 100k, 1M rows) and
+stops growing once cheap summary statistics stop moving between consecutive
+samples. Each statistic family tracks the sample size at which it converged,
+and tasks built on that family report it.
+"""
+
+from typing import Any, Callable, Dict, List, Optional
+
+import polars as pl
+
+from dsbf.utils.backend import is_polars, missing_expr, to_polars
+
+# Tasks whose results depend mostly on one family of statistics
+CONVERGENCE_TASKS: Dict[str, List[str]] = {
+    "means": ["summarize_numeric", "suggest_numerical_binning", "detect_skewness"],
+    "null_rates": ["summarize_nulls", "missingness_heatmap", "missingness_matrix"],
+    "top_k": [
+        "summarize_value_counts",
+        "summarize_modes",
+        "detect_single_dominant_value",
+    ],
+    "correlation_signs": [
+        "compute_correlations",
+        "detect_collinear_features",
+        "detect_data_leakage",
+    ],
+    "drift": [
+        "detect_feature_drift",
+        "detect_target_drift",
+        "compare_with_reference_dataset",
+    ],
+}
+
+PROGRESSIVE_DEFAULTS = {
+    "start_rows": 10_000,
+    "growth_factor": 10,
+    "tolerance": 0.01,
+    "top_k": 5,
+    "min_abs_correlation": 0.1,
+    "max_correlation_columns": 20,
+}
+
+
+def sample_sizes(total_rows: int, start_rows: int, growth_factor: float) -> List[int]:
+    """Geometric sequence of nested sample sizes, ending at the full row count."""
+    sizes: List[int] = []
+    size = max(1, int(start_rows))
+    while size < total_rows:
+        sizes.append(size)
+        size = max(size + 1, int(size * growth_factor))
+    sizes.append(total_rows)
+    return sizes
+
+
+def sample_signature(
+    df: pl.DataFrame,
+    top_k: int = 5,
+    max_correlation_columns: int = 20,
+    reference: Optional[pl.DataFrame] = None,
+) -> Dict[str, Dict[Any, Any]]:
+    """
+    Compute the cheap statistics used to decide convergence.
+
+    Returns:
+        Dict[str, Dict]: {
+            "means": {col: (mean, std)},
+            "null_rates": {col: rate},
+            "top_k": {col: frozenset of the k most frequent repeated values},
+            "correlation_signs": {(a, b): pearson r},
+            "drift": {col: standardized mean difference to the reference},
+        }
+    """
+    numeric = [col for col, dtype in df.schema.items() if dtype.is_numeric()]
+    categorical = [
+        col
+        for col, dtype in df.schema.items()
+        if dtype in (pl.Utf8, pl.Categorical, pl.Boolean)
+    ]
+
+    def _values(col: str) -> pl.Expr:
+        return pl.col(col).cast(pl.Float64).fill_nan(None)
+
+    exprs: List[pl.Expr] = [
+        missing_expr(col, dtype).mean().alias(f"null:{col}")
+        for col, dtype in df.schema.items()
+    ]
+    for col in numeric:
+        exprs += [
+            _values(col).mean().alias(f"mean:{col}"),
+            _values(col).std().alias(f"std:{col}"),
+        ]
+
+    corr_cols = numeric[:max_correlation_columns]
+    pairs = [(a, b) for i, a in enumerate(corr_cols) for b in corr_cols[i + 1 :]]
+    exprs += [
+        pl.corr(_values(a), _values(b)).alias(f"corr:{a}\x00{b}") for a, b in pairs
+    ]
+    row = df.select(exprs).row(0, named=True) if exprs and df.height else {}
+
+    signature: Dict[str, Dict[Any, Any]] = {
+        "means": {c: (row.get(f"mean:{c}"), row.get(f"std:{c}")) for c in numeric},
+        "null_rates": {c: row.get(f"null:{c}") for c in df.columns},
+        "correlation_signs": {(a, b): row.get(f"corr:{a}\x00{b}") for a, b in pairs},
+        "top_k": {},
+    }
+
+    for col in categorical:
+        counts = (
+            df[col]
+            .drop_nulls()
+            .cast(pl.Utf8)
+            .value_counts(name="count")
+            .filter(pl.col("count") > 1)
+            .sort(["count", col], descending=[True, False])
+            .head(top_k)
+        )
+        signature["top_k"][col] = frozenset(counts[col].to_list())
+
+    if reference is not None:
+        ref_stats = reference.select(
+            [
+                stat
+                for col in numeric
+                if col in reference.columns and reference.schema[col].is_numeric()
+                for stat in (
+                    _values(col).mean().alias(f"mean:{col}"),
+                    _values(col).std().alias(f"std:{col}"),
+                )
+            ]
+        )
+        ref_row = ref_stats.row(0, named=True) if ref_stats.width else {}
+        signature["drift"] = {}
+        for col in numeric:
+            ref_mean, ref_std = ref_row.get(f"mean:{col}"), ref_row.get(f"std:{col}")
+            mean = row.get(f"mean:{col}")
+            if None in (ref_mean, ref_std, mean) or not ref_std:
+                continue
+            signature["drift"][col] = (mean - ref_mean) / ref_std
+
+    return signature
+
+
+def _close(a: Optional[float], b: Optional[float], tolerance: float) -> bool:
+    if a is None or b is None:
+        return a is None and b is None
+    return abs(a - b) <= tolerance
+
+
+def compare_signatures(
+    previous: Dict[str, Dict[Any, Any]],
+    current: Dict[str, Dict[Any, Any]],
+    tolerance: float = 0.01,
+    min_abs_correlation: float = 0.1,
+) -> Dict[str, bool]:
+    """
+    Decide, per statistic family, whether two consecutive samples agree.
+
+    - means: shifts by at most `tolerance` standard deviations
+    - null_rates and drift: shift by at most `tolerance` (absolute)
+    - top_k: identical sets of most frequent values
+    - correlation_signs: same sign for every pair with |r| >= min_abs_correlation
+    """
+    stable: Dict[str, bool] = {}
+
+    def _mean_stable(col: str) -> bool:
+        prev_mean, _ = previous["means"].get(col, (None, None))
+        mean, std = current["means"][col]
+        if prev_mean is None or mean is None:
+            return prev_mean is None and mean is None
+        return abs(mean - prev_mean) <= tolerance * (std or 0.0)
+
+    stable["means"] = all(_mean_stable(col) for col in current["means"])
+    stable["null_rates"] = all(
+        _close(previous["null_rates"].get(col), rate, tolerance)
+        for col, rate in current["null_rates"].items()
+    )
+    stable["top_k"] = all(
+        previous["top_k"].get(col) == values for col, values in current["top_k"].items()
+    )
+
+    def _sign_stable(pair: Any, r: Optional[float]) -> bool:
+        prev_r = previous["correlation_signs"].get(pair)
+        if r is None or prev_r is None:
+            return True
+        if max(abs(r), abs(prev_r)) < min_abs_correlation:
+            return True
+        return (r > 0) == (prev_r > 0)
+
+    stable["correlation_signs"] = all(
+        _sign_stable(pair, r) for pair, r in current["correlation_signs"].items()
+    )
+
+    if "drift" in current:
+        stable["drift"] = all(
+            _close(previous.get("drift", {}).get(col), value, tolerance)
+            for col, value in current["drift"].items()
+        )
+    return stable
+
+
+def progressive_sample(
+    df: Any,
+    settings: Optional[Dict[str, Any]] = None,
+    seed: int = 42,
+    reference_df: Any = None,
+    log_fn: Optional[Callable[..., None]] = None,
+):
+    """
+    Grow nested random samples until every statistic family has converged.
+
+    Samples are prefixes of one seeded random permutation, so each sample
+    contains the previous one. A family is stable at a size whose statistics
+    agree with the previous sample within tolerance, and sampling stops at
+    the first size where every family is stable in the same comparison. A
+    family's convergence size is the start of its latest unbroken run of
+    stable comparisons, so a family that drifts again is re-checked.
+
+    Args:
+        df: Full dataset (Polars or Pandas).
+        settings (dict or None): Overrides for PROGRESSIVE_DEFAULTS.
+        seed (int): Seed for the row permutation.
+        reference_df: Optional reference dataset for drift convergence.
+        log_fn (callable or None): Logger accepting (msg, level=...).
+
+    Returns:
+        Tuple of (final sample, sampling info dict or None if not sampled).
+    """
+    cfg = {**PROGRESSIVE_DEFAULTS, **(settings or {})}
+    total_rows = df.shape[0]
+    if total_rows <= cfg["start_rows"]:
+        return df, None
+
+    order = pl.int_range(0, total_rows, eager=True).shuffle(seed=seed)
+    reference = to_polars(reference_df) if reference_df is not None else None
+
+    converged_at: Dict[str, int] = {}
+    previous: Optional[Dict[str, Dict[Any, Any]]] = None
+    tried: List[int] = []
+    converged = False
+    sample = df
+
+    for size in sample_sizes(total_rows, cfg["start_rows"], cfg["growth_factor"]):
+        rows = order.head(size).sort()
+        sample = df[rows] if is_polars(df) else df.iloc[rows.to_numpy()]
+        tried.append(size)
+
+        signature = sample_signature(
+            to_polars(sample),
+            top_k=cfg["top_k"],
+            max_correlation_columns=cfg["max_correlation_columns"],
+            reference=reference,
+        )
+        if previous is not None:
+            stable = compare_signatures(
+                previous, signature, cfg["tolerance"], cfg["min_abs_correlation"]
+            )
+            for family, ok in stable.items():
+                if ok:
+                    converged_at.setdefault(family, size)
+                else:
+                    converged_at.pop(family, None)
+            if log_fn:
+                pending = sorted(f for f in stable if f not in converged_at)
+                log_fn(
+                    f"Progressive sample of {size} rows; "
+                    f"unconverged: {pending or 'none'}",
+                    level="debug",
+                )
+            if all(stable.values()):
+                converged = True
+                break
+        previous = signature
+
+    sampled_rows = tried[-1]
+    if log_fn:
+        log_fn(
+            f"Progressive sampling stopped at {sampled_rows} of {total_rows} rows",
+            level="info",
+        )
+
+    return sample, {
+        "original_rows": total_rows,
+        "sampled_rows": sampled_rows,
+        "sampling_fraction": sampled_rows / total_rows,
+        "strategy": "progressive",
+        "seed": seed,
+        "sample_sizes": tried,
+        "tolerance": cfg["tolerance"],
+        "converged": converged,
+        "converged_at_rows": converged_at,
+    }
@@ -0,0 +1,257 @@
+# dsbf/utils/sql_source.py
+"""
+SQL data source with aggregation pushdown.
+
+Profiling aggregations (row counts, null counts, min/max/avg, distinct counts,
+top-k value counts, and histogram buckets) run inside the database, so only a
+sampled extract of rows is transferred for tasks that need row-level data.
+Works with any DB-API 2.0 connection; tested against stdlib `sqlite3`.
+"""
+
+import sqlite3
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+SQLITE_PREFIX = "sqlite:///"
+# Per-column queries are sent as UNION ALL batches of at most this many
+# branches (SQLite's default compound SELECT limit is 500)
+MAX_UNION_BRANCHES = 200
+
+
+def quote_identifier(name: str) -> str:
+    """Quote a table or column name for use in SQL (ANSI double quotes)."""
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+class SQLSource:
+    """
+    Table-backed data source that pushes profiling aggregations down as SQL.
+
+    Args:
+        connection: Open DB-API 2.0 connection.
+        table (str): Table (or view) name to profile.
+        sample_rows (int): Maximum number of rows in the row-level extract.
+        top_k (int): Number of most frequent values to fetch per column.
+        histogram_bins (int): Number of equal-width buckets per numeric column.
+        random_function (str): SQL expression used to shuffle rows for sampling
+            (e.g. 'RANDOM()' for SQLite/PostgreSQL, 'RAND()' for MySQL).
+    """
+
+    def __init__(
+        self,
+        connection: Any,
+        table: str,
+        sample_rows: int = 100_000,
+        top_k: int = 5,
+        histogram_bins: int = 10,
+        random_function: str = "RANDOM()",
+    ):
+        self.connection = connection
+        self.table = table
+        self.sample_rows = sample_rows
+        self.top_k = top_k
+        self.histogram_bins = histogram_bins
+        self.random_function = random_function
+        self._sample: Optional[pd.DataFrame] = None
+
+    @classmethod
+    def from_config(cls, cfg: Dict[str, Any]) -> "SQLSource":
+        """
+        Build a source from a `metadata.sql_source` config block.
+
+        Only `sqlite:///path.db` URLs are opened directly; other databases can be
+        used by constructing `SQLSource` with an existing DB-API connection.
+        """
+        url = cfg.get("url", "")
+        if not url.startswith(SQLITE_PREFIX):
+            raise ValueError(
+                f"Unsupported SQL url '{url}'. Use 'sqlite:///path.db' or pass a "
+                "DB-API connection to SQLSource directly."
+            )
+        connection = sqlite3.connect(url[len(SQLITE_PREFIX) :])
+        return cls(
+            connection,
+            table=cfg["table"],
+            sample_rows=int(cfg.get("sample_rows", 100_000)),
+            top_k=int(cfg.get("top_k", 5)),
+            histogram_bins=int(cfg.get("histogram_bins", 10)),
+            random_function=cfg.get("random_function", "RANDOM()"),
+        )
+
+    def _query(self, sql: str) -> List[tuple]:
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(sql)
+            return cursor.fetchall()
+        finally:
+            cursor.close()
+
+    def _union_query(self, branches: List[str]) -> List[tuple]:
+        """Run SELECT branches as UNION ALL batches and concatenate the rows."""
+        rows: List[tuple] = []
+        for i in range(0, len(branches), MAX_UNION_BRANCHES):
+            batch = branches[i : i + MAX_UNION_BRANCHES]
+            rows += self._query(" UNION ALL ".join(batch))
+        return rows
+
+    @property
+    def _from(self) -> str:
+        return f"FROM {quote_identifier(self.table)}"
+
+    def row_count(self) -> int:
+        return int(self._query(f"SELECT COUNT(*) {self._from}")[0][0])
+
+    def sample(self) -> pd.DataFrame:
+        """
+        Fetch the row-level extract (all rows if the table fits in `sample_rows`).
+
+        Returns:
+            pd.DataFrame: Sampled rows with the table's columns.
+        """
+        if self._sample is not None:
+            return self._sample
+
+        if self.row_count() <= self.sample_rows:
+            sql = f"SELECT * {self._from}"
+        else:
+            sql = (
+                f"SELECT * {self._from} "
+                f"ORDER BY {self.random_function} LIMIT {int(self.sample_rows)}"
+            )
+
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(sql)
+            columns = [desc[0] for desc in cursor.description]
+            self._sample = pd.DataFrame.from_records(cursor.fetchall(), columns=columns)
+        finally:
+            cursor.close()
+        return self._sample
+
+    def compute_stats(self) -> Dict[str, Any]:
+        """
+        Run all pushdown aggregations and return them as `source_stats`.
+
+        Numeric columns are identified from the sampled extract's dtypes. The
+        aggregates take one query, and top-k values and histograms take one
+        UNION ALL query each over all columns (split into batches of
+        MAX_UNION_BRANCHES), instead of a round trip per column.
+
+        Returns:
+            Dict[str, Any]: {
+                "source": "sql",
+                "num_rows": int,
+                "num_columns": int,
+                "top_k": int,
+                "columns": {column: {"null_count", "non_null_count", "n_unique",
+                    "top_values", and for numeric columns "min", "max", "mean",
+                    "histogram"}},
+            }
+        """
+        sample = self.sample()
+        columns = list(sample.columns)
+        numeric = [c for c in columns if pd.api.types.is_numeric_dtype(sample[c].dtype)]
+
+        # One pass for counts, distinct counts, and numeric aggregates
+        select_items = ["COUNT(*)"]
+        for col in columns:
+            q = quote_identifier(col)
+            select_items += [f"COUNT({q})", f"COUNT(DISTINCT {q})"]
+            if col in numeric:
+                select_items += [f"MIN({q})", f"MAX({q})", f"AVG({q})"]
+        row = self._query(f"SELECT {', '.join(select_items)} {self._from}")[0]
+
+        num_rows = int(row[0])
+        top_values = self._top_values(sample)
+        stats: Dict[str, Dict[str, Any]] = {}
+        ranges: Dict[str, Tuple[Any, Any]] = {}
+        pos = 1
+        for col in columns:
+            non_null, n_unique = int(row[pos]), int(row[pos + 1])
+            pos += 2
+            stats[col] = {
+                "null_count": num_rows - non_null,
+                "non_null_count": non_null,
+                "n_unique": n_unique,
+                "top_values": top_values[col],
+            }
+            if col in numeric:
+                col_min, col_max, col_mean = row[pos : pos + 3]
+                pos += 3
+                if col_min is not None:
+                    stats[col].update(
+                        {"min": col_min, "max": col_max, "mean": float(col_mean)}
+                    )
+                    ranges[col] = (col_min, col_max)
+
+        for col, histogram in self._histograms(ranges).items():
+            stats[col]["histogram"] = histogram
+
+        return {
+            "source": "sql",
+            "num_rows": num_rows,
+            "num_columns": len(columns),
+            "top_k": self.top_k,
+            "columns": stats,
+        }
+
+    def _top_values(self, sample: pd.DataFrame) -> Dict[str, Dict[Any, int]]:
+        """
+        Most frequent values of every column. Columns are batched by sampled
+        dtype so each UNION ALL has one value type and keys keep their type.
+        """
+        columns = list(sample.columns)
+        by_dtype: Dict[str, List[int]] = {}
+        for i, col in enumerate(columns):
+            by_dtype.setdefault(str(sample[col].dtype), []).append(i)
+
+        counts: Dict[str, List[Tuple[Any, int]]] = {col: [] for col in columns}
+        for indices in by_dtype.values():
+            branches = [
+                f"SELECT * FROM (SELECT {i} AS col_index, "
+                f"{quote_identifier(columns[i])} AS value, COUNT(*) AS n "
+                f"{self._from} GROUP BY {quote_identifier(columns[i])} "
+                f"ORDER BY n DESC LIMIT {int(self.top_k)}) AS top_{i}"
+                for i in indices
+            ]
+            for i, value, count in self._union_query(branches):
+                counts[columns[int(i)]].append((value, int(count)))
+
+        # UNION ALL does not promise row order, so re-rank within each column
+        return {
+            col: dict(sorted(pairs, key=lambda pair: -pair[1]))
+            for col, pairs in counts.items()
+        }
+
+    def _histograms(
+        self, ranges: Dict[str, Tuple[Any, Any]]
+    ) -> Dict[str, Dict[str, list]]:
+        """
+        Equal-width bucket counts of numeric columns computed in SQL (last
+        bucket is closed), given each column's (min, max).
+        """
+        bins = self.histogram_bins
+        columns = list(ranges)
+        edges: Dict[str, List[float]] = {}
+        branches = []
+        for i, col in enumerate(columns):
+            col_min, col_max = ranges[col]
+            width = (col_max - col_min) / bins if col_max != col_min else 1.0
+            edges[col] = [col_min + j * width for j in range(bins + 1)]
+
+            q = quote_identifier(col)
+            bucket = f"CAST(({q} - {col_min!r}) / {width!r} AS INTEGER)"
+            branches.append(
+                f"SELECT {i} AS col_index, CASE WHEN {bucket} >= {bins} "
+                f"THEN {bins - 1} ELSE {bucket} END AS b, COUNT(*) AS n "
+                f"{self._from} WHERE {q} IS NOT NULL GROUP BY b"
+            )
+
+        counts = {col: [0] * bins for col in columns}
+        for i, bucket_idx, count in self._union_query(branches):
+            counts[columns[int(i)]][int(bucket_idx)] += int(count)
+        return {col: {"edges": edges[col], "counts": counts[col]} for col in columns}
+
+    def close(self) -> None:
+        self.connection.close()
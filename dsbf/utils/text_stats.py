@@ -0,0 +1,122 @@
+# dsbf/utils/text_stats.py
+"""
+Vectorized statistics over string columns.
+
+Character-level statistics read the UTF-8 bytes of a Polars string column
+straight from its Arrow data buffer instead of iterating over Python strings.
+Length and word statistics use Polars' native string kernels, and length
+histograms are returned pre-binned.
+"""
+
+from typing import Any, Dict, List
+
+import numpy as np
+import polars as pl
+import pyarrow as pa
+
+# Characters that are neither word characters nor whitespace
+SYMBOL_PATTERN = r"[^\w\s]"
+
+
+def utf8_bytes(series: pl.Series) -> np.ndarray:
+    """
+    Concatenated UTF-8 bytes of the non-null values of a string series, as a
+    zero-copy view of its Arrow data buffer where possible.
+    """
+    arr = series.cast(pl.Utf8).drop_nulls().rechunk().to_arrow()
+    if isinstance(arr, pa.ChunkedArray):
+        arr = arr.combine_chunks()
+    if arr.type != pa.large_string():
+        arr = arr.cast(pa.large_string())
+    if len(arr) == 0:
+        return np.empty(0, dtype=np.uint8)
+
+    _, offsets_buf, data_buf = arr.buffers()
+    offsets = np.frombuffer(offsets_buf, dtype=np.int64)
+    start, end = offsets[arr.offset], offsets[arr.offset + len(arr)]
+    return np.frombuffer(data_buf, dtype=np.uint8)[start:end]
+
+
+def character_counts(series: pl.Series) -> np.ndarray:
+    """
+    Occurrences of each distinct character across the non-null values.
+
+    A byte histogram when every value is ASCII; otherwise the bytes are
+    decoded once and counted by code point.
+    """
+    data = utf8_bytes(series)
+    if data.size == 0:
+        return np.empty(0, dtype=np.int64)
+    if data.max() < 0x80:
+        counts = np.bincount(data, minlength=0x80)
+        return counts[counts > 0]
+    codepoints = np.frombuffer(
+        data.tobytes().decode("utf-8").encode("utf-32-le"), dtype=np.uint32
+    )
+    return np.unique(codepoints, return_counts=True)[1]
+
+
+def character_entropy(series: pl.Series) -> float:
+    """Shannon entropy (bits) of the characters across the non-null values."""
+    counts = character_counts(series)
+    if counts.size == 0:
+        return 0.0
+    probs = counts / counts.sum()
+    return float(-(probs * np.log2(probs)).sum())
+
+
+def as_string_series(values) -> pl.Series:
+    """A Polars string series from a Polars or Pandas column (values as str)."""
+    if isinstance(values, pl.Series):
+        return values.cast(pl.Utf8)
+    return pl.Series(str(values.name), values.dropna().astype(str))
+
+
+def string_lengths(series: pl.Series) -> pl.Series:
+    """Character length of each non-null value."""
+    return series.cast(pl.Utf8).drop_nulls().str.len_chars()
+
+
+def summarize_strings(series: pl.Series) -> Dict[str, Any]:
+    """
+    Length, word and symbol statistics of the non-null values, in one query.
+    Words are whitespace-separated runs, as counted by `len(s.split())`.
+
+    Returns:
+        Dict[str, Any]: `count`, `total_chars`, `max_length`, `total_words`,
+        `contains_symbols` and `most_frequent_value` (the first to reach the
+        top count, in order of appearance). Empty if there are no values.
+    """
+    values = series.cast(pl.Utf8).drop_nulls()
+    if values.is_empty():
+        return {}
+    frame = values.alias("v").to_frame()
+    stats = frame.select(
+        pl.len().alias("count"),
+        pl.col("v").str.len_chars().sum().alias("total_chars"),
+        pl.col("v").str.len_chars().max().alias("max_length"),
+        pl.col("v").str.count_matches(r"\S+").sum().alias("total_words"),
+        pl.col("v").str.contains(SYMBOL_PATTERN).any().alias("contains_symbols"),
+    ).row(0, named=True)
+    counts = frame.group_by("v", maintain_order=True).len()
+    stats["most_frequent_value"] = counts["v"][counts["len"].arg_max()]
+    return stats
+
+
+def length_histogram(lengths: pl.Series, bins: int = 30) -> Dict[str, List]:
+    """
+    Pre-binned histogram of integer lengths: one bin per length when the
+    range fits in `bins`, else `bins` equal-width buckets (last one closed).
+
+    Returns:
+        Dict[str, List]: `edges` (len(counts) + 1 bin boundaries) and `counts`.
+    """
+    if lengths.is_empty():
+        return {"edges": [], "counts": []}
+    low, high = int(lengths.min()), int(lengths.max())
+    if high - low + 1 <= bins:
+        edges = np.arange(low, high + 2)
+    else:
+        edges = np.linspace(low, high, bins + 1)
+    counts, _ = np.histogram(lengths.to_numpy(), bins=edges)
+    return {"edges": edges.tolist(), "counts": counts.tolist()}
@@ -0,0 +1,193 @@
+# dsbf/utils/type_profile.py
+"""
+Vectorized per-column type profiles.
+
+A type profile counts a column's non-null values by type family ('str',
+'int', 'float', 'bool', 'datetime', ...) and keeps the row positions of the
+first few values of each family. Strictly typed columns (any Polars dtype but
+Object, and non-object Pandas dtypes) hold a single family, so only their
+nulls are counted. Object columns are scanned in chunks with Pandas'
+`infer_dtype`; only chunks it reports as mixed are classified value by value.
+"""
+
+import datetime as dt
+import decimal
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+import polars as pl
+
+CHUNK_ROWS = 65_536
+
+# Family of the values in an object chunk, by `pandas.api.types.infer_dtype`
+_INFERRED_FAMILIES = {
+    "string": "str",
+    "bytes": "bytes",
+    "integer": "int",
+    "floating": "float",
+    "boolean": "bool",
+    "decimal": "Decimal",
+    "complex": "complex",
+    "datetime": "datetime",
+    "datetime64": "datetime",
+    "date": "date",
+    "time": "time",
+    "timedelta": "timedelta",
+    "timedelta64": "timedelta",
+    "period": "Period",
+    "interval": "Interval",
+}
+
+# Python/NumPy types by family, checked in order (bool before int)
+_TYPE_FAMILIES = (
+    ((bool, np.bool_), "bool"),
+    ((str,), "str"),
+    ((bytes,), "bytes"),
+    ((int, np.integer), "int"),
+    ((float, np.floating), "float"),
+    ((decimal.Decimal,), "Decimal"),
+    ((complex, np.complexfloating), "complex"),
+    ((dt.datetime, np.datetime64), "datetime"),
+    ((dt.date,), "date"),
+    ((dt.time,), "time"),
+    ((dt.timedelta, np.timedelta64), "timedelta"),
+)
+
+
+@dataclass
+class TypeProfile:
+    """Type families of a column's values."""
+
+    counts: Dict[str, int] = field(default_factory=dict)  # non-null, by family
+    null_count: int = 0
+    samples: Dict[str, List[int]] = field(default_factory=dict)  # row positions
+
+    @property
+    def is_mixed(self) -> bool:
+        """True if the non-null values span more than one type family."""
+        return len(self.counts) > 1
+
+    def add(self, family: str, count: int, positions) -> None:
+        if count:
+            self.counts[family] = self.counts.get(family, 0) + int(count)
+            self.samples.setdefault(family, []).extend(int(p) for p in positions)
+
+
+def type_family(tp: type) -> str:
+    """Family name of a Python/NumPy type (its class name if not a known one)."""
+    for types, family in _TYPE_FAMILIES:
+        if issubclass(tp, types):
+            return family
+    return tp.__name__
+
+
+def _dtype_family(dtype) -> str:
+    """Family of the values in a strictly typed Polars or Pandas column."""
+    if isinstance(dtype, pl.DataType) or (
+        isinstance(dtype, type) and issubclass(dtype, pl.DataType)
+    ):
+        if dtype == pl.Boolean:
+            return "bool"
+        if dtype.is_integer():
+            return "int"
+        if dtype.is_float():
+            return "float"
+        if dtype == pl.Decimal:
+            return "Decimal"
+        if dtype in (pl.Utf8, pl.Categorical, pl.Enum):
+            return "str"
+        if dtype == pl.Binary:
+            return "bytes"
+        if dtype == pl.Datetime:
+            return "datetime"
+        if dtype == pl.Date:
+            return "date"
+        if dtype == pl.Time:
+            return "time"
+        if dtype == pl.Duration:
+            return "timedelta"
+        if dtype == pl.List or dtype == pl.Array:
+            return "list"
+        if dtype == pl.Struct:
+            return "dict"
+        return str(dtype)
+
+    if pd.api.types.is_bool_dtype(dtype):
+        return "bool"
+    if pd.api.types.is_integer_dtype(dtype):
+        return "int"
+    if pd.api.types.is_float_dtype(dtype):
+        return "float"
+    if pd.api.types.is_complex_dtype(dtype):
+        return "complex"
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return "datetime"
+    if pd.api.types.is_timedelta64_dtype(dtype):
+        return "timedelta"
+    if pd.api.types.is_string_dtype(dtype):
+        return "str"
+    return str(dtype)
+
+
+def _profile_objects(values: np.ndarray, max_samples: int) -> TypeProfile:
+    profile = TypeProfile()
+    for start in range(0, len(values), CHUNK_ROWS):
+        chunk = values[start : start + CHUNK_ROWS]
+        isnull = pd.isna(chunk)
+        profile.null_count += int(isnull.sum())
+
+        family = _INFERRED_FAMILIES.get(pd.api.types.infer_dtype(chunk, skipna=True))
+        if family is not None:
+            present = np.flatnonzero(~isnull)
+            needed = max_samples - len(profile.samples.get(family, []))
+            profile.add(family, present.size, present[: max(needed, 0)] + start)
+            continue
+
+        # Mixed chunk: code each value by the identity of its type, then
+        # classify only the distinct types
+        present = np.flatnonzero(~isnull)
+        values_present = chunk[present]
+        type_ids = np.fromiter(
+            map(id, map(type, values_present)), dtype=np.int64, count=present.size
+        )
+        codes, _ = pd.factorize(type_ids)
+        for code, count in enumerate(np.bincount(codes)):
+            positions = np.flatnonzero(codes == code)
+            family = type_family(type(values_present[positions[0]]))
+            needed = max_samples - len(profile.samples.get(family, []))
+            profile.add(family, count, present[positions[: max(needed, 0)]] + start)
+    return profile
+
+
+def type_profile(series, max_samples: int = 5) -> TypeProfile:
+    """
+    Profile the type families of a Polars or Pandas series.
+
+    Args:
+        series: The column to profile.
+        max_samples (int): Row positions to keep per family.
+
+    Returns:
+        TypeProfile: Non-null counts and sample positions per family, and the
+        null count (None, NaN, NaT and pd.NA count as null).
+    """
+    if isinstance(series, pl.Series):
+        if series.dtype == pl.Object:
+            return _profile_objects(series.to_numpy(), max_samples)
+        profile = TypeProfile(null_count=series.null_count())
+        present = series.is_not_null()
+        first = present.arg_true().head(max_samples).to_list()
+        profile.add(
+            _dtype_family(series.dtype), len(series) - profile.null_count, first
+        )
+        return profile
+
+    if series.dtype == object or isinstance(series.dtype, pd.CategoricalDtype):
+        return _profile_objects(series.to_numpy(dtype=object), max_samples)
+    present = series.notna().to_numpy()
+    profile = TypeProfile(null_count=int(len(present) - present.sum()))
+    first = np.flatnonzero(present)[:max_samples]
+    profile.add(_dtype_family(series.dtype), int(present.sum()), first)
+    return profile
@@ -0,0 +1,132 @@
+# tests/eda/test_engine/test_distributed_engine.py
+
+import json
+import multiprocessing
+import socket
+import threading
+import time
+import urllib.error
+import urllib.request
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dsbf.config import load_default_config
+from dsbf.eda.distributed_engine import (
+    SKETCH_VERSION,
+    DistributedProfileEngine,
+    SketchVersionError,
+    check_sketch_version,
+    make_worker_server,
+    serve_worker,
+)
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_healthy(url, timeout=60):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with urllib.request.urlopen(f"{url}/health", timeout=1) as response:
+                if json.loads(response.read())["status"] == "ok":
+                    return
+        except OSError:
+            time.sleep(0.2)
+    raise TimeoutError(f"Worker at {url} did not start")
+
+
+@pytest.fixture
+def workers():
+    ctx = multiprocessing.get_context("spawn")
+    urls, processes = [], []
+    for _ in range(2):
+        port = _free_port()
+        process = ctx.Process(
+            target=serve_worker, args=("127.0.0.1", port), daemon=True
+        )
+        process.start()
+        urls.append(f"http://127.0.0.1:{port}")
+        processes.append(process)
+    try:
+        for url in urls:
+            _wait_healthy(url)
+        yield urls
+    finally:
+        for process in processes:
+            process.terminate()
+            process.join()
+
+
+@pytest.mark.filterwarnings("ignore::PendingDeprecationWarning")
+def test_coordinator_merges_worker_states_and_reassigns(
+    clean_engine_run, tmp_path, workers
+):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "a": rng.normal(size=3_000),
+            "b": rng.normal(size=3_000),
+            "city": rng.choice(["NY", "SF", "LA"], size=3_000),
+        }
+    )
+    df.loc[::5, "b"] = np.nan
+    path = tmp_path / "data.parquet"
+    df.to_parquet(path, row_group_size=500)
+
+    dead_worker = f"http://127.0.0.1:{_free_port()}"
+    config = load_default_config()
+    config["output_dir"] = str(tmp_path / "out")
+    config["metadata"]["dataset_path"] = str(path)
+    config["engine"]["mapreduce"] = {"partition_rows": 500}
+    config["engine"]["distributed"] = {"workers": [dead_worker, *workers]}
+
+    engine = DistributedProfileEngine(config)
+    engine.run()
+
+    distributed = engine.run_metadata["distributed"]
+    assert distributed["lost_workers"] == [dead_worker]
+    assert sum(distributed["assignments"].values()) == 6
+    assert engine.run_metadata["mapreduce"]["rows"] == 3_000
+
+    nulls = engine.get_result("summarize_nulls").data["null_counts"]
+    assert nulls["b"] == 600
+    correlations = engine.get_result("compute_correlations").data
+    assert correlations["a|b"] == pytest.approx(df["a"].corr(df["b"]))
+    assert engine.get_result("summarize_value_counts").data["city"] == (
+        df["city"].value_counts().to_dict()
+    )
+
+
+def test_coordinator_requires_workers():
+    with pytest.raises(ValueError):
+        DistributedProfileEngine(load_default_config())
+
+
+def test_sketch_version_mismatch_is_rejected():
+    server = make_worker_server(port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        with urllib.request.urlopen(f"{url}/health", timeout=5) as response:
+            check_sketch_version(json.loads(response.read()), url)
+
+        body = {"partition": {"path": "x.csv"}, "config": {}, "tasks": []}
+        body.update(SKETCH_VERSION, hash_version="2/polars-0.0.0")
+        request = urllib.request.Request(
+            f"{url}/partial", data=json.dumps(body).encode("utf-8"), method="POST"
+        )
+        with pytest.raises(urllib.error.HTTPError) as excinfo:
+            urllib.request.urlopen(request, timeout=5)
+        assert excinfo.value.code == 409
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    with pytest.raises(SketchVersionError):
+        check_sketch_version({"rows": 1, "states": {}}, "old-worker")
@@ -0,0 +1,58 @@
+# tests/eda/test_engine/test_incremental_engine.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dsbf.config import load_default_config
+from dsbf.eda.incremental_engine import IncrementalProfileEngine
+
+
+def _run(tmp_path, data_path, name):
+    config = load_default_config()
+    config["output_dir"] = str(tmp_path / name)
+    config["metadata"]["dataset_path"] = str(data_path)
+    config["engine"]["incremental"] = {"state_path": str(tmp_path / "state.json")}
+    config["engine"]["mapreduce"] = {"max_workers": 1, "partition_rows": 500}
+    engine = IncrementalProfileEngine(config)
+    engine.run()
+    return engine
+
+
+def _frame(rng, n):
+    return pd.DataFrame(
+        {"amount": rng.normal(size=n), "kind": rng.choice(["a", "b"], size=n)}
+    )
+
+
+@pytest.mark.filterwarnings("ignore::PendingDeprecationWarning")
+def test_incremental_engine_appends_and_falls_back(clean_engine_run, tmp_path):
+    rng = np.random.default_rng(0)
+    path = tmp_path / "log.csv"
+    first = _frame(rng, 1_000)
+    first.to_csv(path, index=False)
+
+    engine = _run(tmp_path, path, "run1")
+    assert engine.run_metadata["incremental"]["mode"] == "full"
+
+    second = _frame(rng, 300)
+    second.to_csv(path, mode="a", header=False, index=False)
+    engine = _run(tmp_path, path, "run2")
+
+    incremental = engine.run_metadata["incremental"]
+    assert incremental["mode"] == "append"
+    assert incremental["previous_rows"] == 1_000 and incremental["new_rows"] == 300
+
+    full = pd.concat([first, second], ignore_index=True)
+    numeric = engine.get_result("summarize_numeric").data["amount"]
+    assert numeric["count"] == 1_300
+    assert numeric["mean"] == pytest.approx(full["amount"].mean())
+    assert engine.get_result("summarize_value_counts").data["kind"] == (
+        full["kind"].value_counts().to_dict()
+    )
+
+    # Rewriting history forces a full run
+    _frame(rng, 800).to_csv(path, index=False)
+    engine = _run(tmp_path, path, "run3")
+    assert engine.run_metadata["incremental"]["mode"] == "full"
+    assert engine.get_result("summarize_numeric").data["amount"]["count"] == 800
@@ -0,0 +1,75 @@
+# tests/eda/test_engine/test_mapreduce_engine.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dsbf.config import load_default_config
+from dsbf.eda.mapreduce_engine import MapReduceProfileEngine
+
+
+@pytest.fixture
+def parquet_dataset(tmp_path):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "a": rng.normal(size=4_000),
+            "b": rng.normal(size=4_000),
+            "city": rng.choice(["NY", "SF", "LA"], size=4_000),
+            "tier": rng.choice(["gold", "silver"], size=4_000),
+        }
+    )
+    df["b"] += df["a"]
+    df.loc[::7, "a"] = np.nan
+    path = tmp_path / "data.parquet"
+    df.to_parquet(path, row_group_size=1_000)
+    return df, str(path)
+
+
+def _mapreduce_config(tmp_path, path, workers):
+    config = load_default_config()
+    config["output_dir"] = str(tmp_path / "out")
+    config["metadata"]["dataset_path"] = path
+    config["engine"]["mapreduce"] = {
+        "max_workers": workers,
+        "partition_rows": 1_000,
+        "start_method": "spawn",
+    }
+    return config
+
+
+@pytest.mark.filterwarnings("ignore::PendingDeprecationWarning")
+def test_mapreduce_engine_matches_single_pass(
+    clean_engine_run, tmp_path, parquet_dataset
+):
+    df, path = parquet_dataset
+    engine = MapReduceProfileEngine(_mapreduce_config(tmp_path, path, workers=1))
+    engine.run()
+
+    assert engine.run_metadata["mapreduce"]["partitions"] == 4
+    assert engine.run_metadata["mapreduce"]["rows"] == 4_000
+
+    nulls = engine.get_result("summarize_nulls").data["null_counts"]
+    assert nulls["a"] == int(df["a"].isna().sum())
+
+    numeric = engine.get_result("summarize_numeric").data["a"]
+    assert numeric["mean"] == pytest.approx(df["a"].mean())
+    assert numeric["std"] == pytest.approx(df["a"].std())
+
+    correlations = engine.get_result("compute_correlations").data
+    assert correlations["a|b"] == pytest.approx(df["a"].corr(df["b"]))
+    assert 0.0 <= correlations["city|tier"] <= 1.0
+
+
+@pytest.mark.filterwarnings("ignore::PendingDeprecationWarning")
+def test_mapreduce_engine_worker_processes(clean_engine_run, tmp_path, parquet_dataset):
+    df, path = parquet_dataset
+    engine = MapReduceProfileEngine(_mapreduce_config(tmp_path, path, workers=2))
+    engine.run()
+
+    assert engine.run_metadata["mapreduce"]["workers"] == 2
+    correlations = engine.get_result("compute_correlations").data
+    assert correlations["a|b"] == pytest.approx(df["a"].corr(df["b"]))
+    assert engine.get_result("summarize_value_counts").data["city"] == (
+        df["city"].value_counts().to_dict()
+    )
@@ -0,0 +1,75 @@
+# tests/eda/test_engine/test_merge_engine.py
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dsbf.config import load_default_config
+from dsbf.eda.mapreduce_engine import MapReduceProfileEngine
+from dsbf.eda.merge_engine import ProfileStateMergeEngine
+
+
+def _profile_shard(tmp_path, name, df):
+    path = tmp_path / f"{name}.csv"
+    df.to_csv(path, index=False)
+    config = load_default_config()
+    config["output_dir"] = str(tmp_path / f"out_{name}")
+    config["metadata"]["dataset_path"] = str(path)
+    config["engine"]["save_profile_state"] = True
+    config["engine"]["mapreduce"] = {"max_workers": 1}
+    MapReduceProfileEngine(config).run()
+    return config["output_dir"]
+
+
+@pytest.mark.filterwarnings("ignore::PendingDeprecationWarning")
+def test_merge_saved_profiles_matches_full_profile(clean_engine_run, tmp_path):
+    rng = np.random.default_rng(0)
+    days = [
+        pd.DataFrame(
+            {
+                "amount": rng.gamma(2.0, size=1_000),
+                "store": rng.choice(["a", "b", "c"], size=1_000),
+            }
+        )
+        for _ in range(3)
+    ]
+    days[1].loc[::4, "amount"] = np.nan
+    run_dirs = [_profile_shard(tmp_path, f"day{i}", df) for i, df in enumerate(days)]
+    full = pd.concat(days, ignore_index=True)
+
+    config = load_default_config()
+    config["output_dir"] = str(tmp_path / "week_partial")
+    ProfileStateMergeEngine(run_dirs[:2], config).run()
+
+    # Merged states compose: (day0 + day1) + day2
+    config = load_default_config()
+    config["output_dir"] = str(tmp_path / "week")
+    engine = ProfileStateMergeEngine(
+        [str(tmp_path / "week_partial"), run_dirs[2]], config
+    )
+    engine.run()
+
+    assert engine.run_metadata["merged_profiles"]["rows"] == 3_000
+    assert len(engine.sources) == 3
+
+    shape = engine.get_result("summarize_dataset_shape").data
+    assert shape["num_rows"] == 3_000
+    nulls = engine.get_result("summarize_nulls").data["null_counts"]
+    assert nulls["amount"] == int(full["amount"].isna().sum())
+    numeric = engine.get_result("summarize_numeric").data["amount"]
+    assert numeric["mean"] == pytest.approx(full["amount"].mean())
+    assert numeric["std"] == pytest.approx(full["amount"].std())
+    value_counts = engine.get_result("summarize_value_counts").data["store"]
+    assert value_counts == full["store"].value_counts().to_dict()
+
+    # Sketch approximations are surfaced with the merged results
+    approximate = engine.run_metadata["approximate_results"]
+    assert {"summarize_numeric", "summarize_value_counts"} <= set(approximate)
+    value_counts_meta = engine.get_result("summarize_value_counts").metadata
+    assert value_counts_meta["approximate_columns"] == ["amount"]
+
+    with open(os.path.join(config["output_dir"], "profile_state.json")) as f:
+        assert json.load(f)["rows"] == 3_000
@@ -7,9 +7,12 @@ import warnings
 import pandas as pd
 import pytest
 
+from dsbf.config import load_default_config
 from dsbf.core.context import AnalysisContext
+from dsbf.eda.merge_engine import ProfileStateMergeEngine
 from dsbf.eda.profile_engine import ProfileEngine
 from dsbf.eda.task_result import TaskResult
+from dsbf.utils.profile_state import load_profile_state
 
 
 @pytest.mark.filterwarnings("ignore::PendingDeprecationWarning")
@@ -217,3 +220,333 @@ def test_profile_engine_sampling_metadata(tmp_path):
     assert "sampling" in engine.run_metadata
     assert engine.run_metadata["sampling"]["sampled_rows"] == 1_000_000
     assert engine.run_metadata["sampling"]["original_rows"] == 2_000_000
+
+
+@pytest.mark.filterwarnings("ignore::PendingDeprecationWarning")
+def test_profile_engine_parquet_footer_stats(tmp_path):
+    df_path = tmp_path / "large_dataset.parquet"
+    pd.DataFrame(
+        {
+            "col": [i | 1 for i in range(50_000)],  # Repeated values, not a key
+            "label": [None if i % 5 == 0 else "x" for i in range(50_000)],
+        }
+    ).to_parquet(df_path, row_group_size=10_000)
+
+    config = {
+        "metadata": {
+            "dataset_path": str(df_path),
+            "dataset_name": "test_dataset",
+            "dataset_source": "custom",
+            "output_dir": str(tmp_path),
+            "profiling_depth": "basic",
+        },
+        "engine": {"backend": "polars"},
+        "resource_limits": {
+            "enable_sampling": True,
+            "sample_threshold_rows": 20_000,
+            "sample_strategy": "head",
+        },
+    }
+
+    engine = ProfileEngine(config)
+    engine.run()
+
+    assert engine.context is not None
+    assert engine.context.data.shape[0] == 20_000
+    assert engine.run_metadata["stats_source"] == "parquet_footer"
+    assert engine.run_metadata["sampling"]["original_rows"] == 50_000
+
+    shape = engine.context.results["summarize_dataset_shape"]
+    assert shape.data is not None
+    assert shape.data["num_rows"] == 50_000
+
+    nulls = engine.context.results["summarize_nulls"]
+    assert nulls.data is not None
+    assert nulls.data["null_counts"]["label"] == 10_000
+    assert "label" in nulls.metadata["source_stat_columns"]
+
+    numeric = engine.context.results["summarize_numeric"]
+    assert numeric.data is not None
+    assert numeric.data["col"]["max"] == 19_999  # Sample statistics stay intact
+    assert numeric.data["col"]["source_stats"]["max"] == 49_999
+    assert numeric.metadata["stats_scope"] == "sample"
+    assert numeric.metadata["source_stats_source"] == "parquet_footer"
+
+
+@pytest.mark.filterwarnings("ignore::PendingDeprecationWarning")
+def test_profile_engine_saves_state_over_full_file(tmp_path):
+    df_path = tmp_path / "events.parquet"
+    pd.DataFrame({"x": range(5_000), "y": [1.5, None] * 2_500}).to_parquet(
+        df_path, row_group_size=1_000
+    )
+    config = {
+        "metadata": {
+            "dataset_path": str(df_path),
+            "output_dir": str(tmp_path / "out"),
+            "profiling_depth": "basic",
+        },
+        "engine": {"backend": "polars", "save_profile_state": True},
+        "resource_limits": {"sample_threshold_rows": 1_000},
+    }
+
+    engine = ProfileEngine(config)
+    engine.run()
+
+    assert engine.context is not None
+    assert engine.context.data.shape[0] == 1_000
+    profile = load_profile_state(engine.run_metadata["profile_state"])
+    assert profile["rows"] == 5_000 and not profile.get("sampled")
+    assert profile["tasks"]["summarize_nulls"]["null_counts"]["y"] == 2_500
+
+
+@pytest.mark.filterwarnings("ignore::PendingDeprecationWarning")
+def test_profile_engine_partitioned_dataset(tmp_path):
+    root = tmp_path / "events"
+    for day in ["2025-07-01", "2025-07-02", "2025-07-03"]:
+        part = root / f"date={day}"
+        part.mkdir(parents=True)
+        pd.DataFrame({"value": [1, 2, None], "name": ["a", "b", "c"]}).to_parquet(
+            part / "part-0.parquet"
+        )
+
+    config = {
+        "metadata": {
+            "dataset_path": str(root),
+            "dataset_name": "events",
+            "dataset_source": "custom",
+            "output_dir": str(tmp_path / "out"),
+            "profiling_depth": "basic",
+            "partition_filter": {"date": {"min": "2025-07-02"}},
+            "per_partition_summaries": True,
+        },
+        "engine": {"backend": "polars"},
+    }
+
+    engine = ProfileEngine(config)
+    engine.run()
+
+    assert engine.context is not None
+    assert engine.context.data.shape[0] == 6
+    assert engine.run_metadata["partitions"]["selected"] == [
+        "date=2025-07-02",
+        "date=2025-07-03",
+    ]
+
+    shape = engine.context.results["summarize_dataset_shape"]
+    assert shape.data is not None
+    assert shape.data["num_rows"] == 6
+
+    with open(os.path.join(engine.output_dir, "partition_report.json")) as f:
+        partition_report = json.load(f)
+    assert set(partition_report) == {"date=2025-07-02", "date=2025-07-03"}
+
+
+@pytest.mark.filterwarnings("ignore::PendingDeprecationWarning")
+def test_profile_engine_sql_source(tmp_path):
+    import sqlite3
+
+    db_path = tmp_path / "warehouse.db"
+    conn = sqlite3.connect(db_path)
+    pd.DataFrame(
+        {
+            "amount": [float(i) if i % 4 else None for i in range(400)],
+            "segment": ["a" if i % 2 else "b" for i in range(400)],
+        }
+    ).to_sql("sales", conn, index=False)
+    conn.close()
+
+    config = {
+        "metadata": {
+            "dataset_name": "sales",
+            "dataset_source": "sql",
+            "output_dir": str(tmp_path / "out"),
+            "profiling_depth": "basic",
+            "sql_source": {
+                "url": f"sqlite:///{db_path}",
+                "table": "sales",
+                "sample_rows": 100,
+            },
+        },
+        "engine": {"backend": "polars"},
+    }
+
+    engine = ProfileEngine(config)
+    engine.run()
+
+    assert engine.context is not None
+    assert engine.context.data.shape[0] == 100
+    assert engine.context.data_source is not None
+    with pytest.raises(sqlite3.ProgrammingError):  # Closed after loading
+        engine.context.data_source.connection.cursor()
+    assert engine.run_metadata["stats_source"] == "sql"
+
+    shape = engine.context.results["summarize_dataset_shape"]
+    assert shape.data is not None
+    assert shape.data["num_rows"] == 400
+
+    nulls = engine.context.results["summarize_nulls"]
+    assert nulls.data is not None
+    assert nulls.data["null_counts"]["amount"] == 100
+
+    unique = engine.context.results["summarize_unique"]
+    assert unique.data is not None
+    assert unique.data["amount"] == 300
+
+    value_counts = engine.context.results["summarize_value_counts"]
+    assert value_counts.data is not None
+    assert value_counts.data["segment"] == {"a": 200, "b": 200}
+
+
+@pytest.mark.filterwarnings("ignore::PendingDeprecationWarning")
+def test_profile_engine_marks_sampled_state(tmp_path):
+    import sqlite3
+
+    db_path = tmp_path / "warehouse.db"
+    conn = sqlite3.connect(db_path)
+    pd.DataFrame({"amount": [float(i) for i in range(400)]}).to_sql(
+        "sales", conn, index=False
+    )
+    conn.close()
+
+    config = {
+        "metadata": {
+            "output_dir": str(tmp_path / "out"),
+            "profiling_depth": "basic",
+            "sql_source": {
+                "url": f"sqlite:///{db_path}",
+                "table": "sales",
+                "sample_rows": 100,
+            },
+        },
+        "engine": {"backend": "polars", "save_profile_state": True},
+    }
+    engine = ProfileEngine(config)
+    engine.run()
+
+    profile = load_profile_state(engine.run_metadata["profile_state"])
+    assert profile["sampled"] is True
+    assert profile["rows"] == 100 and profile["source_rows"] == 400
+    assert profile["sampling_strategy"] == "sql_random"
+
+    merge_config = load_default_config()
+    merge_config["output_dir"] = str(tmp_path / "merged")
+    merged = ProfileStateMergeEngine([engine.output_dir], merge_config)
+    merged.run()
+    assert merged.run_metadata["merged_profiles"]["sampled_inputs"] == [
+        engine.output_dir
+    ]
+    assert load_profile_state(merge_config["output_dir"])["sampled"] is True
+
+
+@pytest.mark.filterwarnings("ignore::PendingDeprecationWarning")
+def test_profile_engine_s3_dataset(tmp_path):
+    boto3 = pytest.importorskip("boto3")
+    moto = pytest.importorskip("moto")
+
+    data_path = tmp_path / "current.parquet"
+    ref_path = tmp_path / "reference.csv"
+    pd.DataFrame({"x": range(1_000), "y": [1.5, None] * 500}).to_parquet(data_path)
+    pd.DataFrame({"x": range(100), "y": [1.0] * 100}).to_csv(ref_path, index=False)
+
+    with moto.mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket="lake")
+        client.upload_file(str(data_path), "lake", "current.parquet")
+        client.upload_file(str(ref_path), "lake", "reference.csv")
+
+        config = {
+            "metadata": {
+                "dataset_path": "s3://lake/current.parquet",
+                "dataset_name": "remote",
+                "dataset_source": "s3",
+                "output_dir": str(tmp_path / "out"),
+                "profiling_depth": "basic",
+            },
+            "engine": {
+                "backend": "polars",
+                "reference_dataset_path": "s3://lake/reference.csv",
+                "filesystem": {
+                    "cache_dir": str(tmp_path / "cache"),
+                    "s3": {"region_name": "us-east-1"},
+                },
+            },
+        }
+
+        engine = ProfileEngine(config)
+        engine.run()
+
+    assert engine.context is not None
+    assert engine.context.data.shape == (1_000, 2)
+    assert engine.context.reference_data.shape == (100, 2)
+    assert engine.run_metadata["stats_source"] == "parquet_footer"
+
+
+@pytest.mark.filterwarnings("ignore::PendingDeprecationWarning")
+def test_profile_engine_progressive_sampling(tmp_path):
+    df_path = tmp_path / "events.parquet"
+    pd.DataFrame(
+        {
+            "value": [float(i % 97) for i in range(60_000)],
+            "label": [None if i % 10 == 0 else "ab"[i % 2] for i in range(60_000)],
+        }
+    ).to_parquet(df_path)
+
+    config = {
+        "metadata": {
+            "dataset_path": str(df_path),
+            "dataset_name": "events",
+            "dataset_source": "custom",
+            "output_dir": str(tmp_path / "out"),
+            "profiling_depth": "basic",
+        },
+        "engine": {"backend": "polars"},
+        "resource_limits": {
+            "sample_strategy": "progressive",
+            "progressive": {"start_rows": 1_000, "growth_factor": 4, "tolerance": 0.1},
+        },
+    }
+
+    engine = ProfileEngine(config)
+    engine.run()
+
+    sampling = engine.run_metadata["sampling"]
+    assert sampling["strategy"] == "progressive"
+    assert sampling["converged"] is True
+    assert sampling["sampled_rows"] < 60_000
+
+    nulls = engine.context.results["summarize_nulls"]
+    assert nulls.metadata["converged_at_rows"] == (
+        sampling["converged_at_rows"]["null_rates"]
+    )
+
+
+def test_profile_engine_reads_only_projected_columns(tmp_path, monkeypatch):
+    from dsbf.eda.task_registry import get_all_task_specs
+
+    df_path = tmp_path / "wide.parquet"
+    pd.DataFrame(
+        {
+            "amount": [0.0, 1.5, 2.0, 0.0],
+            "count": [1, 0, 3, 4],
+            "comment": ["a", "b", "c", "d"],
+            "flag": [True, False, True, True],
+        }
+    ).to_parquet(df_path)
+
+    selected = {"infer_types", "summarize_numeric", "detect_zeros"}
+    monkeypatch.setattr(
+        ProfileEngine,
+        "select_task_specs",
+        lambda self: [s for s in get_all_task_specs() if s.name in selected],
+    )
+    config = {
+        "metadata": {"dataset_path": str(df_path), "output_dir": str(tmp_path)},
+        "engine": {"backend": "polars"},
+    }
+
+    engine = ProfileEngine(config)
+    engine.run()
+
+    assert engine.run_metadata["projected_columns"] == ["amount", "count"]
+    assert engine.context.data.columns == ["amount", "count"]
+    assert set(engine.get_result("summarize_numeric").data) == {"amount", "count"}
@@ -0,0 +1,91 @@
+# tests/eda/test_engine/test_semantic_routing.py
+
+import numpy as np
+import polars as pl
+
+from dsbf.core.context import AnalysisContext
+from dsbf.eda.graph import ExecutionGraph, Task
+from dsbf.eda.task_registry import TASK_REGISTRY, load_task_group
+
+
+def _graph(*names):
+    load_task_group("core")
+    return ExecutionGraph(
+        [Task(name, spec=TASK_REGISTRY[name], config={}) for name in names]
+    )
+
+
+def test_tasks_receive_only_matching_semantic_types(tmp_path):
+    df = pl.DataFrame(
+        {
+            "amount": [float(i) for i in range(100)],
+            "rating": [i % 3 for i in range(100)],
+            "label": ["a", "b"] * 50,
+        }
+    )
+    ctx = AnalysisContext(data=df, output_dir=str(tmp_path))
+    ctx.set_metadata(
+        "semantic_types",
+        {"amount": "continuous", "rating": "categorical", "label": "categorical"},
+    )
+
+    graph = _graph("detect_outliers", "summarize_numeric")
+    graph.run(ctx)
+
+    outliers = graph.task_map["detect_outliers"].task_instance
+    assert outliers.input_data.columns == ["amount"]
+    numeric = graph.task_map["summarize_numeric"].task_instance
+    assert numeric.input_data.columns == ["amount", "rating"]
+
+    # Without inferred types (or with routing off) tasks see every column read
+    ctx = AnalysisContext(
+        data=df,
+        config={"engine": {"semantic_routing": False}},
+        output_dir=str(tmp_path),
+    )
+    ctx.set_metadata("semantic_types", {"amount": "continuous"})
+    graph = _graph("detect_outliers")
+    graph.run(ctx)
+    assert graph.task_map["detect_outliers"].task_instance.input_data.columns == [
+        "amount",
+        "rating",
+    ]
+
+
+def test_task_without_matching_columns_is_skipped_uninstantiated():
+    df = pl.DataFrame({"user_id": ["u1", "u2", "u3"], "label": ["a", "b", "a"]})
+    ctx = AnalysisContext(data=df)
+    ctx.set_metadata("semantic_types", {"user_id": "id", "label": "categorical"})
+
+    graph = _graph("detect_bimodal_distribution", "detect_skewness")
+    graph.run(ctx)
+
+    for name in ("detect_bimodal_distribution", "detect_skewness"):
+        task = graph.task_map[name]
+        assert task.status == "skipped"
+        assert task._task_instance is None
+        assert ctx.get_result(name).status == "skipped"
+    assert ctx.metadata["task_outcomes"]["skipped"] == [
+        "detect_bimodal_distribution",
+        "detect_skewness",
+    ]
+
+
+def test_integer_id_column_is_typed_id_and_not_routed_to_numeric_tasks(tmp_path):
+    rng = np.random.default_rng(0)
+    df = pl.DataFrame(
+        {
+            "order_id": rng.permutation(np.arange(10_000, 12_000)),
+            "amount": rng.gamma(2.0, size=2_000),
+            "quantity": rng.integers(0, 1_000_000, size=2_000),
+        }
+    )
+    ctx = AnalysisContext(data=df, output_dir=str(tmp_path))
+
+    graph = _graph("infer_types", "detect_outliers", "detect_skewness")
+    graph.run(ctx)
+
+    assert ctx.metadata["semantic_types"]["order_id"] == "id"
+    assert ctx.metadata["semantic_types"]["quantity"] == "continuous"
+    for name in ("detect_outliers", "detect_skewness"):
+        assert "order_id" not in graph.task_map[name].task_instance.input_data.columns
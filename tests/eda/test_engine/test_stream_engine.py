@@ -0,0 +1,126 @@
+# tests/eda/test_engine/test_stream_engine.py
+
+import io
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import pytest
+
+from dsbf.config import load_default_config
+from dsbf.eda.stream_engine import StreamingProfileEngine
+
+
+def _stream_config(tmp_path, **streaming):
+    config = load_default_config()
+    config["output_dir"] = str(tmp_path)
+    config["engine"]["streaming"] = {"batch_rows": 1_000, **streaming}
+    return config
+
+
+@pytest.mark.filterwarnings("ignore::PendingDeprecationWarning")
+def test_stream_engine_profiles_csv_in_batches(clean_engine_run, tmp_path):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "x": rng.normal(size=5_000),
+            "city": rng.choice(["NY", "SF", "LA"], size=5_000),
+            "count": rng.integers(0, 100, size=5_000).astype(float),
+        }
+    )
+    df.loc[::10, "count"] = np.nan
+
+    engine = StreamingProfileEngine(
+        _stream_config(tmp_path, emit_every_batches=2),
+        stream=io.StringIO(df.to_csv(index=False)),
+    )
+    engine.run()
+
+    with open(os.path.join(tmp_path, "report.json")) as f:
+        results = json.load(f)["results"]
+
+    shape = results["summarize_dataset_shape"]["data"]
+    assert shape["num_rows"] == 5_000 and shape["num_columns"] == 3
+    assert results["summarize_nulls"]["data"]["null_counts"]["count"] == 500
+
+    numeric = results["summarize_numeric"]["data"]["x"]
+    assert numeric["count"] == 5_000
+    assert numeric["mean"] == pytest.approx(df["x"].mean())
+    assert numeric["std"] == pytest.approx(df["x"].std())
+    assert abs((df["x"] < numeric["50%"]).mean() - 0.5) < 0.02
+
+    assert results["summarize_unique"]["data"]["city"] == 3
+    value_counts = results["summarize_value_counts"]["data"]["city"]
+    assert value_counts == df["city"].value_counts().to_dict()
+
+    streaming = engine.run_metadata["streaming"]
+    assert streaming["format"] == "csv"
+    assert streaming["batches"] == 5 and streaming["complete"] is True
+
+
+def test_stream_engine_ndjson_aligns_schema_drift(tmp_path):
+    # Batch 1 is integers, batch 2 floats (widened), batch 3 unparseable (null)
+    lines = [json.dumps({"id": i, "value": i}) for i in range(1_000)]
+    lines += [json.dumps({"id": i, "value": 0.5, "extra": "x"}) for i in range(1_000)]
+    lines += [json.dumps({"id": 2_000, "value": "bad"})]
+
+    engine = StreamingProfileEngine(
+        _stream_config(tmp_path), stream=io.StringIO("\n".join(lines) + "\n")
+    )
+    engine.run()
+
+    result = engine.get_result("summarize_numeric")
+    assert engine.input_format == "ndjson"
+    assert engine.rows_seen == 2_001
+    assert result.data["value"]["count"] == 2_000
+    assert result.data["value"]["min"] == 0.0 and result.data["value"]["max"] == 999
+    assert result.data["value"]["mean"] == pytest.approx((499.5 + 0.5) / 2)
+    assert "extra" not in engine.get_result("summarize_nulls").data["null_counts"]
+    assert engine.run_metadata["streaming"]["coerced_values"] == {"value": 1}
+
+
+def test_stream_engine_widens_all_null_columns(tmp_path):
+    lines = [json.dumps({"a": i, "b": None}) for i in range(2)]
+    lines += [json.dumps({"a": 3, "b": 5}), json.dumps({"a": 4, "b": 7})]
+
+    engine = StreamingProfileEngine(
+        _stream_config(tmp_path, batch_rows=2), stream=io.StringIO("\n".join(lines))
+    )
+    engine.run()
+
+    assert engine.schema["b"] == pl.Int64
+    assert engine.get_result("summarize_numeric").data["b"]["mean"] == 6
+    assert engine.run_metadata["streaming"]["coerced_values"] == {}
+
+
+def test_stream_engine_distinct_counts_survive_widening(tmp_path):
+    values = [1, 2, 3, 1.5, 1.0, 2.0, 3.0]
+    lines = [json.dumps({"x": value}) for value in values]
+
+    engine = StreamingProfileEngine(
+        _stream_config(tmp_path, batch_rows=3), stream=io.StringIO("\n".join(lines))
+    )
+    engine.run()
+
+    assert engine.schema["x"] == pl.Float64
+    assert engine.get_result("summarize_unique").data["x"] == 4
+
+
+def test_stream_engine_csv_quoted_newlines(tmp_path):
+    text = 'id,note\n1,"first\nline"\n2,plain\n3,"a, b"\n'
+
+    engine = StreamingProfileEngine(
+        _stream_config(tmp_path, batch_rows=2), stream=io.StringIO(text)
+    )
+    engine.run()
+
+    assert engine.rows_seen == 3 and engine.batches_seen == 2
+    assert engine.get_result("summarize_unique").data["note"] == 3
+
+
+def test_stream_engine_rejects_empty_stream(tmp_path):
+    engine = StreamingProfileEngine(_stream_config(tmp_path), stream=io.StringIO(""))
+    with pytest.raises(ValueError, match="No records"):
+        engine.run()
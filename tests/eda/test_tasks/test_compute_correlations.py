@@ -3,11 +3,14 @@
 import warnings
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import polars as pl
 import pytest
+from scipy.stats import chi2_contingency
 
 from dsbf.eda.task_result import TaskResult
-from dsbf.eda.tasks.compute_correlations import ComputeCorrelations
+from dsbf.eda.tasks.compute_correlations import ComputeCorrelations, cramers_v
 from tests.helpers.context_utils import make_ctx_and_task
 
 
@@ -199,3 +202,110 @@ def test_compute_correlations_non_numeric_columns(tmp_path):
     assert result.status == "success"
     assert result.data == {}
     assert result.plots == {}
+
+
+def test_compute_correlations_merges_partial_states(tmp_path):
+    df = pd.DataFrame(
+        {
+            "x": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0],
+            "y": [2.0, 1.0, 4.0, 3.0, 6.0, 5.0, 8.0, 9.0],
+            "cat1": ["a", "a", "b", "b", "c", "c", "a", "b"],
+            "cat2": ["u", "u", "v", "v", "v", "u", "u", "v"],
+        }
+    )
+    full, _ = make_ctx_and_task(
+        task_cls=ComputeCorrelations,
+        current_df=df,
+        global_overrides={"output_dir": str(tmp_path)},
+    )
+    expected = full.run_task(ComputeCorrelations()).data
+
+    task = ComputeCorrelations()
+    task.context = full
+    task.finalize(task.merge([task.partial(df.iloc[:3]), task.partial(df.iloc[3:])]))
+
+    result = task.get_output()
+    assert result.metadata["backend"] == "merged"
+    assert result.data == pytest.approx(expected)
+
+
+def test_cramers_v_matches_chi2_contingency():
+    rng = np.random.default_rng(0)
+    a = pd.Series(rng.choice(list("abcd"), 500))
+    b = pd.Series(np.where(rng.random(500) < 0.5, a, rng.choice(list("xyz"), 500)))
+    b[rng.random(500) < 0.1] = None
+
+    table = pd.crosstab(a, b)
+    chi2 = chi2_contingency(table)[0]
+    expected = (chi2 / table.values.sum() / (min(table.shape) - 1)) ** 0.5
+
+    assert cramers_v(a, b, bias_correction=False) == pytest.approx(expected)
+    assert cramers_v(
+        pl.Series(a.tolist()), pl.Series(b.tolist()), bias_correction=False
+    ) == pytest.approx(expected)
+    # The bias correction only ever shrinks the association
+    assert 0.0 <= cramers_v(a, b) < expected
+
+
+def test_compute_correlations_caps_high_cardinality_columns(tmp_path):
+
+    df = pl.DataFrame(
+        {
+            "color": ["red", "blue", "red", "green"] * 10,
+            "shade": ["dark", "light", "dark", "light"] * 10,
+            "size": ["s", "m", "l", "xl", "xxl"] * 8,
+            "user": [f"u{i}" for i in range(40)],
+        }
+    )
+    ctx, task = make_ctx_and_task(
+        task_cls=ComputeCorrelations,
+        current_df=df,
+        task_overrides={"max_categories": 4},
+        global_overrides={"output_dir": str(tmp_path)},
+    )
+    result = ctx.run_task(task)
+
+    assert set(result.data) == {"color|shade"}
+    assert result.metadata["skipped_categorical_columns"] == {"size": 5, "user": 40}
+
+
+def test_compute_correlations_merge_applies_category_cap(tmp_path):
+    df = pd.DataFrame(
+        {
+            "id": [f"u{i}" for i in range(40)],
+            "big": [f"b{i % 8}" for i in range(40)],
+            "g": ["x", "y"] * 20,
+            "h": ["p", "p", "q", "q"] * 10,
+        }
+    )
+    full, _ = make_ctx_and_task(
+        task_cls=ComputeCorrelations,
+        current_df=df,
+        task_overrides={"max_categories": 5},
+        global_overrides={"output_dir": str(tmp_path)},
+    )
+    expected = full.run_task(ComputeCorrelations(config={"max_categories": 5}))
+
+    task = ComputeCorrelations(config={"max_categories": 5})
+    task.context = full
+    # "id" and "big" fit the cap within each chunk of 4 rows, not once merged
+    states = [task.partial(df.iloc[i : i + 4]) for i in range(0, 40, 4)]
+    assert all("id|big" in state["categorical"] for state in states)
+    task.finalize(task.merge(states))
+
+    result = task.get_output()
+    assert set(result.data) == set(expected.data) == {"g|h"}
+    assert result.data == pytest.approx(expected.data)
+    assert set(result.metadata["skipped_categorical_columns"]) == {"id", "big"}
+
+    # Over-cap columns never reach the state
+    state = task.partial(df)
+    assert state["skipped_categorical"] == {"id": 40, "big": 8}
+    assert set(state["categorical"]) == {"g|h"}
+
+    # Below the cap, all-distinct columns are dropped once merged
+    task = ComputeCorrelations(config={"max_categories": 100})
+    task.context = full
+    task.finalize(task.merge([task.partial(df.iloc[:20]), task.partial(df.iloc[20:])]))
+    assert task.get_output().metadata["skipped_categorical_columns"] == {"id": 40}
+    assert "id|g" not in task.get_output().data
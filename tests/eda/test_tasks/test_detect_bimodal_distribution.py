@@ -4,7 +4,11 @@ import numpy as np
 import pandas as pd
 
 from dsbf.eda.task_result import TaskResult
-from dsbf.eda.tasks.detect_bimodal_distribution import DetectBimodalDistribution
+from dsbf.eda.tasks.detect_bimodal_distribution import (
+    DetectBimodalDistribution,
+    bimodality_coefficient,
+    count_histogram_modes,
+)
 from tests.helpers.context_utils import make_ctx_and_task, run_task_with_dependencies
 
 
@@ -147,3 +151,36 @@ def test_skips_constant_column(tmp_path):
     assert result.status == "success"
     assert result.data is not None
     assert "constant" not in result.data["bimodal_flags"]
+
+
+def test_screening_statistics():
+    rng = np.random.default_rng(0)
+    normal = rng.normal(size=5000)
+    bimodal = np.concatenate([rng.normal(0, 1, 2500), rng.normal(5, 1, 2500)])
+
+    assert bimodality_coefficient(normal) < 5 / 9 < bimodality_coefficient(bimodal)
+    assert count_histogram_modes(normal) == 1
+    assert count_histogram_modes(bimodal) == 2
+
+
+def test_gmm_fitted_only_on_screened_columns(tmp_path):
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame(
+        {
+            "bimodal": np.concatenate([rng.normal(0, 1, 500), rng.normal(6, 1, 500)]),
+            "normal": rng.normal(size=1000),
+        }
+    )
+    ctx, task = make_ctx_and_task(
+        DetectBimodalDistribution,
+        current_df=df,
+        task_overrides={"gmm_sample_size": 300},
+        global_overrides={"output_dir": str(tmp_path)},
+    )
+    result: TaskResult = run_task_with_dependencies(ctx, DetectBimodalDistribution)
+
+    assert result.data["bimodal_flags"] == {"bimodal": True, "normal": False}
+    assert list(result.data["bic_scores"]) == ["bimodal"]
+    assert result.data["screening"]["bimodal"]["passed"]
+    assert not result.data["screening"]["normal"]["passed"]
+    assert result.metadata["gmm_fitted_columns"] == ["bimodal"]
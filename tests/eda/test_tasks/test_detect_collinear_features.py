@@ -3,11 +3,19 @@
 import warnings
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import polars as pl
 import pytest
+from statsmodels.stats.outliers_influence import variance_inflation_factor
 
 from dsbf.eda.task_result import TaskResult
-from dsbf.eda.tasks.detect_collinear_features import DetectCollinearFeatures
+from dsbf.eda.tasks.detect_collinear_features import (
+    DetectCollinearFeatures,
+    nearest_psd_corr,
+    pairwise_complete_corr,
+    vif_from_corr,
+)
 from tests.helpers.context_utils import make_ctx_and_task
 
 
@@ -86,3 +94,87 @@ def test_detect_collinear_features_generates_plot(tmp_path):
     assert interactive["type"] == "correlation"
     assert "annotations" in interactive
     assert any("vif" in a.lower() for a in interactive["annotations"])
+
+
+def test_vif_from_corr_matches_ols_vif():
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=(500, 4)) + 50
+    x[:, 3] = x[:, 0] + 0.5 * x[:, 1] + 0.1 * rng.normal(size=500)
+    with_const = np.column_stack([np.ones(500), x])
+    expected = [variance_inflation_factor(with_const, i) for i in range(1, 5)]
+
+    corr, counts = pairwise_complete_corr(x)
+    vif, eigenvalues = vif_from_corr(corr)
+
+    assert vif == pytest.approx(expected)
+    assert counts.min() == 500
+    assert list(eigenvalues) == sorted(eigenvalues, reverse=True)
+
+    # Exact linear combinations get infinite VIF; unrelated columns do not
+    exact = np.column_stack([x[:, :3], x[:, 0] - x[:, 1]])
+    vif, _ = vif_from_corr(pairwise_complete_corr(exact)[0])
+    assert np.isinf(vif[[0, 1, 3]]).all()
+    assert vif[2] == pytest.approx(1.0, abs=0.05)
+
+
+def test_detect_collinear_features_keeps_rows_with_nulls(tmp_path):
+    rng = np.random.default_rng(1)
+    a = rng.normal(size=200)
+    df = pl.DataFrame(
+        {
+            "a": a,
+            "b": a * 3 + rng.normal(scale=0.05, size=200),
+            "c": rng.normal(size=200),
+            "constant": [1.0] * 200,
+            "sparse": [None] * 199 + [1.0],
+        }
+    ).with_columns(
+        pl.when(pl.int_range(pl.len()) % 2 == 0)
+        .then(None)
+        .otherwise(pl.col("c"))
+        .alias("c")
+    )
+    ctx, task = make_ctx_and_task(
+        task_cls=DetectCollinearFeatures,
+        current_df=df,
+        global_overrides={"output_dir": str(tmp_path)},
+    )
+    result = ctx.run_task(task)
+
+    assert set(result.data["collinear_columns"]) == {"a", "b"}
+    assert result.data["vif_scores"]["c"] < 2
+    assert result.data["condition_number"] > 100
+    assert len(result.data["eigenvalues"]) == 3
+    assert result.metadata["constant_columns"] == ["constant", "sparse"]
+    assert result.metadata["min_pairwise_rows"] == 100
+
+
+def test_detect_collinear_features_repairs_non_psd_correlations(tmp_path):
+    # Each pair of columns is only observed together in its own block of rows
+    rng = np.random.default_rng(0)
+    values = np.full((600, 3), np.nan)
+    for block, (i, j, sign) in enumerate([(0, 1, 1), (0, 2, 1), (1, 2, -1)]):
+        rows = slice(block * 200, (block + 1) * 200)
+        u = rng.normal(size=200)
+        values[rows, i] = u
+        values[rows, j] = sign * u + 0.3 * rng.normal(size=200)
+
+    corr, _ = pairwise_complete_corr(values)
+    assert np.linalg.eigvalsh(corr)[0] < 0
+    repaired, negative = nearest_psd_corr(corr)
+    assert negative == 1
+    assert np.linalg.eigvalsh(repaired)[0] > 0
+    assert np.diag(repaired) == pytest.approx(1.0)
+
+    df = pl.DataFrame(values, schema=["a", "b", "c"], orient="row")
+    ctx, task = make_ctx_and_task(
+        task_cls=DetectCollinearFeatures,
+        current_df=df,
+        global_overrides={"output_dir": str(tmp_path)},
+    )
+    result = ctx.run_task(task)
+
+    assert result.metadata["non_psd"] is True
+    assert result.metadata["min_raw_eigenvalue"] < 0
+    assert all(np.isfinite(v) for v in result.data["vif_scores"].values())
+    assert np.isfinite(result.data["condition_number"])
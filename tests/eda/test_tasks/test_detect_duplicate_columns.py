@@ -1,6 +1,7 @@
 # tests/test_tasks/test_detect_duplicate_columns.py
 
 import pandas as pd
+import polars as pl
 
 from dsbf.eda.task_result import TaskResult
 from dsbf.eda.tasks.detect_duplicate_columns import DetectDuplicateColumns
@@ -32,3 +33,75 @@ def test_detect_duplicate_columns_expected_output():
 
     pairs = result.data.get("duplicate_column_pairs", [])
     assert any(set(pair) == {"a", "b"} for pair in pairs)
+
+
+def test_detect_duplicate_columns_normalises_dtypes_and_nulls():
+    df = pd.DataFrame(
+        {
+            "int": [1, 2, 3, None],  # Float64 with NaN in pandas
+            "float": [1.0, 2.0, 3.0, None],
+            "shifted_null": [1.0, 2.0, None, 4.0],
+            "text": ["x", "y", "x", None],
+            "category": pd.Categorical(["x", "y", "x", None]),
+        }
+    )
+    task = DetectDuplicateColumns()
+    task.set_input(df)
+    task.run()
+
+    assert task.output is not None
+    assert task.output.data["duplicate_column_pairs"] == [
+        ("int", "float"),
+        ("text", "category"),
+    ]
+    assert task.output.data["near_duplicate_column_pairs"] == []
+
+
+def test_detect_duplicate_columns_near_duplicates():
+    df = pd.DataFrame(
+        {
+            "celsius": [10.0, 20.5, 30.0, 15.0],
+            "shifted": [110.0, 120.5, 130.0, 115.0],
+            "grade": ["a", "b", "a", "c"],
+            "label": ["low", "mid", "low", "high"],
+            "constant": [1, 1, 1, 1],
+            "constant_too": [2, 2, 2, 2],
+        }
+    )
+    task = DetectDuplicateColumns(config={"near_duplicates": True})
+    task.set_input(df)
+    task.run()
+
+    assert task.output is not None
+    assert task.output.data["duplicate_column_pairs"] == []
+    assert task.output.data["near_duplicate_column_pairs"] == [
+        {
+            "columns": ["celsius", "shifted"],
+            "relation": "constant_offset",
+            "offset": 100.0,
+        },
+        {"columns": ["grade", "label"], "relation": "category_renaming"},
+    ]
+
+
+def test_detect_duplicate_columns_keeps_large_integers_exact():
+    big = 2**60
+    df = pl.DataFrame(
+        {
+            "a": [big, big + 2, big + 4],
+            "c": [big + 1, big + 3, big + 5],
+            "a_float": [float(big), float(big + 2), float(big + 4)],
+            "small": [1, 2, 3],
+            "small_float": [1.0, 2.0, 3.0],
+        }
+    )
+    task = DetectDuplicateColumns(config={"near_duplicates": True})
+    task.set_input(df)
+    task.run()
+
+    assert task.output is not None
+    # float(big + 2) == float(big): only the exact integer pair matches
+    assert task.output.data["duplicate_column_pairs"] == [("small", "small_float")]
+    assert {"columns": ["a", "c"], "relation": "constant_offset", "offset": 1.0} in (
+        task.output.data["near_duplicate_column_pairs"]
+    )
@@ -167,3 +167,20 @@ def test_detects_high_entropy_column_without_regex_match():
     assert "hashy" in result.summary["columns"]
     assert result.data is not None
     assert result.data["hashy"]["match_type"] == "high_entropy"
+
+
+def test_variable_length_column_still_pattern_matched():
+    # Length spread rules out the entropy check; the hex pattern still applies
+    values = ["a" * (i % 7 + 1) + "0f" * i for i in range(20)]
+    df = pl.DataFrame({"blob": values})
+
+    ctx, task = make_ctx_and_task(
+        task_cls=DetectEncodedColumns,
+        current_df=df,
+        task_overrides={"min_entropy": 0.5},
+    )
+    result = ctx.run_task(task)
+
+    assert result.data["blob"]["match_type"] == "hex"
+    assert result.data["blob"]["length_std"] > 2.0
+    assert 0 < result.data["blob"]["entropy"] < 2
@@ -44,3 +44,21 @@ def test_detect_id_columns_handles_no_ids():
 
     assert result.status == "success"
     assert result.data == {}
+
+
+def test_detect_id_columns_compares_sample_counts_to_sample_rows():
+    df = pd.DataFrame({"id": range(100), "group": [1, 2] * 50})
+
+    ctx, task = make_ctx_and_task(task_cls=DetectIdColumns, current_df=df)
+    # Head sample of a larger source that has no distinct counts
+    ctx.set_metadata("source_stats", {"num_rows": 1_000, "columns": {}})
+    result = ctx.run_task(task)
+    assert list(result.data) == ["id"]
+
+    # Exact source distinct counts are compared to the source row count
+    ctx, task = make_ctx_and_task(task_cls=DetectIdColumns, current_df=df)
+    ctx.set_metadata(
+        "source_stats", {"num_rows": 1_000, "columns": {"id": {"n_unique": 500}}}
+    )
+    result = ctx.run_task(task)
+    assert result.data == {}
@@ -32,3 +32,31 @@ def test_detect_out_of_bounds_expected_output():
     assert "score" in result.data
     assert "percent" in result.data
     assert "weight" not in result.data  # no default rule for weight
+
+
+def test_detect_out_of_bounds_uses_source_stats():
+    df = pd.DataFrame({"age": [25, 30, 40], "percent": [50, 110, 20]})
+
+    ctx, task = make_ctx_and_task(
+        task_cls=DetectOutOfBounds,
+        current_df=df,
+    )
+    ctx.set_metadata(
+        "source_stats",
+        {
+            "source": "parquet_footer",
+            "num_rows": 3,
+            "columns": {
+                "age": {"min": 25, "max": 40},
+                "percent": {"min": 20, "max": 110},
+            },
+        },
+    )
+    result = ctx.run_task(task)
+
+    assert result.data is not None
+    assert "age" not in result.data
+    assert result.metadata["source_stat_columns"] == ["age"]
+
+    # Footer shows a possible violation, so the column is still scanned
+    assert result.data["percent"]["count"] == 1
@@ -148,3 +148,19 @@ def test_detect_outliers_with_plots(tmp_path):
     assert isinstance(interactive, dict)
     assert "annotations" in interactive
     assert any("Outliers detected" in a for a in interactive["annotations"])
+
+
+def test_detect_outliers_approximate_mode(tmp_path):
+    df = pd.DataFrame({"x": list(range(1, 200)) + [10_000]})
+
+    ctx, task = make_ctx_and_task(
+        task_cls=DetectOutliers,
+        current_df=df,
+        global_overrides={"output_dir": str(tmp_path), "engine": {"approximate": True}},
+    )
+    result = ctx.run_task(task)
+
+    assert result.status == "success"
+    assert result.data["outlier_counts"]["x"] == 1
+    assert result.metadata["approximate"] is True
+    assert result.metadata["quantile_rank_error"] < 0.02
@@ -51,3 +51,45 @@ def test_ignores_columns_not_in_config():
     assert result is not None
     assert result.status == "success"
     assert result.summary["num_columns_with_violations"] == 0
+
+
+def test_unstructured_columns_are_not_checked_and_matches_are_anchored():
+    df = pl.DataFrame(
+        {
+            "zip": ["12345", "54321", "123456", "00000", None] * 4,
+            "code": ["abc", "def", "123", "ghi", "jkl"] * 4,
+        }
+    )
+
+    ctx, task = make_ctx_and_task(
+        task_cls=DetectRegexFormatViolations,
+        current_df=df,
+        task_overrides={
+            "custom_patterns": {"zip": r"\d{5}", "code": r"\d+"},
+            "match_threshold": 0.6,
+            "max_violations": 2,
+        },
+    )
+    result = ctx.run_task(task)
+
+    assert result.summary["columns"] == ["zip"]
+    assert result.summary["violations"]["zip"]["num_violations"] == 4
+    assert result.data["zip"] == ["123456", "123456"]
+    assert result.metadata["unstructured_columns"] == ["code"]
+    assert result.metadata["sample_match_rates"]["zip"] == 0.75
+
+
+def test_python_regex_fallback_for_lookarounds():
+    df = pl.DataFrame({"sku": ["AB-1", "AB-2", "XY-3", "AB-4"]})
+
+    ctx, task = make_ctx_and_task(
+        task_cls=DetectRegexFormatViolations,
+        current_df=df,
+        task_overrides={"custom_patterns": {"sku": r"(?=AB)[A-Z]{2}-\d"}},
+    )
+    result = ctx.run_task(task)
+
+    assert result.summary["violations"]["sku"] == {
+        "num_violations": 1,
+        "sample_violations": ["XY-3"],
+    }
@@ -1,10 +1,12 @@
 # tests/eda/test_tasks/test_infer_types.py
 
 import pandas as pd
+import polars as pl
 import pytest
 
 from dsbf.eda.task_result import TaskResult
-from dsbf.eda.tasks.infer_types import InferTypes
+from dsbf.eda.tasks import infer_types
+from dsbf.eda.tasks.infer_types import InferTypes, stratified_positions
 from tests.helpers.context_utils import make_ctx_and_task
 
 
@@ -36,3 +38,60 @@ def test_infer_types_expanded_output():
     assert result.data["bool"]["analysis_intent_dtype"] == "categorical"
     assert result.data["datetime_str"]["analysis_intent_dtype"] == "datetime"
     assert result.data["text"]["analysis_intent_dtype"] in ("id", "text", "categorical")
+
+
+def test_stratified_positions_cover_every_stratum():
+    positions = stratified_positions(1000, 10, seed=1)
+    assert list(positions // 100) == list(range(10))
+    assert list(stratified_positions(1000, 10, seed=1)) == list(positions)
+    assert list(stratified_positions(5, 10)) == [0, 1, 2, 3, 4]
+
+
+def test_unsampled_rows_decide_datetime(monkeypatch):
+    monkeypatch.setattr(infer_types, "_TYPE_CACHE", {})
+    dates = ["2023-01-01"] * 999 + ["not a date"]
+    df = pl.DataFrame({"date": dates, "empty": pl.Series([None] * 1000, dtype=pl.Utf8)})
+
+    ctx, task = make_ctx_and_task(
+        task_cls=InferTypes, current_df=df, task_overrides={"sample_size": 50}
+    )
+    result = ctx.run_task(task)
+    assert result.data["date"]["analysis_intent_dtype"] != "datetime"
+    assert result.data["empty"]["analysis_intent_dtype"] == "unknown"
+
+    ctx, task = make_ctx_and_task(
+        task_cls=InferTypes,
+        current_df=df,
+        task_overrides={"sample_size": 50, "max_parse_failures": 1},
+    )
+    result = ctx.run_task(task)
+    assert result.data["date"]["analysis_intent_dtype"] == "datetime"
+
+
+def test_inferred_types_cached_across_runs(tmp_path, monkeypatch):
+    monkeypatch.setattr(infer_types, "_TYPE_CACHE", {})
+    df = pl.DataFrame({"x": list(range(100)), "s": ["a", "b"] * 50})
+    overrides = {"cache_dir": str(tmp_path)}
+
+    ctx, task = make_ctx_and_task(InferTypes, df, task_overrides=overrides)
+    first = ctx.run_task(task)
+    assert first.metadata["cache_hits"] == 0
+    assert (tmp_path / infer_types.TYPE_CACHE_FILE).exists()
+
+    # A new process starts with an empty in-memory cache
+    monkeypatch.setattr(infer_types, "_TYPE_CACHE", {})
+    ctx, task = make_ctx_and_task(InferTypes, df, task_overrides=overrides)
+    second = ctx.run_task(task)
+    assert second.metadata["cache_hits"] == 2
+    assert second.data == first.data
+
+    changed = df.with_columns(pl.col("s").replace("b", "c"))
+    ctx, task = make_ctx_and_task(InferTypes, changed, task_overrides=overrides)
+    assert ctx.run_task(task).metadata["cache_hits"] == 1
+
+    # Settings that change the parse checks invalidate cached types
+    for setting in ({"parse_probe_rows": 10}, {"chunk_rows": 50}):
+        ctx, task = make_ctx_and_task(
+            InferTypes, df, task_overrides={**overrides, **setting}
+        )
+        assert ctx.run_task(task).metadata["cache_hits"] == 0
@@ -121,3 +121,25 @@ def test_suggest_numerical_binning_generates_plot(tmp_path):
         "skewness" in a.lower() or "suggested" in a.lower()
         for a in interactive["annotations"]
     )
+
+
+def test_approximate_mode_matches_exact_suggestion(tmp_path):
+    df = pl.DataFrame({"feature": [1] * 50 + [1000] * 10})
+
+    suggestions = {}
+    for approximate in (False, True):
+        ctx, task = make_ctx_and_task(
+            task_cls=SuggestNumericalBinning,
+            current_df=df,
+            task_overrides={"skew_threshold": 1.0},
+            global_overrides={
+                "output_dir": str(tmp_path),
+                "engine": {"approximate": approximate, "sketches": {"chunk_rows": 7}},
+            },
+        )
+        result = ctx.run_task(task)
+        assert result.status == "success"
+        suggestions[approximate] = result.data["binning_suggestions"]["feature"]
+
+    assert suggestions[True] == suggestions[False]
+    assert result.metadata["approximate"] is True
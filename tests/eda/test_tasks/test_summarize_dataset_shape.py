@@ -24,3 +24,18 @@ def test_summarize_dataset_shape_expected_output():
     assert result.data["num_columns"] == 2
     assert 0 < result.data["null_cell_percentage"] < 1
     assert "approx_memory_MB" in result.data
+
+
+def test_summarize_dataset_shape_partial_footer_uses_sample_cells():
+    # Head sample of a 8-row file; the float column has no footer null count
+    df = pd.DataFrame({"a": [1, None, 3, None], "b": ["x", "y", None, "z"]})
+
+    ctx, task = make_ctx_and_task(task_cls=SummarizeDatasetShape, current_df=df)
+    ctx.set_metadata(
+        "source_stats", {"num_rows": 8, "columns": {"b": {"null_count": 1}}}
+    )
+    result = ctx.run_task(task)
+
+    assert result.data["num_rows"] == 8
+    assert result.data["null_cell_percentage"] == 3 / 8
+    assert result.metadata["stats_source"] == "data"
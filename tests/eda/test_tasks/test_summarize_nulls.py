@@ -79,3 +79,57 @@ def test_summarize_nulls_with_plots(tmp_path):
     assert isinstance(interactive, dict)
     assert "annotations" in interactive
     assert any("fully null" in ann.lower() for ann in interactive["annotations"])
+
+
+def test_summarize_nulls_partial_merge_matches_run(tmp_path):
+    df = pd.DataFrame(
+        {"a": [None, 1, None, 1], "b": [1.0, float("nan"), None, 1.0], "c": [1] * 4}
+    )
+    ctx, task = make_ctx_and_task(
+        task_cls=SummarizeNulls,
+        current_df=df,
+        global_overrides={"output_dir": str(tmp_path)},
+    )
+    expected = ctx.run_task(task).data
+
+    # The second chunk lacks column 'c', which counts as missing there
+    state = task.merge([task.partial(df[:2]), task.partial(df[2:][["a", "b"]])])
+    task.finalize(state)
+
+    assert task.output is not None
+    assert task.output.data["null_counts"] == {"a": 2, "b": 2, "c": 2}
+    assert task.output.data["null_patterns"] == {"100": 1, "010": 1, "111": 1, "001": 1}
+    assert task.output.metadata["null_patterns_exact"] is True
+    assert task.output.data["null_counts"]["a"] == expected["null_counts"]["a"]
+
+
+def test_summarize_nulls_reports_top_patterns_only():
+    df = pd.DataFrame({"a": [None, None, None, 1], "b": [1, None, 1, 1]})
+    task = SummarizeNulls(config={"pattern_capacity": 2})
+    task.set_input(df)
+    task.run()
+
+    assert task.output is not None
+    assert task.output.data["null_patterns"] == {"10": 2, "00": 1}
+    assert task.output.metadata["distinct_null_patterns"] == 3
+
+
+def test_summarize_nulls_sampled_counts_share_one_scope():
+    df = pd.DataFrame({"a": [1.0, None, 3.0, None], "b": ["x", "y", None, "z"]})
+    footer = {"b": {"null_count": 5}}
+
+    ctx, task = make_ctx_and_task(task_cls=SummarizeNulls, current_df=df)
+    ctx.set_metadata("source_stats", {"num_rows": 8, "columns": footer})
+    result = ctx.run_task(task)
+    assert result.data["null_counts"] == {"a": 2, "b": 1}
+    assert result.data["null_percentages"] == {"a": 0.5, "b": 0.25}
+    assert result.metadata["null_counts_scope"] == "sample"
+    assert result.metadata["source_stat_columns"] == []
+
+    footer["a"] = {"null_count": 4}
+    ctx, task = make_ctx_and_task(task_cls=SummarizeNulls, current_df=df)
+    ctx.set_metadata("source_stats", {"num_rows": 8, "columns": footer})
+    result = ctx.run_task(task)
+    assert result.data["null_counts"] == {"a": 4, "b": 5}
+    assert result.metadata["rows"] == 8
+    assert result.metadata["null_counts_scope"] == "source"
@@ -4,6 +4,7 @@ from pathlib import Path
 
 import pandas as pd
 import polars as pl
+import pytest
 
 from dsbf.eda.task_result import TaskResult
 from dsbf.eda.tasks.summarize_numeric import SummarizeNumeric
@@ -161,3 +162,49 @@ def test_summarize_numeric_with_polars_input(tmp_path):
     assert isinstance(static_path, Path)
     assert static_path.exists()
     static_path.unlink()
+
+
+def test_summarize_numeric_partial_merge_matches_run(tmp_path):
+    df = pd.DataFrame({"a": [1.0, 2.0, None, 4.0, 5.0, 6.0], "b": list("xyzxyz")})
+    ctx, task = make_ctx_and_task(
+        task_cls=SummarizeNumeric,
+        current_df=df,
+        global_overrides={"output_dir": str(tmp_path)},
+    )
+    expected = ctx.run_task(task).data
+
+    state = task.merge(
+        [task.partial(df.iloc[:3]), task.partial(pl.from_pandas(df[3:]))]
+    )
+    task.finalize(state)
+
+    assert task.output is not None
+    assert set(task.output.data) == {"a"}
+    for key in ("count", "mean", "std", "min", "25%", "50%", "max"):
+        assert task.output.data["a"][key] == pytest.approx(expected["a"][key])
+
+
+def test_summarize_numeric_reports_source_stats_separately(tmp_path):
+    df = pl.DataFrame({"a": [1.0, 2.0, 3.0, 4.0]})
+    ctx, task = make_ctx_and_task(
+        task_cls=SummarizeNumeric,
+        current_df=df,
+        global_overrides={"output_dir": str(tmp_path)},
+    )
+    source_stats = {"non_null_count": 400, "mean": 50.0, "min": 0.0, "max": 99.0}
+    ctx.set_metadata(
+        "source_stats",
+        {"source": "sql", "num_rows": 400, "columns": {"a": source_stats}},
+    )
+    result = ctx.run_task(task)
+
+    assert result.data is not None
+    assert result.data["a"]["count"] == 4 and result.data["a"]["max"] == 4.0
+    assert result.data["a"]["source_stats"] == {
+        "count": 400,
+        "mean": 50.0,
+        "min": 0.0,
+        "max": 99.0,
+    }
+    assert result.metadata["source_stat_columns"] == ["a"]
+    assert result.metadata["source_stats_source"] == "sql"
@@ -75,3 +75,23 @@ def test_summarize_unique_with_plots(tmp_path):
     assert isinstance(interactive, dict)
     assert "annotations" in interactive
     assert any("constant" in ann.lower() for ann in interactive["annotations"])
+
+
+def test_summarize_unique_approximate_mode():
+    df = pd.DataFrame({"id": range(5000), "group": [i % 7 for i in range(5000)]})
+
+    ctx, task = make_ctx_and_task(
+        task_cls=SummarizeUnique,
+        current_df=df,
+        global_overrides={
+            "engine": {"approximate": True, "sketches": {"chunk_rows": 1000}}
+        },
+    )
+    result = ctx.run_task(task)
+
+    assert result.status == "success"
+    assert result.data["group"] == 7
+    error = result.metadata["distinct_count_relative_error"]
+    assert error == pytest.approx(1.04 / 2**7)
+    assert result.data["id"] == pytest.approx(5000, rel=4 * error)
+    assert result.metadata["approximate"] is True
@@ -111,3 +111,22 @@ def test_summarize_value_counts_empty_df(tmp_path):
     assert result.status == "success"
     assert result.data == {}
     assert result.plots == {}
+
+
+def test_summarize_value_counts_merge_marks_approximation(tmp_path):
+    df = pd.DataFrame(
+        {"small": ["a", "b"] * 50, "wide": [f"v{i % 20}" for i in range(100)]}
+    )
+    ctx, _ = make_ctx_and_task(
+        task_cls=SummarizeValueCounts,
+        current_df=df,
+        global_overrides={"output_dir": str(tmp_path)},
+    )
+    task = SummarizeValueCounts(config={"top_k_capacity": 10})
+    task.context = ctx
+    task.finalize(task.merge([task.partial(df.iloc[:50]), task.partial(df.iloc[50:])]))
+
+    result = task.get_output()
+    assert result.data["small"] == {"a": 50, "b": 50}
+    assert result.metadata["approximate"] is True
+    assert result.metadata["approximate_columns"] == ["wide"]
@@ -62,6 +62,18 @@ def test_get_column_type_info_merges_both_dtypes():
     assert out["a"]["analysis_intent_dtype"] == "continuous"
 
 
+def test_get_plot_max_rows_prefers_task_then_engine():
+    ctx = AnalysisContext(
+        data=pd.DataFrame(), config={"engine": {"plot_max_rows": 1_000}}
+    )
+    task = DummyTask(name="dummy")
+    assert task.get_plot_max_rows() is None
+    task.context = ctx
+    assert task.get_plot_max_rows() == 1_000
+    task.config = {"plot_max_rows": 0}
+    assert task.get_plot_max_rows() == 0
+
+
 def test_get_expected_types_from_registry_gracefully_handles_missing():
     task = DummyTask(name="dummy")
     # Should not raise even if not registered
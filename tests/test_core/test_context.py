@@ -94,3 +94,69 @@ def test_compute_reliability_flags_works_with_polars():
     ctx.compute_reliability_flags(df)
     assert isinstance(ctx.reliability_flags, dict)
     assert "n_rows" in ctx.reliability_flags
+
+
+class RowCountingTask(BaseTask):
+    def run(self):
+        self.output = TaskResult(
+            name=self.name, data={"rows": self.input_data.shape[0]}
+        )
+
+
+def test_run_task_serves_max_rows_from_shared_pool():
+    df = pl.DataFrame({"x": range(10_000)})
+    ctx = AnalysisContext(data=df)
+
+    capped = RowCountingTask(name="capped", config={"max_rows": 500})
+    same_cap = RowCountingTask(name="same_cap", config={"max_rows": 500})
+    larger = RowCountingTask(name="larger", config={"max_rows": 2_000})
+    full = RowCountingTask(name="full", config={"max_rows": 0})
+
+    assert ctx.run_task(capped).data == {"rows": 500}
+    ctx.run_task(same_cap)
+    ctx.run_task(larger)
+    assert ctx.run_task(full).data == {"rows": 10_000}
+
+    # Same size is reused; smaller samples nest inside larger ones
+    assert same_cap.input_data is capped.input_data
+    assert set(capped.input_data["x"]).issubset(set(larger.input_data["x"]))
+    assert capped.input_data["x"].is_sorted()
+    assert full.input_data is df
+
+    assert ctx.results["capped"].metadata["sampled_rows"] == 500
+    assert ctx.results["capped"].metadata["source_rows"] == 10_000
+    assert "sampled_rows" not in ctx.results["full"].metadata
+    assert ctx.get_metadata("task_rows") == {
+        "capped": 500,
+        "same_cap": 500,
+        "larger": 2_000,
+    }
+
+
+def test_run_task_projects_declared_columns(tmp_path):
+    from dsbf.eda.tasks.detect_class_imbalance import DetectClassImbalance
+    from dsbf.eda.tasks.detect_zeros import DetectZeros
+
+    df = pl.DataFrame({"x": [0, 1, 2], "y": [0.0, 0.5, 0.0], "label": ["a", "b", "a"]})
+    ctx = AnalysisContext(data=df, output_dir=str(tmp_path))
+
+    zeros = DetectZeros(name="detect_zeros")
+    ctx.run_task(zeros)
+    assert zeros.input_data.columns == ["x", "y"]
+    assert ctx.results["detect_zeros"].metadata["input_columns"] == 2
+
+    imbalance = DetectClassImbalance(
+        name="detect_class_imbalance", config={"target_column": "label"}
+    )
+    ctx.run_task(imbalance)
+    assert imbalance.input_data.columns == ["label"]
+
+    # Tasks sharing a projection share one view; opting out serves the full frame
+    again = DetectZeros(name="again")
+    ctx.run_task(again)
+    assert again.input_data is zeros.input_data
+
+    ctx.config = {"engine": {"column_projection": False}}
+    unprojected = DetectZeros(name="unprojected")
+    ctx.run_task(unprojected)
+    assert unprojected.input_data is df
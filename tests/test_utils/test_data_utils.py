@@ -1,9 +1,15 @@
 # tests/test_utils/test_data_utils.py
 
 import pandas as pd
+import polars as pl
 import pytest
 
-from dsbf.utils.data_utils import data_sampling
+from dsbf.utils.data_utils import (
+    ReservoirSampler,
+    allocate_strata,
+    data_sampling,
+    reservoir_sample_lazy,
+)
 
 
 @pytest.mark.parametrize(
@@ -35,3 +41,98 @@ def test_data_sampling_behavior(n_rows, strategy, expected_rows):
         assert "strategy" in info
     else:
         assert info is None
+
+
+def _sampling_config(strategy, **extra):
+    return {
+        "resource_limits": {
+            "sample_threshold_rows": 1_000,
+            "sample_strategy": strategy,
+            **extra,
+        }
+    }
+
+
+@pytest.mark.parametrize("backend", ["polars", "pandas"])
+def test_stratified_sampling_keeps_class_proportions(backend):
+    df = pl.DataFrame({"target": [0] * 9_000 + [1] * 990 + [None] * 10})
+    if backend == "pandas":
+        df = df.to_pandas()
+    config = _sampling_config("stratified", stratify_column="target", sample_seed=7)
+
+    sampled_df, info = data_sampling(df, config)
+    again, _ = data_sampling(df, config)
+
+    counts = pl.from_pandas(sampled_df) if backend == "pandas" else sampled_df
+    counts = dict(counts["target"].value_counts().iter_rows())
+    assert len(sampled_df) == 1_000
+    assert {k if k == k else None: v for k, v in counts.items()} == {
+        0: 900,
+        1: 99,
+        None: 1,
+    }
+    assert info["strategy"] == "stratified"
+    assert info["stratify_column"] == "target"
+    assert info["sampling_fraction"] == pytest.approx(0.1)
+    assert again.equals(sampled_df)
+
+
+def test_stratified_without_column_falls_back_to_seeded_random():
+    df = pl.DataFrame({"x": range(5_000)})
+
+    first, info = data_sampling(df, _sampling_config("stratified"))
+    second, _ = data_sampling(df, _sampling_config("stratified"))
+
+    assert info["strategy"] == "random"
+    assert first.equals(second)
+    assert first["x"].is_sorted()
+    assert not first.equals(df.head(1_000))
+
+
+def test_reservoir_sample_is_independent_of_batching():
+    df = pl.DataFrame({"x": range(10_000)})
+
+    sampler = ReservoirSampler(500, seed=3)
+    for batch in df.iter_slices(777):
+        sampler.update(batch)
+    lazy_sample, total = reservoir_sample_lazy(df.lazy(), 500, seed=3)
+    _, info = data_sampling(df, _sampling_config("reservoir", sample_seed=3))
+
+    assert total == 10_000
+    assert sampler.sample().height == 500
+    assert sampler.sample().equals(lazy_sample)
+    assert info["sampled_rows"] == 1_000
+    assert info["strategy"] == "reservoir"
+    # Uniform over the stream, not biased toward the start
+    assert 4_000 < sampler.sample()["x"].mean() < 6_000
+
+
+def test_allocate_strata_sums_to_n_and_keeps_rare_strata():
+    quotas = allocate_strata([9_000, 990, 10], 1_000)
+    assert sum(quotas) == 1_000
+    assert quotas[-1] >= 1
+    assert allocate_strata([3, 3, 4], 5) == [2, 1, 2]
+
+
+def test_allocate_strata_with_more_strata_than_rows():
+    sizes = [1] * 10_000 + [50, 40]
+    quotas = allocate_strata(sizes, 1_000)
+    assert sum(quotas) == 1_000
+    assert quotas[-2:] == [4, 3]
+    assert quotas[:10_000].count(1) == 993
+
+
+@pytest.mark.parametrize("backend", ["polars", "pandas"])
+def test_stratified_sampling_bins_high_cardinality_numeric(backend):
+    df = pl.DataFrame({"target": [i * 0.5 for i in range(20_000)]})
+    if backend == "pandas":
+        df = df.to_pandas()
+    config = _sampling_config("stratified", stratify_column="target")
+
+    sampled_df, info = data_sampling(df, config)
+
+    assert len(sampled_df) == 1_000
+    assert info["stratify_bins"] == 20
+    # Each quantile bin keeps its 5% share of the sample
+    bins = (pl.Series(list(sampled_df["target"])) // 500).value_counts()
+    assert set(bins["count"].to_list()) == {50}
@@ -0,0 +1,147 @@
+# tests/test_utils/test_filesystem.py
+
+import io
+import os
+import stat
+
+import numpy as np
+import polars as pl
+import pytest
+
+from dsbf.utils import filesystem
+from dsbf.utils.filesystem import (
+    BlockCache,
+    LocalFileSystem,
+    RemoteFile,
+    get_filesystem,
+    is_remote_path,
+    read_remote_parquet,
+    read_remote_table,
+    register_filesystem,
+)
+
+
+class CountingFileSystem(LocalFileSystem):
+    """Local filesystem that records every ranged read."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.reads = []
+
+    def read_range(self, path, start, length):
+        self.reads.append((start, length))
+        return super().read_range(path, start, length)
+
+
+@pytest.fixture
+def parquet_file(tmp_path):
+    path = tmp_path / "data.parquet"
+    pl.DataFrame({"x": list(range(10_000)), "y": ["a", "b"] * 5_000}).write_parquet(
+        path, row_group_size=1_000
+    )
+    return str(path)
+
+
+def test_scheme_detection_and_registry(monkeypatch):
+    assert is_remote_path("s3://bucket/key.parquet")
+    assert not is_remote_path("data/local.csv")
+    assert not is_remote_path("file:///tmp/data.csv")
+
+    # Register into a copy so the global registry is restored afterwards
+    monkeypatch.setattr(filesystem, "FILESYSTEMS", dict(filesystem.FILESYSTEMS))
+    register_filesystem("mem", CountingFileSystem)
+    assert isinstance(get_filesystem("mem://x"), CountingFileSystem)
+
+    with pytest.raises(ValueError):
+        get_filesystem("unknown://bucket/key")
+
+
+def test_block_cache_reads_through_once(tmp_path, parquet_file):
+    fs = CountingFileSystem()
+    cache = BlockCache(fs, cache_dir=str(tmp_path / "cache"), block_size=1024)
+
+    data = cache.read(parquet_file, 1000, 2000)
+    assert data == open(parquet_file, "rb").read()[1000:3000]
+    reads_after_first = len(fs.reads)
+
+    assert cache.read(parquet_file, 1500, 100) == data[500:600]
+    assert len(fs.reads) == reads_after_first  # served from cache
+
+
+def test_block_cache_defaults_to_private_user_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    cache = BlockCache(CountingFileSystem())
+
+    assert cache.cache_dir == str(tmp_path / "xdg" / "dsbf")
+    assert stat.S_IMODE(os.stat(cache.cache_dir).st_mode) == 0o700
+
+
+def test_block_cache_evicts_least_recently_used_blocks(tmp_path, parquet_file):
+    fs = CountingFileSystem()
+    cache_dir = tmp_path / "cache"
+    cache = BlockCache(
+        fs, cache_dir=str(cache_dir), block_size=1024, max_bytes=3 * 1024
+    )
+    (cache_dir / "notes.txt").write_text("not a block")
+
+    for index in range(3):
+        cache.read(parquet_file, index * 1024, 1024)
+        os.utime(cache._block_path(parquet_file, index), ns=(index, index))
+    cache.read(parquet_file, 0, 1024)  # Hit: block 0 is now the most recent
+    cache.read(parquet_file, 3 * 1024, 1024)  # Over the cap: evicts block 1
+
+    assert not os.path.exists(cache._block_path(parquet_file, 1))
+    assert (cache_dir / "notes.txt").exists()
+    reads = len(fs.reads)
+    cache.read(parquet_file, 0, 1024)
+    assert len(fs.reads) == reads
+    cache.read(parquet_file, 1024, 1024)
+    assert len(fs.reads) == reads + 1
+
+
+def test_remote_file_is_seekable(tmp_path, parquet_file):
+    cache = BlockCache(CountingFileSystem(), cache_dir=str(tmp_path / "cache"))
+    f = RemoteFile(cache, parquet_file)
+
+    f.seek(-4, io.SEEK_END)
+    assert f.read() == b"PAR1"
+    assert f.tell() == cache.size(parquet_file)
+
+
+def test_read_remote_parquet_fetches_only_needed_row_groups(tmp_path):
+    path = str(tmp_path / "large.parquet")
+    rng = np.random.default_rng(0)
+    pl.DataFrame({"x": rng.random(200_000)}).write_parquet(
+        path, row_group_size=20_000, compression="uncompressed"
+    )
+
+    fs = CountingFileSystem()
+    cache = BlockCache(fs, cache_dir=str(tmp_path / "cache"), block_size=65_536)
+
+    head = read_remote_parquet(path, cache, n_rows=30_000, max_workers=2)
+    partial_bytes = sum(length for _, length in fs.reads)
+
+    assert head.height == 30_000
+    assert partial_bytes < cache.size(path) / 2
+
+    full = read_remote_parquet(path, cache, max_workers=4)
+    assert full.height == 200_000
+
+
+def test_s3_parquet_with_moto(tmp_path, parquet_file):
+    boto3 = pytest.importorskip("boto3")
+    moto = pytest.importorskip("moto")
+
+    with moto.mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket="lake")
+        client.upload_file(parquet_file, "lake", "events/data.parquet")
+
+        fs = get_filesystem(
+            "s3://lake/events/data.parquet", {"s3": {"region_name": "us-east-1"}}
+        )
+        cache = BlockCache(fs, cache_dir=str(tmp_path / "cache"), block_size=4096)
+        df = read_remote_table("s3://lake/events/data.parquet", cache, n_rows=2_000)
+
+        assert df.height == 2_000
+        assert cache.remote_reads > 0
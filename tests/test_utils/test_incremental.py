@@ -0,0 +1,115 @@
+# tests/test_utils/test_incremental.py
+
+import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from dsbf.utils.incremental import fingerprint_source, plan_appended_partitions
+from dsbf.utils.partition_utils import read_row_partition
+
+
+def _write_csv(path, start, stop):
+    pl.DataFrame({"x": list(range(start, stop))}).write_csv(path)
+
+
+def test_csv_append_plans_only_new_rows(tmp_path):
+    path = tmp_path / "log.csv"
+    _write_csv(path, 0, 1_000)
+    before = fingerprint_source(str(path))
+
+    with open(path, "a") as f:
+        f.writelines(f"{i}\n" for i in range(1_000, 1_250))
+
+    pieces, after, reason = plan_appended_partitions(str(path), before, 100)
+    assert reason == "append-only"
+    frames = [read_row_partition(p) for p in pieces]
+    assert [df.height for df in frames] == [100, 100, 50]
+    assert pl.concat(frames)["x"].to_list() == list(range(1_000, 1_250))
+    assert (
+        after["files"][str(path)] == fingerprint_source(str(path))["files"][str(path)]
+    )
+
+    pieces, _, reason = plan_appended_partitions(str(path), after, 100)
+    assert pieces == [] and reason == "append-only"
+
+
+def test_csv_append_to_unterminated_row_is_not_an_append(tmp_path):
+    path = tmp_path / "log.csv"
+    path.write_text("x\n1\n2")
+    before = fingerprint_source(str(path))
+    assert before["files"][str(path)]["rows"] == 2
+
+    with open(path, "a") as f:
+        f.write("3\n4\n")  # Turns the old last row "2" into "23"
+
+    pieces, _, reason = plan_appended_partitions(str(path), before, 100)
+    assert pieces is None and reason.startswith("file rewritten")
+
+
+def test_csv_rewrite_is_not_an_append(tmp_path):
+    path = tmp_path / "log.csv"
+    _write_csv(path, 0, 1_000)
+    before = fingerprint_source(str(path))
+    _write_csv(path, 5, 1_100)
+
+    pieces, _, reason = plan_appended_partitions(str(path), before, 100)
+    assert pieces is None and reason.startswith("file rewritten")
+
+
+def test_partitioned_directory_picks_up_new_files(tmp_path):
+    root = tmp_path / "events"
+    for day in ("2025-07-01", "2025-07-02"):
+        (root / f"date={day}").mkdir(parents=True)
+        pl.DataFrame({"x": [1, 2, 3]}).write_parquet(
+            root / f"date={day}" / "part-0.parquet"
+        )
+    before = fingerprint_source(str(root))
+
+    (root / "date=2025-07-03").mkdir()
+    pl.DataFrame({"x": [4, 5]}).write_parquet(
+        root / "date=2025-07-03" / "part-0.parquet"
+    )
+    pieces, _, _ = plan_appended_partitions(str(root), before, 100)
+    assert len(pieces) == 1 and pieces[0].values == {"date": "2025-07-03"}
+
+    (root / "date=2025-07-01" / "part-0.parquet").unlink()
+    pieces, _, reason = plan_appended_partitions(str(root), before, 100)
+    assert pieces is None and reason.startswith("file removed")
+
+
+def test_csv_same_length_edit_is_not_an_append(tmp_path):
+    path = tmp_path / "log.csv"
+    _write_csv(path, 0, 100_000)
+    before = fingerprint_source(str(path))
+
+    text = path.read_text()
+    middle = text.index("\n50000\n")
+    path.write_text(text[:middle] + "\n50001\n" + text[middle + 7 :] + "7\n")
+
+    pieces, _, reason = plan_appended_partitions(str(path), before, 100)
+    assert pieces is None and reason.startswith("file rewritten")
+
+
+def test_parquet_rewrite_with_same_row_counts_is_not_an_append(tmp_path):
+    path = tmp_path / "x.parquet"
+    pl.DataFrame({"x": list(range(1_000))}).write_parquet(path)
+    before = fingerprint_source(str(path))
+
+    pieces, _, reason = plan_appended_partitions(str(path), before, 100)
+    assert pieces == [] and reason == "append-only"
+
+    pl.DataFrame({"x": list(range(1, 1_001))}).write_parquet(path)
+    pieces, _, reason = plan_appended_partitions(str(path), before, 100)
+    assert pieces is None and reason.startswith("file rewritten")
+
+
+def test_parquet_appended_row_groups_are_planned(tmp_path):
+    path = tmp_path / "x.parquet"
+    table = pa.table({"x": list(range(1_000))})
+    pq.write_table(table, path, row_group_size=500)
+    before = fingerprint_source(str(path))
+
+    pq.write_table(pa.concat_tables([table, table.slice(0, 300)]), path, 500)
+    pieces, _, reason = plan_appended_partitions(str(path), before, 100)
+    assert reason == "append-only"
+    assert [p.row_groups for p in pieces] == [[2]]
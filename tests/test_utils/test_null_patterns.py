@@ -0,0 +1,40 @@
+# tests/test_utils/test_null_patterns.py
+
+import numpy as np
+import pandas as pd
+import polars as pl
+
+from dsbf.utils.null_patterns import (
+    count_null_patterns,
+    pack_null_patterns,
+    top_null_patterns,
+)
+
+
+def test_patterns_match_row_strings_across_words():
+    rng = np.random.default_rng(0)
+    values = rng.random((500, 70))
+    values[rng.random((500, 70)) < 0.05] = np.nan
+    df = pd.DataFrame(values, columns=[f"c{i}" for i in range(70)])
+    expected = (
+        df.isnull()
+        .astype(int)
+        .apply(lambda row: "".join(row.astype(str)), axis=1)
+        .value_counts()
+        .to_dict()
+    )
+
+    assert pack_null_patterns(df).columns == ["w0", "w1"]
+    counts = count_null_patterns(pl.from_pandas(df))
+    assert counts.height == len(expected)
+    assert dict(top_null_patterns(counts, df.shape[1])) == expected
+
+
+def test_top_patterns_are_most_frequent_first():
+    df = pl.DataFrame(
+        {"a": [None, None, None, 1.0], "b": [1.0, float("nan"), None, 1.0]}
+    )
+    counts = count_null_patterns(df)
+
+    assert top_null_patterns(counts, 2, limit=1) == [("11", 2)]
+    assert count_null_patterns(pl.DataFrame()).height == 0
@@ -0,0 +1,70 @@
+# tests/test_utils/test_parquet_utils.py
+
+import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from dsbf.utils.parquet_utils import is_parquet_path, read_parquet_footer_stats
+
+
+def test_is_parquet_path():
+    assert is_parquet_path("data/events.parquet")
+    assert is_parquet_path("DATA.PQ")
+    assert not is_parquet_path("data.csv")
+    assert not is_parquet_path(None)
+
+
+def test_footer_stats_across_row_groups(tmp_path):
+    path = tmp_path / "data.parquet"
+    table = pa.table(
+        {
+            "id": [1, 2, 3, 4, 5, 6],
+            "score": [0.5, None, 1.5, 2.5, None, -1.0],
+            "city": ["NY", None, "SF", None, None, "LA"],
+        }
+    )
+    pq.write_table(table, path, row_group_size=2)
+
+    stats = read_parquet_footer_stats(str(path))
+
+    assert stats["source"] == "parquet_footer"
+    assert stats["num_rows"] == 6
+    assert stats["num_columns"] == 3
+    assert stats["num_row_groups"] == 3
+
+    assert stats["columns"]["id"] == {
+        "null_count": 0,
+        "non_null_count": 6,
+        "min": 1,
+        "max": 6,
+    }
+    assert stats["columns"]["city"]["null_count"] == 3
+    assert "min" not in stats["columns"]["city"]
+
+    # Float nulls are not exact under NaN semantics, but min/max still are
+    assert "null_count" not in stats["columns"]["score"]
+    assert stats["columns"]["score"]["min"] == -1.0
+    assert stats["columns"]["score"]["max"] == 2.5
+
+
+def test_footer_stats_all_null_row_group(tmp_path):
+    path = tmp_path / "nulls.parquet"
+    pl.DataFrame({"x": [None, None, 3, 7]}, schema={"x": pl.Int64}).write_parquet(
+        path, row_group_size=2
+    )
+
+    stats = read_parquet_footer_stats(str(path))
+
+    assert stats["columns"]["x"]["null_count"] == 2
+    assert stats["columns"]["x"]["min"] == 3
+    assert stats["columns"]["x"]["max"] == 7
+
+
+def test_footer_stats_missing_statistics(tmp_path):
+    path = tmp_path / "nostats.parquet"
+    pq.write_table(pa.table({"x": [1, 2, 3]}), path, write_statistics=False)
+
+    stats = read_parquet_footer_stats(str(path))
+
+    assert stats["num_rows"] == 3
+    assert stats["columns"]["x"] == {}
@@ -0,0 +1,151 @@
+# tests/test_utils/test_partition_utils.py
+
+from datetime import date
+
+import polars as pl
+import pytest
+
+from dsbf.utils.partition_utils import (
+    Partition,
+    discover_partitions,
+    filter_partitions,
+    is_partitioned_path,
+    load_partitions,
+    plan_row_partitions,
+    read_row_partition,
+    scan_text_file,
+)
+
+
+@pytest.fixture
+def partitioned_dir(tmp_path):
+    root = tmp_path / "events"
+    for day, region, values in [
+        ("2025-07-01", "us", [1, 2]),
+        ("2025-07-05", "us", [3, None]),
+        ("2025-07-09", "eu", [5, 6]),
+    ]:
+        part = root / f"date={day}" / f"region={region}"
+        part.mkdir(parents=True)
+        pl.DataFrame({"value": values}, schema={"value": pl.Int64}).write_parquet(
+            part / "part-0.parquet"
+        )
+    (root / "_SUCCESS").write_text("")
+    return root
+
+
+def test_discover_partitions(partitioned_dir):
+    partitions = discover_partitions(str(partitioned_dir))
+
+    assert [p.label for p in partitions] == [
+        "date=2025-07-01/region=us",
+        "date=2025-07-05/region=us",
+        "date=2025-07-09/region=eu",
+    ]
+    assert all(len(p.files) == 1 for p in partitions)
+
+
+def test_discover_partitions_with_glob(partitioned_dir):
+    partitions = discover_partitions(str(partitioned_dir / "date=*" / "region=us"))
+
+    assert is_partitioned_path(str(partitioned_dir / "date=*"))
+    assert {p.values["date"] for p in partitions} == {"2025-07-01", "2025-07-05"}
+
+
+def test_filter_partitions_rules(partitioned_dir):
+    partitions = discover_partitions(str(partitioned_dir))
+
+    last_week = filter_partitions(
+        partitions, {"date": {"last_n_days": 7}}, today=date(2025, 7, 9)
+    )
+    assert [p.values["date"] for p in last_week] == ["2025-07-05", "2025-07-09"]
+
+    bounded = filter_partitions(partitions, {"date": {"max": "2025-07-05"}})
+    assert len(bounded) == 2
+
+    by_region = filter_partitions(partitions, {"region": ["eu"]})
+    assert [p.values["region"] for p in by_region] == ["eu"]
+
+    assert filter_partitions(partitions, {"missing_key": "x"}) == []
+
+
+def test_filter_partitions_compares_bounds_by_type():
+    partitions = [
+        Partition(values={"hour": hour, "date": day})
+        for hour, day in [("9", "2025-7-9"), ("10", "2025-7-10"), ("x", "x")]
+    ]
+
+    def kept(rule):
+        return [p.values["hour"] for p in filter_partitions(partitions, rule)]
+
+    assert kept({"hour": {"min": 10}}) == ["10", "x"]
+    assert kept({"hour": {"max": "9"}}) == ["9"]
+    assert kept({"date": {"min": date(2025, 7, 10)}}) == ["10", "x"]
+    assert kept({"date": {"max": "2025-07-09"}}) == ["9"]
+
+
+def test_load_partitions_adds_columns_and_summaries(partitioned_dir):
+    partitions = discover_partitions(str(partitioned_dir))
+    df, summaries = load_partitions(partitions, max_workers=2, summarize=True)
+
+    assert df.height == 6
+    assert set(df.columns) == {"value", "date", "region"}
+
+    summary = summaries["date=2025-07-05/region=us"]
+    assert summary["rows"] == 2
+    assert summary["null_counts"]["value"] == 1
+    assert summary["numeric"]["value"]["max"] == 3
+
+
+def test_load_partitions_requires_selection():
+    with pytest.raises(ValueError):
+        load_partitions([])
+
+
+def test_plan_and_read_row_partitions(tmp_path):
+    df = pl.DataFrame({"x": list(range(2_500))})
+    parquet_path = tmp_path / "data.parquet"
+    df.write_parquet(parquet_path, row_group_size=500)
+    csv_path = tmp_path / "data.csv"
+    df.write_csv(csv_path)
+
+    parquet_parts = plan_row_partitions(str(parquet_path), partition_rows=1_000)
+    assert [p.row_groups for p in parquet_parts] == [[0, 1], [2, 3], [4]]
+
+    csv_parts = plan_row_partitions(str(csv_path), partition_rows=1_000)
+    assert [read_row_partition(p).height for p in csv_parts] == [1_000, 1_000, 500]
+    assert csv_parts[0].byte_range[0] == csv_parts[0].header_end == len("x\n")
+
+    for parts in (parquet_parts, csv_parts):
+        combined = pl.concat([read_row_partition(p) for p in parts])
+        assert combined["x"].to_list() == df["x"].to_list()
+
+
+def test_text_partitions_split_on_record_boundaries(tmp_path):
+    path = tmp_path / "notes.csv"
+    path.write_text('id,note\n1,"first\nline"\n2,plain\n3,"a, ""b"""\n4,x')
+
+    parts = plan_row_partitions(str(path), partition_rows=2)
+    frames = [read_row_partition(p) for p in parts]
+    assert [df.height for df in frames] == [2, 2]
+    assert frames[0]["note"].to_list() == ["first\nline", "plain"]
+    assert frames[1]["note"].to_list() == ['a, "b"', "x"]
+
+    scan = scan_text_file(str(path), prefix_bytes=parts[1].byte_range[0])
+    assert scan.rows == 4 and scan.prefix_on_record
+
+    ndjson = tmp_path / "events.ndjson"
+    ndjson.write_text("".join(f'{{"a": {i}}}\n' for i in range(5)))
+    parts = plan_row_partitions(str(ndjson), partition_rows=2)
+    assert [read_row_partition(p)["a"].to_list() for p in parts] == [
+        [0, 1],
+        [2, 3],
+        [4],
+    ]
+
+
+def test_plan_row_partitions_carries_hive_values(partitioned_dir):
+    parts = plan_row_partitions(str(partitioned_dir), partition_rows=1_000)
+    assert len(parts) == 3
+    df = read_row_partition(parts[-1])
+    assert df["region"].to_list() == ["eu", "eu"]
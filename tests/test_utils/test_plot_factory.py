@@ -1,6 +1,7 @@
 # tests/test_utils/test_plot_factory.py
 
 import pandas as pd
+import polars as pl
 import pytest
 
 from dsbf.utils.plot_factory import PlotFactory
@@ -41,3 +42,41 @@ def test_histogram_static_creates_file(tmp_path, test_series):
 def test_plotdata_format_keys_present(test_series):
     result = PlotFactory.plot_histogram_interactive(test_series)
     assert set(result.keys()).issuperset({"type", "data", "config", "annotations"})
+
+
+def test_row_level_plots_are_capped():
+    series = pd.Series(range(1_000), name="big")
+
+    result = PlotFactory.plot_histogram_interactive(series, max_rows=100)
+
+    assert len(result["data"]["x"]) == 100
+    assert result["data"]["x"] == sorted(result["data"]["x"])
+    assert len(PlotFactory.plot_histogram_interactive(series)["data"]["x"]) == 1_000
+    assert len(PlotFactory._limit_rows(series, 0)) == 1_000
+
+
+def test_polars_row_cap_keeps_row_order():
+    series = pl.Series("big", range(1_000))
+    frame = series.to_frame()
+
+    assert PlotFactory._limit_rows(series, 100).is_sorted()
+    sampled = PlotFactory._limit_rows(frame, 100)
+    assert sampled.columns == ["big"] and sampled["big"].is_sorted()
+
+
+def test_binned_histogram_uses_counts(tmp_path):
+    histogram = {"edges": [0, 1, 2, 3], "counts": [4, 0, 2]}
+    file_path = tmp_path / "binned.png"
+    static = PlotFactory.plot_binned_histogram_static(histogram, str(file_path))
+    interactive = PlotFactory.plot_binned_histogram_interactive(
+        histogram, x_label="Length"
+    )
+
+    assert file_path.exists()
+    assert static["plot_data"]["data"] == histogram
+    assert interactive["type"] == "histogram"
+    assert interactive["data"] == histogram
+    assert interactive["config"]["x_label"] == "Length"
+    assert PlotFactory.plot_binned_histogram_interactive({"edges": [], "counts": []})[
+        "annotations"
+    ] == ["Empty series"]
@@ -0,0 +1,42 @@
+# tests/test_utils/test_profile_state.py
+
+import json
+
+import pytest
+
+from dsbf.utils.profile_state import (
+    PROFILE_STATE_FILE,
+    PROFILE_STATE_VERSION,
+    load_profile_state,
+    save_profile_state,
+)
+from dsbf.utils.sketches import FrequentItemsSketch
+
+
+def test_profile_state_roundtrip(tmp_path):
+    states = {"summarize_value_counts": {"columns": {"x": FrequentItemsSketch()}}}
+    states["summarize_value_counts"]["columns"]["x"].update(["a", "a", "b"])
+
+    path = save_profile_state(str(tmp_path), states, rows=3, sources=["day1.csv"])
+    assert path.endswith(PROFILE_STATE_FILE)
+
+    profile = load_profile_state(str(tmp_path))
+    assert profile["version"] == PROFILE_STATE_VERSION
+    assert profile["rows"] == 3 and profile["sources"] == ["day1.csv"]
+    sketch = profile["tasks"]["summarize_value_counts"]["columns"]["x"]
+    assert sketch.counts == {"a": 2, "b": 1}
+
+
+def test_profile_state_rejects_foreign_and_future_files(tmp_path):
+    foreign = tmp_path / "report.json"
+    foreign.write_text(json.dumps({"results": {}}))
+    with pytest.raises(ValueError, match="not a DSBF profile state"):
+        load_profile_state(str(foreign))
+
+    path = save_profile_state(str(tmp_path), {}, rows=0)
+    payload = json.loads(open(path).read())
+    payload["version"] = PROFILE_STATE_VERSION + 1
+    with open(path, "w") as f:
+        json.dump(payload, f)
+    with pytest.raises(ValueError, match="version"):
+        load_profile_state(path)
@@ -0,0 +1,99 @@
+# tests/test_utils/test_progressive.py
+
+import numpy as np
+import polars as pl
+
+import dsbf.utils.progressive as progressive
+from dsbf.utils.progressive import (
+    compare_signatures,
+    progressive_sample,
+    sample_signature,
+    sample_sizes,
+)
+
+
+def _make_df(n_rows: int, seed: int = 0) -> pl.DataFrame:
+    rng = np.random.default_rng(seed)
+    a = rng.normal(size=n_rows)
+    return pl.DataFrame(
+        {
+            "a": a,
+            "b": a * 0.5 + rng.normal(size=n_rows),
+            "segment": rng.choice(["x", "y", "z"], n_rows, p=[0.6, 0.3, 0.1]),
+            "id": np.arange(n_rows),
+        }
+    )
+
+
+def test_sample_sizes_grow_geometrically_to_full_size():
+    assert sample_sizes(250_000, 10_000, 10) == [10_000, 100_000, 250_000]
+    assert sample_sizes(5_000, 10_000, 10) == [5_000]
+
+
+def test_progressive_sample_stops_before_full_scan():
+    df = _make_df(400_000)
+    settings = {"start_rows": 2_000, "growth_factor": 4, "tolerance": 0.05}
+
+    sample, info = progressive_sample(df, settings=settings, seed=1)
+
+    assert info is not None
+    assert info["converged"] is True
+    assert info["sampled_rows"] < 400_000
+    assert sample.height == info["sampled_rows"]
+    assert info["sample_sizes"][0] == 2_000
+    assert set(info["converged_at_rows"]) == {
+        "means",
+        "null_rates",
+        "top_k",
+        "correlation_signs",
+    }
+    assert max(info["converged_at_rows"].values()) == info["sampled_rows"]
+    # Nested samples keep the original row order
+    assert sample["id"].is_sorted()
+
+
+def test_family_that_becomes_unstable_is_rechecked(monkeypatch):
+    # means is stable only at the first and third comparisons, top_k from the
+    # second on: the families first agree together at the third
+    outcomes = iter(
+        [
+            {"means": True, "top_k": False},
+            {"means": False, "top_k": True},
+            {"means": True, "top_k": True},
+        ]
+    )
+    monkeypatch.setattr(progressive, "compare_signatures", lambda *_: next(outcomes))
+
+    _, info = progressive_sample(
+        _make_df(100_000), settings={"start_rows": 1_000, "growth_factor": 2}
+    )
+
+    assert info is not None and info["converged"] is True
+    assert info["sample_sizes"] == [1_000, 2_000, 4_000, 8_000]
+    assert info["converged_at_rows"] == {"means": 8_000, "top_k": 4_000}
+
+
+def test_signature_detects_correlation_sign_flip_and_new_top_values():
+    df = _make_df(5_000)
+    flipped = df.with_columns((-pl.col("b")).alias("b"), pl.lit("w").alias("segment"))
+
+    stable = compare_signatures(sample_signature(df), sample_signature(flipped))
+
+    assert stable["means"] is False
+    assert stable["correlation_signs"] is False
+    assert stable["top_k"] is False
+    assert stable["null_rates"] is True
+
+
+def test_drift_family_tracked_with_reference():
+    df = _make_df(50_000)
+    reference = _make_df(5_000, seed=1).with_columns(pl.col("a") + 1)
+
+    _, info = progressive_sample(
+        df,
+        settings={"start_rows": 1_000, "growth_factor": 5, "tolerance": 0.1},
+        reference_df=reference,
+    )
+
+    assert info is not None
+    assert "drift" in info["converged_at_rows"]
@@ -0,0 +1,145 @@
+# tests/test_utils/test_sketches.py
+
+import json
+from datetime import date, datetime
+
+import numpy as np
+import polars as pl
+import pytest
+
+from dsbf.utils.sketches import (
+    FrequentItemsSketch,
+    HyperLogLog,
+    KLLSketch,
+    RunningCovariance,
+    RunningMoments,
+    decode_state,
+    encode_state,
+    sketch_from_dict,
+)
+
+
+def _roundtrip(sketch):
+    return sketch_from_dict(json.loads(json.dumps(sketch.to_dict())))
+
+
+def test_running_moments_merge_matches_numpy():
+    rng = np.random.default_rng(0)
+    values = rng.gamma(2.0, size=10_000)
+
+    merged = RunningMoments()
+    for chunk in np.array_split(values, 13):
+        merged.merge(RunningMoments().update(chunk))
+
+    assert merged.n == values.size
+    assert merged.mean == pytest.approx(values.mean())
+    assert merged.std(ddof=1) == pytest.approx(values.std(ddof=1))
+    centered = values - values.mean()
+    expected_skew = np.mean(centered**3) / np.mean(centered**2) ** 1.5
+    assert merged.skewness() == pytest.approx(expected_skew)
+    assert merged.min == values.min() and merged.max == values.max()
+    assert _roundtrip(merged).mean == merged.mean
+
+
+def test_running_moments_ignores_nan():
+    moments = RunningMoments().update([1.0, np.nan, 3.0])
+    assert moments.n == 2
+    assert moments.mean == 2.0
+
+
+def test_hyperloglog_estimate_within_error_and_mergeable():
+    left = HyperLogLog().update(np.arange(0, 60_000))
+    right = HyperLogLog().update(np.arange(40_000, 100_000))
+    union = _roundtrip(left).merge(right)
+
+    assert union.estimate() == pytest.approx(100_000, rel=4 * union.relative_error())
+    assert HyperLogLog().update([1, 2, 2, 3, None]).estimate() == pytest.approx(
+        3, abs=0.01
+    )
+
+
+def test_hyperloglog_hashes_values_not_dtypes():
+    ints = HyperLogLog().update(pl.Series([1, 2, 3]))
+    floats = HyperLogLog().update(pl.Series([1.0, 2.0, 3.0, 2.5]))
+    assert ints.merge(floats).estimate() == pytest.approx(4, abs=0.01)
+
+    dates = HyperLogLog().update(pl.Series([date(2024, 1, 1)]))
+    stamps = HyperLogLog().update(pl.Series([datetime(2024, 1, 1)]))
+    assert dates.merge(stamps).estimate() == pytest.approx(1, abs=0.01)
+
+    legacy = _roundtrip(HyperLogLog().update([1]))
+    legacy.hash_version = None
+    with pytest.raises(ValueError, match="hash versions"):
+        HyperLogLog().merge(legacy)
+
+
+def test_frequent_items_exact_below_capacity():
+    sketch = FrequentItemsSketch(capacity=10)
+    sketch.update(pl.Series(["a", "b", "a", None]))
+    sketch.merge(FrequentItemsSketch(capacity=10).update(pl.Series(["a", "c"])))
+
+    assert sketch.is_exact
+    assert sketch.top(1) == [("a", 3)]
+    assert dict(sketch.top(10)) == {"a": 3, "b": 1, "c": 1, None: 1}
+
+
+def test_frequent_items_bounded_error_when_pruned():
+    rng = np.random.default_rng(1)
+    values = rng.zipf(1.8, size=50_000)
+    sketch = FrequentItemsSketch(capacity=20)
+    for chunk in np.array_split(values, 10):
+        sketch.update(pl.Series(chunk))
+
+    true_counts = {v: int((values == v).sum()) for v in (1, 2, 3)}
+    assert not sketch.is_exact
+    assert sketch.error_bound() <= values.size / 21
+    for value, count in sketch.top(3):
+        assert count <= true_counts[value] <= count + sketch.error_bound()
+    assert len(_roundtrip(sketch).counts) <= 20
+
+
+def test_kll_exact_when_small_and_bounded_when_large():
+    small = KLLSketch(k=200).update([5.0, 1.0, 3.0])
+    assert small.is_exact
+    assert small.quantile(0.5) == 3.0
+
+    rng = np.random.default_rng(2)
+    values = rng.normal(size=100_000)
+    sketch = KLLSketch(k=200)
+    for chunk in np.array_split(values, 25):
+        sketch.merge(KLLSketch(k=200).update(chunk))
+
+    ordered = np.sort(values)
+    for q in (0.01, 0.25, 0.5, 0.75, 0.99):
+        rank = np.searchsorted(ordered, sketch.quantile(q)) / values.size
+        assert abs(rank - q) <= sketch.rank_error()
+    assert sum(level.size for level in sketch.levels) < 1_000
+    assert _roundtrip(sketch).quantile(0.5) == sketch.quantile(0.5)
+
+
+def test_running_covariance_merge_matches_numpy():
+    rng = np.random.default_rng(1)
+    x = rng.normal(size=5_000)
+    y = 0.5 * x + rng.normal(size=5_000)
+    x[::11] = np.nan
+
+    left = RunningCovariance().update(x[:2_000], y[:2_000])
+    right = RunningCovariance().update(x[2_000:], y[2_000:])
+    merged = _roundtrip(left.merge(right))
+
+    mask = ~np.isnan(x)
+    assert merged.n == int(mask.sum())
+    assert merged.correlation() == pytest.approx(np.corrcoef(x[mask], y[mask])[0, 1])
+
+
+def test_state_codec_roundtrip():
+    state = {
+        "rows": 3,
+        "columns": {"x": HyperLogLog(p=12).update([1, 2, 3])},
+        "tables": {"a": {"u": 2}},
+    }
+    decoded = decode_state(json.loads(json.dumps(encode_state(state))))
+
+    assert decoded["rows"] == 3 and decoded["tables"] == {"a": {"u": 2}}
+    assert isinstance(decoded["columns"]["x"], HyperLogLog)
+    assert decoded["columns"]["x"].estimate() == pytest.approx(3, abs=0.5)
@@ -0,0 +1,102 @@
+# tests/test_utils/test_sql_source.py
+
+import sqlite3
+
+import pytest
+
+from dsbf.utils import sql_source
+from dsbf.utils.sql_source import SQLSource, quote_identifier
+
+
+@pytest.fixture
+def sqlite_db(tmp_path):
+    path = tmp_path / "events.db"
+    conn = sqlite3.connect(path)
+    conn.execute('CREATE TABLE events (id INTEGER, amount REAL, "user type" TEXT)')
+    rows = [
+        (i, None if i % 10 == 0 else float(i), "pro" if i % 3 == 0 else "free")
+        for i in range(100)
+    ]
+    conn.executemany("INSERT INTO events VALUES (?, ?, ?)", rows)
+    conn.commit()
+    conn.close()
+    return path
+
+
+def test_quote_identifier_escapes_quotes():
+    assert quote_identifier('we"ird') == '"we""ird"'
+
+
+def test_compute_stats_pushdown(sqlite_db):
+    source = SQLSource.from_config(
+        {"url": f"sqlite:///{sqlite_db}", "table": "events", "histogram_bins": 4}
+    )
+    stats = source.compute_stats()
+
+    assert stats["source"] == "sql"
+    assert stats["num_rows"] == 100
+    assert stats["num_columns"] == 3
+
+    amount = stats["columns"]["amount"]
+    assert amount["null_count"] == 10
+    assert amount["non_null_count"] == 90
+    assert amount["min"] == 1.0
+    assert amount["max"] == 99.0
+    assert sum(amount["histogram"]["counts"]) == 90
+    assert len(amount["histogram"]["edges"]) == 5
+
+    user_type = stats["columns"]["user type"]
+    assert user_type["n_unique"] == 2
+    assert user_type["top_values"] == {"free": 66, "pro": 34}
+    assert "min" not in user_type
+
+    assert stats["columns"]["id"]["n_unique"] == 100
+    source.close()
+
+
+def test_per_column_queries_are_batched(tmp_path, monkeypatch):
+    path = tmp_path / "wide.db"
+    conn = sqlite3.connect(path)
+    names = [f"c{i}" for i in range(30)]
+    conn.execute(f"CREATE TABLE wide ({', '.join(n + ' INTEGER' for n in names)})")
+    conn.executemany(
+        f"INSERT INTO wide VALUES ({', '.join('?' * len(names))})",
+        [tuple((r * (i + 1)) % 7 for i in range(len(names))) for r in range(50)],
+    )
+    conn.commit()
+
+    queries = []
+    query = SQLSource._query
+
+    def counting_query(self, sql):
+        queries.append(sql)
+        return query(self, sql)
+
+    monkeypatch.setattr(SQLSource, "_query", counting_query)
+    stats = SQLSource(conn, table="wide", top_k=3).compute_stats()
+    # Row count, aggregates, one top-k and one histogram query for all columns
+    assert len(queries) == 4
+
+    monkeypatch.setattr(sql_source, "MAX_UNION_BRANCHES", 7)
+    queries.clear()
+    batched = SQLSource(conn, table="wide", top_k=3).compute_stats()
+    assert len(queries) == 2 + 2 * 5
+    assert batched == stats
+    c0 = stats["columns"]["c0"]
+    assert len(c0["top_values"]) == 3 and next(iter(c0["top_values"].items())) == (0, 8)
+    assert sum(c0["histogram"]["counts"]) == 50
+    conn.close()
+
+
+def test_sample_respects_limit(sqlite_db):
+    source = SQLSource(sqlite3.connect(sqlite_db), table="events", sample_rows=25)
+    sample = source.sample()
+
+    assert len(sample) == 25
+    assert list(sample.columns) == ["id", "amount", "user type"]
+    assert source.sample() is sample  # cached
+
+
+def test_from_config_rejects_unknown_url():
+    with pytest.raises(ValueError):
+        SQLSource.from_config({"url": "postgresql://host/db", "table": "t"})
@@ -0,0 +1,63 @@
+# tests/test_utils/test_text_stats.py
+
+import math
+from collections import Counter
+
+import polars as pl
+import pytest
+
+from dsbf.utils.text_stats import (
+    character_entropy,
+    length_histogram,
+    summarize_strings,
+    utf8_bytes,
+)
+
+
+def _reference_entropy(values):
+    counts = Counter("".join(values))
+    total = sum(counts.values())
+    return -sum(c / total * math.log2(c / total) for c in counts.values())
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        ["abc", "aab", None, "zzzz"],
+        ["naïve", "café", None, "日本語", "a"],
+    ],
+)
+def test_character_entropy_matches_per_character_counts(values):
+    expected = _reference_entropy([v for v in values if v is not None])
+    assert character_entropy(pl.Series(values)) == pytest.approx(expected)
+
+
+def test_utf8_bytes_respects_slices_and_categoricals():
+    series = pl.Series(["xx", "héllo", None, "yy"])
+    assert utf8_bytes(series.slice(1, 2)).tobytes() == "héllo".encode()
+    assert utf8_bytes(series.cast(pl.Categorical)).tobytes() == "xxhélloyy".encode()
+    assert character_entropy(pl.Series([None], dtype=pl.Utf8)) == 0.0
+
+
+def test_summarize_strings_matches_python_string_methods():
+    values = ["a b", "  spaced   out ", "x!", "", "日本 語", "a b", None, "tab\tsep"]
+    strings = [v for v in values if v is not None]
+    stats = summarize_strings(pl.Series(values))
+
+    assert stats["count"] == len(strings)
+    assert stats["total_chars"] == sum(len(s) for s in strings)
+    assert stats["max_length"] == max(len(s) for s in strings)
+    assert stats["total_words"] == sum(len(s.split()) for s in strings)
+    assert stats["contains_symbols"] is True
+    assert stats["most_frequent_value"] == Counter(strings).most_common(1)[0][0]
+    assert summarize_strings(pl.Series(["ab", "cd"]))["contains_symbols"] is False
+    assert summarize_strings(pl.Series([None], dtype=pl.Utf8)) == {}
+
+
+def test_length_histogram_bins():
+    narrow = length_histogram(pl.Series([2, 3, 3, 5]))
+    assert narrow == {"edges": [2, 3, 4, 5, 6], "counts": [1, 2, 0, 1]}
+
+    wide = length_histogram(pl.Series(list(range(100))), bins=10)
+    assert len(wide["edges"]) == 11
+    assert sum(wide["counts"]) == 100
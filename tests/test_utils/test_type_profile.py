@@ -0,0 +1,50 @@
+# tests/test_utils/test_type_profile.py
+
+import datetime as dt
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+import polars as pl
+
+from dsbf.core.context import AnalysisContext
+from dsbf.utils import type_profile as tp
+from dsbf.utils.type_profile import type_profile
+
+
+def test_object_profile_matches_per_value_types(monkeypatch):
+    monkeypatch.setattr(tp, "CHUNK_ROWS", 100)  # pure and mixed chunks
+    values = np.array(
+        ["a"] * 300 + [1, np.int32(2), 2.5, True, dt.date(2024, 1, 1)] * 20,
+        dtype=object,
+    )
+    values[::50] = None
+    profile = type_profile(pd.Series(values))
+
+    expected = Counter(tp.type_family(type(v)) for v in values if v is not None)
+    assert profile.counts == dict(expected)
+    assert profile.null_count == 8
+    assert profile.is_mixed
+    for family, positions in profile.samples.items():
+        assert len(positions) == min(5, expected[family])
+        assert all(tp.type_family(type(values[i])) == family for i in positions)
+
+
+def test_nan_counts_as_null_and_typed_columns_are_single_family():
+    profile = type_profile(pd.Series(["a", np.nan, "b", None], dtype=object))
+    assert profile.counts == {"str": 2}
+    assert profile.null_count == 2
+    assert not profile.is_mixed
+
+    profile = type_profile(pl.Series([None, 1, 2]))
+    assert profile.counts == {"int": 2}
+    assert profile.samples == {"int": [1, 2]}
+    assert type_profile(pd.Series([1.0, np.nan])).counts == {"float": 1}
+
+
+def test_context_shares_profiles_between_tasks():
+    df = pd.DataFrame({"a": pd.Series(["x", 1], dtype=object)})
+    ctx = AnalysisContext(df)
+    first = ctx.get_type_profile("a", df["a"])
+    assert ctx.get_type_profile("a", df["a"]) is first
+    assert ctx.get_type_profile("a", df["a"].head(1)) is not first